@@ -0,0 +1,8 @@
+#!/bin/sh
+
+# benchmark workloads : Thumb-2 assembly, no C library, semihosting output and exit (see startup.S)
+# prebuilt images were assembled by LLVM (llvm-mc -triple=thumbv7em-none-eabi -mcpu=cortex-m4 -filetype=obj)
+# and linked by ld.lld -n with the same linker script
+for workload in branchy coremark crc divide dsp memcpy; do
+	arm-none-eabi-gcc -mcpu=cortex-m4 -mthumb -nostdlib -nostartfiles -Wl,-n -T bench.ld startup.S $workload.S -o $workload.out
+done
@@ -348,7 +348,9 @@ def emitDecoder(dec, ofile, existing_vars, indent=0):
         working = re.sub(rf'({var}) = [^;]+; *', '', working)
 
     if 'imm32' in existing_vars:
-        working = re.sub(r'\(imm32, carry\) = T32ExpandImm_C\([^,]+, ([^)]+)\)', r'carry = \1', working)
+        # carry out of constant is computed from imm32 at execution, see emitExecute
+        working = re.sub(r'\(imm32, carry\) = T32ExpandImm_C\([^;]+; *', '', working)
+        working = re.sub(r'carry = PSTATE\.C; *', '', working)
         if 'sat_imm' in working:
             working = working.replace('sat_imm', 'imm32')
         elif 'saturate_to' in working:
@@ -407,6 +409,9 @@ def emitExecute(exec, ofile, existing_vars=[], indent=0):
         if 'saturate_to' in working:
             working = working.replace('saturate_to', 'imm32')
 
+    if 'imm32' in existing_vars and 'carry) =' not in working:
+        working = working.replace('core.APSR.C = carry;', 'core.APSR.C = core.T32ExpandImmCarry(imm32);')
+
     if 'Replicate' in working:
         working = re.sub(r'core.R\[(\w+)\]<(\w+):(\w+)> = core.Replicate\([^;]*', r'core.R[\1] = core.R[\1] & ~((0xffffffff >> (31 - \2 + \3)) << \3)', working)
 
@@ -571,7 +576,7 @@ class Instruction:
                 for f in zero_default_fields:
                     if f in all_opt_fields:
                         print(f'    if {f} is None:', file=ofile)
-                        print(f"        {f} = '0'", file=ofile)
+                        print(f"        {f} = 0" if f == 'imm32' else f"        {f} = '0'", file=ofile)
 
                 if 'shift_t' in all_opt_fields:
                     print('    if shift_t is None:', file=ofile)
@@ -614,7 +619,8 @@ class Instruction:
                 if self.conditional or 'cond' in all_fields:
                     indent-=4
                     print(" "*indent, 'else:', sep='', file=ofile)
-                    print(" "*(indent+4), f"log.debug(f'{exec_routine} skipped')", sep='', file=ofile)
+                    print(" "*(indent+4), 'if core.trace:', sep='', file=ofile)
+                    print(" "*(indent+8), f"log.debug(f'{exec_routine} skipped')", sep='', file=ofile)
                 print(f'    return {exec_routine}', file=ofile)
                 print(file=ofile)
 
@@ -1457,13 +1463,14 @@ def main():
                     print("    ],", file=outf)
                 print("}", file=outf)
 
+        # regexes are compiled by the core on first use of their mnemonic (see Core.getPatterns)
         print('patterns = {', file=outall)
         mnem_list = sorted(global_patterns.keys())
         for mnem in mnem_list:
             # sort them using magic order
             print(f"    '{mnem}': [", file=outall)
             for _,_,pat,method,bitdiff in sorted(global_patterns[mnem], key=lambda decode_pat:decode_pat[2].count('(?P<')*1000+(-100 if ('PC' in decode_pat[2] or 'SP' in decode_pat[2]) else 0)+len(decode_pat[2])):
-                print(" "*8, "(re.compile(r'", pat, "', re.I), ", method, ', ', dict(bitdiff), '),', sep='', file=outall)
+                print(" "*8, "(r'", pat, "', ", method, ', ', dict(bitdiff), '),', sep='', file=outall)
             print("    ],", file=outall)
         print("}", file=outall)
 
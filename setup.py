@@ -50,6 +50,11 @@ setup(
     entry_points={
         'console_scripts': [
             'thumb2ISS = thumb2ISS.thumb2ISS:run',
+            'thumb2ISS-batch = thumb2ISS.batch:batch',
+            'thumb2ISS-fanout = thumb2ISS.fanout:fanout',
+            'thumb2ISS-trace = thumb2ISS.tracer:dump',
+            'thumb2ISS-lockstep = thumb2ISS.lockstep:run',
+            'thumb2ISS-bench = thumb2ISS.bench:bench',
         ],
     },
 )
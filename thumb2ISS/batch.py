@@ -0,0 +1,98 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import click
+import logging
+import contextlib
+import io
+import json
+import sys,time,os
+from concurrent.futures import ProcessPoolExecutor
+from .sim import Simulator
+from .core import Core
+from .timings import Architecture
+from .thumb2ISS import loadImage, execute
+from .hostlib import routines as host_routines
+from .report import newResult, setReason, writeJsonLine, writeJUnit
+from .version import __version__
+
+log = logging.getLogger('thumb2ISS.batch')
+
+def initWorker(verbose):
+    ''' Pool worker set up : instruction tables are imported once, then shared by every simulated image '''
+    logging.basicConfig(level=logging.WARNING if verbose else logging.ERROR, stream=sys.stderr)
+    Core()
+
+def simulateImage(elf_file, cpu='M4', timeout=None, cache_dir=None, max_cycles=None, max_instructions=None, accelerate=(), accelerate_check=False):
+    ''' Runs ELF_FILE to completion, returns the result of the run (see report.newResult) '''
+    result = newResult(elf_file)
+    stdout = io.StringIO()
+    start_time = time.time()
+    s = Simulator(t_arch=Architecture.fromString(cpu), log_root=log)
+    try:
+        # semihosting output goes to the stdout active when target opens it
+        with contextlib.redirect_stdout(stdout):
+            if loadImage(s, elf_file, cache_dir=cache_dir):
+                s.accelerate(accelerate, accelerate_check)
+                reason, result['instructions'] = execute(s, timeout, max_cycles, max_instructions)
+                setReason(result, reason, s.core.exit_status)
+            else:
+                result['error'] = 'Load failed'
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+    if s.core is not None:
+        result['cycles'] = s.cycles['total']
+    result['wall_time'] = round(time.time() - start_time, 6)
+    result['stdout'] = stdout.getvalue()
+    return result
+
+def runBatch(elf_files, jobs=None, cpu='M4', timeout=None, cache_dir=None, verbose=0, max_cycles=None, max_instructions=None, accelerate=(), accelerate_check=False):
+    ''' Simulates every image on a pool of jobs processes, yields the reports in images order '''
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initWorker, initargs=(verbose,)) as pool:
+        futures = [pool.submit(simulateImage, os.path.abspath(elf_file), cpu, timeout, cache_dir, max_cycles, max_instructions, accelerate, accelerate_check) for elf_file in elf_files]
+        for elf_file, future in zip(elf_files, futures):
+            result = future.result()
+            result['image'] = elf_file
+            yield result
+
+@click.command()
+@click.argument('elf_files', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('-j', '--jobs', type=click.IntRange(min=1), help='Count of worker processes  [default: cpu count]')
+@click.option('-c', '--cpu', type=click.Choice(['M0', 'M0+', 'M3', 'M4', 'M23', 'M33'], case_sensitive=False), default='M4', help='Tune target (cycle counting)')
+@click.option('-t', '--timeout', type=click.IntRange(min=1), help='Stop simulation of an image after this host wall-clock time (s), which depends on host speed  [default: none]')
+@click.option('--max-cycles', type=click.IntRange(min=1), help='Stop simulation of an image once this count of cycles is simulated')
+@click.option('--max-instructions', type=click.IntRange(min=1), help='Stop simulation of an image once this count of instructions is executed')
+@click.option('--cache-dir', type=click.Path(file_okay=False), help='Keep decoded programs in this directory to skip decoding on next runs of same image')
+@click.option('-a', '--accelerate', multiple=True, type=click.Choice(list(host_routines) + ['all']), help='Run this C library routine natively instead of simulating it (repeatable)')
+@click.option('--accelerate-check', is_flag=True, default=False, help='Simulate accelerated routines anyway and check native results against simulated ones')
+@click.option('-o', '--output', type=click.File('w'), default='-', help='Report file  [default: stdout]')
+@click.option('-f', '--format', 'report_format', type=click.Choice(['json', 'jsonl', 'junit'], case_sensitive=False), default='json', show_default=True, help='Report format, jsonl reports are written as soon as each image ends')
+@click.option('-v', '--verbose', count=True, help='Tune stderr output verbosity')
+@click.version_option(__version__)
+def batch(elf_files, jobs, cpu, timeout, max_cycles, max_instructions, cache_dir, accelerate, accelerate_check, output, report_format, verbose):
+    ''' Runs every ELF_FILES on thumb2 Instruction Set Simulator, in parallel, and reports their results'''
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, stream=sys.stderr)
+
+    results = []
+    if 'all' in accelerate:
+        accelerate = list(host_routines)
+    for result in runBatch(elf_files, jobs, cpu, timeout, cache_dir, verbose, max_cycles, max_instructions, accelerate, accelerate_check):
+        log.info(f'{result["image"]} ended by {result["reason"]} ({result["cycles"]} cycles simulated in {result["wall_time"]:.3f} s)')
+        if report_format == 'jsonl':
+            writeJsonLine(result, output)
+        results.append(result)
+
+    if report_format == 'json':
+        json.dump(results, output, indent=2)
+        print(file=output)
+    elif report_format == 'junit':
+        writeJUnit(results, output)
+    sys.exit(0 if all(result['exit_code'] == 0 for result in results) else 1)
+
+if __name__ == '__main__':
+    batch()
@@ -0,0 +1,165 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import click
+import logging
+import contextlib
+import io
+import json
+import glob
+import platform
+import statistics
+import sys,time,os
+from concurrent.futures import ProcessPoolExecutor
+from .sim import Simulator
+from .timings import Architecture
+from .thumb2ISS import loadImage, execute
+from .version import __version__
+
+log = logging.getLogger('thumb2ISS.bench')
+
+# prebuilt workloads of the source tree, see bench/build.sh
+bench_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bench')
+
+def peakMemory():
+    ''' Peak resident set size of this process (kB), None where unknown '''
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+def measureWorkload(elf_file, cpu='M4', repeat=3, lazy=True):
+    ''' Loads and runs ELF_FILE repeat times, returns its measures : load time of first run (s, instruction tables
+        set up included) with its breakdown by start up phase, best run time (s), retired instructions, simulated
+        cycles, simulated MIPS (from best run time), peak RSS (kB) and status, 'ok' when every run reached its end of execution with "ok" as output '''
+    measures = {'load_time': None, 'run_time': None, 'instructions': 0, 'cycles': 0, 'mips': 0.0, 'peak_rss': None, 'status': 'ok'}
+    for _ in range(repeat):
+        stdout = io.StringIO()
+        s = Simulator(t_arch=Architecture.fromString(cpu), log_root=log)
+        with contextlib.redirect_stdout(stdout):
+            start = time.perf_counter()
+            if not loadImage(s, elf_file, lazy=lazy):
+                measures['status'] = 'load failed'
+                break
+            loaded = time.perf_counter()
+            reason, measures['instructions'] = execute(s, None)
+            ended = time.perf_counter()
+        measures['cycles'] = s.cycles['total']
+        if reason != 'exit' or stdout.getvalue().strip() != 'ok':
+            measures['status'] = f'{reason}: {stdout.getvalue().strip()}'
+            break
+        if measures['run_time'] is None or ended - loaded < measures['run_time']:
+            measures['run_time'] = ended - loaded
+        if measures['load_time'] is None:
+            measures['load_time'] = loaded - start
+            measures['load_phases'] = dict(s.phases)
+    if measures['run_time']:
+        measures['mips'] = measures['instructions'] / measures['run_time'] / 1e6
+    measures['peak_rss'] = peakMemory()
+    return measures
+
+def runSuite(elf_files, cpu='M4', repeat=3, lazy=True):
+    ''' Measures every workload in its own process, so that peak RSS is its own. Yields (name, measures) '''
+    for elf_file in elf_files:
+        name = os.path.splitext(os.path.basename(elf_file))[0]
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            try:
+                measures = pool.submit(measureWorkload, os.path.abspath(elf_file), cpu, repeat, lazy).result()
+            except Exception as e:
+                measures = {'load_time': None, 'run_time': None, 'instructions': 0, 'cycles': 0, 'mips': 0.0, 'peak_rss': None,
+                    'status': f'{type(e).__name__}: {e}'}
+        yield name, measures
+
+def readHistory(path):
+    ''' Records of previous runs, oldest first '''
+    if path is None or not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if len(line.strip()) > 0]
+
+def newRecord(workloads, cpu):
+    ''' History record of a suite run : host, versions and measures by workload '''
+    return {'date': time.strftime('%Y-%m-%dT%H:%M:%S'), 'version': __version__, 'python': platform.python_version(),
+        'host': platform.node(), 'machine': platform.machine(), 'cpu': cpu, 'workloads': workloads}
+
+def compareHistory(workloads, history, window=5, tolerance=0.1):
+    ''' Compares measures to the last window records of history holding the same workload. Returns
+        {name: (baseline MIPS, ratio to baseline, regressed, changed)}, baseline being the median of their MIPS,
+        regressed when MIPS fell below baseline by more than tolerance, and changed when simulated instructions or
+        cycles differ from the last record (behavior change rather than speed) '''
+    comparison = {}
+    for name, measures in workloads.items():
+        previous = [record['workloads'][name] for record in history if name in record['workloads'] and record['workloads'][name]['status'] == 'ok'][-window:]
+        if len(previous) == 0 or measures['status'] != 'ok':
+            continue
+        baseline = statistics.median(p['mips'] for p in previous)
+        ratio = measures['mips'] / baseline if baseline > 0 else 1.0
+        changed = (measures['instructions'], measures['cycles']) != (previous[-1]['instructions'], previous[-1]['cycles'])
+        comparison[name] = (baseline, ratio, ratio < 1 - tolerance, changed)
+    return comparison
+
+def writeReport(workloads, comparison, f):
+    print(f'{"workload":<12} {"instrs":>10} {"cycles":>10} {"load (s)":>9} {"run (s)":>8} {"MIPS":>7} {"RSS (MB)":>9}  history', file=f)
+    for name, m in workloads.items():
+        if m['status'] != 'ok':
+            print(f'{name:<12} {m["status"]}', file=f)
+            continue
+        rss = f'{m["peak_rss"]/1024:.1f}' if m['peak_rss'] is not None else '-'
+        line = f'{name:<12} {m["instructions"]:>10} {m["cycles"]:>10} {m["load_time"]:>9.3f} {m["run_time"]:>8.3f} {m["mips"]:>7.3f} {rss:>9}'
+        if name in comparison:
+            baseline, ratio, regressed, changed = comparison[name]
+            line += f'  {100*(ratio-1):+.1f}% of {baseline:.3f}'
+            if regressed:
+                line += ' REGRESSION'
+            if changed:
+                line += ' (simulated instructions or cycles changed)'
+        print(line, file=f)
+
+@click.command()
+@click.argument('elf_files', nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option('-c', '--cpu', type=click.Choice(['M0', 'M0+', 'M3', 'M4', 'M23', 'M33'], case_sensitive=False), default='M4', help='Tune target (cycle counting)')
+@click.option('-n', '--repeat', default=3, show_default=True, type=click.IntRange(min=1), help='Runs of each workload, best times being kept')
+@click.option('--eager', is_flag=True, default=False, help='Decode every instruction at load instead of on first execution')
+@click.option('--history', type=click.Path(dir_okay=False), help='JSON lines file of previous runs, which this run is compared to then appended to')
+@click.option('--window', default=5, show_default=True, type=click.IntRange(min=1), help='Count of previous runs whose median MIPS is the baseline')
+@click.option('--tolerance', default=10.0, show_default=True, type=click.FloatRange(min=0), help='MIPS drop (%) below baseline reported as a regression')
+@click.option('-o', '--output', type=click.File('w'), help='JSON record of this run')
+@click.option('-v', '--verbose', count=True, help='Tune stderr output verbosity')
+@click.version_option(__version__)
+def bench(elf_files, cpu, repeat, eager, history, window, tolerance, output, verbose):
+    ''' Measures simulation speed of thumb2 Instruction Set Simulator on ELF_FILES workloads (benchmark suite of the
+        source tree by default) : simulated MIPS, load time and peak RSS, compared to history of previous runs.
+        Exit code is 1 when a workload fails or regresses'''
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, stream=sys.stderr)
+
+    if len(elf_files) == 0:
+        elf_files = sorted(glob.glob(os.path.join(bench_dir, '*.out')))
+        if len(elf_files) == 0:
+            raise click.UsageError(f'No workload found in {bench_dir}')
+
+    workloads = {}
+    for name, measures in runSuite(elf_files, cpu, repeat, not eager):
+        log.info(f'{name} : {measures["status"]}, {measures["mips"]:.3f} MIPS')
+        workloads[name] = measures
+    comparison = compareHistory(workloads, readHistory(history), window, tolerance / 100)
+    writeReport(workloads, comparison, sys.stdout)
+
+    record = newRecord(workloads, cpu)
+    if history is not None:
+        with open(history, 'a') as f:
+            print(json.dumps(record), file=f)
+    if output is not None:
+        json.dump(record, output, indent=2)
+        print(file=output)
+    failed = any(m['status'] != 'ok' for m in workloads.values()) or any(c[2] for c in comparison.values())
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    bench()
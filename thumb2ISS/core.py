@@ -6,76 +6,118 @@
 #
 # License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
 #
-import struct
 import re
 import binascii
 import importlib
 import logging
 import glob
-from .core_routines import Api as coreApi
-from .register import Register
-
-class Singleton(type):
-    _instances = {}
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+from .core_routines import Api as coreApi, condition_codes
+from .register import BitField
+from .decoder import Operands
+from .semihosting import saveHandles, restoreHandles
 
 class EndOfExecutionException(Exception):
-    pass
+    ''' End of execution requested by the target, status being its exit status (0 on success) '''
+    def __init__(self, status=0):
+        super().__init__('End of execution' if status == 0 else f'End of execution with status {status}')
+        self.status = status
+
+def _flag(mask):
+    def get(self):
+        if self.pending is not None:
+            self.materialize()
+        return self._nzcv & mask != 0
+    def set(self, value):
+        self.nzcv = self.nzcv | mask if value else self.nzcv & ~mask
+    return property(get, set)
 
 class ProgramStatus:
     def __init__(self):
-        self.N = False
-        self.Z = False
-        self.C = False
-        self.V = False
+        self._nzcv = 0 # N, Z, C and V flags as bits 3 to 0, column of condition_table
+        self.pending = None # operands of last flag setting addition, until flags are read
         self.Q = False
         self.GE = [False] * 4
         self.ITsteps = 0
         self.ITcond = None
-    
+
+    N = _flag(8)
+    Z = _flag(4)
+    C = _flag(2)
+    V = _flag(1)
+
+    @property
+    def nzcv(self):
+        if self.pending is not None:
+            self.materialize()
+        return self._nzcv
+
+    @nzcv.setter
+    def nzcv(self, value):
+        self.pending = None
+        self._nzcv = value
 
     def update(self, flags):
-        self.N = flags.get('N', self.N)
-        self.Z = flags.get('Z', self.Z)
-        self.C = flags.get('C', self.C)
-        self.V = flags.get('V', self.V)
-        self.Q = flags.get('Q', self.Q)
+        # all flags at once, as given by AddWithCarry : most of them are overwritten before being read,
+        # so they are computed on first read only
+        self.pending = flags
+
+    def materialize(self):
+        x, y, unsigned_sum = self.pending
+        result = unsigned_sum & 0xffffffff
+        # overflow when both operands have the same sign, different from the sign of result
+        self._nzcv = ((result >> 28) & 8) | ((result == 0) << 2) | ((unsigned_sum >> 31) & 2) \
+            | (((x ^ result) & (y ^ result)) >> 31)
+        self.pending = None
 
     def __str__(self):
         ge_bits = ''.join(str(int(v)) for v in self.GE)
         return f'N: {int(self.N)} | Z: {int(self.Z)} | C: {int(self.C)} | V: {int(self.V)} | Q: {int(self.Q)} | GE: {ge_bits[::-1]}'
 
-class Core(coreApi, metaclass=Singleton):
-    def __init__(self, log_root=None, profile=False):
+# instruction patterns of instructions._all by mnemonic, with their regexes compiled (see Core.getPatterns)
+_compiled_patterns = {}
+
+class Core(coreApi):
+    _current = None
+
+    @classmethod
+    def current(cls):
+        ''' Last created core, for code written when Core was a singleton '''
+        return cls._current
+
+    def __init__(self, log_root=None, profile=False, trace=False):
+        Core._current = self
         self.initializeRegisters()
         self.reg_num = {f'{p}{i}':i for i in range(16) for p in 'rR'}
         self.reg_num.update({'SB':0, 'sb':9, 'SL':10, 'sl':10, 'FP':11, 'fp':11, 'IP': 12, 'ip':12, 'SP':13, 'sp':13, 'LR':14, 'lr':14, 'PC':15, 'pc':15})
-        self.bytes_to_Uint = ['', '<B', '<H', '', '<L']
         if log_root is None:
             self.log = logging.getLogger('Core')
         else:
             self.log = log_root.getChild('Core')
         self.instructions = {}
         self.profile = profile
+        # execution details (register writes, memory accesses, branches...) are only logged in trace mode
+        self.trace = trace
         if self.profile:
             self.matched_patterns = {}
             self.exec_called = {}
             self.exec_by_mnem = {}
         from .instructions._all import patterns
         self.instructions = patterns
+        self.factories = {action.__name__:action for mnem in patterns for _, action, _ in patterns[mnem]}
         self.lastUpdatedRegs = []
         self._load_result = 0
         self._store_result = 0
         self._stall_cycle = False
         self._loaded_regs = set()
-
+        # semihosting files opened by the target, and read position in the features file
+        self.sh_handles = {}
+        self.sh_files = {}  # (name, mode) of target files, by handle
+        self.sh_feature_pos = 0
+        self.exit_status = None
 
         if self.profile:
             for mnem in self.instructions:
-                self.matched_patterns[mnem] = {pat[0].pattern:0 for pat in self.instructions[mnem]}
+                self.matched_patterns[mnem] = {pat[0]:0 for pat in self.instructions[mnem]}
                 self.exec_by_mnem[mnem] = []
                 for _, action, _ in self.instructions[mnem]:
                     if action.__name__+'_exec' not in self.exec_by_mnem[mnem]:
@@ -83,8 +125,9 @@ class Core(coreApi, metaclass=Singleton):
                     self.exec_called[action.__name__+'_exec'] = 0
 
     def initializeRegisters(self):
-        self.R = {i:self.Field(0) for i in range(16)}
-        self.R[14] = self.Field(0xffffffff) # initial LR
+        # register file : unsigned 32 bits values as plain ints
+        self.R = [0] * 16
+        self.R[14] = 0xffffffff # initial LR
         self.APSR = ProgramStatus()
         self.pc_updated = False
 
@@ -97,8 +140,10 @@ class Core(coreApi, metaclass=Singleton):
             return self.PC
 
     def writeR(self, reg_id, reg_val):
+        reg_val = self.UInt(reg_val)
         self.R[reg_id] = reg_val
-        self.log.info(f'Setting R{reg_id}={hex(self.UInt(self.Field(reg_val)))}')
+        if self.trace:
+            self.log.info(f'Setting R{reg_id}={hex(reg_val)}')
         self.lastUpdatedRegs.append(reg_id)
 
     @property
@@ -129,8 +174,31 @@ class Core(coreApi, metaclass=Singleton):
     def configure(self, pc, sp, mem):
         self.initializeRegisters()
         self.memory = mem
-        self.R[15] = self.Field(pc & 0xfffffffe)
-        self.R[13] = self.Field(sp)
+        self.R[15] = pc & 0xfffffffe
+        self.R[13] = sp & 0xffffffff
+        # exit status of the target, once it ended its execution
+        self.exit_status = None
+
+    def saveState(self):
+        ''' Registers, flags and pipeline state as plain values (see Simulator.snapshot) '''
+        apsr = self.APSR
+        return {
+            'R' : list(self.R),
+            'APSR' : (apsr._nzcv, apsr.pending, apsr.Q, list(apsr.GE), apsr.ITsteps, apsr.ITcond),
+            'pipeline' : (self.pc_updated, self._load_result, self._store_result, self._stall_cycle,
+                set(self._loaded_regs), list(self.lastUpdatedRegs)),
+            'semihosting' : saveHandles(self),
+        }
+
+    def restoreState(self, state):
+        apsr = self.APSR
+        self.R[:] = state['R']
+        (apsr._nzcv, apsr.pending, apsr.Q, GE, apsr.ITsteps, apsr.ITcond) = state['APSR']
+        apsr.GE = list(GE)
+        (self.pc_updated, self._load_result, self._store_result, self._stall_cycle, loaded_regs, last_updated) = state['pipeline']
+        self._loaded_regs = set(loaded_regs)
+        self.lastUpdatedRegs = list(last_updated)
+        restoreHandles(self, state['semihosting'])
 
     def getPC(self):
         return self.UInt(self.R[15])
@@ -184,6 +252,14 @@ class Core(coreApi, metaclass=Singleton):
         print(f'pc: {hex(self.UInt(self.R[15]))}')
         print(' '*indent, self.APSR, sep='')
 
+    def getPatterns(self, mnem):
+        ''' (regex, factory, bitdiffs) of mnem, its regexes being compiled on its first use by any core '''
+        compiled = _compiled_patterns.get(mnem)
+        if compiled is None:
+            compiled = [(re.compile(pat, re.I), action, bitdiffs) for pat, action, bitdiffs in self.instructions.get(mnem, [])]
+            _compiled_patterns[mnem] = compiled
+        return compiled
+
     def getExec(self, mnem, full_assembly, expected_pc, timings=None):
         m = None
         if mnem.upper() not in self.instructions:
@@ -197,48 +273,82 @@ class Core(coreApi, metaclass=Singleton):
                     if mnem.upper().endswith(legal_cond):
                         mnem = mnem[:-2]
                         break
-        for pat, action, bitdiffs in self.instructions.get(mnem.upper(), []):
+        for pat, action, bitdiffs in self.getPatterns(mnem.upper()):
             m = pat.match(full_assembly)
             if m is not None:
                 break
         if m is not None:
             if self.profile:
                 self.matched_patterns[mnem.upper()][pat.pattern] += 1
-            instr_exec = action(self, m, bitdiffs)
-            if timings is not None:
-                instr_timing = timings.getTiming(mnem.upper(), expected_pc)
-            else:
-                instr_timing = 1
-            def mnem_exec():
-                try:
-                    assert(expected_pc == self.UInt(self.R[15]))
-                except:
-                    raise Exception(f'{full_assembly} Expected PC to be {hex(expected_pc)} but was {hex(self.UInt(self.R[15]))}')
-                if self.profile:
-                    self.exec_called[instr_exec.__name__] += 1
-                instr_exec()
-                return instr_timing
-            return mnem_exec
+            instr_exec = action(self, self.intOperands(m.groupdict()), bitdiffs)
+            return self.wrapExec(instr_exec, mnem.upper(), full_assembly, expected_pc, timings)
 
         if mnem.upper() not in ['CPSIE', 'CPSID', 'DMB', 'DSB', 'ISB', 'WFE', 'WFI', 'SEV', 'SVC', 'PLD', 'PLI']:
             print(self.instructions.get(mnem.upper(), []))
             raise Exception(f'Unmanaged {mnem} : {full_assembly}')
+        return self.nopExec(mnem)
+
+    def getDecodedExec(self, decoded, expected_pc, timings=None):
+        ''' Same as getExec for an instruction decoded from its encoding (see decoder.Decoder) '''
+        if decoded.factory is None:
+            return self.nopExec(decoded.mnem)
+        instr_exec = self.factories[decoded.factory](self, self.intOperands(decoded.operands), decoded.bitdiffs)
+        return self.wrapExec(instr_exec, decoded.mnem, decoded, expected_pc, timings)
+
+    def intOperands(self, groups):
+        # immediate is involved in arithmetic with register values, which are plain ints,
+        # conditions are looked up by code (see ConditionPassed)
+        operands = Operands(groups)
+        if operands.get('imm32') is not None:
+            operands['imm32'] = int(operands['imm32'], 0)
+        for name in ['c', 'firstcond']:
+            if operands.get(name) is not None:
+                operands[name] = condition_codes[operands[name].lower()]
+        return operands
+
+    def getUndefinedExec(self, encoding, expected_pc):
+        def undefined_exec():
+            raise Exception(f'Undefined instruction {encoding.hex()} at {hex(expected_pc)}')
+        undefined_exec.action = undefined_exec
+        undefined_exec.timing = 1
+        return undefined_exec
+
+    def wrapExec(self, instr_exec, mnem, full_assembly, expected_pc, timings=None):
+        if timings is not None:
+            instr_timing = timings.getTiming(mnem, expected_pc)
+        else:
+            instr_timing = 1
+        def mnem_exec():
+            try:
+                assert(expected_pc == self.UInt(self.R[15]))
+            except:
+                raise Exception(f'{full_assembly} Expected PC to be {hex(expected_pc)} but was {hex(self.UInt(self.R[15]))}')
+            if self.profile:
+                self.exec_called[instr_exec.__name__] += 1
+            instr_exec()
+            return instr_timing
+        # unwrapped execution, used by basic block engine (see Simulator.compileBlock)
+        mnem_exec.action = instr_exec
+        mnem_exec.timing = instr_timing
+        return mnem_exec
+
+    def nopExec(self, mnem):
         def debug_exec():
             self.log.warning(f'Unsupported {mnem} executed as NOP')
             return 1
+        debug_exec.action = debug_exec
+        debug_exec.timing = 1
         return debug_exec
 
-    def Exit(self):
-        raise EndOfExecutionException(f'End of execution')
+    def Exit(self, status=0):
+        self.exit_status = status
+        raise EndOfExecutionException(status)
     
     def Field(self, value, msb=31, lsb=0):
-        mask = (0xffffffff >> (31 - msb + lsb)) << lsb
         if type(value) != int:
             value = self.UInt(value)
-        val = (value & mask) >> lsb
-
-        reg_res = Register(struct.pack('<L', val))
-        reg_res._msb = msb - lsb
-        return reg_res
+        if msb == 31 and lsb == 0:
+            return value & 0xffffffff
+        return BitField((value >> lsb) & (0xffffffff >> (31 - msb + lsb)), msb - lsb)
         
 
@@ -6,10 +6,21 @@
 #
 # License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
 #
-from .register import Register
-import struct
+from .register import BitField
 from .semihosting import ExecuteCmd as semihostExecuteCmd
 
+# condition codes, in encoding order ('hs' and 'lo' being aliases of 'cs' and 'cc')
+condition_codes = {name: code for code, names in enumerate(['eq', 'ne', 'cs hs', 'cc lo', 'mi', 'pl', 'vs', 'vc',
+    'hi', 'ls', 'ge', 'lt', 'gt', 'le', 'al', 'nv']) for name in names.split()}
+
+def _conditionHolds(cond, nzcv):
+    n, z, c, v = (nzcv >> 3) & 1, (nzcv >> 2) & 1, (nzcv >> 1) & 1, nzcv & 1
+    result = [z, c, n, v, c and not z, n == v, not z and n == v, True][cond >> 1]
+    return bool(result) != (cond & 1 == 1 and cond != 15)
+
+# outcome of each condition code (row) for each NZCV flags value (column, see ProgramStatus.nzcv)
+condition_table = [[_conditionHolds(cond, nzcv) for nzcv in range(16)] for cond in range(16)]
+
 
 class Api():
 
@@ -18,21 +29,18 @@ class Api():
         return abs(x)
 
     def AddWithCarry(self, x, y, carry_in):
-        unsigned_sum = self.UInt(x) + self.UInt(y) + self.UInt(carry_in)
-        signed_sum = self.SInt(x) + self.SInt(y) + self.UInt(carry_in);
-        result = self.Field(unsigned_sum, 31, 0) # same value as signed_sum<N-1:0>
-        nzcv = {'N': self.Bit(result, 31),
-                'Z' : self.IsZero(result),
-                'C' : self.UInt(result) != unsigned_sum,
-                'V' : self.SInt(result) != signed_sum
-                }
-        carry_out = nzcv['C']
-        self.log.info(f'Carry is {carry_out} because result {hex(self.UInt(result))} vs {hex(unsigned_sum)}')
-        return (result, nzcv)
+        x = self.UInt(x)
+        y = self.UInt(y)
+        unsigned_sum = x + y + self.UInt(carry_in)
+        result = unsigned_sum & 0xffffffff # same value as signed_sum<N-1:0>
+        if self.trace:
+            carry_out = unsigned_sum != result
+            self.log.info(f'Carry is {carry_out} because result {hex(result)} vs {hex(unsigned_sum)}')
+        # flags are only computed if they are read (see ProgramStatus.update)
+        return (result, (x, y, unsigned_sum))
 
     def Align(self, reg_value, boundary):
-        address = self.UInt(reg_value) & (-boundary)
-        return Register(struct.pack('<L', address))
+        return self.UInt(reg_value) & (-boundary)
 
     def ALUException(self, address):
         raise Exception(f'ALUException @ {hex(self.UInt(address))}')
@@ -59,8 +67,8 @@ class Api():
         return False
 
     def Bit(self, value, bit_pos=31):
-        if type(value) == bytes or type(value) == Register:
-            return (self.UInt(value) & (1 << bit_pos)) != 0
+        if type(value) == bytes:
+            value = self.UInt(value)
         elif type(value) == str:
             value = int(value, 0)
         return (value & (1 << bit_pos)) != 0
@@ -70,8 +78,9 @@ class Api():
             self.LR = self.R[15] + 5
         elif branchType == 'INDCALL':
             self.LR = self.R[15] + 3
-        self.log.info(f'Branching to {hex(self.UInt(targetAddress))}' + (f' with link back to {hex(self.UInt(self.LR))}' if branchType.endswith('CALL') else ''))
-        self.PC = Register(targetAddress & (~1))
+        if self.trace:
+            self.log.info(f'Branching to {hex(self.UInt(targetAddress))}' + (f' with link back to {hex(self.UInt(self.LR))}' if branchType.endswith('CALL') else ''))
+        self.PC = self.UInt(targetAddress) & (~1)
 
     def BXWritePC(self, targetAddress, branchType):
         self.BranchWritePC(targetAddress, branchType)
@@ -93,24 +102,9 @@ class Api():
         pass
 
     def ConditionPassed(self, cond):
+        # cond is a condition code, resolved from its name when the instruction is decoded (see Core.intOperands)
         if cond is None: return True
-        cond = cond.upper()
-        if cond == 'EQ': return (self.APSR.Z == True)
-        if cond == 'NE': return (self.APSR.Z == False)
-        if cond == 'CS': return (self.APSR.C == True)
-        if cond == 'CC': return (self.APSR.C == False)
-        if cond == 'MI': return (self.APSR.N == True)
-        if cond == 'PL': return (self.APSR.N == False)
-        if cond == 'VS': return (self.APSR.V == True)
-        if cond == 'VC': return (self.APSR.V == False)
-        if cond == 'HI': return (self.APSR.C == True and self.APSR.Z == False)
-        if cond == 'LS': return (self.APSR.C == False or self.APSR.Z == True)
-        if cond == 'GE': return (self.APSR.N == self.APSR.V)
-        if cond == 'LT': return (self.APSR.N != self.APSR.V)
-        if cond == 'GT': return (self.APSR.Z == False and self.APSR.N == self.APSR.V)
-        if cond == 'LE': return (self.APSR.Z == True or self.APSR.N != self.APSR.V)
-        if cond == 'AL' or cond == '': return True
-        raise Exception(f'Illegal condition : {cond}')
+        return condition_table[cond][self.APSR.nzcv]
 
     def CountLeadingZeroBits(self, x):
         return 32 - (self.HighestSetBit(x) + 1)
@@ -139,11 +133,9 @@ class Api():
         return False #(self.UInt(address) & (size-1)) == 0
 
     def IsZero(self, value):
-        if type(value) == Register:
-            return (value.ival == 0)
-        elif type(value) == bytes:
+        if type(value) == bytes:
             return (self.UInt(value) == 0)
-        return (int(value) == 0)
+        return (int(value) & 0xffffffff == 0)
 
     def IsZeroBit(self, value):
         return self.IsZero(value)
@@ -223,14 +215,11 @@ class Api():
     def ReadMemU(self, address, size):
         self._load_result += 1
         assert(size in [1,2,4])
-        try:
-            byte_seq = b''.join(self.memory[i] for i in range(address.ival, address.ival + size))
-        except KeyError:
-            raise Exception(f'Illegal memory access between {hex(address.ival)} and {hex(address.ival + size - 1)}')
-
         # load as unsigned
-        value = struct.unpack(self.bytes_to_Uint[size], byte_seq)[0]
-        self.log.info(f'Read {size} bytes as unsigned from {hex(address.ival)} : {hex(value)}')
+        address = self.UInt(address)
+        value = self.memory.read(address, size)
+        if self.trace:
+            self.log.info(f'Read {size} bytes as unsigned from {hex(address)} : {hex(value)}')
         return self.Field(value, msb=8*size-1)
 
     def ReadSpecReg(self, spec_reg):
@@ -334,53 +323,46 @@ class Api():
 
     def SignExtend(self, candidate, bitsize, msb=None, lsb=None):
 
-        in_c = candidate
         if type(candidate) is str and ('0' in candidate or '1' in candidate):
-            value = int(candidate, 2)
-            msb = len(candidate)
-            candidate = self.Field(value)
-            candidate._msb = msb
+            candidate = BitField(int(candidate, 2), len(candidate) - 1)
         elif msb is not None:
             candidate = self.Field(candidate, msb, lsb)
-        elif type(candidate) != Register:
-            candidate = self.Field(candidate)
 
-        # get unsigned representation of value
-        value = self.UInt(candidate)
+        # get unsigned representation of value and its sign bit position
+        if type(candidate) is BitField:
+            value = int(candidate)
+            sign_pos = candidate._msb
+        else:
+            value = self.UInt(candidate)
+            sign_pos = 31
 
-        # test sign bit
-        sign_bit = value & (1 << candidate._msb)
-        if sign_bit:
+        in_value = value
+        if value & (1 << sign_pos):
             # sign extend
-            value = value | ((0xFFFFFFFF << candidate._msb) & 0xFFFFFFFF)
+            value = value | ((0xFFFFFFFF << sign_pos) & 0xFFFFFFFF)
 
-        self.log.info(f'SignExtended {self.UInt(in_c)} to {hex(value)}')
+        if self.trace:
+            self.log.info(f'SignExtended {hex(in_value)} to {hex(value)}')
         return self.Field(value, msb=bitsize-1)
 
     def SignExtendSubField(self, candidate, msb, lsb, bitsize):
         return self.SignExtend(candidate, bitsize, msb, lsb)
     
     def SInt(self, value, highValue=None):
-        if type(value) == Register:
-            value = self.SignExtend(value, 32).ival
-        elif value == '0' or value == '1':
+        if type(value) is BitField:
+            # sign bit of a field is its most significant one
+            sign_pos = value._msb
             value = int(value)
-        elif type(value) == str:
-            value = int(value, 0)
-
-        if type(value) == int:
-            if value < 0:
-                value = struct.pack('<l', value)
-            else:
-                value = struct.pack('<L', value)
-
-        if type(value) == bytes:
-            value = struct.unpack('<l', value)[0]
+        else:
+            value = self.UInt(value)
+            sign_pos = 31
+        if value & (1 << sign_pos):
+            value -= 2 << sign_pos
 
         if highValue is not None:
-            highValue = self.UInt(highValue)
-            combo = struct.pack('<lL', value, highValue)
-            value = struct.unpack('<q', combo)[0]
+            value = (value & 0xffffffff) | (self.UInt(highValue) << 32)
+            if value & (1 << 63):
+                value -= 1 << 64
 
         return value
 
@@ -393,32 +375,29 @@ class Api():
             self.log.info(f'Breakpoint #{hex(value)} executed as NOP')
 
     # T
+    def T32ExpandImmCarry(self, imm32):
+        ''' Carry out of T32ExpandImm_C, from expanded constant : unchanged C unless constant is rotated '''
+        imm32 = self.UInt(imm32)
+        low = imm32 & 0xff
+        if imm32 in (low, low * 0x00010001, ((imm32 >> 8) & 0xff) * 0x01000100, low * 0x01010101):
+            return self.APSR.C
+        return imm32 >= 0x80000000
 
     # U
 
     def UInt(self, value, highValue=None):
-        if type(value) == Register:
-            value = value.bval
-        elif value == '0' or value == '1':
-            value = int(value)
-        elif type(value) == str:
-            value = int(value, 0)
-
-        if type(value) == int:
-            if value < 0:
-                if value < -2**31:
-                    print(hex(value))
-                value = struct.pack('<l', value)
+        if type(value) is not int:
+            if type(value) == str:
+                value = int(value, 0)
+            elif type(value) == bytes:
+                value = int.from_bytes(value, 'little')
             else:
-                value = struct.pack('<L', value)
-
-        if type(value) == bytes:
-            value = struct.unpack('<L', value)[0]
+                # bit field or boolean
+                value = int(value)
+        value &= 0xffffffff
 
         if highValue is not None:
-            highValue = self.UInt(highValue)
-            combo = struct.pack('<LL', value, highValue)
-            value = struct.unpack('<Q', combo)[0]
+            value |= self.UInt(highValue) << 32
         return value
         
     def UnsignedSat(self, i, N):
@@ -452,15 +431,11 @@ class Api():
     def WriteMemU(self, address, size, value):
         assert(size in [1,2,4])
         self._store_result += 1
+        address = self.UInt(address)
         value = self.UInt(value)
-        self.log.info(f'Write {size} bytes as unsigned to {hex(address.ival)} : {hex(value)}')
-        try:
-            i=0
-            for b in value.to_bytes(size, byteorder='little'):
-                self.memory[address.ival+i] = b.to_bytes(1, byteorder='little')
-                i+=1
-        except KeyError:
-            raise Exception(f'Illegal memory access between {hex(address.ival)} and {hex(address.ival + size - 1)}')
+        if self.trace:
+            self.log.info(f'Write {size} bytes as unsigned to {hex(address)} : {hex(value)}')
+        self.memory.write(address, size, value)
 
 
     def WriteSpecReg(self, spec_reg, value):
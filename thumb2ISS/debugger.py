@@ -11,12 +11,14 @@ from InquirerPy.prompts.expand import ExpandChoice
 from InquirerPy.base.control import Choice
 from InquirerPy.separator import Separator
 import re, os
-from .sim import Simulator, Core
+from .sim import Simulator
 
 
 class Debugger():
-    def __init__(self):
-        sim = Simulator()
+    def __init__(self, sim=None):
+        if sim is None:
+            sim = Simulator.current()
+        self.sim = sim
         self.symbols = sim.getSymbols()
         self.symb_completer = { k:None for k in self.symbols }
         self.regwrite_pat = re.compile(r'r(?P<reg_id>\d+)\s*(?P<op>[+-|&])?=\s*(?P<not>~)?(?P<imm>[\dxa-f]+)\s*', re.I)
@@ -37,30 +39,30 @@ class Debugger():
     ]
 
     def step_over(self):
-        Simulator().step_over()
+        self.sim.step_over()
 
     def step_in(self):
-        Simulator().step_in()
+        self.sim.step_in()
 
     def step_out(self):
-        Simulator().step_out()
+        self.sim.step_out()
 
     def run(self):
-        Simulator().run()
+        self.sim.run()
 
     def reset(self):
-        Simulator().reset()
+        self.sim.reset()
 
 
     def until(self):
         address = self.querySymbol()
         if address is not None:
-            Simulator().run_until(address)
+            self.sim.run_until(address)
 
     def break_at(self):
         address = self.querySymbol()
         if address is not None:
-            Simulator().addBreakpoint(address)
+            self.sim.addBreakpoint(address)
 
     def get_symbol(self, candidate):
         if candidate in self.symbols:
@@ -69,7 +71,7 @@ class Debugger():
             candidate = int(candidate,0)
         except:
             candidate = -1
-        if Simulator().isAddressValid(candidate):
+        if self.sim.isAddressValid(candidate):
             return candidate
         return None
 
@@ -85,7 +87,7 @@ class Debugger():
         ).execute()
 
     def break_edit(self):
-        sim = Simulator()
+        sim = self.sim
         original_bkpt_list = sim.getBreakPoints()
         if len(original_bkpt_list) > 0:
             choices = [Choice(bkpt, hex(bkpt), True) for bkpt in original_bkpt_list]
@@ -106,7 +108,7 @@ class Debugger():
 
 
     def mem_edit(self):
-        sim = Simulator()
+        sim = self.sim
         address = self.querySymbol()
         if address is not None:
             data_size = inquirer.select(
@@ -123,9 +125,7 @@ class Debugger():
                 mandatory=False
             ).execute()
             if data_size is not None:
-                raw_data = b''.join(sim.memory[i] for i in range(address, address+data_size))
-
-                udata = int.from_bytes(raw_data, byteorder='little')
+                udata = sim.memory.read(address, data_size)
                 ndata = inquirer.text(
                     message=f"Current val ({hex(udata)}), new val : (Ctrl-Z to cancel)",
                     validate=lambda result:self.get_value(result) is not None,
@@ -135,10 +135,7 @@ class Debugger():
                     mandatory=False,
                 ).execute()
                 if ndata is not None:            
-                    i = 0
-                    for b in ndata.to_bytes(data_size, byteorder='little'):
-                        sim.memory[address+i] = b.to_bytes(1, byteorder='little')
-                        i+=1
+                    sim.memory.write(address, data_size, ndata)
 
     def get_regwrite(self, result):
         if result is not None:
@@ -154,17 +151,17 @@ class Debugger():
                 if m.group('not'):
                     val = ~val
                 def exec_regwrite():
-                    core = Core()
+                    core = self.sim.core
                     if op is None or op == '':
                         core.R[reg_id] = core.Field(val)
                     elif op == '+':
-                        core.R[reg_id] = core.R[reg_id] + val
+                        core.R[reg_id] = core.Field(core.R[reg_id] + val)
                     elif op == '-':
-                        core.R[reg_id] = core.R[reg_id] - val
+                        core.R[reg_id] = core.Field(core.R[reg_id] - val)
                     elif op == '|':
-                        core.R[reg_id] = core.R[reg_id] | val
+                        core.R[reg_id] = core.Field(core.R[reg_id] | val)
                     elif op == '&':
-                        core.R[reg_id] = core.R[reg_id] & val
+                        core.R[reg_id] = core.Field(core.R[reg_id] & val)
                 return exec_regwrite
         return None
 
@@ -179,12 +176,11 @@ class Debugger():
         ).execute()
         if action is not None:
             action()
-            print(Core().R[1].ival, Core())
-            Core().showRegisters()
+            self.sim.core.showRegisters()
 
     def loop(self):
         cmd = True
-        sim = Simulator()
+        sim = self.sim
         while cmd:
             os.system('cls')
             # display disassembly
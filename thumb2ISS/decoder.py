@@ -0,0 +1,679 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+from collections import namedtuple
+
+conditions = ['eq', 'ne', 'cs', 'cc', 'mi', 'pl', 'vs', 'vc', 'hi', 'ls', 'ge', 'lt', 'gt', 'le', 'al']
+reg_names = [f'r{i}' for i in range(13)] + ['sp', 'lr', 'pc']
+spec_regs = {0: 'apsr', 1: 'iapsr', 2: 'eapsr', 3: 'xpsr', 5: 'ipsr', 6: 'epsr', 7: 'iepsr', 8: 'msp', 9: 'psp',
+             16: 'primask', 17: 'basepri', 18: 'basepri_max', 19: 'faultmask', 20: 'control'}
+
+# encoding fields holding a register number
+_reg_fields = ['Rd', 'Rn', 'Rm', 'Rt', 'Rt2', 'Ra', 'Rs', 'RdLo', 'RdHi', 'Rdn', 'Rdm']
+# encoding fields given to instruction factories as bitdiffs
+_bitdiff_fields = ['S', 'P', 'U', 'W', 'H', 'op', 'N', 'M', 'R', 'T', 'tb', 'sh', 'DN']
+
+
+class Operands(dict):
+    ''' Operand groups of a decoded instruction, handed to instruction factories in place of a regex match '''
+    def groupdict(self):
+        return self
+
+
+class Decoded(namedtuple('Decoded', 'mnem factory operands bitdiffs length')):
+    ''' Decoded instruction : timing mnemonic, factory name (None for hints executed as NOP), operands and bitdiffs '''
+    def __str__(self):
+        return formatAssembly(self)
+
+
+def instructionLength(halfword):
+    ''' Size in bytes of the instruction starting with halfword '''
+    return 4 if halfword >> 11 in (0b11101, 0b11110, 0b11111) else 2
+
+
+def _signExtend(value, bits):
+    return value - (1 << bits) if value >> (bits - 1) else value
+
+
+def _thumbExpandImm(imm12):
+    imm8 = imm12 & 0xff
+    if imm12 >> 10 == 0:
+        return [imm8, imm8 << 16 | imm8, imm8 << 24 | imm8 << 8, imm8 * 0x01010101][(imm12 >> 8) & 3]
+    unrotated = 0x80 | (imm12 & 0x7f)
+    rotation = imm12 >> 7
+    return ((unrotated >> rotation) | (unrotated << (32 - rotation))) & 0xffffffff
+
+
+def _decodeImmShift(stype, imm5):
+    if stype == 0:
+        return 'lsl', imm5
+    if stype == 3:
+        return ('rrx', 0) if imm5 == 0 else ('ror', imm5)
+    return ['lsl', 'lsr', 'asr'][stype], imm5 if imm5 else 32
+
+
+def _regList(bitmap):
+    return ', '.join(reg_names[i] for i in range(16) if bitmap >> i & 1)
+
+
+# operand builders : fill operands from encoding fields, returning False rejects the encoding
+
+def _imm(f, ops, address, scale=1):
+    ops['imm32'] = str(f.get('imm8', f.get('imm5', f.get('imm7', f.get('imm3', 0)))) * scale)
+
+def _imm2(f, ops, address):
+    _imm(f, ops, address, 2)
+
+def _imm4(f, ops, address):
+    _imm(f, ops, address, 4)
+
+def _hexImm(f, ops, address):
+    ops['imm32'] = hex(f.get('imm4', 0) << 12 | f.get('imm12', f.get('imm8', 0)))
+
+def _imm12(f, ops, address):
+    ops['imm32'] = str(f.get('i', 0) << 11 | f.get('imm3', 0) << 8 | f['imm8'] if 'imm3' in f else f['imm12'])
+
+def _imm16(f, ops, address):
+    ops['imm32'] = str(f['imm4'] << 12 | f['i'] << 11 | f['imm3'] << 8 | f['imm8'])
+
+def _modImm(f, ops, address):
+    ops['imm32'] = str(_thumbExpandImm(f['i'] << 11 | f['imm3'] << 8 | f['imm8']))
+
+def _imm8PUW(f, ops, address):
+    if f['P'] == 0 and f['W'] == 0:
+        return False
+    ops['imm32'] = str(f['imm8'])
+    ops['wback'] = '!' if f['W'] else None
+
+def _dual(f, ops, address):
+    if f.get('P', 1) == 0 and f.get('W', 0) == 0:
+        return False
+    ops['imm32'] = str(f['imm8'] * 4)
+    if 'W' in f:
+        ops['wback'] = '!' if f['W'] else None
+
+def _literal(f, ops, address):
+    # factories compute the address from Align(PC, 4), imm32 and U
+    ops['Rn'] = 'pc'
+    ops['imm32'] = str(f.get('imm12', f.get('imm8', 0) * 4))
+
+def _adr(f, ops, address):
+    imm32 = f['imm8'] * 4 if 'i' not in f else f['i'] << 11 | f['imm3'] << 8 | f['imm8']
+    ops['imm32'] = str(imm32)
+
+def _regOffset(f, ops, address):
+    ops['shift_t'] = 'lsl'
+    ops['shift_n'] = str(f.get('imm2', 0))
+
+def _immShift(f, ops, address):
+    stype = f.get('stype', f.get('tb', 0) << 1)
+    shift_t, shift_n = _decodeImmShift(stype, f.get('imm3', 0) << 2 | f.get('imm2', 0) if 'imm3' in f else f.get('imm5', 0))
+    ops['shift_t'] = shift_t
+    ops['shift_n'] = str(shift_n)
+
+def _rotation(f, ops, address):
+    ops['shift_t'] = 'ror'
+    ops['rotation'] = str(f['rotate'] * 8)
+
+def _sat(f, ops, address):
+    ops['imm32'] = str(f['sat_imm'] + (1 if f['signed'] else 0))
+    if 'imm3' in f:
+        ops['shift_t'] = 'asr' if f['sh'] else 'lsl'
+        ops['shift_n'] = str(f['imm3'] << 2 | f['imm2'])
+
+def _bitfield(f, ops, address):
+    lsb = f['imm3'] << 2 | f['imm2']
+    width = f['widthm1'] + 1 if 'widthm1' in f else f['msb'] - lsb + 1
+    if width <= 0:
+        return False
+    ops['lsb'] = str(lsb)
+    ops['width'] = str(width)
+
+def _hiRegs(f, ops, address):
+    if 'DN' in f:
+        ops['Rdn'] = reg_names[f['DN'] << 3 | f['Rdn']]
+    if 'N' in f:
+        ops['Rn'] = reg_names[f['N'] << 3 | f['Rn']]
+    if 'D' in f:
+        ops['Rd'] = reg_names[f['D'] << 3 | f['Rd']]
+    if 'DM' in f:
+        ops['Rdm'] = reg_names[f['DM'] << 3 | f['Rdm']]
+
+def _registers(f, ops, address):
+    bitmap = f['registers'] | f.get('M', 0) << 14 | f.get('P', 0) << 15
+    if bitmap == 0:
+        return False
+    ops['registers'] = _regList(bitmap)
+    if 'W' in f:
+        ops['wback'] = '!' if f['W'] else None
+    elif 'Rn' in f and f.get('load', 0):
+        ops['wback'] = None if bitmap >> f['Rn'] & 1 else '!'
+
+def _branch(f, ops, address):
+    if 'cond' in f:
+        if f['cond'] >= 14:
+            return False
+        ops['c'] = conditions[f['cond']]
+    if 'imm11' not in f:
+        offset = _signExtend(f['imm8'] << 1, 9)
+    elif 'imm6' in f:
+        offset = _signExtend(f['S'] << 20 | f['J2'] << 19 | f['J1'] << 18 | f['imm6'] << 12 | f['imm11'] << 1, 21)
+    elif 'imm10' in f:
+        I1 = 1 ^ f['J1'] ^ f['S']
+        I2 = 1 ^ f['J2'] ^ f['S']
+        offset = _signExtend(f['S'] << 24 | I1 << 23 | I2 << 22 | f['imm10'] << 12 | f['imm11'] << 1, 25)
+    else:
+        offset = _signExtend(f['imm11'] << 1, 12)
+    ops['abs_address'] = hex((address + 4 + offset) & 0xffffffff)
+
+def _cbz(f, ops, address):
+    ops['abs_address'] = hex(address + 4 + (f['i'] << 6 | f['imm5'] << 1))
+
+def _it(f, ops, address):
+    mask = f['mask']
+    if mask == 0 or f['firstcond'] == 15:
+        return False
+    count = 4 - (mask & -mask).bit_length()
+    ops['firstcond'] = conditions[f['firstcond']]
+    ops['mask'] = ''.join('t' if (mask >> (3 - i) & 1) == (f['firstcond'] & 1) else 'e' for i in range(count))
+    if f['firstcond'] == 14 and 'e' in ops['mask']:
+        return False
+
+def _specReg(f, ops, address):
+    if f['SYSm'] not in spec_regs:
+        return False
+    ops['spec_reg'] = spec_regs[f['SYSm']]
+
+
+# timing mnemonics depending on encoding fields
+
+def _shiftMnem(f):
+    stype = f.get('stype', f.get('op', 0))
+    imm5 = f.get('imm3', 0) << 2 | f.get('imm2', 0) if 'imm3' in f else f.get('imm5', 1)
+    if stype == 0 and imm5 == 0:
+        return 'MOV{S}'
+    if stype == 3 and imm5 == 0:
+        return 'RRX{S}'
+    return ['LSL', 'LSR', 'ASR', 'ROR'][stype] + '{S}'
+
+def _parallelMnem(f):
+    prefix = {0b000: 'S', 0b001: 'Q', 0b010: 'SH', 0b100: 'U', 0b101: 'UQ', 0b110: 'UH'}.get(f['prefix'])
+    op = {0b001: 'ADD16', 0b010: 'ASX', 0b110: 'SAX', 0b101: 'SUB16', 0b000: 'ADD8', 0b100: 'SUB8'}.get(f['op1'])
+    if prefix is None or op is None:
+        return None
+    return prefix + op
+
+_xy = lambda f: 'BT'[f['N']] + 'BT'[f['M']]
+_x = lambda f: 'X' if f['M'] else ''
+
+
+# encoding diagrams, most significant bit first, 'name:width' for fields, 'x' for don't care bits,
+# 32-bit encodings give both halfwords separated by '|'
+# (diagram, timing mnemonic, factory name, operand builder, static operands)
+_thumb16 = [
+    ('0001100 Rm:3 Rn:3 Rd:3',         'ADD{S}',   'ADD_r_T1_A',    None,        {}),
+    ('0001101 Rm:3 Rn:3 Rd:3',         'SUB{S}',   'SUB_r_T1_A',    None,        {}),
+    ('0001110 imm3:3 Rn:3 Rd:3',       'ADD{S}',   'ADD_i_T1_A',    _imm,        {}),
+    ('0001111 imm3:3 Rn:3 Rd:3',       'SUB{S}',   'SUB_i_T1_A',    _imm,        {}),
+    ('000 stype:2 imm5:5 Rm:3 Rd:3',   _shiftMnem, 'MOV_r_T2_A',    _immShift,   {}),
+    ('00100 Rd:3 imm8:8',              'MOV{S}',   'MOV_i_T1_A',    _imm,        {}),
+    ('00101 Rn:3 imm8:8',              'CMP',      'CMP_i_T1_A',    _imm,        {}),
+    ('00110 Rdn:3 imm8:8',             'ADD{S}',   'ADD_i_T2_A',    _imm,        {}),
+    ('00111 Rdn:3 imm8:8',             'SUB{S}',   'SUB_i_T2_A',    _imm,        {}),
+    ('0100000000 Rm:3 Rdn:3',          'AND{S}',   'AND_r_T1_A',    None,        {}),
+    ('0100000001 Rm:3 Rdn:3',          'EOR{S}',   'EOR_r_T1_A',    None,        {}),
+    ('0100000010 Rs:3 Rdm:3',          'LSL{S}',   'MOV_rr_T1_A',   None,        {'shift_t': 'lsl'}),
+    ('0100000011 Rs:3 Rdm:3',          'LSR{S}',   'MOV_rr_T1_A',   None,        {'shift_t': 'lsr'}),
+    ('0100000100 Rs:3 Rdm:3',          'ASR{S}',   'MOV_rr_T1_A',   None,        {'shift_t': 'asr'}),
+    ('0100000101 Rm:3 Rdn:3',          'ADC{S}',   'ADC_r_T1_A',    None,        {}),
+    ('0100000110 Rm:3 Rdn:3',          'SBC{S}',   'SBC_r_T1_A',    None,        {}),
+    ('0100000111 Rs:3 Rdm:3',          'ROR{S}',   'MOV_rr_T1_A',   None,        {'shift_t': 'ror'}),
+    ('0100001000 Rm:3 Rn:3',           'TST',      'TST_r_T1_A',    None,        {}),
+    ('0100001001 Rn:3 Rd:3',           'RSB{S}',   'RSB_i_T1_A',    None,        {'imm32': '0'}),
+    ('0100001010 Rm:3 Rn:3',           'CMP',      'CMP_r_T1_A',    None,        {}),
+    ('0100001011 Rm:3 Rn:3',           'CMN',      'CMN_r_T1_A',    None,        {}),
+    ('0100001100 Rm:3 Rdn:3',          'ORR{S}',   'ORR_r_T1_A',    None,        {}),
+    ('0100001101 Rn:3 Rdm:3',          'MUL{S}',   'MUL_T1_A',      None,        {}),
+    ('0100001110 Rm:3 Rdn:3',          'BIC{S}',   'BIC_r_T1_A',    None,        {}),
+    ('0100001111 Rm:3 Rd:3',           'MVN{S}',   'MVN_r_T1_A',    None,        {}),
+    ('01000100 DM:1 1101 Rdm:3',       'ADD',      'ADD_SP_r_T1_A', _hiRegs,     {'Rn': 'sp'}),
+    ('01000100 1 Rm:4 101',            'ADD',      'ADD_SP_r_T2_A', None,        {'Rd': 'sp'}),
+    ('01000100 DN:1 Rm:4 Rdn:3',       'ADD',      'ADD_r_T2_A',    _hiRegs,     {}),
+    ('01000101 N:1 Rm:4 Rn:3',         'CMP',      'CMP_r_T2_A',    _hiRegs,     {}),
+    ('01000110 D:1 Rm:4 Rd:3',         'MOV',      'MOV_r_T1_A',    _hiRegs,     {}),
+    ('010001110 Rm:4 xxx',             'BX',       'BX_T1_A',       None,        {}),
+    ('010001111 Rm:4 xxx',             'BLX',      'BLX_r_T1_A',    None,        {}),
+    ('01001 Rt:3 imm8:8',              'LDR',      'LDR_l_T2_A',    _literal,    {}),
+    ('0101000 Rm:3 Rn:3 Rt:3',         'STR',      'STR_r_T1_A',    None,        {}),
+    ('0101001 Rm:3 Rn:3 Rt:3',         'STRH',     'STRH_r_T1_A',   None,        {}),
+    ('0101010 Rm:3 Rn:3 Rt:3',         'STRB',     'STRB_r_T1_A',   None,        {}),
+    ('0101011 Rm:3 Rn:3 Rt:3',         'LDRSB',    'LDRSB_r_T1_A',  None,        {}),
+    ('0101100 Rm:3 Rn:3 Rt:3',         'LDR',      'LDR_r_T1_A',    None,        {}),
+    ('0101101 Rm:3 Rn:3 Rt:3',         'LDRH',     'LDRH_r_T1_A',   None,        {}),
+    ('0101110 Rm:3 Rn:3 Rt:3',         'LDRB',     'LDRB_r_T1_A',   None,        {}),
+    ('0101111 Rm:3 Rn:3 Rt:3',         'LDRSH',    'LDRSH_r_T1_A',  None,        {}),
+    ('01100 imm5:5 Rn:3 Rt:3',         'STR',      'STR_i_T1_A',    _imm4,       {}),
+    ('01101 imm5:5 Rn:3 Rt:3',         'LDR',      'LDR_i_T1_A',    _imm4,       {}),
+    ('01110 imm5:5 Rn:3 Rt:3',         'STRB',     'STRB_i_T1_A',   _imm,        {}),
+    ('01111 imm5:5 Rn:3 Rt:3',         'LDRB',     'LDRB_i_T1_A',   _imm,        {}),
+    ('10000 imm5:5 Rn:3 Rt:3',         'STRH',     'STRH_i_T1_A',   _imm2,       {}),
+    ('10001 imm5:5 Rn:3 Rt:3',         'LDRH',     'LDRH_i_T1_A',   _imm2,       {}),
+    ('10010 Rt:3 imm8:8',              'STR',      'STR_i_T2_A',    _imm4,       {'Rn': 'sp'}),
+    ('10011 Rt:3 imm8:8',              'LDR',      'LDR_i_T2_A',    _imm4,       {'Rn': 'sp'}),
+    ('10100 Rd:3 imm8:8',              'ADR',      'ADR_T1_A',      _adr,        {}),
+    ('10101 Rd:3 imm8:8',              'ADD',      'ADD_SP_i_T1_A', _imm4,       {'Rn': 'sp'}),
+    ('101100000 imm7:7',               'ADD',      'ADD_SP_i_T2_A', _imm4,       {'Rd': 'sp'}),
+    ('101100001 imm7:7',               'SUB',      'SUB_SP_i_T1_A', _imm4,       {'Rd': 'sp'}),
+    ('1011 op:1 0 i:1 1 imm5:5 Rn:3',  lambda f: 'CBNZ' if f['op'] else 'CBZ', 'CBNZ_T1_A', _cbz, {}),
+    ('1011001000 Rm:3 Rd:3',           'SXTH',     'SXTH_T1_A',     None,        {}),
+    ('1011001001 Rm:3 Rd:3',           'SXTB',     'SXTB_T1_A',     None,        {}),
+    ('1011001010 Rm:3 Rd:3',           'UXTH',     'UXTH_T1_A',     None,        {}),
+    ('1011001011 Rm:3 Rd:3',           'UXTB',     'UXTB_T1_A',     None,        {}),
+    ('1011010 M:1 registers:8',        'PUSH',     'PUSH_T1_A',     _registers,  {}),
+    ('10110110011 im:1 0xxx',          lambda f: 'CPSID' if f['im'] else 'CPSIE', None, None, {}),
+    ('1011101000 Rm:3 Rd:3',           'REV',      'REV_T1_A',      None,        {}),
+    ('1011101001 Rm:3 Rd:3',           'REV16',    'REV16_T1_A',    None,        {}),
+    ('1011101011 Rm:3 Rd:3',           'REVSH',    'REVSH_T1_A',    None,        {}),
+    ('1011110 P:1 registers:8',        'POP',      'POP_T1_A',      _registers,  {}),
+    ('10111110 imm8:8',                'BKPT',     'BKPT_T1_A',     _hexImm,     {}),
+    ('1011111100000000',               'NOP',      'NOP_T1_A',      None,        {}),
+    ('1011111100010000',               'NOP',      'NOP_T1_A',      None,        {}),
+    ('1011111100100000',               'WFE',      None,            None,        {}),
+    ('1011111100110000',               'WFI',      None,            None,        {}),
+    ('1011111101000000',               'SEV',      None,            None,        {}),
+    ('10111111 xxxx 0000',             'NOP',      'NOP_T1_A',      None,        {}),
+    ('10111111 firstcond:4 mask:4',    'IT',       'IT_T1_A',       _it,         {}),
+    ('11000 Rn:3 registers:8',         'STM',      'STM_T1_A',      _registers,  {'wback': '!'}),
+    ('11001 Rn:3 registers:8',         'LDM',      'LDM_T1_A',      _registers,  {'load': 1}),
+    ('11011110 imm8:8',                'UDF',      'UDF_T1_A',      _hexImm,     {}),
+    ('11011111 imm8:8',                'SVC',      'SVC_T1_A',      _hexImm,     {}),
+    ('1101 cond:4 imm8:8',             'B',        'B_T1_A',        _branch,     {}),
+    ('11100 imm11:11',                 'B',        'B_T2_A',        _branch,     {}),
+]
+
+_mod_imm = '11110 i:1 0 {} | 0 imm3:3 {} imm8:8'
+_plain_imm = '11110 i:1 1 {} | 0 imm3:3 Rd:4 {}'
+_shifted_reg = '1110101 {} | x imm3:3 {} imm2:2 stype:2 Rm:4'
+_data_reg = '11111010 {} | 1111 Rd:4 {} Rm:4'
+_multiply = '111110110 {} Rn:4 | {} Rd:4 {} Rm:4'
+_long_multiply = '111110111 {} Rn:4 | {} Rm:4'
+
+_thumb32 = [
+    # data processing (modified immediate)
+    (_mod_imm.format('0000 1 Rn:4', '1111'),   'TST',      'TST_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('0000 S:1 Rn:4', 'Rd:4'), 'AND{S}',   'AND_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('0001 S:1 Rn:4', 'Rd:4'), 'BIC{S}',   'BIC_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('0010 S:1 1111', 'Rd:4'), 'MOV{S}',   'MOV_i_T2_A',    _modImm,     {}),
+    (_mod_imm.format('0010 S:1 Rn:4', 'Rd:4'), 'ORR{S}',   'ORR_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('0011 S:1 1111', 'Rd:4'), 'MVN{S}',   'MVN_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('0011 S:1 Rn:4', 'Rd:4'), 'ORN{S}',   'ORN_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('0100 1 Rn:4', '1111'),   'TEQ',      'TEQ_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('0100 S:1 Rn:4', 'Rd:4'), 'EOR{S}',   'EOR_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('1000 1 Rn:4', '1111'),   'CMN',      'CMN_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('1000 S:1 1101', 'Rd:4'), 'ADD{S}',   'ADD_SP_i_T3_A', _modImm,     {'Rn': 'sp'}),
+    (_mod_imm.format('1000 S:1 Rn:4', 'Rd:4'), 'ADD{S}',   'ADD_i_T3_A',    _modImm,     {}),
+    (_mod_imm.format('1010 S:1 Rn:4', 'Rd:4'), 'ADC{S}',   'ADC_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('1011 S:1 Rn:4', 'Rd:4'), 'SBC{S}',   'SBC_i_T1_A',    _modImm,     {}),
+    (_mod_imm.format('1101 1 Rn:4', '1111'),   'CMP',      'CMP_i_T2_A',    _modImm,     {}),
+    (_mod_imm.format('1101 S:1 1101', 'Rd:4'), 'SUB{S}',   'SUB_SP_i_T2_A', _modImm,     {'Rn': 'sp'}),
+    (_mod_imm.format('1101 S:1 Rn:4', 'Rd:4'), 'SUB{S}',   'SUB_i_T3_A',    _modImm,     {}),
+    (_mod_imm.format('1110 S:1 Rn:4', 'Rd:4'), 'RSB{S}',   'RSB_i_T2_A',    _modImm,     {}),
+    # data processing (plain binary immediate)
+    (_plain_imm.format('00000 1111', 'imm8:8'),   'ADR',   'ADR_T3_A',      _adr,        {}),
+    (_plain_imm.format('00000 1101', 'imm8:8'),   'ADDW',  'ADD_SP_i_T4_A', _imm12,      {'Rn': 'sp'}),
+    (_plain_imm.format('00000 Rn:4', 'imm8:8'),   'ADDW',  'ADD_i_T4_A',    _imm12,      {}),
+    (_plain_imm.format('00100 imm4:4', 'imm8:8'), 'MOVW',  'MOV_i_T3_A',    _imm16,      {}),
+    (_plain_imm.format('01010 1111', 'imm8:8'),   'ADR',   'ADR_T2_A',      _adr,        {}),
+    (_plain_imm.format('01010 1101', 'imm8:8'),   'SUBW',  'SUB_SP_i_T3_A', _imm12,      {'Rn': 'sp'}),
+    (_plain_imm.format('01010 Rn:4', 'imm8:8'),   'SUBW',  'SUB_i_T4_A',    _imm12,      {}),
+    (_plain_imm.format('01100 imm4:4', 'imm8:8'), 'MOVT',  'MOVT_T1_A',     _imm16,      {}),
+    ('11110 x 1 10010 Rn:4 | 0 000 Rd:4 00 x sat_imm:5',                  'SSAT16', 'SSAT16_T1_A', _sat, {'signed': 1}),
+    ('11110 x 1 100 sh:1 0 Rn:4 | 0 imm3:3 Rd:4 imm2:2 x sat_imm:5',      'SSAT',   'SSAT_T1_A',   _sat, {'signed': 1}),
+    ('11110 x 1 10100 Rn:4 | 0 imm3:3 Rd:4 imm2:2 x widthm1:5',           'SBFX',   'SBFX_T1_A',   _bitfield, {}),
+    ('11110 x 1 10110 1111 | 0 imm3:3 Rd:4 imm2:2 x msb:5',               'BFC',    'BFC_T1_A',    _bitfield, {}),
+    ('11110 x 1 10110 Rn:4 | 0 imm3:3 Rd:4 imm2:2 x msb:5',               'BFI',    'BFI_T1_A',    _bitfield, {}),
+    ('11110 x 1 11010 Rn:4 | 0 000 Rd:4 00 xx sat_imm:4',                 'USAT16', 'USAT16_T1_A', _sat, {'signed': 0}),
+    ('11110 x 1 110 sh:1 0 Rn:4 | 0 imm3:3 Rd:4 imm2:2 x sat_imm:5',      'USAT',   'USAT_T1_A',   _sat, {'signed': 0}),
+    ('11110 x 1 11100 Rn:4 | 0 imm3:3 Rd:4 imm2:2 x widthm1:5',           'UBFX',   'UBFX_T1_A',   _bitfield, {}),
+    # branches and miscellaneous control
+    ('11110 0 1110 0 x Rn:4 | 10 x 0 xx xx SYSm:8',  'MSR',   'MSR_r_T1_AS',   _specReg,    {}),
+    ('11110 0 1110 1 0 1111 | 10 x 0 x 000 00000000', 'NOP',  'NOP_T2_A',      None,        {}),
+    ('11110 0 1110 1 0 1111 | 10 x 0 x 000 00000001', 'NOP',  'NOP_T2_A',      None,        {}),
+    ('11110 0 1110 1 0 1111 | 10 x 0 x 000 00000010', 'WFE',  None,            None,        {}),
+    ('11110 0 1110 1 0 1111 | 10 x 0 x 000 00000011', 'WFI',  None,            None,        {}),
+    ('11110 0 1110 1 0 1111 | 10 x 0 x 000 00000100', 'SEV',  None,            None,        {}),
+    ('11110 0 1110 1 1 1111 | 10 x 0 xxxx 0010 xxxx', 'CLREX', 'CLREX_T1_A',   None,        {}),
+    ('11110 0 1110 1 1 1111 | 10 x 0 xxxx 0100 xxxx', 'DSB',  None,            None,        {}),
+    ('11110 0 1110 1 1 1111 | 10 x 0 xxxx 0101 xxxx', 'DMB',  None,            None,        {}),
+    ('11110 0 1110 1 1 1111 | 10 x 0 xxxx 0110 xxxx', 'ISB',  None,            None,        {}),
+    ('11110 0 1111 1 x 1111 | 10 x 0 Rd:4 SYSm:8',    'MRS',  'MRS_T1_AS',     _specReg,    {}),
+    ('11110 1 1111 1 1 imm4:4 | 1010 imm12:12',       'UDF',  'UDF_T2_A',      _hexImm,     {}),
+    ('11110 S:1 cond:4 imm6:6 | 10 J1:1 0 J2:1 imm11:11',  'B',  'B_T3_A',     _branch,     {}),
+    ('11110 S:1 imm10:10 | 10 J1:1 1 J2:1 imm11:11',       'B',  'B_T4_A',     _branch,     {}),
+    ('11110 S:1 imm10:10 | 11 J1:1 1 J2:1 imm11:11',       'BL', 'BL_i_T1_A',  _branch,     {}),
+    # load/store multiple
+    ('1110100 01 0 1 1 1101 | registers:16',          'POP',   'POP_T1_A',     _registers,  {}),
+    ('1110100 01 0 W:1 0 Rn:4 | registers:16',        'STM',   'STM_T2_A',     _registers,  {}),
+    ('1110100 01 0 W:1 1 Rn:4 | registers:16',        'LDM',   'LDM_T2_A',     _registers,  {}),
+    ('1110100 10 0 1 0 1101 | registers:16',          'PUSH',  'PUSH_T1_A',    _registers,  {}),
+    ('1110100 10 0 W:1 0 Rn:4 | registers:16',        'STMDB', 'STMDB_T1_A',   _registers,  {}),
+    ('1110100 10 0 W:1 1 Rn:4 | registers:16',        'LDMDB', 'LDMDB_T1_A',   _registers,  {}),
+    # load/store dual, exclusive, table branch
+    ('1110100 0 0 1 0 0 Rn:4 | Rt:4 Rd:4 imm8:8',     'STREX',  'STREX_T1_A',  _imm4,       {}),
+    ('1110100 0 0 1 0 1 Rn:4 | Rt:4 xxxx imm8:8',     'LDREX',  'LDREX_T1_A',  _imm4,       {}),
+    ('1110100 0 1 1 0 0 Rn:4 | Rt:4 xxxx 0100 Rd:4',  'STREXB', 'STREXB_T1_A', None,        {}),
+    ('1110100 0 1 1 0 0 Rn:4 | Rt:4 xxxx 0101 Rd:4',  'STREXH', 'STREXH_T1_A', None,        {}),
+    ('1110100 0 1 1 0 1 Rn:4 | xxxx xxxx 000 H:1 Rm:4', lambda f: 'TBH' if f['H'] else 'TBB', 'TBB_T1_A', None, {}),
+    ('1110100 0 1 1 0 1 Rn:4 | Rt:4 xxxx 0100 xxxx',  'LDREXB', 'LDREXB_T1_A', None,        {}),
+    ('1110100 0 1 1 0 1 Rn:4 | Rt:4 xxxx 0101 xxxx',  'LDREXH', 'LDREXH_T1_A', None,        {}),
+    ('1110100 P:1 U:1 1 W:1 1 1111 | Rt:4 Rt2:4 imm8:8',  'LDRD', 'LDRD_l_T1_A', _literal, {}),
+    ('1110100 P:1 U:1 1 W:1 0 Rn:4 | Rt:4 Rt2:4 imm8:8',  'STRD', 'STRD_i_T1_A', _dual,    {}),
+    ('1110100 P:1 U:1 1 W:1 1 Rn:4 | Rt:4 Rt2:4 imm8:8',  'LDRD', 'LDRD_i_T1_A', _dual,    {}),
+    # store single
+    ('11111000 1 000 Rn:4 | Rt:4 imm12:12',           'STRB',  'STRB_i_T2_A',  _imm12,      {}),
+    ('11111000 0 000 Rn:4 | Rt:4 000000 imm2:2 Rm:4', 'STRB',  'STRB_r_T2_A',  _regOffset,  {}),
+    ('11111000 0 000 Rn:4 | Rt:4 1110 imm8:8',        'STRBT', 'STRBT_T1_A',   _imm,        {}),
+    ('11111000 0 000 Rn:4 | Rt:4 1 P:1 U:1 W:1 imm8:8', 'STRB', 'STRB_i_T3_A', _imm8PUW,    {}),
+    ('11111000 1 010 Rn:4 | Rt:4 imm12:12',           'STRH',  'STRH_i_T2_A',  _imm12,      {}),
+    ('11111000 0 010 Rn:4 | Rt:4 000000 imm2:2 Rm:4', 'STRH',  'STRH_r_T2_A',  _regOffset,  {}),
+    ('11111000 0 010 Rn:4 | Rt:4 1110 imm8:8',        'STRHT', 'STRHT_T1_A',   _imm,        {}),
+    ('11111000 0 010 Rn:4 | Rt:4 1 P:1 U:1 W:1 imm8:8', 'STRH', 'STRH_i_T3_A', _imm8PUW,    {}),
+    ('11111000 1 100 Rn:4 | Rt:4 imm12:12',           'STR',   'STR_i_T3_A',   _imm12,      {}),
+    ('11111000 0 100 Rn:4 | Rt:4 000000 imm2:2 Rm:4', 'STR',   'STR_r_T2_A',   _regOffset,  {}),
+    ('11111000 0 100 Rn:4 | Rt:4 1110 imm8:8',        'STRT',  'STRT_T1_A',    _imm,        {}),
+    ('11111000 0 100 Rn:4 | Rt:4 1 P:1 U:1 W:1 imm8:8', 'STR',  'STR_i_T4_A',  _imm8PUW,    {}),
+    # load byte, halfword, memory hints
+    ('1111100 0 x 0 x 1 xxxx | 1111 xxxxxxxxxxxx',    'PLD',   None,           None,        {}),
+    ('1111100 1 x 0 x 1 xxxx | 1111 xxxxxxxxxxxx',    'PLI',   None,           None,        {}),
+    ('1111100 0 U:1 00 1 1111 | Rt:4 imm12:12',       'LDRB',  'LDRB_l_T1_A',  _literal,    {}),
+    ('1111100 0 U:1 01 1 1111 | Rt:4 imm12:12',       'LDRH',  'LDRH_l_T1_A',  _literal,    {}),
+    ('1111100 1 U:1 00 1 1111 | Rt:4 imm12:12',       'LDRSB', 'LDRSB_l_T1_A', _literal,    {}),
+    ('1111100 1 U:1 01 1 1111 | Rt:4 imm12:12',       'LDRSH', 'LDRSH_l_T1_A', _literal,    {}),
+    ('11111000 1 001 Rn:4 | Rt:4 imm12:12',           'LDRB',  'LDRB_i_T2_A',  _imm12,      {}),
+    ('11111000 0 001 Rn:4 | Rt:4 000000 imm2:2 Rm:4', 'LDRB',  'LDRB_r_T2_A',  _regOffset,  {}),
+    ('11111000 0 001 Rn:4 | Rt:4 1110 imm8:8',        'LDRBT', 'LDRBT_T1_A',   _imm,        {}),
+    ('11111000 0 001 Rn:4 | Rt:4 1 P:1 U:1 W:1 imm8:8', 'LDRB', 'LDRB_i_T3_A', _imm8PUW,    {}),
+    ('11111000 1 011 Rn:4 | Rt:4 imm12:12',           'LDRH',  'LDRH_i_T2_A',  _imm12,      {}),
+    ('11111000 0 011 Rn:4 | Rt:4 000000 imm2:2 Rm:4', 'LDRH',  'LDRH_r_T2_A',  _regOffset,  {}),
+    ('11111000 0 011 Rn:4 | Rt:4 1110 imm8:8',        'LDRHT', 'LDRHT_T1_A',   _imm,        {}),
+    ('11111000 0 011 Rn:4 | Rt:4 1 P:1 U:1 W:1 imm8:8', 'LDRH', 'LDRH_i_T3_A', _imm8PUW,    {}),
+    ('11111001 1 001 Rn:4 | Rt:4 imm12:12',           'LDRSB', 'LDRSB_i_T1_A', _imm12,      {}),
+    ('11111001 0 001 Rn:4 | Rt:4 000000 imm2:2 Rm:4', 'LDRSB', 'LDRSB_r_T2_A', _regOffset,  {}),
+    ('11111001 0 001 Rn:4 | Rt:4 1110 imm8:8',        'LDRSBT', 'LDRSBT_T1_A', _imm,        {}),
+    ('11111001 0 001 Rn:4 | Rt:4 1 P:1 U:1 W:1 imm8:8', 'LDRSB', 'LDRSB_i_T2_A', _imm8PUW,  {}),
+    ('11111001 1 011 Rn:4 | Rt:4 imm12:12',           'LDRSH', 'LDRSH_i_T1_A', _imm12,      {}),
+    ('11111001 0 011 Rn:4 | Rt:4 000000 imm2:2 Rm:4', 'LDRSH', 'LDRSH_r_T2_A', _regOffset,  {}),
+    ('11111001 0 011 Rn:4 | Rt:4 1110 imm8:8',        'LDRSHT', 'LDRSHT_T1_A', _imm,        {}),
+    ('11111001 0 011 Rn:4 | Rt:4 1 P:1 U:1 W:1 imm8:8', 'LDRSH', 'LDRSH_i_T2_A', _imm8PUW,  {}),
+    # load word
+    ('1111100 0 U:1 10 1 1111 | Rt:4 imm12:12',       'LDR',   'LDR_l_T2_A',   _literal,    {}),
+    ('11111000 1 101 Rn:4 | Rt:4 imm12:12',           'LDR',   'LDR_i_T3_A',   _imm12,      {}),
+    ('11111000 0 101 Rn:4 | Rt:4 000000 imm2:2 Rm:4', 'LDR',   'LDR_r_T2_A',   _regOffset,  {}),
+    ('11111000 0 101 Rn:4 | Rt:4 1110 imm8:8',        'LDRT',  'LDRT_T1_A',    _imm,        {}),
+    ('11111000 0 101 Rn:4 | Rt:4 1 P:1 U:1 W:1 imm8:8', 'LDR',  'LDR_i_T4_A',  _imm8PUW,    {}),
+    # data processing (shifted register)
+    (_shifted_reg.format('0000 1 Rn:4', '1111'),    'TST',      'TST_r_T2_A',    _immShift,   {}),
+    (_shifted_reg.format('0000 S:1 Rn:4', 'Rd:4'),  'AND{S}',   'AND_r_T2_A',    _immShift,   {}),
+    (_shifted_reg.format('0001 S:1 Rn:4', 'Rd:4'),  'BIC{S}',   'BIC_r_T2_A',    _immShift,   {}),
+    (_shifted_reg.format('0010 S:1 1111', 'Rd:4'),  _shiftMnem, 'MOV_r_T3_A',    _immShift,   {}),
+    (_shifted_reg.format('0010 S:1 Rn:4', 'Rd:4'),  'ORR{S}',   'ORR_r_T2_A',    _immShift,   {}),
+    (_shifted_reg.format('0011 S:1 1111', 'Rd:4'),  'MVN{S}',   'MVN_r_T2_A',    _immShift,   {}),
+    (_shifted_reg.format('0011 S:1 Rn:4', 'Rd:4'),  'ORN{S}',   'ORN_r_T1_A',    _immShift,   {}),
+    (_shifted_reg.format('0100 1 Rn:4', '1111'),    'TEQ',      'TEQ_r_T1_A',    _immShift,   {}),
+    (_shifted_reg.format('0100 S:1 Rn:4', 'Rd:4'),  'EOR{S}',   'EOR_r_T2_A',    _immShift,   {}),
+    ('1110101 0110 0 Rn:4 | x imm3:3 Rd:4 imm2:2 tb:1 T:1 Rm:4', lambda f: 'PKHTB' if f['tb'] else 'PKHBT', 'PKH_T1_A', _immShift, {}),
+    (_shifted_reg.format('1000 1 Rn:4', '1111'),    'CMN',      'CMN_r_T2_A',    _immShift,   {}),
+    (_shifted_reg.format('1000 S:1 1101', 'Rd:4'),  'ADD{S}',   'ADD_SP_r_T3_A', _immShift,   {'Rn': 'sp'}),
+    (_shifted_reg.format('1000 S:1 Rn:4', 'Rd:4'),  'ADD{S}',   'ADD_r_T3_A',    _immShift,   {}),
+    (_shifted_reg.format('1010 S:1 Rn:4', 'Rd:4'),  'ADC{S}',   'ADC_r_T2_A',    _immShift,   {}),
+    (_shifted_reg.format('1011 S:1 Rn:4', 'Rd:4'),  'SBC{S}',   'SBC_r_T2_A',    _immShift,   {}),
+    (_shifted_reg.format('1101 1 Rn:4', '1111'),    'CMP',      'CMP_r_T3_A',    _immShift,   {}),
+    (_shifted_reg.format('1101 S:1 1101', 'Rd:4'),  'SUB{S}',   'SUB_SP_r_T1_A', _immShift,   {'Rn': 'sp'}),
+    (_shifted_reg.format('1101 S:1 Rn:4', 'Rd:4'),  'SUB{S}',   'SUB_r_T2_A',    _immShift,   {}),
+    (_shifted_reg.format('1110 S:1 Rn:4', 'Rd:4'),  'RSB{S}',   'RSB_r_T1_A',    _immShift,   {}),
+    # data processing (register)
+    ('11111010 0 op:2 S:1 Rm:4 | 1111 Rd:4 0000 Rs:4', lambda f: ['LSL', 'LSR', 'ASR', 'ROR'][f['op']] + '{S}', 'MOV_rr_T2_A',
+        lambda f, ops, address: ops.update(shift_t=['lsl', 'lsr', 'asr', 'ror'][f['op']]), {}),
+    (_data_reg.format('0000 1111', '1x rotate:2'),  'SXTH',     'SXTH_T2_A',     _rotation,   {}),
+    (_data_reg.format('0000 Rn:4', '1x rotate:2'),  'SXTAH',    'SXTAH_T1_A',    _rotation,   {}),
+    (_data_reg.format('0001 1111', '1x rotate:2'),  'UXTH',     'UXTH_T2_A',     _rotation,   {}),
+    (_data_reg.format('0001 Rn:4', '1x rotate:2'),  'UXTAH',    'UXTAH_T1_A',    _rotation,   {}),
+    (_data_reg.format('0010 1111', '1x rotate:2'),  'SXTB16',   'SXTB16_T1_A',   _rotation,   {}),
+    (_data_reg.format('0010 Rn:4', '1x rotate:2'),  'SXTAB16',  'SXTAB16_T1_A',  _rotation,   {}),
+    (_data_reg.format('0011 1111', '1x rotate:2'),  'UXTB16',   'UXTB16_T1_A',   _rotation,   {}),
+    (_data_reg.format('0011 Rn:4', '1x rotate:2'),  'UXTAB16',  'UXTAB16_T1_A',  _rotation,   {}),
+    (_data_reg.format('0100 1111', '1x rotate:2'),  'SXTB',     'SXTB_T2_A',     _rotation,   {}),
+    (_data_reg.format('0100 Rn:4', '1x rotate:2'),  'SXTAB',    'SXTAB_T1_A',    _rotation,   {}),
+    (_data_reg.format('0101 1111', '1x rotate:2'),  'UXTB',     'UXTB_T2_A',     _rotation,   {}),
+    (_data_reg.format('0101 Rn:4', '1x rotate:2'),  'UXTAB',    'UXTAB_T1_A',    _rotation,   {}),
+    (_data_reg.format('1 op1:3 Rn:4', '0 prefix:3'), _parallelMnem, lambda f: _parallelMnem(f) + '_T1_A', None, {}),
+    (_data_reg.format('1000 Rn:4', '1000'),         'QADD',     'QADD_T1_A',     None,        {}),
+    (_data_reg.format('1000 Rn:4', '1001'),         'QDADD',    'QDADD_T1_A',    None,        {}),
+    (_data_reg.format('1000 Rn:4', '1010'),         'QSUB',     'QSUB_T1_A',     None,        {}),
+    (_data_reg.format('1000 Rn:4', '1011'),         'QDSUB',    'QDSUB_T1_A',    None,        {}),
+    (_data_reg.format('1001 xxxx', '1000'),         'REV',      'REV_T2_A',      None,        {}),
+    (_data_reg.format('1001 xxxx', '1001'),         'REV16',    'REV16_T2_A',    None,        {}),
+    (_data_reg.format('1001 xxxx', '1010'),         'RBIT',     'RBIT_T1_A',     None,        {}),
+    (_data_reg.format('1001 xxxx', '1011'),         'REVSH',    'REVSH_T2_A',    None,        {}),
+    (_data_reg.format('1010 Rn:4', '1000'),         'SEL',      'SEL_T1_A',      None,        {}),
+    (_data_reg.format('1011 xxxx', '1000'),         'CLZ',      'CLZ_T1_A',      None,        {}),
+    # multiply, multiply accumulate, absolute difference
+    (_multiply.format('000', '1111', '0000'),       'MUL',      'MUL_T2_A',      None,        {}),
+    (_multiply.format('000', 'Ra:4', '0000'),       'MLA',      'MLA_T1_A',      None,        {}),
+    (_multiply.format('000', 'Ra:4', '0001'),       'MLS',      'MLS_T1_A',      None,        {}),
+    (_multiply.format('001', '1111', '00 N:1 M:1'), lambda f: 'SMUL' + _xy(f),  'SMULBB_T1_A', None, {}),
+    (_multiply.format('001', 'Ra:4', '00 N:1 M:1'), lambda f: 'SMLA' + _xy(f),  'SMLABB_T1_A', None, {}),
+    (_multiply.format('010', '1111', '000 M:1'),    lambda f: 'SMUAD' + _x(f),  'SMUAD_T1_A',  None, {}),
+    (_multiply.format('010', 'Ra:4', '000 M:1'),    lambda f: 'SMLAD' + _x(f),  'SMLAD_T1_A',  None, {}),
+    (_multiply.format('011', '1111', '000 M:1'),    lambda f: 'SMULW' + 'BT'[f['M']], 'SMULWB_T1_A', None, {}),
+    (_multiply.format('011', 'Ra:4', '000 M:1'),    lambda f: 'SMLAW' + 'BT'[f['M']], 'SMLAWB_T1_A', None, {}),
+    (_multiply.format('100', '1111', '000 M:1'),    lambda f: 'SMUSD' + _x(f),  'SMUSD_T1_A',  None, {}),
+    (_multiply.format('100', 'Ra:4', '000 M:1'),    lambda f: 'SMLSD' + _x(f),  'SMLSD_T1_A',  None, {}),
+    (_multiply.format('101', '1111', '000 R:1'),    lambda f: 'SMMUL' + 'R' * f['R'], 'SMMUL_T1_A', None, {}),
+    (_multiply.format('101', 'Ra:4', '000 R:1'),    lambda f: 'SMMLA' + 'R' * f['R'], 'SMMLA_T1_A', None, {}),
+    (_multiply.format('110', 'Ra:4', '000 R:1'),    lambda f: 'SMMLS' + 'R' * f['R'], 'SMMLS_T1_A', None, {}),
+    (_multiply.format('111', '1111', '0000'),       'USAD8',    'USAD8_T1_A',    None,        {}),
+    (_multiply.format('111', 'Ra:4', '0000'),       'USADA8',   'USADA8_T1_A',   None,        {}),
+    # long multiply, long multiply accumulate, divide
+    (_long_multiply.format('000', 'RdLo:4 RdHi:4 0000'),    'SMULL',    'SMULL_T1_A',  None, {}),
+    (_long_multiply.format('001', 'xxxx Rd:4 1111'),        'SDIV',     'SDIV_T1_A',   None, {}),
+    (_long_multiply.format('010', 'RdLo:4 RdHi:4 0000'),    'UMULL',    'UMULL_T1_A',  None, {}),
+    (_long_multiply.format('011', 'xxxx Rd:4 1111'),        'UDIV',     'UDIV_T1_A',   None, {}),
+    (_long_multiply.format('100', 'RdLo:4 RdHi:4 0000'),    'SMLAL',    'SMLAL_T1_A',  None, {}),
+    (_long_multiply.format('100', 'RdLo:4 RdHi:4 10 N:1 M:1'), lambda f: 'SMLAL' + _xy(f), 'SMLALBB_T1_A', None, {}),
+    (_long_multiply.format('100', 'RdLo:4 RdHi:4 110 M:1'), lambda f: 'SMLALD' + _x(f), 'SMLALD_T1_A',  None, {}),
+    (_long_multiply.format('101', 'RdLo:4 RdHi:4 110 M:1'), lambda f: 'SMLSLD' + _x(f), 'SMLSLD_T1_A',  None, {}),
+    (_long_multiply.format('110', 'RdLo:4 RdHi:4 0000'),    'UMLAL',    'UMLAL_T1_A',  None, {}),
+    (_long_multiply.format('110', 'RdLo:4 RdHi:4 0110'),    'UMAAL',    'UMAAL_T1_A',  None, {}),
+]
+
+
+class _Encoding:
+    ''' Encoding diagram compiled to mask/value and field extractors '''
+    def __init__(self, diagram, mnem, factory, builder, static):
+        self.diagram = diagram
+        self.mnem = mnem
+        self.factory = factory
+        self.builder = builder
+        self.static = static
+        self.mask = 0
+        self.value = 0
+        self.fields = []    # (name, lsb, mask)
+        bits = 0
+        tokens = [token for token in diagram.replace('|', ' ').split(' ') if len(token) > 0]
+        for token in reversed(tokens):
+            if ':' in token:
+                name, width = token.split(':')
+                self.fields.append((name, bits, (1 << int(width)) - 1))
+                bits += int(width)
+            else:
+                for bit in reversed(token):
+                    if bit != 'x':
+                        self.mask |= 1 << bits
+                        self.value |= int(bit) << bits
+                    bits += 1
+        self.length = bits // 8
+
+    def match(self, word):
+        return word & self.mask == self.value
+
+
+def _buckets(encodings, key_bits, shift):
+    ''' Decode tree first level : encodings compatible with each value of key bits of the word '''
+    key_mask = (1 << key_bits) - 1
+    table = [[] for _ in range(1 << key_bits)]
+    for enc in encodings:
+        mask = enc.mask >> shift & key_mask
+        value = enc.value >> shift & key_mask
+        for key in range(1 << key_bits):
+            if key & mask == value:
+                table[key].append(enc)
+    return table
+
+_encodings16 = [_Encoding(*entry) for entry in _thumb16]
+_encodings32 = [_Encoding(*entry) for entry in _thumb32]
+# 16-bit encodings are split by bits 15:10, 32-bit ones by hw1 bits 12:4 and hw2 bit 15
+_table16 = _buckets(_encodings16, 6, 10)
+_table32_hi = _buckets(_encodings32, 9, 20)
+_table32 = [[enc for enc in encs if enc.mask >> 15 & 1 == 0 or enc.value >> 15 & 1 == bit] for encs in _table32_hi for bit in (0, 1)]
+
+
+def _itConditions(firstcond, mask):
+    ''' Conditions of the instructions of an IT block, None if the IT encoding is invalid '''
+    if mask == 0 or firstcond == 15:
+        return None
+    length = 4 - ((mask & -mask).bit_length() - 1)
+    conds = [firstcond] + [(firstcond & 0xe) | (mask >> (4 - i) & 1) for i in range(1, length)]
+    return None if 15 in conds else conds
+
+
+def decode(data, address, cond=None):
+    ''' Decodes instruction encoding (little endian halfwords) located at address, cond being the
+        condition given by an enclosing IT block. Returns a Decoded instruction or None if the
+        encoding is unknown '''
+    hw1 = data[0] | data[1] << 8
+    if len(data) == 4:
+        word = hw1 << 16 | data[2] | data[3] << 8
+        candidates = _table32[(word >> 20 & 0x1ff) << 1 | word >> 15 & 1]
+    else:
+        word = hw1
+        candidates = _table16[word >> 10]
+
+    for enc in candidates:
+        if word & enc.mask == enc.value:
+            decoded = _build(enc, word, address, None if cond is None else conditions[cond])
+            if decoded is not None:
+                return decoded
+    return None
+
+
+def _build(enc, word, address, cond):
+    f = {name: value for name, value in enc.static.items() if type(value) is not str}
+    for name, lsb, mask in enc.fields:
+        f[name] = word >> lsb & mask
+
+    ops = Operands()
+    for name in _reg_fields:
+        if name in f:
+            ops[name] = reg_names[f[name]]
+    for name, value in enc.static.items():
+        if type(value) is str:
+            ops[name] = value
+    if enc.builder is not None and enc.builder(f, ops, address) is False:
+        return None
+    bitdiffs = {name: str(f[name]) for name in _bitdiff_fields if name in f}
+
+    mnem = enc.mnem(f) if callable(enc.mnem) else enc.mnem
+    if mnem is None:
+        return None
+    factory = enc.factory(f) if callable(enc.factory) else enc.factory
+    if mnem.endswith('{S}'):
+        if 'S' not in f:
+            # 16-bit data processing sets flags outside IT blocks only
+            bitdiffs['S'] = '0' if cond is not None else '1'
+        mnem = mnem[:-3] + ('S' if bitdiffs['S'] == '1' else '')
+
+    if mnem != 'IT' and cond is not None and cond != 'al':
+        ops['c'] = cond
+    return Decoded(mnem, None if factory is None else 'aarch32_' + factory, ops, bitdiffs, enc.length)
+
+
+class Decoder:
+    ''' Thumb-2 instruction decoder, keeps track of IT blocks across consecutive instructions '''
+
+    def __init__(self):
+        self.it_conds = []
+        self.next_address = None
+
+    def condition(self, data, address):
+        ''' Condition code applied by an enclosing IT block to the instruction located at address
+            (None outside IT blocks), only IT instructions themselves have to be recognized for that '''
+        if address != self.next_address:
+            self.it_conds = []
+        self.next_address = address + len(data)
+        cond = self.it_conds.pop(0) if len(self.it_conds) > 0 else None
+        if len(data) == 2 and data[1] == 0xbf and data[0] & 0xf:
+            self.it_conds = _itConditions(data[0] >> 4, data[0] & 0xf) or []
+        return cond
+
+    def decode(self, data, address):
+        ''' Decodes instruction encoding (little endian halfwords) located at address,
+            returns a Decoded instruction or None if the encoding is unknown '''
+        return decode(data, address, self.condition(data, address))
+
+
+def formatAssembly(decoded):
+    ''' Human readable assembly of a decoded instruction '''
+    ops = decoded.operands
+    text = decoded.mnem.lower()
+    if decoded.mnem == 'IT':
+        return f'it{ops["mask"]} {ops["firstcond"]}'
+    if ops.get('c') is not None:
+        text += ops['c']
+    # saturating instructions only have a 32 bits encoding, their bit position comes before saturated register
+    is_saturate = decoded.mnem in ('SSAT', 'SSAT16', 'USAT', 'USAT16')
+    if decoded.length == 4 and decoded.mnem != 'BL' and not is_saturate:
+        text += '.w'
+    args = [ops[name] for name in ['Rd', 'Rdn', 'Rdm', 'RdLo', 'RdHi', 'Rt', 'Rt2', 'spec_reg'] if name in ops]
+    if is_saturate:
+        args.append(f'#{ops["imm32"]}')
+    is_memory = decoded.mnem[:3] in ('LDR', 'STR') or decoded.mnem[:3] in ('TBB', 'TBH')
+    if is_memory and 'abs_address' not in ops:
+        offset = [ops[name] for name in ['Rm'] if name in ops]
+        if 'imm32' in ops:
+            sign = '-' if decoded.bitdiffs.get('U', '1') == '0' else ''
+            offset.append(f'#{sign}{ops["imm32"]}')
+        if ops.get('shift_n', '0') != '0':
+            offset[-1] += f', lsl #{ops["shift_n"]}'
+        if decoded.bitdiffs.get('P', '1') == '0':
+            args.append(f'[{ops.get("Rn")}], ' + ', '.join(offset))
+        else:
+            args.append('[' + ', '.join([ops.get('Rn')] + offset) + ']' + (ops.get('wback') or ''))
+    else:
+        args += [ops[name] for name in ['Rn', 'Rm', 'Rs', 'Ra'] if name in ops]
+        if 'registers' in ops:
+            if 'Rn' in ops:
+                args[-1] += ops.get('wback') or ''
+            args.append('{' + ops['registers'] + '}')
+        if 'abs_address' in ops:
+            args.append(ops['abs_address'][2:])
+        elif 'imm32' in ops and not is_saturate:
+            args.append(f'#{ops["imm32"]}')
+        if 'lsb' in ops:
+            args += [f'#{ops["lsb"]}', f'#{ops["width"]}']
+        if 'rotation' in ops and ops['rotation'] != '0':
+            args.append(f'ror #{ops["rotation"]}')
+        elif 'shift_t' in ops and decoded.mnem.startswith(ops['shift_t'].upper()):
+            # shift encoded as mov (lsl, lsr, asr, ror, rrx)
+            if 'shift_n' in ops and ops['shift_t'] != 'rrx':
+                args.append(f'#{ops["shift_n"]}')
+        elif 'shift_n' in ops and (ops['shift_n'] != '0' or ops['shift_t'] == 'rrx'):
+            args.append(ops['shift_t'] if ops['shift_t'] == 'rrx' else f'{ops["shift_t"]} #{ops["shift_n"]}')
+    if len(args) == 0:
+        return text
+    return f'{text} ' + ', '.join(args)
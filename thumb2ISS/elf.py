@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import struct
+from collections import namedtuple
+
+PT_LOAD = 1
+
+SHT_SYMTAB = 2
+SHT_NOBITS = 8
+
+SHF_WRITE     = 0x1
+SHF_ALLOC     = 0x2
+SHF_EXECINSTR = 0x4
+
+STT_NOTYPE  = 0
+STT_OBJECT  = 1
+STT_FUNC    = 2
+STT_SECTION = 3
+STT_FILE    = 4
+
+STB_LOCAL  = 0
+STB_GLOBAL = 1
+STB_WEAK   = 2
+
+SHN_UNDEF = 0
+SHN_LORESERVE = 0xff00
+
+EM_ARM = 40
+
+Segment = namedtuple('Segment', 'type offset vaddr paddr filesz memsz flags align')
+Section = namedtuple('Section', 'name type flags addr offset size link info addralign entsize')
+Symbol  = namedtuple('Symbol', 'name value size type bind other shndx')
+
+_elf_header = struct.Struct('<HHIIIIIHHHHHH')
+_prog_header = struct.Struct('<IIIIIIII')
+_sect_header = struct.Struct('<IIIIIIIIII')
+_symbol = struct.Struct('<IIIBBH')
+
+
+class ElfFile:
+    ''' Minimal ELF32 little endian reader : program headers, section headers and symbols '''
+
+    def __init__(self, path=None, data=None):
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        self.data = data
+        if data[:4] != b'\x7fELF' or data[4] != 1 or data[5] != 1:
+            raise Exception(f'{path} is not a 32-bit little endian ELF file')
+
+        (self.type, self.machine, _, self.entry, phoff, shoff, self.flags, _,
+            phentsize, phnum, shentsize, shnum, shstrndx) = _elf_header.unpack_from(data, 16)
+        if self.machine != EM_ARM:
+            raise Exception(f'{path} does not target ARM architecture (e_machine={self.machine})')
+
+        self.segments = [Segment(*_prog_header.unpack_from(data, phoff + i*phentsize)) for i in range(phnum)]
+
+        sections = [Section(*_sect_header.unpack_from(data, shoff + i*shentsize)) for i in range(shnum)]
+        shstrtab = sections[shstrndx] if shstrndx < shnum else None
+        self.sections = [s._replace(name=self.getString(shstrtab, s.name)) for s in sections]
+
+        self.symbols = []
+        for symtab in self.sections:
+            if symtab.type == SHT_SYMTAB:
+                strtab = self.sections[symtab.link]
+                for offset in range(symtab.offset, symtab.offset + symtab.size, symtab.entsize):
+                    name, value, size, info, other, shndx = _symbol.unpack_from(data, offset)
+                    self.symbols.append(Symbol(self.getString(strtab, name), value, size, info & 0xf, info >> 4, other, shndx))
+
+    def getString(self, strtab, offset):
+        if strtab is None:
+            return ''
+        start = strtab.offset + offset
+        return self.data[start:self.data.index(b'\x00', start)].decode('ascii', errors='replace')
+
+    def getSection(self, name):
+        for section in self.sections:
+            if section.name == name:
+                return section
+        return None
+
+    def romChunks(self):
+        ''' Content of loadable segments at their load address (as objcopy would output it) '''
+        return [(seg.paddr, self.data[seg.offset:seg.offset + seg.filesz]) for seg in self.segments if seg.type == PT_LOAD and seg.filesz > 0]
+
+    def ramChunks(self):
+        ''' Zero-initialized writable sections at their run address, extended up to the stack top when the
+            linker script places heap and stack outside of any section (CMSIS __StackTop symbol) '''
+        chunks = [(sec.addr, bytes(sec.size)) for sec in self.sections if sec.flags & SHF_ALLOC and sec.flags & SHF_WRITE and sec.size > 0]
+        stack_top = [sym.value for sym in self.symbols if sym.name == '__StackTop']
+        if len(chunks) > 0 and len(stack_top) > 0:
+            ram_end = max(address + len(data) for address, data in chunks)
+            if ram_end < stack_top[0] <= ram_end + 0x1000000:
+                chunks.append((ram_end, bytes(stack_top[0] - ram_end)))
+        return chunks
+
+    def codeSymbols(self):
+        ''' Named symbols of executable sections, as objdump labels them (thumb bit removed) '''
+        symbols = []
+        for sym in self.symbols:
+            if sym.type in [STT_NOTYPE, STT_OBJECT, STT_FUNC] and len(sym.name) > 0 and not sym.name.startswith('$') \
+                    and SHN_UNDEF < sym.shndx < SHN_LORESERVE and self.sections[sym.shndx].flags & SHF_EXECINSTR:
+                symbols.append(sym)
+        # globals come last to be preferred when several symbols share an address
+        symbols.sort(key=lambda sym: sym.bind != STB_LOCAL)
+        return [(sym.name, sym.value & ~1 if sym.type == STT_FUNC else sym.value) for sym in symbols]
+
+    def thumbChunks(self):
+        ''' Content of executable sections at their run address, restricted to thumb code according to mapping symbols '''
+        mapping = self.mappingSymbols()
+        chunks = []
+        for sec in self.sections:
+            if sec.flags & SHF_ALLOC and sec.flags & SHF_EXECINSTR and sec.type != SHT_NOBITS and sec.size > 0:
+                end = sec.addr + sec.size
+                kinds = [(address, kind) for address, kind in mapping if sec.addr <= address < end]
+                if len(kinds) == 0 or kinds[0][0] != sec.addr:
+                    # no mapping symbol at section start : thumb code assumed
+                    kinds.insert(0, (sec.addr, 't'))
+                for (start, kind), (stop, _) in zip(kinds, kinds[1:] + [(end, None)]):
+                    if kind == 't' and stop > start:
+                        chunks.append((start, self.data[sec.offset + start - sec.addr:sec.offset + stop - sec.addr]))
+        return chunks
+
+    def mappingSymbols(self):
+        ''' Sorted (address, kind) list of ARM mapping symbols, kind being 't' (thumb code), 'a' (arm code) or 'd' (data) '''
+        return sorted((sym.value & ~1, sym.name[1]) for sym in self.symbols if sym.name[:2] in ['$t', '$a', '$d'] and (len(sym.name) == 2 or sym.name[2] == '.'))
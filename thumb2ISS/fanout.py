@@ -0,0 +1,176 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import click
+import logging
+import contextlib
+import io
+import json
+import sys,time,os
+from .sim import Simulator
+from .timings import Architecture
+from .thumb2ISS import loadImage, execute
+from .hostlib import routines as host_routines
+from .semihosting import saveHandles, restoreHandles
+from .report import newResult, setReason, writeJsonLine, writeJUnit
+from .version import __version__
+
+log = logging.getLogger('thumb2ISS.fanout')
+
+def location(s, where):
+    ''' Address of a symbol, or of an integer literal '''
+    where = str(where)
+    if where.lower() in s.labels:
+        return s.labels[where.lower()]
+    return int(where, 0)
+
+def applyVariant(s, variant):
+    ''' Writes inputs of variant : {'registers': {'r0': value, ...}, 'memory': {location: hex string, ...}} '''
+    core = s.core
+    for reg, value in variant.get('registers', {}).items():
+        core.R[core.reg_num[reg]] = value & 0xffffffff
+    for where, data in variant.get('memory', {}).items():
+        s.memory.writeBytes(location(s, where), bytes.fromhex(data) if type(data) is str else bytes(data))
+
+def runVariant(s, image, name, variant, timeout=None, max_cycles=None, max_instructions=None, outputs=()):
+    ''' Simulates variant from current state to its end, returns its result (see report.newResult), with cycles and
+        instructions counted from current state, r0-r3 and content of outputs (location, size) memory areas '''
+    result = newResult(f'{image}[{name}]')
+    result['registers'] = {}
+    result['outputs'] = {}
+    stdout = io.StringIO()
+    start_time = time.time()
+    start_cycles, start_instructions = s.cycles['total'], s.retired
+    try:
+        with contextlib.redirect_stdout(stdout):
+            # target standard streams are bound to the output of this variant
+            restoreHandles(s.core, saveHandles(s.core))
+            applyVariant(s, variant)
+            reason, _ = execute(s, timeout,
+                None if max_cycles is None else start_cycles + max_cycles,
+                None if max_instructions is None else start_instructions + max_instructions)
+        result['outputs'] = {where: s.memory.readBytes(location(s, where), size).hex() for where, size in outputs}
+        setReason(result, reason, s.core.exit_status)
+    except Exception as e:
+        setReason(result, 'error')
+        result['error'] = f'{type(e).__name__}: {e}'
+    result['cycles'] = s.cycles['total'] - start_cycles
+    result['instructions'] = s.retired - start_instructions
+    result['registers'] = {f'r{i}': s.core.R[i] for i in range(4)}
+    result['wall_time'] = round(time.time() - start_time, 6)
+    result['stdout'] = stdout.getvalue()
+    return result
+
+def forkVariant(s, image, name, variant, *args):
+    ''' Simulates variant in a child process, sharing the simulator state copy-on-write.
+        Returns the child pid and the pipe its result comes from '''
+    read_end, write_end = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_end)
+            with os.fdopen(write_end, 'wb') as f:
+                f.write(json.dumps(runVariant(s, image, name, variant, *args)).encode())
+        finally:
+            os._exit(0)
+    os.close(write_end)
+    return pid, read_end
+
+def collectVariant(image, name, pid, read_end):
+    with os.fdopen(read_end, 'rb') as f:
+        data = f.read()
+    os.waitpid(pid, 0)
+    if len(data) == 0:
+        result = newResult(f'{image}[{name}]')
+        result['error'] = 'Variant process ended without result'
+        return result
+    return json.loads(data)
+
+def fanOut(s, image, symbol, variants, jobs=None, timeout=None, max_cycles=None, max_instructions=None, outputs=()):
+    ''' Runs loaded simulator up to symbol, then simulates every variant (see applyVariant) from there, each one in a
+        forked process (up to jobs at once) where available. Yields the results in variants order, target output
+        before symbol being part of every result stdout '''
+    boot_stdout = io.StringIO()
+    with contextlib.redirect_stdout(boot_stdout):
+        s.run_until(location(s, symbol))
+    log.info(f'{symbol} reached after {s.cycles["total"]} cycles')
+    names = [variant.get('name', str(index)) for index, variant in enumerate(variants)]
+    args = (timeout, max_cycles, max_instructions, outputs)
+
+    def results():
+        if not hasattr(os, 'fork'):
+            snapshot = s.snapshot()
+            for name, variant in zip(names, variants):
+                s.restore(snapshot)
+                yield runVariant(s, image, name, variant, *args)
+            return
+        running = []
+        for name, variant in zip(names, variants):
+            if len(running) == (jobs or os.cpu_count()):
+                yield collectVariant(image, *running.pop(0))
+            running.append((name,) + forkVariant(s, image, name, variant, *args))
+        while len(running) > 0:
+            yield collectVariant(image, *running.pop(0))
+
+    for result in results():
+        result['stdout'] = boot_stdout.getvalue() + result['stdout']
+        yield result
+
+def parseOutput(ctx, param, value):
+    try:
+        return [(where, int(size, 0)) for where, size in (output.rsplit(':', 1) for output in value)]
+    except ValueError:
+        raise click.BadParameter('expected LOCATION:SIZE')
+
+@click.command()
+@click.argument('elf_file', type=click.Path(exists=True, dir_okay=False))
+@click.argument('inputs', type=click.File('r'))
+@click.option('--at', 'symbol', default='main', show_default=True, help='Symbol (or address) where simulation forks into variants')
+@click.option('-r', '--read', 'outputs', multiple=True, callback=parseOutput, help='LOCATION:SIZE memory area reported for every variant (repeatable), location being a symbol or an address')
+@click.option('-j', '--jobs', type=click.IntRange(min=1), help='Count of variants simulated at once  [default: cpu count]')
+@click.option('-c', '--cpu', type=click.Choice(['M0', 'M0+', 'M3', 'M4', 'M23', 'M33'], case_sensitive=False), default='M4', help='Tune target (cycle counting)')
+@click.option('-t', '--timeout', type=click.IntRange(min=1), help='Stop simulation of a variant after this host wall-clock time (s), which depends on host speed  [default: none]')
+@click.option('--max-cycles', type=click.IntRange(min=1), help='Stop simulation of a variant once this count of cycles is simulated')
+@click.option('--max-instructions', type=click.IntRange(min=1), help='Stop simulation of a variant once this count of instructions is executed')
+@click.option('--cache-dir', type=click.Path(file_okay=False), help='Keep decoded programs in this directory to skip disassembly parsing or eager decoding on next runs of same image')
+@click.option('-a', '--accelerate', multiple=True, type=click.Choice(list(host_routines) + ['all']), help='Run this C library routine natively instead of simulating it (repeatable)')
+@click.option('-o', '--output', type=click.File('w'), default='-', help='Report file  [default: stdout]')
+@click.option('-f', '--format', 'report_format', type=click.Choice(['json', 'jsonl', 'junit'], case_sensitive=False), default='json', show_default=True, help='Report format, jsonl reports are written as soon as each variant ends')
+@click.option('-v', '--verbose', count=True, help='Tune stderr output verbosity')
+@click.version_option(__version__)
+def fanout(elf_file, inputs, symbol, outputs, jobs, cpu, timeout, max_cycles, max_instructions, cache_dir, accelerate, output, report_format, verbose):
+    ''' Runs ELF_FILE on thumb2 Instruction Set Simulator up to a symbol, then simulates from there every variant of
+        INPUTS (JSON lines, such as {"name": "n", "registers": {"r0": 1}, "memory": {"buffer": "00ff"}})
+        and reports their results'''
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, stream=sys.stderr)
+    log.getChild('Sim').setLevel(logging.INFO if verbose > 1 else logging.ERROR)
+
+    variants = [json.loads(line) for line in inputs if len(line.strip()) > 0]
+    s = Simulator(t_arch=Architecture.fromString(cpu), log_root=log)
+    if not loadImage(s, elf_file, cache_dir=cache_dir):
+        raise click.ClickException(f'Unable to load {elf_file}')
+    s.accelerate(host_routines if 'all' in accelerate else accelerate)
+
+    results = []
+    for result in fanOut(s, elf_file, symbol, variants, jobs, timeout, max_cycles, max_instructions, outputs):
+        log.info(f'{result["image"]} ended by {result["reason"]} ({result["cycles"]} cycles simulated in {result["wall_time"]:.3f} s)')
+        if report_format == 'jsonl':
+            writeJsonLine(result, output)
+        results.append(result)
+
+    if report_format == 'json':
+        json.dump(results, output, indent=2)
+        print(file=output)
+    elif report_format == 'junit':
+        writeJUnit(results, output, name='thumb2ISS-fanout')
+    sys.exit(0 if all(result['exit_code'] == 0 for result in results) else 1)
+
+if __name__ == '__main__':
+    fanout()
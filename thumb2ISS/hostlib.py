@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+
+# Native implementations of C library routines, run in place of their simulated code (see Simulator.accelerate).
+# Each routine takes memory and r0-r2 arguments, and returns r0 result, memory write as (address, data) or None,
+# and count of processed bytes (to model its cycle cost).
+
+def memcpy(memory, dst, src, n):
+    return dst, (dst, memory.readBytes(src, n)) if n > 0 else None, n
+
+def memmove(memory, dst, src, n):
+    # source is read before destination is written : overlapping areas are handled
+    return dst, (dst, memory.readBytes(src, n)) if n > 0 else None, n
+
+def memset(memory, dst, c, n):
+    return dst, (dst, bytes([c & 0xff]) * n) if n > 0 else None, n
+
+def strlen(memory, s, *_):
+    length = memory.find(s, 0)
+    if length < 0:
+        raise Exception(f'Illegal memory access, string at {hex(s)} is not terminated in its memory region')
+    return length, None, length + 1
+
+def memchr(memory, s, c, n):
+    if n == 0:
+        return 0, None, 0
+    index = memory.find(s, c & 0xff, n)
+    if index < 0:
+        return 0, None, n
+    return s + index, None, index + 1
+
+routines = {'memcpy': memcpy, 'memmove': memmove, 'memset': memset, 'strlen': strlen, 'memchr': memchr}
+
+# (fixed cycles, cycles per processed byte) up to return, fitted on simulated cycles of newlib routines
+# for Cortex-M4 (demo/hello_world-cm4.out) over aligned and unaligned areas
+costs = {
+    'memcpy':  (24, 1.1),
+    'memmove': (20, 1.8),
+    'memset':  (26, 0.9),
+    'strlen':  (40, 1.2),
+    'memchr':  (36, 1.6),
+}
+
+def cycleCost(name, size):
+    fixed, per_byte = costs[name]
+    return fixed + int(per_byte * size)
@@ -0,0 +1,161 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+
+# Python source of common register only instructions, generated by compiled blocks (see Simulator.compileBlock)
+# in place of calls to their executors. Registers are held in locals of the block function (see RegisterLocals),
+# flags are set as executors do : all four of them pending for additions, N, Z and C at once otherwise.
+
+# AddWithCarry(x, y, carry_in) operands of arithmetic instructions, from first operand n and second one y
+_arith = {
+    'ADD': ('{n}', '{y}', 0),
+    'CMN': ('{n}', '{y}', 0),
+    'SUB': ('{n}', '~{y} & 0xffffffff', 1),
+    'CMP': ('{n}', '~{y} & 0xffffffff', 1),
+    'RSB': ('~{n} & 0xffffffff', '{y}', 1),
+}
+# result of logical instructions, from first operand n and second one y
+_logical = {
+    'AND': '{n} & {y}',
+    'TST': '{n} & {y}',
+    'ORR': '{n} | {y}',
+    'ORN': '({n} | ~{y}) & 0xffffffff',
+    'EOR': '{n} ^ {y}',
+    'TEQ': '{n} ^ {y}',
+    'BIC': '{n} & ~{y}',
+    'MOV': '{y}',
+    'MVN': '~{y} & 0xffffffff',
+}
+# field mask and sign bit of extensions
+_extend = {'UXTB': (0xff, 0), 'UXTH': (0xffff, 0), 'SXTB': (0xff, 0x80), 'SXTH': (0xffff, 0x8000)}
+_compare = ('CMP', 'CMN', 'TST', 'TEQ')
+
+
+class RegisterLocals:
+    ''' Registers of a generated function held in locals r0 to r14 : loaded from R on first read, written back
+        to R when flushed '''
+
+    def __init__(self):
+        self.loaded = set()
+        self.dirty = set()
+
+    def read(self, reg, lines):
+        if reg not in self.loaded:
+            lines.append(f'r{reg} = R[{reg}]')
+            self.loaded.add(reg)
+        return f'r{reg}'
+
+    def write(self, reg):
+        self.loaded.add(reg)
+        self.dirty.add(reg)
+        return f'r{reg}'
+
+    def flush(self):
+        ''' Lines writing back updated registers, all of them being reloaded on next read '''
+        lines = [f'R[{reg}] = r{reg}' for reg in sorted(self.dirty)]
+        self.loaded = set()
+        self.dirty = set()
+        return lines
+
+
+def _shift(value, shift_t, shift_n):
+    ''' Expressions of shifted value and of its carry out (None when unchanged), as Shift_C '''
+    shift_t, n = shift_t.lower(), int(shift_n)
+    if n == 0:
+        return value, None
+    if shift_t == 'lsl':
+        return f'({value} << {n} & 0xffffffff)', f'({value} >> {32 - n} & 1)'
+    if shift_t == 'lsr':
+        return f'({value} >> {n})', f'({value} >> {n - 1} & 1)'
+    if shift_t == 'asr':
+        return f'(({value} - ({value} >> 31 << 32)) >> {n} & 0xffffffff)', f'({value} >> {n - 1} & 1)'
+    return f'(({value} >> {n} | {value} << {32 - n}) & 0xffffffff)', f'({value} >> {n - 1} & 1)'
+
+def _immCarry(imm32):
+    ''' Expression of carry out of an expanded constant (None when unchanged), as T32ExpandImmCarry '''
+    low = imm32 & 0xff
+    if imm32 in (low, low * 0x00010001, ((imm32 >> 8) & 0xff) * 0x01000100, low * 0x01010101):
+        return None
+    return str(int(imm32 >= 0x80000000))
+
+def _logicalFlags(carry):
+    if carry is None:
+        return 'apsr.nzcv = (apsr.nzcv & 3) | (t >> 28 & 8) | (t == 0) << 2'
+    return f'apsr.nzcv = (apsr.nzcv & 1) | (t >> 28 & 8) | (t == 0) << 2 | {carry} << 1'
+
+def inlined(instruction):
+    ''' True when source of decoded instruction is generated, given that it neither reads memory nor touches PC '''
+    ops = instruction.operands
+    if instruction.factory is None:
+        return ops.get('c') is None
+    family, form = instruction.factory[len('aarch32_'):-len('_A')].split('_', 1)
+    if ops.get('c') is not None or ops.get('shift_t', 'lsl').lower() == 'rrx':
+        return False
+    if family in _arith or family in _logical:
+        return form[:2] in ('i_', 'r_') or (family in ('ADD', 'SUB') and form.startswith('SP_i_'))
+    return family in ('MUL', 'MLA', 'MLS') or family in _extend
+
+def inlineSource(instruction, reg_num, regs):
+    ''' Lines executing decoded instruction (see inlined) on register locals '''
+    ops = instruction.operands
+    if instruction.factory is None:
+        return []
+    family, form = instruction.factory[len('aarch32_'):-len('_A')].split('_', 1)
+    setflags = instruction.bitdiffs.get('S') == '1'
+    dest = ops.get('Rd') or ops.get('Rdn') or ops.get('Rdm') or ops.get('Rn')
+    lines = []
+
+    if family in ('MUL', 'MLA', 'MLS'):
+        n = regs.read(reg_num[ops['Rn']], lines)
+        m = regs.read(reg_num[ops.get('Rm') or ops.get('Rdm') or dest], lines)
+        if family == 'MLA':
+            lines.append(f't = ({n} * {m} + {regs.read(reg_num[ops["Ra"]], lines)}) & 0xffffffff')
+        elif family == 'MLS':
+            lines.append(f't = ({regs.read(reg_num[ops["Ra"]], lines)} - {n} * {m}) & 0xffffffff')
+        else:
+            lines.append(f't = {n} * {m} & 0xffffffff')
+        lines.append(f'{regs.write(reg_num[dest])} = t')
+        if setflags:
+            lines.append(_logicalFlags(None))
+        return lines
+
+    if family in _extend:
+        field, sign = _extend[family]
+        rotated, _ = _shift(regs.read(reg_num[ops['Rm']], lines), 'ror', ops.get('rotation') or '0')
+        if sign:
+            lines.append(f't = {rotated} & {field:#x}')
+            lines.append(f'{regs.write(reg_num[dest])} = t - ((t & {sign:#x}) << 1) & 0xffffffff')
+        else:
+            lines.append(f'{regs.write(reg_num[dest])} = {rotated} & {field:#x}')
+        return lines
+
+    # second operand : expanded constant or shifted register, and its carry out
+    if form.startswith('r_'):
+        y, carry = _shift(regs.read(reg_num[ops['Rm']], lines), ops.get('shift_t') or 'lsl', ops.get('shift_n') or '0')
+    else:
+        # constant of 16 bits RSB is implicit
+        imm32 = 0 if instruction.factory == 'aarch32_RSB_i_T1_A' else int(ops['imm32'], 0) & 0xffffffff
+        y, carry = f'{imm32:#x}', _immCarry(imm32)
+    if family not in ('MOV', 'MVN'):
+        n = regs.read(reg_num[ops.get('Rn') or ops.get('Rdn') or ops['Rd']], lines)
+
+    if family in _arith:
+        x, y, carry_in = (operand.format(n=n, y=y) if type(operand) is str else operand for operand in _arith[family])
+        lines += [f'u = {x}', f'v = {y}', f's = u + v + 1' if carry_in else 's = u + v']
+        if family not in _compare:
+            lines.append(f'{regs.write(reg_num[dest])} = s & 0xffffffff')
+        if setflags or family in _compare:
+            lines.append('apsr.pending = (u, v, s)')
+    else:
+        lines.append('t = ' + _logical[family].format(n=n if family not in ('MOV', 'MVN') else None, y=y))
+        # carry out is shifted out of source register, which may be the destination one
+        if setflags or family in _compare:
+            lines.append(_logicalFlags(carry))
+        if family not in _compare:
+            lines.append(f'{regs.write(reg_num[dest])} = t')
+    return lines
@@ -44,7 +44,8 @@ def aarch32_ADC_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADC_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADC_i_T1_A_exec skipped')
     return aarch32_ADC_i_T1_A_exec
 
 
@@ -82,7 +83,8 @@ def aarch32_ADC_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADC_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADC_r_T1_A_exec skipped')
     return aarch32_ADC_r_T1_A_exec
 
 # pattern ADC{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -135,7 +137,8 @@ def aarch32_ADC_r_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADC_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADC_r_T2_A_exec skipped')
     return aarch32_ADC_r_T2_A_exec
 
 
@@ -164,7 +167,8 @@ def aarch32_ADD_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_i_T1_A_exec skipped')
     return aarch32_ADD_i_T1_A_exec
 
 # pattern ADD<c>{<q>} <Rdn>, #<imm8> with bitdiffs=[('S', '0')]
@@ -196,7 +200,8 @@ def aarch32_ADD_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_i_T2_A_exec skipped')
     return aarch32_ADD_i_T2_A_exec
 
 # pattern ADD<c>.W {<Rd>,} <Rn>, #<const> with bitdiffs=[('S', '0')]
@@ -231,7 +236,8 @@ def aarch32_ADD_i_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_i_T3_A_exec skipped')
     return aarch32_ADD_i_T3_A_exec
 
 # pattern ADD{<c>}{<q>} {<Rd>,} <Rn>, #<imm12> with bitdiffs=[]
@@ -261,7 +267,8 @@ def aarch32_ADD_i_T4_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_i_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_i_T4_A_exec skipped')
     return aarch32_ADD_i_T4_A_exec
 
 
@@ -299,7 +306,8 @@ def aarch32_ADD_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_r_T1_A_exec skipped')
     return aarch32_ADD_r_T1_A_exec
 
 # pattern ADD<c>{<q>} <Rdn>, <Rm> with bitdiffs=[('DN', '1')]
@@ -334,7 +342,8 @@ def aarch32_ADD_r_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_r_T2_A_exec skipped')
     return aarch32_ADD_r_T2_A_exec
 
 # pattern ADD{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -389,7 +398,8 @@ def aarch32_ADD_r_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_r_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_r_T3_A_exec skipped')
     return aarch32_ADD_r_T3_A_exec
 
 
@@ -420,7 +430,8 @@ def aarch32_ADD_SP_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_i_T1_A_exec skipped')
     return aarch32_ADD_SP_i_T1_A_exec
 
 # pattern ADD{<c>}{<q>} {SP,} SP, #<imm7> with bitdiffs=[]
@@ -448,7 +459,8 @@ def aarch32_ADD_SP_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_i_T2_A_exec skipped')
     return aarch32_ADD_SP_i_T2_A_exec
 
 # pattern ADD{<c>}.W {<Rd>,} SP, #<const> with bitdiffs=[('S', '0')]
@@ -484,7 +496,8 @@ def aarch32_ADD_SP_i_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_i_T3_A_exec skipped')
     return aarch32_ADD_SP_i_T3_A_exec
 
 # pattern ADD{<c>}{<q>} {<Rd>,} SP, #<imm12> with bitdiffs=[]
@@ -517,7 +530,8 @@ def aarch32_ADD_SP_i_T4_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_i_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_i_T4_A_exec skipped')
     return aarch32_ADD_SP_i_T4_A_exec
 
 
@@ -549,7 +563,8 @@ def aarch32_ADD_SP_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_r_T1_A_exec skipped')
     return aarch32_ADD_SP_r_T1_A_exec
 
 # pattern ADD{<c>}{<q>} {SP,} SP, <Rm> with bitdiffs=[]
@@ -578,7 +593,8 @@ def aarch32_ADD_SP_r_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_r_T2_A_exec skipped')
     return aarch32_ADD_SP_r_T2_A_exec
 
 # pattern ADD{<c>}{<q>} {<Rd>,} SP, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -625,7 +641,8 @@ def aarch32_ADD_SP_r_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_r_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_r_T3_A_exec skipped')
     return aarch32_ADD_SP_r_T3_A_exec
 
 
@@ -656,7 +673,8 @@ def aarch32_ADR_T1_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_ADR_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADR_T1_A_exec skipped')
     return aarch32_ADR_T1_A_exec
 
 # pattern ADR{<c>}{<q>} <Rd>, <label> with bitdiffs=[]
@@ -687,7 +705,8 @@ def aarch32_ADR_T2_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_ADR_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADR_T2_A_exec skipped')
     return aarch32_ADR_T2_A_exec
 
 # pattern ADR{<c>}.W <Rd>, <label> with bitdiffs=[]
@@ -722,7 +741,8 @@ def aarch32_ADR_T3_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_ADR_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADR_T3_A_exec skipped')
     return aarch32_ADR_T3_A_exec
 
 
@@ -743,7 +763,6 @@ def aarch32_AND_i_T1_A(core, regex_match, bitdiffs):
     log.debug(f'aarch32_AND_i_T1_A Rd={Rd} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     d = core.reg_num[Rd];  n = core.reg_num[Rn];  setflags = (S == '1');
-    carry = core.APSR.C;
     if (d == 15 and not setflags) or n == 15:
         raise Exception('UNPREDICTABLE'); # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -762,10 +781,11 @@ def aarch32_AND_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.N = core.Bit(result,31);
                     core.APSR.Z = core.IsZeroBit(result);
-                    core.APSR.C = carry;
+                    core.APSR.C = core.T32ExpandImmCarry(imm32);
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_AND_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_AND_i_T1_A_exec skipped')
     return aarch32_AND_i_T1_A_exec
 
 
@@ -806,7 +826,8 @@ def aarch32_AND_r_T1_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_AND_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_AND_r_T1_A_exec skipped')
     return aarch32_AND_r_T1_A_exec
 
 # pattern AND{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -863,7 +884,8 @@ def aarch32_AND_r_T2_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_AND_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_AND_r_T2_A_exec skipped')
     return aarch32_AND_r_T2_A_exec
 
 
@@ -883,7 +905,8 @@ def aarch32_B_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.BranchWritePC(abs_address, 'DIR');
         else:
-            log.debug(f'aarch32_B_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_B_T1_A_exec skipped')
     return aarch32_B_T1_A_exec
 
 # pattern B{<c>}{<q>} <label> with bitdiffs=[]
@@ -901,7 +924,8 @@ def aarch32_B_T2_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.BranchWritePC(abs_address, 'DIR');
         else:
-            log.debug(f'aarch32_B_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_B_T2_A_exec skipped')
     return aarch32_B_T2_A_exec
 
 # pattern B<c>.W <label> with bitdiffs=[]
@@ -921,7 +945,8 @@ def aarch32_B_T3_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.BranchWritePC(abs_address, 'DIR');
         else:
-            log.debug(f'aarch32_B_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_B_T3_A_exec skipped')
     return aarch32_B_T3_A_exec
 
 # pattern B{<c>}.W <label> with bitdiffs=[]
@@ -941,7 +966,8 @@ def aarch32_B_T4_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.BranchWritePC(abs_address, 'DIR');
         else:
-            log.debug(f'aarch32_B_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_B_T4_A_exec skipped')
     return aarch32_B_T4_A_exec
 
 
@@ -968,7 +994,8 @@ def aarch32_BFC_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.readR(d) & ~((0xffffffff >> (31 - msbit + lsbit)) << lsbit));
             # Other bits of core.readR(d) are unchanged
         else:
-            log.debug(f'aarch32_BFC_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BFC_T1_A_exec skipped')
     return aarch32_BFC_T1_A_exec
 
 
@@ -998,7 +1025,8 @@ def aarch32_BFI_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, tmp_Rd | ((core.UInt(core.readR(n)) & mask) << lsbit));
             # Other bits of core.readR(d) are unchanged
         else:
-            log.debug(f'aarch32_BFI_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BFI_T1_A_exec skipped')
     return aarch32_BFI_T1_A_exec
 
 
@@ -1019,7 +1047,6 @@ def aarch32_BIC_i_T1_A(core, regex_match, bitdiffs):
     log.debug(f'aarch32_BIC_i_T1_A Rd={Rd} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     d = core.reg_num[Rd];  n = core.reg_num[Rn];  setflags = (S == '1');
-    carry = core.APSR.C;
     if d == 15 or n == 15:
         raise Exception('UNPREDICTABLE');  # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -1038,10 +1065,11 @@ def aarch32_BIC_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.N = core.Bit(result,31);
                     core.APSR.Z = core.IsZeroBit(result);
-                    core.APSR.C = carry;
+                    core.APSR.C = core.T32ExpandImmCarry(imm32);
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_BIC_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BIC_i_T1_A_exec skipped')
     return aarch32_BIC_i_T1_A_exec
 
 
@@ -1082,7 +1110,8 @@ def aarch32_BIC_r_T1_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_BIC_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BIC_r_T1_A_exec skipped')
     return aarch32_BIC_r_T1_A_exec
 
 # pattern BIC{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -1138,7 +1167,8 @@ def aarch32_BIC_r_T2_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_BIC_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BIC_r_T2_A_exec skipped')
     return aarch32_BIC_r_T2_A_exec
 
 
@@ -1176,7 +1206,8 @@ def aarch32_BLX_r_T1_A(core, regex_match, bitdiffs):
             target = core.readR(m);
             core.BXWritePC(target, 'INDCALL');
         else:
-            log.debug(f'aarch32_BLX_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BLX_r_T1_A_exec skipped')
     return aarch32_BLX_r_T1_A_exec
 
 
@@ -1198,7 +1229,8 @@ def aarch32_BL_i_T1_A(core, regex_match, bitdiffs):
                 targetAddress = abs_address;
             core.BranchWritePC(targetAddress, 'DIRCALL');
         else:
-            log.debug(f'aarch32_BL_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BL_i_T1_A_exec skipped')
     return aarch32_BL_i_T1_A_exec
 
 # pattern BLX{<c>}{<q>} <label> with bitdiffs=[]
@@ -1221,7 +1253,8 @@ def aarch32_BL_i_T2_A(core, regex_match, bitdiffs):
                 targetAddress = abs_address;
             core.BranchWritePC(targetAddress, 'DIRCALL');
         else:
-            log.debug(f'aarch32_BL_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BL_i_T2_A_exec skipped')
     return aarch32_BL_i_T2_A_exec
 
 
@@ -1241,7 +1274,8 @@ def aarch32_BX_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.BXWritePC(core.readR(m), 'INDIR');
         else:
-            log.debug(f'aarch32_BX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BX_T1_A_exec skipped')
     return aarch32_BX_T1_A_exec
 
 
@@ -1282,7 +1316,8 @@ def aarch32_CLREX_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.ClearExclusiveLocal(core.ProcessorID());
         else:
-            log.debug(f'aarch32_CLREX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CLREX_T1_A_exec skipped')
     return aarch32_CLREX_T1_A_exec
 
 
@@ -1307,7 +1342,8 @@ def aarch32_CLZ_T1_A(core, regex_match, bitdiffs):
             result = core.CountLeadingZeroBits(core.readR(m));
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_CLZ_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CLZ_T1_A_exec skipped')
     return aarch32_CLZ_T1_A_exec
 
 
@@ -1331,7 +1367,8 @@ def aarch32_CMN_i_T1_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), imm32, '0');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMN_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMN_i_T1_A_exec skipped')
     return aarch32_CMN_i_T1_A_exec
 
 
@@ -1355,7 +1392,8 @@ def aarch32_CMN_r_T1_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), shifted, '0');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMN_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMN_r_T1_A_exec skipped')
     return aarch32_CMN_r_T1_A_exec
 
 # pattern CMN{<c>}{<q>} <Rn>, <Rm>, RRX with bitdiffs=[('stype', '11')]
@@ -1389,7 +1427,8 @@ def aarch32_CMN_r_T2_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), shifted, '0');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMN_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMN_r_T2_A_exec skipped')
     return aarch32_CMN_r_T2_A_exec
 
 
@@ -1411,7 +1450,8 @@ def aarch32_CMP_i_T1_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), core.NOT(imm32), '1');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMP_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMP_i_T1_A_exec skipped')
     return aarch32_CMP_i_T1_A_exec
 
 # pattern CMP{<c>}.W <Rn>, #<const> with bitdiffs=[]
@@ -1435,7 +1475,8 @@ def aarch32_CMP_i_T2_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), core.NOT(imm32), '1');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMP_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMP_i_T2_A_exec skipped')
     return aarch32_CMP_i_T2_A_exec
 
 
@@ -1459,7 +1500,8 @@ def aarch32_CMP_r_T1_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), core.NOT(shifted), '1');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMP_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMP_r_T1_A_exec skipped')
     return aarch32_CMP_r_T1_A_exec
 
 # pattern CMP{<c>}{<q>} <Rn>, <Rm> with bitdiffs=[]
@@ -1485,7 +1527,8 @@ def aarch32_CMP_r_T2_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), core.NOT(shifted), '1');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMP_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMP_r_T2_A_exec skipped')
     return aarch32_CMP_r_T2_A_exec
 
 # pattern CMP{<c>}{<q>} <Rn>, <Rm>, RRX with bitdiffs=[('stype', '11')]
@@ -1515,7 +1558,8 @@ def aarch32_CMP_r_T3_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), core.NOT(shifted), '1');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMP_r_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMP_r_T3_A_exec skipped')
     return aarch32_CMP_r_T3_A_exec
 
 
@@ -1536,7 +1580,6 @@ def aarch32_EOR_i_T1_A(core, regex_match, bitdiffs):
     log.debug(f'aarch32_EOR_i_T1_A Rd={Rd} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     d = core.reg_num[Rd];  n = core.reg_num[Rn];  setflags = (S == '1');
-    carry = core.APSR.C;
     if (d == 15 and not setflags) or n == 15:
         raise Exception('UNPREDICTABLE');
     # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
@@ -1556,10 +1599,11 @@ def aarch32_EOR_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.N = core.Bit(result,31);
                     core.APSR.Z = core.IsZeroBit(result);
-                    core.APSR.C = carry;
+                    core.APSR.C = core.T32ExpandImmCarry(imm32);
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_EOR_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_EOR_i_T1_A_exec skipped')
     return aarch32_EOR_i_T1_A_exec
 
 
@@ -1600,7 +1644,8 @@ def aarch32_EOR_r_T1_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_EOR_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_EOR_r_T1_A_exec skipped')
     return aarch32_EOR_r_T1_A_exec
 
 # pattern EOR{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -1657,7 +1702,8 @@ def aarch32_EOR_r_T2_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_EOR_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_EOR_r_T2_A_exec skipped')
     return aarch32_EOR_r_T2_A_exec
 
 
@@ -1713,7 +1759,8 @@ def aarch32_LDM_T1_A(core, regex_match, bitdiffs):
             if wback and registers[n] == '1':
                  core.writeR(n, UNKNOWN = 0);
         else:
-            log.debug(f'aarch32_LDM_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDM_T1_A_exec skipped')
     return aarch32_LDM_T1_A_exec
 
 # pattern LDM{IA}{<c>}.W <Rn>{!}, <registers> with bitdiffs=[]
@@ -1762,7 +1809,8 @@ def aarch32_LDM_T2_A(core, regex_match, bitdiffs):
             if wback and registers[n] == '1':
                  core.writeR(n, UNKNOWN = 0);
         else:
-            log.debug(f'aarch32_LDM_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDM_T2_A_exec skipped')
     return aarch32_LDM_T2_A_exec
 
 
@@ -1807,7 +1855,8 @@ def aarch32_LDMDB_T1_A(core, regex_match, bitdiffs):
             if wback and registers[n] == '1':
                  core.writeR(n, UNKNOWN = 0);
         else:
-            log.debug(f'aarch32_LDMDB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDMDB_T1_A_exec skipped')
     return aarch32_LDMDB_T1_A_exec
 
 
@@ -1821,7 +1870,7 @@ def aarch32_LDRBT_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRBT_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  postindex = False;  add = True;
@@ -1841,7 +1890,8 @@ def aarch32_LDRBT_T1_A(core, regex_match, bitdiffs):
             if postindex:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRBT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRBT_T1_A_exec skipped')
     return aarch32_LDRBT_T1_A_exec
 
 
@@ -1855,7 +1905,7 @@ def aarch32_LDRB_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRB_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -1871,7 +1921,8 @@ def aarch32_LDRB_i_T1_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRB_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRB_i_T1_A_exec skipped')
     return aarch32_LDRB_i_T1_A_exec
 
 # pattern LDRB{<c>}.W <Rt>, [<Rn> {, #{+}<imm>}] with bitdiffs=[]
@@ -1885,7 +1936,7 @@ def aarch32_LDRB_i_T2_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRB_i_T2_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -1902,7 +1953,8 @@ def aarch32_LDRB_i_T2_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRB_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRB_i_T2_A_exec skipped')
     return aarch32_LDRB_i_T2_A_exec
 
 # pattern LDRB{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -1921,7 +1973,7 @@ def aarch32_LDRB_i_T3_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRB_i_T3_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if P == '0' and W == '0':
@@ -1942,7 +1994,8 @@ def aarch32_LDRB_i_T3_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRB_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRB_i_T3_A_exec skipped')
     return aarch32_LDRB_i_T3_A_exec
 
 
@@ -1975,7 +2028,8 @@ def aarch32_LDRB_l_T1_A(core, regex_match, bitdiffs):
                 address = abs_address;
             core.writeR(t, core.ZeroExtend(core.ReadMemU(address,1), 32));
         else:
-            log.debug(f'aarch32_LDRB_l_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRB_l_T1_A_exec skipped')
     return aarch32_LDRB_l_T1_A_exec
 
 
@@ -2004,7 +2058,8 @@ def aarch32_LDRB_r_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRB_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRB_r_T1_A_exec skipped')
     return aarch32_LDRB_r_T1_A_exec
 
 # pattern LDRB{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -2040,7 +2095,8 @@ def aarch32_LDRB_r_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRB_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRB_r_T2_A_exec skipped')
     return aarch32_LDRB_r_T2_A_exec
 
 
@@ -2062,7 +2118,7 @@ def aarch32_LDRD_i_T1_A(core, regex_match, bitdiffs):
     W = bitdiffs.get('W', '0')
     U = bitdiffs.get('U', '1')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRD_i_T1_A Rt={Rt} Rt2={Rt2} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  t2 = core.reg_num[Rt2];  n = core.reg_num[Rn];  
@@ -2091,7 +2147,8 @@ def aarch32_LDRD_i_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRD_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRD_i_T1_A_exec skipped')
     return aarch32_LDRD_i_T1_A_exec
 
 
@@ -2137,7 +2194,8 @@ def aarch32_LDRD_l_T1_A(core, regex_match, bitdiffs):
                 core.writeR(t, core.ReadMemA(address,4));
                 core.writeR(t2, core.ReadMemA(address+4,4));
         else:
-            log.debug(f'aarch32_LDRD_l_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRD_l_T1_A_exec skipped')
     return aarch32_LDRD_l_T1_A_exec
 
 
@@ -2151,7 +2209,7 @@ def aarch32_LDREX_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDREX_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -2165,7 +2223,8 @@ def aarch32_LDREX_T1_A(core, regex_match, bitdiffs):
             core.SetExclusiveMonitors(address,4);
             core.writeR(t, core.ReadMemA(address,4));
         else:
-            log.debug(f'aarch32_LDREX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDREX_T1_A_exec skipped')
     return aarch32_LDREX_T1_A_exec
 
 
@@ -2190,7 +2249,8 @@ def aarch32_LDREXB_T1_A(core, regex_match, bitdiffs):
             core.SetExclusiveMonitors(address,1);
             core.writeR(t, core.ZeroExtend(core.ReadMemA(address,1), 32));
         else:
-            log.debug(f'aarch32_LDREXB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDREXB_T1_A_exec skipped')
     return aarch32_LDREXB_T1_A_exec
 
 
@@ -2215,7 +2275,8 @@ def aarch32_LDREXH_T1_A(core, regex_match, bitdiffs):
             core.SetExclusiveMonitors(address,2);
             core.writeR(t, core.ZeroExtend(core.ReadMemA(address,2), 32));
         else:
-            log.debug(f'aarch32_LDREXH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDREXH_T1_A_exec skipped')
     return aarch32_LDREXH_T1_A_exec
 
 
@@ -2229,7 +2290,7 @@ def aarch32_LDRHT_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRHT_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  postindex = False;  add = True;
@@ -2250,7 +2311,8 @@ def aarch32_LDRHT_T1_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.ZeroExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRHT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRHT_T1_A_exec skipped')
     return aarch32_LDRHT_T1_A_exec
 
 
@@ -2264,7 +2326,7 @@ def aarch32_LDRH_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRH_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -2281,7 +2343,8 @@ def aarch32_LDRH_i_T1_A(core, regex_match, bitdiffs):
                      core.writeR(n, offset_addr);
                 core.writeR(t, core.ZeroExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRH_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRH_i_T1_A_exec skipped')
     return aarch32_LDRH_i_T1_A_exec
 
 # pattern LDRH{<c>}.W <Rt>, [<Rn> {, #{+}<imm>}] with bitdiffs=[]
@@ -2295,7 +2358,7 @@ def aarch32_LDRH_i_T2_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRH_i_T2_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -2313,7 +2376,8 @@ def aarch32_LDRH_i_T2_A(core, regex_match, bitdiffs):
                      core.writeR(n, offset_addr);
                 core.writeR(t, core.ZeroExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRH_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRH_i_T2_A_exec skipped')
     return aarch32_LDRH_i_T2_A_exec
 
 # pattern LDRH{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -2332,7 +2396,7 @@ def aarch32_LDRH_i_T3_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRH_i_T3_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if P == '0' and W == '0':
@@ -2354,7 +2418,8 @@ def aarch32_LDRH_i_T3_A(core, regex_match, bitdiffs):
                      core.writeR(n, offset_addr);
                 core.writeR(t, core.ZeroExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRH_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRH_i_T3_A_exec skipped')
     return aarch32_LDRH_i_T3_A_exec
 
 
@@ -2388,7 +2453,8 @@ def aarch32_LDRH_l_T1_A(core, regex_match, bitdiffs):
             data = core.ReadMemU(address,2);
             core.writeR(t, core.ZeroExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRH_l_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRH_l_T1_A_exec skipped')
     return aarch32_LDRH_l_T1_A_exec
 
 
@@ -2418,7 +2484,8 @@ def aarch32_LDRH_r_T1_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.ZeroExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRH_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRH_r_T1_A_exec skipped')
     return aarch32_LDRH_r_T1_A_exec
 
 # pattern LDRH{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -2455,7 +2522,8 @@ def aarch32_LDRH_r_T2_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.ZeroExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRH_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRH_r_T2_A_exec skipped')
     return aarch32_LDRH_r_T2_A_exec
 
 
@@ -2469,7 +2537,7 @@ def aarch32_LDRSBT_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSBT_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  postindex = False;  add = True;
@@ -2489,7 +2557,8 @@ def aarch32_LDRSBT_T1_A(core, regex_match, bitdiffs):
             if postindex:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRSBT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSBT_T1_A_exec skipped')
     return aarch32_LDRSBT_T1_A_exec
 
 
@@ -2503,7 +2572,7 @@ def aarch32_LDRSB_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSB_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -2519,7 +2588,8 @@ def aarch32_LDRSB_i_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRSB_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSB_i_T1_A_exec skipped')
     return aarch32_LDRSB_i_T1_A_exec
 
 # pattern LDRSB{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -2538,7 +2608,7 @@ def aarch32_LDRSB_i_T2_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSB_i_T2_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if P == '0' and W == '0':
@@ -2558,7 +2628,8 @@ def aarch32_LDRSB_i_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRSB_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSB_i_T2_A_exec skipped')
     return aarch32_LDRSB_i_T2_A_exec
 
 
@@ -2591,7 +2662,8 @@ def aarch32_LDRSB_l_T1_A(core, regex_match, bitdiffs):
                 address = abs_address;
             core.writeR(t, core.SignExtend(core.ReadMemU(address,1), 32));
         else:
-            log.debug(f'aarch32_LDRSB_l_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSB_l_T1_A_exec skipped')
     return aarch32_LDRSB_l_T1_A_exec
 
 
@@ -2620,7 +2692,8 @@ def aarch32_LDRSB_r_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRSB_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSB_r_T1_A_exec skipped')
     return aarch32_LDRSB_r_T1_A_exec
 
 # pattern LDRSB{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -2656,7 +2729,8 @@ def aarch32_LDRSB_r_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRSB_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSB_r_T2_A_exec skipped')
     return aarch32_LDRSB_r_T2_A_exec
 
 
@@ -2670,7 +2744,7 @@ def aarch32_LDRSHT_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSHT_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  postindex = False;  add = True;
@@ -2691,7 +2765,8 @@ def aarch32_LDRSHT_T1_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSHT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSHT_T1_A_exec skipped')
     return aarch32_LDRSHT_T1_A_exec
 
 
@@ -2705,7 +2780,7 @@ def aarch32_LDRSH_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSH_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -2722,7 +2797,8 @@ def aarch32_LDRSH_i_T1_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSH_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSH_i_T1_A_exec skipped')
     return aarch32_LDRSH_i_T1_A_exec
 
 # pattern LDRSH{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -2741,7 +2817,7 @@ def aarch32_LDRSH_i_T2_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSH_i_T2_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if P == '0' and W == '0':
@@ -2762,7 +2838,8 @@ def aarch32_LDRSH_i_T2_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSH_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSH_i_T2_A_exec skipped')
     return aarch32_LDRSH_i_T2_A_exec
 
 
@@ -2796,7 +2873,8 @@ def aarch32_LDRSH_l_T1_A(core, regex_match, bitdiffs):
             data = core.ReadMemU(address,2);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSH_l_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSH_l_T1_A_exec skipped')
     return aarch32_LDRSH_l_T1_A_exec
 
 
@@ -2826,7 +2904,8 @@ def aarch32_LDRSH_r_T1_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSH_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSH_r_T1_A_exec skipped')
     return aarch32_LDRSH_r_T1_A_exec
 
 # pattern LDRSH{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -2863,7 +2942,8 @@ def aarch32_LDRSH_r_T2_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSH_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSH_r_T2_A_exec skipped')
     return aarch32_LDRSH_r_T2_A_exec
 
 
@@ -2877,7 +2957,7 @@ def aarch32_LDRT_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRT_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  postindex = False;  add = True;
@@ -2898,7 +2978,8 @@ def aarch32_LDRT_T1_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDRT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRT_T1_A_exec skipped')
     return aarch32_LDRT_T1_A_exec
 
 
@@ -2912,7 +2993,7 @@ def aarch32_LDR_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDR_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -2935,7 +3016,8 @@ def aarch32_LDR_i_T1_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_i_T1_A_exec skipped')
     return aarch32_LDR_i_T1_A_exec
 
 # pattern LDR{<c>}{<q>} <Rt>, [SP{, #{+}<imm>}] with bitdiffs=[]
@@ -2946,7 +3028,7 @@ def aarch32_LDR_i_T2_A(core, regex_match, bitdiffs):
     Rt = regex_groups.get('Rt', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDR_i_T2_A Rt={Rt} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = 13;  
@@ -2969,7 +3051,8 @@ def aarch32_LDR_i_T2_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_i_T2_A_exec skipped')
     return aarch32_LDR_i_T2_A_exec
 
 # pattern LDR{<c>}.W <Rt>, [<Rn> {, #{+}<imm>}] with bitdiffs=[]
@@ -2983,7 +3066,7 @@ def aarch32_LDR_i_T3_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDR_i_T3_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  index = True;  add = True;
@@ -3006,7 +3089,8 @@ def aarch32_LDR_i_T3_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_i_T3_A_exec skipped')
     return aarch32_LDR_i_T3_A_exec
 
 # pattern LDR{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -3025,7 +3109,7 @@ def aarch32_LDR_i_T4_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDR_i_T4_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if P == '0' and W == '0':
@@ -3050,7 +3134,8 @@ def aarch32_LDR_i_T4_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_i_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_i_T4_A_exec skipped')
     return aarch32_LDR_i_T4_A_exec
 
 
@@ -3081,7 +3166,8 @@ def aarch32_LDR_l_T1_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_l_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_l_T1_A_exec skipped')
     return aarch32_LDR_l_T1_A_exec
 
 # pattern LDR{<c>}.W <Rt>, <label> with bitdiffs=[]
@@ -3120,7 +3206,8 @@ def aarch32_LDR_l_T2_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_l_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_l_T2_A_exec skipped')
     return aarch32_LDR_l_T2_A_exec
 
 
@@ -3154,7 +3241,8 @@ def aarch32_LDR_r_T1_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_r_T1_A_exec skipped')
     return aarch32_LDR_r_T1_A_exec
 
 # pattern LDR{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -3195,7 +3283,8 @@ def aarch32_LDR_r_T2_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_r_T2_A_exec skipped')
     return aarch32_LDR_r_T2_A_exec
 
 
@@ -3228,7 +3317,8 @@ def aarch32_MLA_T1_A(core, regex_match, bitdiffs):
                 core.APSR.Z = core.IsZeroBit(core.Field(result,31,0));
                 # core.APSR.C, core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MLA_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MLA_T1_A_exec skipped')
     return aarch32_MLA_T1_A_exec
 
 
@@ -3258,7 +3348,8 @@ def aarch32_MLS_T1_A(core, regex_match, bitdiffs):
             result = addend - operand1 * operand2;
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_MLS_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MLS_T1_A_exec skipped')
     return aarch32_MLS_T1_A_exec
 
 
@@ -3282,7 +3373,8 @@ def aarch32_MOVT_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),31,16,imm32));
             # core.Field(core.readR(d),15,0) unchanged
         else:
-            log.debug(f'aarch32_MOVT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOVT_T1_A_exec skipped')
     return aarch32_MOVT_T1_A_exec
 
 
@@ -3299,7 +3391,7 @@ def aarch32_MOV_i_T1_A(core, regex_match, bitdiffs):
     S = bitdiffs.get('S', '0')
     log.debug(f'aarch32_MOV_i_T1_A Rd={Rd} imm32={imm32} cond={cond}')
     # decode
-    d = core.reg_num[Rd];  setflags = (S == '1');  carry = core.APSR.C;
+    d = core.reg_num[Rd];  setflags = (S == '1');
 
     def aarch32_MOV_i_T1_A_exec():
         # execute
@@ -3316,10 +3408,11 @@ def aarch32_MOV_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.N = core.Bit(result,31);
                     core.APSR.Z = core.IsZeroBit(result);
-                    core.APSR.C = carry;
+                    core.APSR.C = core.T32ExpandImmCarry(imm32);
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_i_T1_A_exec skipped')
     return aarch32_MOV_i_T1_A_exec
 
 # pattern MOV<c>.W <Rd>, #<const> with bitdiffs=[('S', '0')]
@@ -3338,7 +3431,7 @@ def aarch32_MOV_i_T2_A(core, regex_match, bitdiffs):
     S = bitdiffs.get('S', '0')
     log.debug(f'aarch32_MOV_i_T2_A Rd={Rd} imm32={imm32} cond={cond}')
     # decode
-    d = core.reg_num[Rd];  setflags = (S == '1');  carry = core.APSR.C;
+    d = core.reg_num[Rd];  setflags = (S == '1');
     if d == 15:
         raise Exception('UNPREDICTABLE'); # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -3357,10 +3450,11 @@ def aarch32_MOV_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.N = core.Bit(result,31);
                     core.APSR.Z = core.IsZeroBit(result);
-                    core.APSR.C = carry;
+                    core.APSR.C = core.T32ExpandImmCarry(imm32);
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_i_T2_A_exec skipped')
     return aarch32_MOV_i_T2_A_exec
 
 # pattern MOV{<c>}{<q>} <Rd>, #<imm16> with bitdiffs=[]
@@ -3396,7 +3490,8 @@ def aarch32_MOV_i_T3_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_i_T3_A_exec skipped')
     return aarch32_MOV_i_T3_A_exec
 
 
@@ -3431,7 +3526,8 @@ def aarch32_MOV_r_T1_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_r_T1_A_exec skipped')
     return aarch32_MOV_r_T1_A_exec
 
 # pattern MOV<c>{<q>} <Rd>, <Rm> {, <shift> #<amount>} with bitdiffs=[('S', '0')]
@@ -3484,7 +3580,8 @@ def aarch32_MOV_r_T2_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_r_T2_A_exec skipped')
     return aarch32_MOV_r_T2_A_exec
 
 # pattern MOV{<c>}{<q>} <Rd>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -3570,7 +3667,8 @@ def aarch32_MOV_r_T3_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_r_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_r_T3_A_exec skipped')
     return aarch32_MOV_r_T3_A_exec
 
 
@@ -3640,7 +3738,8 @@ def aarch32_MOV_rr_T1_A(core, regex_match, bitdiffs):
                 core.APSR.C = carry;
                 # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_rr_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_rr_T1_A_exec skipped')
     return aarch32_MOV_rr_T1_A_exec
 
 # pattern MOVS.W <Rd>, <Rm>, <shift> <Rs> with bitdiffs=[('S', '1')]
@@ -3710,7 +3809,8 @@ def aarch32_MOV_rr_T2_A(core, regex_match, bitdiffs):
                 core.APSR.C = carry;
                 # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_rr_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_rr_T2_A_exec skipped')
     return aarch32_MOV_rr_T2_A_exec
 
 
@@ -3734,7 +3834,8 @@ def aarch32_MRS_T1_AS(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.writeR(d, core.ReadSpecReg(spec_reg));
         else:
-            log.debug(f'aarch32_MRS_T1_AS_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MRS_T1_AS_exec skipped')
     return aarch32_MRS_T1_AS_exec
 
 
@@ -3762,7 +3863,8 @@ def aarch32_MSR_r_T1_AS(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.WriteSpecReg(spec_reg, core.readR(n));
         else:
-            log.debug(f'aarch32_MSR_r_T1_AS_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MSR_r_T1_AS_exec skipped')
     return aarch32_MSR_r_T1_AS_exec
 
 
@@ -3793,7 +3895,8 @@ def aarch32_MUL_T1_A(core, regex_match, bitdiffs):
                 core.APSR.Z = core.IsZeroBit(core.Field(result,31,0));
                 # core.APSR.C, core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MUL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MUL_T1_A_exec skipped')
     return aarch32_MUL_T1_A_exec
 
 # pattern MUL<c>.W <Rd>, <Rn>{, <Rm>} with bitdiffs=[]
@@ -3826,7 +3929,8 @@ def aarch32_MUL_T2_A(core, regex_match, bitdiffs):
                 core.APSR.Z = core.IsZeroBit(core.Field(result,31,0));
                 # core.APSR.C, core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MUL_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MUL_T2_A_exec skipped')
     return aarch32_MUL_T2_A_exec
 
 
@@ -3844,7 +3948,6 @@ def aarch32_MVN_i_T1_A(core, regex_match, bitdiffs):
     log.debug(f'aarch32_MVN_i_T1_A Rd={Rd} imm32={imm32} cond={cond}')
     # decode
     d = core.reg_num[Rd];  setflags = (S == '1');
-    carry = core.APSR.C;
     if d == 15:
         raise Exception('UNPREDICTABLE'); # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -3863,10 +3966,11 @@ def aarch32_MVN_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.N = core.Bit(result,31);
                     core.APSR.Z = core.IsZeroBit(result);
-                    core.APSR.C = carry;
+                    core.APSR.C = core.T32ExpandImmCarry(imm32);
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MVN_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MVN_i_T1_A_exec skipped')
     return aarch32_MVN_i_T1_A_exec
 
 
@@ -3905,7 +4009,8 @@ def aarch32_MVN_r_T1_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MVN_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MVN_r_T1_A_exec skipped')
     return aarch32_MVN_r_T1_A_exec
 
 # pattern MVN{<c>}{<q>} <Rd>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -3958,7 +4063,8 @@ def aarch32_MVN_r_T2_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MVN_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MVN_r_T2_A_exec skipped')
     return aarch32_MVN_r_T2_A_exec
 
 
@@ -3977,7 +4083,8 @@ def aarch32_NOP_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             pass # Do nothing
         else:
-            log.debug(f'aarch32_NOP_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_NOP_T1_A_exec skipped')
     return aarch32_NOP_T1_A_exec
 
 # pattern NOP{<c>}.W with bitdiffs=[]
@@ -3994,7 +4101,8 @@ def aarch32_NOP_T2_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             pass # Do nothing
         else:
-            log.debug(f'aarch32_NOP_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_NOP_T2_A_exec skipped')
     return aarch32_NOP_T2_A_exec
 
 
@@ -4015,7 +4123,6 @@ def aarch32_ORN_i_T1_A(core, regex_match, bitdiffs):
     log.debug(f'aarch32_ORN_i_T1_A Rd={Rd} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     d = core.reg_num[Rd];  n = core.reg_num[Rn];  setflags = (S == '1');
-    carry = core.APSR.C;
     if d == 15:
         raise Exception('UNPREDICTABLE'); # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -4027,10 +4134,11 @@ def aarch32_ORN_i_T1_A(core, regex_match, bitdiffs):
             if setflags:
                 core.APSR.N = core.Bit(result,31);
                 core.APSR.Z = core.IsZeroBit(result);
-                core.APSR.C = carry;
+                core.APSR.C = core.T32ExpandImmCarry(imm32);
                 # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_ORN_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ORN_i_T1_A_exec skipped')
     return aarch32_ORN_i_T1_A_exec
 
 
@@ -4077,7 +4185,8 @@ def aarch32_ORN_r_T1_A(core, regex_match, bitdiffs):
                 core.APSR.C = carry;
                 # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_ORN_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ORN_r_T1_A_exec skipped')
     return aarch32_ORN_r_T1_A_exec
 
 
@@ -4098,7 +4207,6 @@ def aarch32_ORR_i_T1_A(core, regex_match, bitdiffs):
     log.debug(f'aarch32_ORR_i_T1_A Rd={Rd} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     d = core.reg_num[Rd];  n = core.reg_num[Rn];  setflags = (S == '1');
-    carry = core.APSR.C;
     if d == 15:
         raise Exception('UNPREDICTABLE'); # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -4117,10 +4225,11 @@ def aarch32_ORR_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.N = core.Bit(result,31);
                     core.APSR.Z = core.IsZeroBit(result);
-                    core.APSR.C = carry;
+                    core.APSR.C = core.T32ExpandImmCarry(imm32);
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_ORR_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ORR_i_T1_A_exec skipped')
     return aarch32_ORR_i_T1_A_exec
 
 
@@ -4161,7 +4270,8 @@ def aarch32_ORR_r_T1_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_ORR_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ORR_r_T1_A_exec skipped')
     return aarch32_ORR_r_T1_A_exec
 
 # pattern ORR{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -4217,7 +4327,8 @@ def aarch32_ORR_r_T2_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_ORR_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ORR_r_T2_A_exec skipped')
     return aarch32_ORR_r_T2_A_exec
 
 
@@ -4258,7 +4369,8 @@ def aarch32_PKH_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(operand2,15,0) if tbform else core.Field(core.readR(n),15,0)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(core.readR(n),31,16)    if tbform else core.Field(operand2,31,16)));
         else:
-            log.debug(f'aarch32_PKH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_PKH_T1_A_exec skipped')
     return aarch32_PKH_T1_A_exec
 
 
@@ -4299,7 +4411,8 @@ def aarch32_POP_T1_A(core, regex_match, bitdiffs):
             if registers[13] == '1':
                  core.writeR(13, UNKNOWN = 0);
         else:
-            log.debug(f'aarch32_POP_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_POP_T1_A_exec skipped')
     return aarch32_POP_T1_A_exec
 
 
@@ -4341,7 +4454,8 @@ def aarch32_PUSH_T1_A(core, regex_match, bitdiffs):
                     core.WriteMemA(address,4, core.PCStoreValue());
             core.writeR(13, core.readR(13) - 4*registers.count('1'));
         else:
-            log.debug(f'aarch32_PUSH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_PUSH_T1_A_exec skipped')
     return aarch32_PUSH_T1_A_exec
 
 
@@ -4370,7 +4484,8 @@ def aarch32_QADD_T1_A(core, regex_match, bitdiffs):
             if sat:
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_QADD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QADD_T1_A_exec skipped')
     return aarch32_QADD_T1_A_exec
 
 
@@ -4399,7 +4514,8 @@ def aarch32_QADD16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.SignedSat(sum1, 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.SignedSat(sum2, 16)));
         else:
-            log.debug(f'aarch32_QADD16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QADD16_T1_A_exec skipped')
     return aarch32_QADD16_T1_A_exec
 
 
@@ -4432,7 +4548,8 @@ def aarch32_QADD8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.SignedSat(sum3, 8)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.SignedSat(sum4, 8)));
         else:
-            log.debug(f'aarch32_QADD8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QADD8_T1_A_exec skipped')
     return aarch32_QADD8_T1_A_exec
 
 
@@ -4461,7 +4578,8 @@ def aarch32_QASX_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.SignedSat(diff, 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.SignedSat(sum, 16)));
         else:
-            log.debug(f'aarch32_QASX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QASX_T1_A_exec skipped')
     return aarch32_QASX_T1_A_exec
 
 
@@ -4491,7 +4609,8 @@ def aarch32_QDADD_T1_A(core, regex_match, bitdiffs):
             if sat1 or sat2:
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_QDADD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QDADD_T1_A_exec skipped')
     return aarch32_QDADD_T1_A_exec
 
 
@@ -4521,7 +4640,8 @@ def aarch32_QDSUB_T1_A(core, regex_match, bitdiffs):
             if sat1 or sat2:
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_QDSUB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QDSUB_T1_A_exec skipped')
     return aarch32_QDSUB_T1_A_exec
 
 
@@ -4550,7 +4670,8 @@ def aarch32_QSAX_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.SignedSat(sum, 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.SignedSat(diff, 16)));
         else:
-            log.debug(f'aarch32_QSAX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QSAX_T1_A_exec skipped')
     return aarch32_QSAX_T1_A_exec
 
 
@@ -4579,7 +4700,8 @@ def aarch32_QSUB_T1_A(core, regex_match, bitdiffs):
             if sat:
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_QSUB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QSUB_T1_A_exec skipped')
     return aarch32_QSUB_T1_A_exec
 
 
@@ -4608,7 +4730,8 @@ def aarch32_QSUB16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.SignedSat(diff1, 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.SignedSat(diff2, 16)));
         else:
-            log.debug(f'aarch32_QSUB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QSUB16_T1_A_exec skipped')
     return aarch32_QSUB16_T1_A_exec
 
 
@@ -4641,7 +4764,8 @@ def aarch32_QSUB8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.SignedSat(diff3, 8)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.SignedSat(diff4, 8)));
         else:
-            log.debug(f'aarch32_QSUB8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QSUB8_T1_A_exec skipped')
     return aarch32_QSUB8_T1_A_exec
 
 
@@ -4665,7 +4789,8 @@ def aarch32_RBIT_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.writeR(d, core.Field(int(f'{core.UInt(core.readR(m)):032b}'[::-1],2)))
         else:
-            log.debug(f'aarch32_RBIT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_RBIT_T1_A_exec skipped')
     return aarch32_RBIT_T1_A_exec
 
 
@@ -4691,7 +4816,8 @@ def aarch32_REV_T1_A(core, regex_match, bitdiffs):
             result = core.SetField(result,7,0,core.Field(core.readR(m),31,24));
             core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_REV_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_REV_T1_A_exec skipped')
     return aarch32_REV_T1_A_exec
 
 # pattern REV{<c>}.W <Rd>, <Rm> with bitdiffs=[]
@@ -4719,7 +4845,8 @@ def aarch32_REV_T2_A(core, regex_match, bitdiffs):
             result = core.SetField(result,7,0,core.Field(core.readR(m),31,24));
             core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_REV_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_REV_T2_A_exec skipped')
     return aarch32_REV_T2_A_exec
 
 
@@ -4745,7 +4872,8 @@ def aarch32_REV16_T1_A(core, regex_match, bitdiffs):
             result = core.SetField(result,7,0,core.Field(core.readR(m),15,8));
             core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_REV16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_REV16_T1_A_exec skipped')
     return aarch32_REV16_T1_A_exec
 
 # pattern REV16{<c>}.W <Rd>, <Rm> with bitdiffs=[]
@@ -4773,7 +4901,8 @@ def aarch32_REV16_T2_A(core, regex_match, bitdiffs):
             result = core.SetField(result,7,0,core.Field(core.readR(m),15,8));
             core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_REV16_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_REV16_T2_A_exec skipped')
     return aarch32_REV16_T2_A_exec
 
 
@@ -4797,7 +4926,8 @@ def aarch32_REVSH_T1_A(core, regex_match, bitdiffs):
             result = core.SetField(result,7,0,core.Field(core.readR(m),15,8));
             core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_REVSH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_REVSH_T1_A_exec skipped')
     return aarch32_REVSH_T1_A_exec
 
 # pattern REVSH{<c>}.W <Rd>, <Rm> with bitdiffs=[]
@@ -4823,7 +4953,8 @@ def aarch32_REVSH_T2_A(core, regex_match, bitdiffs):
             result = core.SetField(result,7,0,core.Field(core.readR(m),15,8));
             core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_REVSH_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_REVSH_T2_A_exec skipped')
     return aarch32_REVSH_T2_A_exec
 
 
@@ -4863,7 +4994,8 @@ def aarch32_RSB_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_RSB_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_RSB_i_T1_A_exec skipped')
     return aarch32_RSB_i_T1_A_exec
 
 # pattern RSB<c>.W {<Rd>,} <Rn>, #0 with bitdiffs=[('S', '0')]
@@ -4904,7 +5036,8 @@ def aarch32_RSB_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_RSB_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_RSB_i_T2_A_exec skipped')
     return aarch32_RSB_i_T2_A_exec
 
 
@@ -4955,7 +5088,8 @@ def aarch32_RSB_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_RSB_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_RSB_r_T1_A_exec skipped')
     return aarch32_RSB_r_T1_A_exec
 
 
@@ -4986,7 +5120,8 @@ def aarch32_SADD16_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetField(core.APSR.GE,1,0,'11' if sum1 >= 0 else '00');
             core.APSR.GE = core.SetField(core.APSR.GE,3,2,'11' if sum2 >= 0 else '00');
         else:
-            log.debug(f'aarch32_SADD16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SADD16_T1_A_exec skipped')
     return aarch32_SADD16_T1_A_exec
 
 
@@ -5023,7 +5158,8 @@ def aarch32_SADD8_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetBit(core.APSR.GE,2,'1' if sum3 >= 0 else '0')
             core.APSR.GE = core.SetBit(core.APSR.GE,3,'1' if sum4 >= 0 else '0')
         else:
-            log.debug(f'aarch32_SADD8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SADD8_T1_A_exec skipped')
     return aarch32_SADD8_T1_A_exec
 
 
@@ -5054,7 +5190,8 @@ def aarch32_SASX_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetField(core.APSR.GE,1,0,'11' if diff >= 0 else '00');
             core.APSR.GE = core.SetField(core.APSR.GE,3,2,'11' if sum  >= 0 else '00');
         else:
-            log.debug(f'aarch32_SASX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SASX_T1_A_exec skipped')
     return aarch32_SASX_T1_A_exec
 
 
@@ -5093,7 +5230,8 @@ def aarch32_SBC_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SBC_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SBC_i_T1_A_exec skipped')
     return aarch32_SBC_i_T1_A_exec
 
 
@@ -5131,7 +5269,8 @@ def aarch32_SBC_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SBC_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SBC_r_T1_A_exec skipped')
     return aarch32_SBC_r_T1_A_exec
 
 # pattern SBC{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -5184,7 +5323,8 @@ def aarch32_SBC_r_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SBC_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SBC_r_T2_A_exec skipped')
     return aarch32_SBC_r_T2_A_exec
 
 
@@ -5213,7 +5353,8 @@ def aarch32_SBFX_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.writeR(d, core.SignExtendSubField(core.readR(n), msbit, lsbit, 32));
         else:
-            log.debug(f'aarch32_SBFX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SBFX_T1_A_exec skipped')
     return aarch32_SBFX_T1_A_exec
 
 
@@ -5245,7 +5386,8 @@ def aarch32_SDIV_T1_A(core, regex_match, bitdiffs):
                 result = core.RoundTowardsZero(core.Real(core.SInt(core.readR(n))) / core.Real(core.SInt(core.readR(m))));
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_SDIV_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SDIV_T1_A_exec skipped')
     return aarch32_SDIV_T1_A_exec
 
 
@@ -5274,7 +5416,8 @@ def aarch32_SEL_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.Field(core.readR(n),23,16) if core.APSR.GE[2] else core.Field(core.readR(m),23,16)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.Field(core.readR(n),31,24) if core.APSR.GE[3] else core.Field(core.readR(m),31,24)));
         else:
-            log.debug(f'aarch32_SEL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SEL_T1_A_exec skipped')
     return aarch32_SEL_T1_A_exec
 
 
@@ -5303,7 +5446,8 @@ def aarch32_SHADD16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(sum1,16,1)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(sum2,16,1)));
         else:
-            log.debug(f'aarch32_SHADD16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SHADD16_T1_A_exec skipped')
     return aarch32_SHADD16_T1_A_exec
 
 
@@ -5336,7 +5480,8 @@ def aarch32_SHADD8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.Field(sum3,8,1)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.Field(sum4,8,1)));
         else:
-            log.debug(f'aarch32_SHADD8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SHADD8_T1_A_exec skipped')
     return aarch32_SHADD8_T1_A_exec
 
 
@@ -5365,7 +5510,8 @@ def aarch32_SHASX_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(diff,16,1)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(sum,16,1)));
         else:
-            log.debug(f'aarch32_SHASX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SHASX_T1_A_exec skipped')
     return aarch32_SHASX_T1_A_exec
 
 
@@ -5394,7 +5540,8 @@ def aarch32_SHSAX_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(sum,16,1)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(diff,16,1)));
         else:
-            log.debug(f'aarch32_SHSAX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SHSAX_T1_A_exec skipped')
     return aarch32_SHSAX_T1_A_exec
 
 
@@ -5423,7 +5570,8 @@ def aarch32_SHSUB16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(diff1,16,1)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(diff2,16,1)));
         else:
-            log.debug(f'aarch32_SHSUB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SHSUB16_T1_A_exec skipped')
     return aarch32_SHSUB16_T1_A_exec
 
 
@@ -5456,7 +5604,8 @@ def aarch32_SHSUB8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.Field(diff3,8,1)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.Field(diff4,8,1)));
         else:
-            log.debug(f'aarch32_SHSUB8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SHSUB8_T1_A_exec skipped')
     return aarch32_SHSUB8_T1_A_exec
 
 
@@ -5496,7 +5645,8 @@ def aarch32_SMLABB_T1_A(core, regex_match, bitdiffs):
                   # Signed overflow
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_SMLABB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMLABB_T1_A_exec skipped')
     return aarch32_SMLABB_T1_A_exec
 
 
@@ -5532,7 +5682,8 @@ def aarch32_SMLAD_T1_A(core, regex_match, bitdiffs):
                   # Signed overflow
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_SMLAD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMLAD_T1_A_exec skipped')
     return aarch32_SMLAD_T1_A_exec
 
 
@@ -5566,7 +5717,8 @@ def aarch32_SMLAL_T1_A(core, regex_match, bitdiffs):
                 core.APSR.Z = core.IsZeroBit(core.Field(result,63,0));
                 # core.APSR.C, core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_SMLAL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMLAL_T1_A_exec skipped')
     return aarch32_SMLAL_T1_A_exec
 
 
@@ -5607,7 +5759,8 @@ def aarch32_SMLALBB_T1_A(core, regex_match, bitdiffs):
             core.writeR(dHi, core.Field(result,63,32));
             core.writeR(dLo, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_SMLALBB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMLALBB_T1_A_exec skipped')
     return aarch32_SMLALBB_T1_A_exec
 
 
@@ -5643,7 +5796,8 @@ def aarch32_SMLALD_T1_A(core, regex_match, bitdiffs):
             core.writeR(dHi, core.Field(result,63,32));
             core.writeR(dLo, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_SMLALD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMLALD_T1_A_exec skipped')
     return aarch32_SMLALD_T1_A_exec
 
 
@@ -5676,7 +5830,8 @@ def aarch32_SMLAWB_T1_A(core, regex_match, bitdiffs):
                   # Signed overflow
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_SMLAWB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMLAWB_T1_A_exec skipped')
     return aarch32_SMLAWB_T1_A_exec
 
 
@@ -5711,7 +5866,8 @@ def aarch32_SMLSD_T1_A(core, regex_match, bitdiffs):
                   # Signed overflow
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_SMLSD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMLSD_T1_A_exec skipped')
     return aarch32_SMLSD_T1_A_exec
 
 
@@ -5747,7 +5903,8 @@ def aarch32_SMLSLD_T1_A(core, regex_match, bitdiffs):
             core.writeR(dHi, core.Field(result,63,32));
             core.writeR(dLo, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_SMLSLD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMLSLD_T1_A_exec skipped')
     return aarch32_SMLSLD_T1_A_exec
 
 
@@ -5778,7 +5935,8 @@ def aarch32_SMMLA_T1_A(core, regex_match, bitdiffs):
                  result = result + 0x80000000;
             core.writeR(d, core.Field(result,63,32));
         else:
-            log.debug(f'aarch32_SMMLA_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMMLA_T1_A_exec skipped')
     return aarch32_SMMLA_T1_A_exec
 
 
@@ -5810,7 +5968,8 @@ def aarch32_SMMLS_T1_A(core, regex_match, bitdiffs):
                  result = result + 0x80000000;
             core.writeR(d, core.Field(result,63,32));
         else:
-            log.debug(f'aarch32_SMMLS_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMMLS_T1_A_exec skipped')
     return aarch32_SMMLS_T1_A_exec
 
 
@@ -5842,7 +6001,8 @@ def aarch32_SMMUL_T1_A(core, regex_match, bitdiffs):
                  result = result + 0x80000000;
             core.writeR(d, core.Field(result,63,32));
         else:
-            log.debug(f'aarch32_SMMUL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMMUL_T1_A_exec skipped')
     return aarch32_SMMUL_T1_A_exec
 
 
@@ -5878,7 +6038,8 @@ def aarch32_SMUAD_T1_A(core, regex_match, bitdiffs):
                   # Signed overflow
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_SMUAD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMUAD_T1_A_exec skipped')
     return aarch32_SMUAD_T1_A_exec
 
 
@@ -5917,7 +6078,8 @@ def aarch32_SMULBB_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.Field(result,31,0));
             # Signed overflow cannot occur
         else:
-            log.debug(f'aarch32_SMULBB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMULBB_T1_A_exec skipped')
     return aarch32_SMULBB_T1_A_exec
 
 
@@ -5951,7 +6113,8 @@ def aarch32_SMULL_T1_A(core, regex_match, bitdiffs):
                 core.APSR.Z = core.IsZeroBit(core.Field(result,63,0));
                 # core.APSR.C, core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_SMULL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMULL_T1_A_exec skipped')
     return aarch32_SMULL_T1_A_exec
 
 
@@ -5983,7 +6146,8 @@ def aarch32_SMULWB_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.Field(product,47,16));
             # Signed overflow cannot occur
         else:
-            log.debug(f'aarch32_SMULWB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMULWB_T1_A_exec skipped')
     return aarch32_SMULWB_T1_A_exec
 
 
@@ -6017,7 +6181,8 @@ def aarch32_SMUSD_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.Field(result,31,0));
             # Signed overflow cannot occur
         else:
-            log.debug(f'aarch32_SMUSD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMUSD_T1_A_exec skipped')
     return aarch32_SMUSD_T1_A_exec
 
 
@@ -6054,7 +6219,8 @@ def aarch32_SSAT_T1_A(core, regex_match, bitdiffs):
             if sat:
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_SSAT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SSAT_T1_A_exec skipped')
     return aarch32_SSAT_T1_A_exec
 
 
@@ -6083,7 +6249,8 @@ def aarch32_SSAT16_T1_A(core, regex_match, bitdiffs):
             if sat1 or sat2:
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_SSAT16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SSAT16_T1_A_exec skipped')
     return aarch32_SSAT16_T1_A_exec
 
 
@@ -6114,7 +6281,8 @@ def aarch32_SSAX_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetField(core.APSR.GE,1,0,'11' if sum  >= 0 else '00');
             core.APSR.GE = core.SetField(core.APSR.GE,3,2,'11' if diff >= 0 else '00');
         else:
-            log.debug(f'aarch32_SSAX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SSAX_T1_A_exec skipped')
     return aarch32_SSAX_T1_A_exec
 
 
@@ -6145,7 +6313,8 @@ def aarch32_SSUB16_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetField(core.APSR.GE,1,0,'11' if diff1 >= 0 else '00');
             core.APSR.GE = core.SetField(core.APSR.GE,3,2,'11' if diff2 >= 0 else '00');
         else:
-            log.debug(f'aarch32_SSUB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SSUB16_T1_A_exec skipped')
     return aarch32_SSUB16_T1_A_exec
 
 
@@ -6182,7 +6351,8 @@ def aarch32_SSUB8_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetBit(core.APSR.GE,2,'1' if diff3 >= 0 else '0')
             core.APSR.GE = core.SetBit(core.APSR.GE,3,'1' if diff4 >= 0 else '0')
         else:
-            log.debug(f'aarch32_SSUB8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SSUB8_T1_A_exec skipped')
     return aarch32_SSUB8_T1_A_exec
 
 
@@ -6220,7 +6390,8 @@ def aarch32_STM_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, core.readR(n) + 4*registers.count('1'));
         else:
-            log.debug(f'aarch32_STM_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STM_T1_A_exec skipped')
     return aarch32_STM_T1_A_exec
 
 # pattern STM{IA}{<c>}.W <Rn>{!}, <registers> with bitdiffs=[]
@@ -6272,7 +6443,8 @@ def aarch32_STM_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, core.readR(n) + 4*registers.count('1'));
         else:
-            log.debug(f'aarch32_STM_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STM_T2_A_exec skipped')
     return aarch32_STM_T2_A_exec
 
 
@@ -6320,7 +6492,8 @@ def aarch32_STMDB_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, core.readR(n) - 4*registers.count('1'));
         else:
-            log.debug(f'aarch32_STMDB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STMDB_T1_A_exec skipped')
     return aarch32_STMDB_T1_A_exec
 
 
@@ -6334,7 +6507,7 @@ def aarch32_STRBT_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRBT_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111':
@@ -6356,7 +6529,8 @@ def aarch32_STRBT_T1_A(core, regex_match, bitdiffs):
             if postindex:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRBT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRBT_T1_A_exec skipped')
     return aarch32_STRBT_T1_A_exec
 
 
@@ -6370,7 +6544,7 @@ def aarch32_STRB_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRB_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -6386,7 +6560,8 @@ def aarch32_STRB_i_T1_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRB_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRB_i_T1_A_exec skipped')
     return aarch32_STRB_i_T1_A_exec
 
 # pattern STRB{<c>}.W <Rt>, [<Rn> {, #{+}<imm>}] with bitdiffs=[]
@@ -6400,7 +6575,7 @@ def aarch32_STRB_i_T2_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRB_i_T2_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111':
@@ -6420,7 +6595,8 @@ def aarch32_STRB_i_T2_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRB_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRB_i_T2_A_exec skipped')
     return aarch32_STRB_i_T2_A_exec
 
 # pattern STRB{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -6439,7 +6615,7 @@ def aarch32_STRB_i_T3_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRB_i_T3_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111' or (P == '0' and W == '0'):
@@ -6459,7 +6635,8 @@ def aarch32_STRB_i_T3_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRB_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRB_i_T3_A_exec skipped')
     return aarch32_STRB_i_T3_A_exec
 
 
@@ -6488,7 +6665,8 @@ def aarch32_STRB_r_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRB_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRB_r_T1_A_exec skipped')
     return aarch32_STRB_r_T1_A_exec
 
 # pattern STRB{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -6526,7 +6704,8 @@ def aarch32_STRB_r_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRB_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRB_r_T2_A_exec skipped')
     return aarch32_STRB_r_T2_A_exec
 
 
@@ -6548,7 +6727,7 @@ def aarch32_STRD_i_T1_A(core, regex_match, bitdiffs):
     W = bitdiffs.get('W', '0')
     U = bitdiffs.get('U', '1')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRD_i_T1_A Rt={Rt} Rt2={Rt2} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  t2 = core.reg_num[Rt2];  n = core.reg_num[Rn];  
@@ -6575,7 +6754,8 @@ def aarch32_STRD_i_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRD_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRD_i_T1_A_exec skipped')
     return aarch32_STRD_i_T1_A_exec
 
 
@@ -6590,7 +6770,7 @@ def aarch32_STREX_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STREX_T1_A Rd={Rd} Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     d = core.reg_num[Rd];  t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -6609,7 +6789,8 @@ def aarch32_STREX_T1_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.ZeroExtend('1', 32));
         else:
-            log.debug(f'aarch32_STREX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STREX_T1_A_exec skipped')
     return aarch32_STREX_T1_A_exec
 
 
@@ -6640,7 +6821,8 @@ def aarch32_STREXB_T1_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.ZeroExtend('1', 32));
         else:
-            log.debug(f'aarch32_STREXB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STREXB_T1_A_exec skipped')
     return aarch32_STREXB_T1_A_exec
 
 
@@ -6671,7 +6853,8 @@ def aarch32_STREXH_T1_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.ZeroExtend('1', 32));
         else:
-            log.debug(f'aarch32_STREXH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STREXH_T1_A_exec skipped')
     return aarch32_STREXH_T1_A_exec
 
 
@@ -6685,7 +6868,7 @@ def aarch32_STRHT_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRHT_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111':
@@ -6707,7 +6890,8 @@ def aarch32_STRHT_T1_A(core, regex_match, bitdiffs):
             if postindex:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRHT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRHT_T1_A_exec skipped')
     return aarch32_STRHT_T1_A_exec
 
 
@@ -6721,7 +6905,7 @@ def aarch32_STRH_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRH_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -6737,7 +6921,8 @@ def aarch32_STRH_i_T1_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRH_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRH_i_T1_A_exec skipped')
     return aarch32_STRH_i_T1_A_exec
 
 # pattern STRH{<c>}.W <Rt>, [<Rn> {, #{+}<imm>}] with bitdiffs=[]
@@ -6751,7 +6936,7 @@ def aarch32_STRH_i_T2_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRH_i_T2_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111':
@@ -6771,7 +6956,8 @@ def aarch32_STRH_i_T2_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRH_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRH_i_T2_A_exec skipped')
     return aarch32_STRH_i_T2_A_exec
 
 # pattern STRH{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -6790,7 +6976,7 @@ def aarch32_STRH_i_T3_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRH_i_T3_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111' or (P == '0' and W == '0'):
@@ -6810,7 +6996,8 @@ def aarch32_STRH_i_T3_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRH_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRH_i_T3_A_exec skipped')
     return aarch32_STRH_i_T3_A_exec
 
 
@@ -6839,7 +7026,8 @@ def aarch32_STRH_r_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRH_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRH_r_T1_A_exec skipped')
     return aarch32_STRH_r_T1_A_exec
 
 # pattern STRH{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -6877,7 +7065,8 @@ def aarch32_STRH_r_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRH_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRH_r_T2_A_exec skipped')
     return aarch32_STRH_r_T2_A_exec
 
 
@@ -6891,7 +7080,7 @@ def aarch32_STRT_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRT_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111':
@@ -6919,7 +7108,8 @@ def aarch32_STRT_T1_A(core, regex_match, bitdiffs):
             if postindex:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRT_T1_A_exec skipped')
     return aarch32_STRT_T1_A_exec
 
 
@@ -6933,7 +7123,7 @@ def aarch32_STR_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STR_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -6949,7 +7139,8 @@ def aarch32_STR_i_T1_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_i_T1_A_exec skipped')
     return aarch32_STR_i_T1_A_exec
 
 # pattern STR{<c>}{<q>} <Rt>, [SP{, #{+}<imm>}] with bitdiffs=[]
@@ -6960,7 +7151,7 @@ def aarch32_STR_i_T2_A(core, regex_match, bitdiffs):
     Rt = regex_groups.get('Rt', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STR_i_T2_A Rt={Rt} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = 13;  
@@ -6976,7 +7167,8 @@ def aarch32_STR_i_T2_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_i_T2_A_exec skipped')
     return aarch32_STR_i_T2_A_exec
 
 # pattern STR{<c>}.W <Rt>, [<Rn> {, #{+}<imm>}] with bitdiffs=[]
@@ -6990,7 +7182,7 @@ def aarch32_STR_i_T3_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STR_i_T3_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111':
@@ -7010,7 +7202,8 @@ def aarch32_STR_i_T3_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_i_T3_A_exec skipped')
     return aarch32_STR_i_T3_A_exec
 
 # pattern STR{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -7029,7 +7222,7 @@ def aarch32_STR_i_T4_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STR_i_T4_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111' or (P == '0' and W == '0'):
@@ -7049,7 +7242,8 @@ def aarch32_STR_i_T4_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_i_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_i_T4_A_exec skipped')
     return aarch32_STR_i_T4_A_exec
 
 
@@ -7084,7 +7278,8 @@ def aarch32_STR_r_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_r_T1_A_exec skipped')
     return aarch32_STR_r_T1_A_exec
 
 # pattern STR{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -7128,7 +7323,8 @@ def aarch32_STR_r_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_r_T2_A_exec skipped')
     return aarch32_STR_r_T2_A_exec
 
 
@@ -7162,7 +7358,8 @@ def aarch32_SUB_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_i_T1_A_exec skipped')
     return aarch32_SUB_i_T1_A_exec
 
 # pattern SUB<c>{<q>} <Rdn>, #<imm8> with bitdiffs=[('S', '0')]
@@ -7199,7 +7396,8 @@ def aarch32_SUB_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_i_T2_A_exec skipped')
     return aarch32_SUB_i_T2_A_exec
 
 # pattern SUB<c>.W {<Rd>,} <Rn>, #<const> with bitdiffs=[('S', '0')]
@@ -7239,7 +7437,8 @@ def aarch32_SUB_i_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_i_T3_A_exec skipped')
     return aarch32_SUB_i_T3_A_exec
 
 # pattern SUB{<c>}{<q>} {<Rd>,} <Rn>, #<imm12> with bitdiffs=[]
@@ -7274,7 +7473,8 @@ def aarch32_SUB_i_T4_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_i_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_i_T4_A_exec skipped')
     return aarch32_SUB_i_T4_A_exec
 
 # pattern SUBS{<c>}{<q>} PC, LR, #<imm8> with bitdiffs=[]
@@ -7303,7 +7503,8 @@ def aarch32_SUB_i_T5_AS(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_i_T5_AS_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_i_T5_AS_exec skipped')
     return aarch32_SUB_i_T5_AS_exec
 
 
@@ -7342,7 +7543,8 @@ def aarch32_SUB_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_r_T1_A_exec skipped')
     return aarch32_SUB_r_T1_A_exec
 
 # pattern SUB{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -7396,7 +7598,8 @@ def aarch32_SUB_r_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_r_T2_A_exec skipped')
     return aarch32_SUB_r_T2_A_exec
 
 
@@ -7426,7 +7629,8 @@ def aarch32_SUB_SP_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_SP_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_SP_i_T1_A_exec skipped')
     return aarch32_SUB_SP_i_T1_A_exec
 
 # pattern SUB{<c>}.W {<Rd>,} SP, #<const> with bitdiffs=[('S', '0')]
@@ -7462,7 +7666,8 @@ def aarch32_SUB_SP_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_SP_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_SP_i_T2_A_exec skipped')
     return aarch32_SUB_SP_i_T2_A_exec
 
 # pattern SUB{<c>}{<q>} {<Rd>,} SP, #<imm12> with bitdiffs=[]
@@ -7495,7 +7700,8 @@ def aarch32_SUB_SP_i_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_SP_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_SP_i_T3_A_exec skipped')
     return aarch32_SUB_SP_i_T3_A_exec
 
 
@@ -7545,7 +7751,8 @@ def aarch32_SUB_SP_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_SP_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_SP_r_T1_A_exec skipped')
     return aarch32_SUB_SP_r_T1_A_exec
 
 
@@ -7565,7 +7772,8 @@ def aarch32_SVC_T1_A(core, regex_match, bitdiffs):
             core.CheckForSVCTrap(core.Field(imm32,15,0));
             core.CallSupervisor(core.Field(imm32,15,0));
         else:
-            log.debug(f'aarch32_SVC_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SVC_T1_A_exec skipped')
     return aarch32_SVC_T1_A_exec
 
 
@@ -7598,7 +7806,8 @@ def aarch32_SXTAB_T1_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.readR(n) + core.SignExtend(core.Field(rotated,7,0), 32));
         else:
-            log.debug(f'aarch32_SXTAB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SXTAB_T1_A_exec skipped')
     return aarch32_SXTAB_T1_A_exec
 
 
@@ -7632,7 +7841,8 @@ def aarch32_SXTAB16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(core.readR(n),15,0) + core.SignExtend(core.Field(rotated,7,0), 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(core.readR(n),31,16) + core.SignExtend(core.Field(rotated,23,16), 16)));
         else:
-            log.debug(f'aarch32_SXTAB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SXTAB16_T1_A_exec skipped')
     return aarch32_SXTAB16_T1_A_exec
 
 
@@ -7665,7 +7875,8 @@ def aarch32_SXTAH_T1_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.readR(n) + core.SignExtend(core.Field(rotated,15,0), 32));
         else:
-            log.debug(f'aarch32_SXTAH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SXTAH_T1_A_exec skipped')
     return aarch32_SXTAH_T1_A_exec
 
 
@@ -7687,7 +7898,8 @@ def aarch32_SXTB_T1_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.SignExtend(core.Field(rotated,7,0), 32));
         else:
-            log.debug(f'aarch32_SXTB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SXTB_T1_A_exec skipped')
     return aarch32_SXTB_T1_A_exec
 
 # pattern SXTB{<c>}.W {<Rd>,} <Rm> with bitdiffs=[]
@@ -7717,7 +7929,8 @@ def aarch32_SXTB_T2_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.SignExtend(core.Field(rotated,7,0), 32));
         else:
-            log.debug(f'aarch32_SXTB_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SXTB_T2_A_exec skipped')
     return aarch32_SXTB_T2_A_exec
 
 
@@ -7748,7 +7961,8 @@ def aarch32_SXTB16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.SignExtend(core.Field(rotated,7,0), 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.SignExtend(core.Field(rotated,23,16), 16)));
         else:
-            log.debug(f'aarch32_SXTB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SXTB16_T1_A_exec skipped')
     return aarch32_SXTB16_T1_A_exec
 
 
@@ -7770,7 +7984,8 @@ def aarch32_SXTH_T1_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.SignExtend(core.Field(rotated,15,0), 32));
         else:
-            log.debug(f'aarch32_SXTH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SXTH_T1_A_exec skipped')
     return aarch32_SXTH_T1_A_exec
 
 # pattern SXTH{<c>}.W {<Rd>,} <Rm> with bitdiffs=[]
@@ -7800,7 +8015,8 @@ def aarch32_SXTH_T2_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.SignExtend(core.Field(rotated,15,0), 32));
         else:
-            log.debug(f'aarch32_SXTH_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SXTH_T2_A_exec skipped')
     return aarch32_SXTH_T2_A_exec
 
 
@@ -7831,7 +8047,8 @@ def aarch32_TBB_T1_A(core, regex_match, bitdiffs):
                 halfwords = core.UInt(core.ReadMemU(core.readR(n)+core.readR(m), 1));
             core.BranchWritePC(core.PC + 2*halfwords, 'INDIR');
         else:
-            log.debug(f'aarch32_TBB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_TBB_T1_A_exec skipped')
     return aarch32_TBB_T1_A_exec
 
 
@@ -7846,7 +8063,6 @@ def aarch32_TEQ_i_T1_A(core, regex_match, bitdiffs):
     log.debug(f'aarch32_TEQ_i_T1_A Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     n = core.reg_num[Rn];
-    carry = core.APSR.C;
     if n == 15:
         raise Exception('UNPREDICTABLE'); # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -7856,10 +8072,11 @@ def aarch32_TEQ_i_T1_A(core, regex_match, bitdiffs):
             result = core.readR(n) ^ imm32;
             core.APSR.N = core.Bit(result,31);
             core.APSR.Z = core.IsZeroBit(result);
-            core.APSR.C = carry;
+            core.APSR.C = core.T32ExpandImmCarry(imm32);
             # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_TEQ_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_TEQ_i_T1_A_exec skipped')
     return aarch32_TEQ_i_T1_A_exec
 
 
@@ -7896,7 +8113,8 @@ def aarch32_TEQ_r_T1_A(core, regex_match, bitdiffs):
             core.APSR.C = carry;
             # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_TEQ_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_TEQ_r_T1_A_exec skipped')
     return aarch32_TEQ_r_T1_A_exec
 
 
@@ -7911,7 +8129,6 @@ def aarch32_TST_i_T1_A(core, regex_match, bitdiffs):
     log.debug(f'aarch32_TST_i_T1_A Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     n = core.reg_num[Rn];
-    carry = core.APSR.C;
     if n == 15:
         raise Exception('UNPREDICTABLE'); # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -7921,10 +8138,11 @@ def aarch32_TST_i_T1_A(core, regex_match, bitdiffs):
             result = core.readR(n) & imm32;
             core.APSR.N = core.Bit(result,31);
             core.APSR.Z = core.IsZeroBit(result);
-            core.APSR.C = carry;
+            core.APSR.C = core.T32ExpandImmCarry(imm32);
             # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_TST_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_TST_i_T1_A_exec skipped')
     return aarch32_TST_i_T1_A_exec
 
 
@@ -7951,7 +8169,8 @@ def aarch32_TST_r_T1_A(core, regex_match, bitdiffs):
             core.APSR.C = carry;
             # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_TST_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_TST_r_T1_A_exec skipped')
     return aarch32_TST_r_T1_A_exec
 
 # pattern TST{<c>}{<q>} <Rn>, <Rm>, RRX with bitdiffs=[('stype', '11')]
@@ -7988,7 +8207,8 @@ def aarch32_TST_r_T2_A(core, regex_match, bitdiffs):
             core.APSR.C = carry;
             # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_TST_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_TST_r_T2_A_exec skipped')
     return aarch32_TST_r_T2_A_exec
 
 
@@ -8019,7 +8239,8 @@ def aarch32_UADD16_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetField(core.APSR.GE,1,0,'11' if sum1 >= 0x10000 else '00');
             core.APSR.GE = core.SetField(core.APSR.GE,3,2,'11' if sum2 >= 0x10000 else '00');
         else:
-            log.debug(f'aarch32_UADD16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UADD16_T1_A_exec skipped')
     return aarch32_UADD16_T1_A_exec
 
 
@@ -8056,7 +8277,8 @@ def aarch32_UADD8_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetBit(core.APSR.GE,2,'1' if sum3 >= 0x100 else '0')
             core.APSR.GE = core.SetBit(core.APSR.GE,3,'1' if sum4 >= 0x100 else '0')
         else:
-            log.debug(f'aarch32_UADD8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UADD8_T1_A_exec skipped')
     return aarch32_UADD8_T1_A_exec
 
 
@@ -8087,7 +8309,8 @@ def aarch32_UASX_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetField(core.APSR.GE,1,0,'11' if diff >= 0 else '00');
             core.APSR.GE = core.SetField(core.APSR.GE,3,2,'11' if sum  >= 0x10000 else '00');
         else:
-            log.debug(f'aarch32_UASX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UASX_T1_A_exec skipped')
     return aarch32_UASX_T1_A_exec
 
 
@@ -8116,7 +8339,8 @@ def aarch32_UBFX_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.writeR(d, core.ZeroExtendSubField(core.readR(n), msbit, lsbit, 32));
         else:
-            log.debug(f'aarch32_UBFX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UBFX_T1_A_exec skipped')
     return aarch32_UBFX_T1_A_exec
 
 
@@ -8136,7 +8360,8 @@ def aarch32_UDF_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             raise Exception('UNDEFINED');
         else:
-            log.debug(f'aarch32_UDF_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UDF_T1_A_exec skipped')
     return aarch32_UDF_T1_A_exec
 
 # pattern UDF{<c>}.W {#}<imm> with bitdiffs=[]
@@ -8156,7 +8381,8 @@ def aarch32_UDF_T2_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             raise Exception('UNDEFINED');
         else:
-            log.debug(f'aarch32_UDF_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UDF_T2_A_exec skipped')
     return aarch32_UDF_T2_A_exec
 
 
@@ -8188,7 +8414,8 @@ def aarch32_UDIV_T1_A(core, regex_match, bitdiffs):
                 result = core.RoundTowardsZero(core.Real(core.UInt(core.readR(n))) / core.Real(core.UInt(core.readR(m))));
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_UDIV_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UDIV_T1_A_exec skipped')
     return aarch32_UDIV_T1_A_exec
 
 
@@ -8217,7 +8444,8 @@ def aarch32_UHADD16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(sum1,16,1)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(sum2,16,1)));
         else:
-            log.debug(f'aarch32_UHADD16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UHADD16_T1_A_exec skipped')
     return aarch32_UHADD16_T1_A_exec
 
 
@@ -8250,7 +8478,8 @@ def aarch32_UHADD8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.Field(sum3,8,1)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.Field(sum4,8,1)));
         else:
-            log.debug(f'aarch32_UHADD8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UHADD8_T1_A_exec skipped')
     return aarch32_UHADD8_T1_A_exec
 
 
@@ -8279,7 +8508,8 @@ def aarch32_UHASX_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(diff,16,1)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(sum,16,1)));
         else:
-            log.debug(f'aarch32_UHASX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UHASX_T1_A_exec skipped')
     return aarch32_UHASX_T1_A_exec
 
 
@@ -8308,7 +8538,8 @@ def aarch32_UHSAX_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(sum,16,1)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(diff,16,1)));
         else:
-            log.debug(f'aarch32_UHSAX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UHSAX_T1_A_exec skipped')
     return aarch32_UHSAX_T1_A_exec
 
 
@@ -8337,7 +8568,8 @@ def aarch32_UHSUB16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(diff1,16,1)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(diff2,16,1)));
         else:
-            log.debug(f'aarch32_UHSUB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UHSUB16_T1_A_exec skipped')
     return aarch32_UHSUB16_T1_A_exec
 
 
@@ -8370,7 +8602,8 @@ def aarch32_UHSUB8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.Field(diff3,8,1)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.Field(diff4,8,1)));
         else:
-            log.debug(f'aarch32_UHSUB8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UHSUB8_T1_A_exec skipped')
     return aarch32_UHSUB8_T1_A_exec
 
 
@@ -8400,7 +8633,8 @@ def aarch32_UMAAL_T1_A(core, regex_match, bitdiffs):
             core.writeR(dHi, core.Field(result,63,32));
             core.writeR(dLo, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_UMAAL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UMAAL_T1_A_exec skipped')
     return aarch32_UMAAL_T1_A_exec
 
 
@@ -8434,7 +8668,8 @@ def aarch32_UMLAL_T1_A(core, regex_match, bitdiffs):
                 core.APSR.Z = core.IsZeroBit(core.Field(result,63,0));
                 # core.APSR.C, core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_UMLAL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UMLAL_T1_A_exec skipped')
     return aarch32_UMLAL_T1_A_exec
 
 
@@ -8468,7 +8703,8 @@ def aarch32_UMULL_T1_A(core, regex_match, bitdiffs):
                 core.APSR.Z = core.IsZeroBit(core.Field(result,63,0));
                 # core.APSR.C, core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_UMULL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UMULL_T1_A_exec skipped')
     return aarch32_UMULL_T1_A_exec
 
 
@@ -8497,7 +8733,8 @@ def aarch32_UQADD16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.UnsignedSat(sum1, 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.UnsignedSat(sum2, 16)));
         else:
-            log.debug(f'aarch32_UQADD16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UQADD16_T1_A_exec skipped')
     return aarch32_UQADD16_T1_A_exec
 
 
@@ -8530,7 +8767,8 @@ def aarch32_UQADD8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.UnsignedSat(sum3, 8)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.UnsignedSat(sum4, 8)));
         else:
-            log.debug(f'aarch32_UQADD8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UQADD8_T1_A_exec skipped')
     return aarch32_UQADD8_T1_A_exec
 
 
@@ -8559,7 +8797,8 @@ def aarch32_UQASX_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.UnsignedSat(diff, 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.UnsignedSat(sum, 16)));
         else:
-            log.debug(f'aarch32_UQASX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UQASX_T1_A_exec skipped')
     return aarch32_UQASX_T1_A_exec
 
 
@@ -8588,7 +8827,8 @@ def aarch32_UQSAX_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.UnsignedSat(sum, 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.UnsignedSat(diff, 16)));
         else:
-            log.debug(f'aarch32_UQSAX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UQSAX_T1_A_exec skipped')
     return aarch32_UQSAX_T1_A_exec
 
 
@@ -8617,7 +8857,8 @@ def aarch32_UQSUB16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.UnsignedSat(diff1, 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.UnsignedSat(diff2, 16)));
         else:
-            log.debug(f'aarch32_UQSUB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UQSUB16_T1_A_exec skipped')
     return aarch32_UQSUB16_T1_A_exec
 
 
@@ -8650,7 +8891,8 @@ def aarch32_UQSUB8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.UnsignedSat(diff3, 8)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.UnsignedSat(diff4, 8)));
         else:
-            log.debug(f'aarch32_UQSUB8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UQSUB8_T1_A_exec skipped')
     return aarch32_UQSUB8_T1_A_exec
 
 
@@ -8681,7 +8923,8 @@ def aarch32_USAD8_T1_A(core, regex_match, bitdiffs):
             result = absdiff1 + absdiff2 + absdiff3 + absdiff4;
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_USAD8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USAD8_T1_A_exec skipped')
     return aarch32_USAD8_T1_A_exec
 
 
@@ -8711,7 +8954,8 @@ def aarch32_USADA8_T1_A(core, regex_match, bitdiffs):
             result = core.UInt(core.readR(a)) + absdiff1 + absdiff2 + absdiff3 + absdiff4;
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_USADA8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USADA8_T1_A_exec skipped')
     return aarch32_USADA8_T1_A_exec
 
 
@@ -8748,7 +8992,8 @@ def aarch32_USAT_T1_A(core, regex_match, bitdiffs):
             if sat:
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_USAT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USAT_T1_A_exec skipped')
     return aarch32_USAT_T1_A_exec
 
 
@@ -8777,7 +9022,8 @@ def aarch32_USAT16_T1_A(core, regex_match, bitdiffs):
             if sat1 or sat2:
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_USAT16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USAT16_T1_A_exec skipped')
     return aarch32_USAT16_T1_A_exec
 
 
@@ -8808,7 +9054,8 @@ def aarch32_USAX_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetField(core.APSR.GE,1,0,'11' if sum  >= 0x10000 else '00');
             core.APSR.GE = core.SetField(core.APSR.GE,3,2,'11' if diff >= 0 else '00');
         else:
-            log.debug(f'aarch32_USAX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USAX_T1_A_exec skipped')
     return aarch32_USAX_T1_A_exec
 
 
@@ -8839,7 +9086,8 @@ def aarch32_USUB16_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetField(core.APSR.GE,1,0,'11' if diff1 >= 0 else '00');
             core.APSR.GE = core.SetField(core.APSR.GE,3,2,'11' if diff2 >= 0 else '00');
         else:
-            log.debug(f'aarch32_USUB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USUB16_T1_A_exec skipped')
     return aarch32_USUB16_T1_A_exec
 
 
@@ -8876,7 +9124,8 @@ def aarch32_USUB8_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetBit(core.APSR.GE,2,'1' if diff3 >= 0 else '0')
             core.APSR.GE = core.SetBit(core.APSR.GE,3,'1' if diff4 >= 0 else '0')
         else:
-            log.debug(f'aarch32_USUB8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USUB8_T1_A_exec skipped')
     return aarch32_USUB8_T1_A_exec
 
 
@@ -8909,7 +9158,8 @@ def aarch32_UXTAB_T1_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.readR(n) + core.ZeroExtend(core.Field(rotated,7,0), 32));
         else:
-            log.debug(f'aarch32_UXTAB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTAB_T1_A_exec skipped')
     return aarch32_UXTAB_T1_A_exec
 
 
@@ -8943,7 +9193,8 @@ def aarch32_UXTAB16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(core.readR(n),15,0) + core.ZeroExtend(core.Field(rotated,7,0), 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(core.readR(n),31,16) + core.ZeroExtend(core.Field(rotated,23,16), 16)));
         else:
-            log.debug(f'aarch32_UXTAB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTAB16_T1_A_exec skipped')
     return aarch32_UXTAB16_T1_A_exec
 
 
@@ -8976,7 +9227,8 @@ def aarch32_UXTAH_T1_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.readR(n) + core.ZeroExtend(core.Field(rotated,15,0), 32));
         else:
-            log.debug(f'aarch32_UXTAH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTAH_T1_A_exec skipped')
     return aarch32_UXTAH_T1_A_exec
 
 
@@ -8998,7 +9250,8 @@ def aarch32_UXTB_T1_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.ZeroExtend(core.Field(rotated,7,0), 32));
         else:
-            log.debug(f'aarch32_UXTB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTB_T1_A_exec skipped')
     return aarch32_UXTB_T1_A_exec
 
 # pattern UXTB{<c>}.W {<Rd>,} <Rm> with bitdiffs=[]
@@ -9028,7 +9281,8 @@ def aarch32_UXTB_T2_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.ZeroExtend(core.Field(rotated,7,0), 32));
         else:
-            log.debug(f'aarch32_UXTB_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTB_T2_A_exec skipped')
     return aarch32_UXTB_T2_A_exec
 
 
@@ -9059,7 +9313,8 @@ def aarch32_UXTB16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.ZeroExtend(core.Field(rotated,7,0), 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.ZeroExtend(core.Field(rotated,23,16), 16)));
         else:
-            log.debug(f'aarch32_UXTB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTB16_T1_A_exec skipped')
     return aarch32_UXTB16_T1_A_exec
 
 
@@ -9081,7 +9336,8 @@ def aarch32_UXTH_T1_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.ZeroExtend(core.Field(rotated,15,0), 32));
         else:
-            log.debug(f'aarch32_UXTH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTH_T1_A_exec skipped')
     return aarch32_UXTH_T1_A_exec
 
 # pattern UXTH{<c>}.W {<Rd>,} <Rm> with bitdiffs=[]
@@ -9111,1014 +9367,1015 @@ def aarch32_UXTH_T2_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.ZeroExtend(core.Field(rotated,15,0), 32));
         else:
-            log.debug(f'aarch32_UXTH_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTH_T2_A_exec skipped')
     return aarch32_UXTH_T2_A_exec
 
 
 patterns = {
     'ADC': [
-        (re.compile(r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADC_r_T1_A, {'S': '0'}),
-        (re.compile(r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_ADC_r_T1_A, {'S': '0'}),
-        (re.compile(r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADC_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADC_i_T1_A, {'S': '0'}),
-        (re.compile(r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_ADC_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_ADC_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_ADC_r_T1_A, {'S': '0'}),
+        (r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_ADC_r_T1_A, {'S': '0'}),
+        (r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_ADC_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADC_i_T1_A, {'S': '0'}),
+        (r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_ADC_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^ADC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_ADC_r_T2_A, {'S': '0', 'stype': '11'}),
     ],
     'ADCS': [
-        (re.compile(r'^ADCS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADC_r_T1_A, {'S': '1'}),
-        (re.compile(r'^ADCS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_ADC_r_T1_A, {'S': '1'}),
-        (re.compile(r'^ADCS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADC_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ADCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADC_i_T1_A, {'S': '1'}),
-        (re.compile(r'^ADCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_ADC_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ADCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_ADC_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^ADCS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_ADC_r_T1_A, {'S': '1'}),
+        (r'^ADCS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_ADC_r_T1_A, {'S': '1'}),
+        (r'^ADCS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_ADC_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^ADCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADC_i_T1_A, {'S': '1'}),
+        (r'^ADCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_ADC_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^ADCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_ADC_r_T2_A, {'S': '1', 'stype': '11'}),
     ],
     'ADD': [
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\sSP,\s(?P<Rdm>\w+)$', re.I), aarch32_ADD_SP_r_T1_A, {}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:SP,\s)?SP,\s(?P<Rm>\w+)$', re.I), aarch32_ADD_SP_r_T2_A, {}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\sSP,\s(?P=Rdm)$', re.I), aarch32_ADD_SP_r_T1_A, {}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:SP,\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_SP_i_T2_A, {}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)$', re.I), aarch32_ADD_SP_r_T3_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_SP_i_T3_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\sSP,\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_SP_i_T1_A, {}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\sPC,\s#(?P<imm32>\d+)$', re.I), aarch32_ADR_T1_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\sPC,\s#(?P<imm32>\d+)$', re.I), aarch32_ADR_T3_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_SP_i_T3_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_SP_i_T4_A, {}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADD_r_T2_A, {'DN': '1'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADD_r_T2_A, {'DN': '1'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T2_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T2_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_ADD_r_T2_A, {'DN': '1'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T2_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_ADD_SP_r_T3_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADD_r_T3_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADD_r_T3_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T3_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADD_r_T1_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T1_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T3_A, {'S': '0'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T4_A, {}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_ADD_SP_r_T3_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_ADD_r_T3_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_ADD_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\sSP,\s(?P<Rdm>\w+)$', aarch32_ADD_SP_r_T1_A, {}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:SP,\s)?SP,\s(?P<Rm>\w+)$', aarch32_ADD_SP_r_T2_A, {}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\sSP,\s(?P=Rdm)$', aarch32_ADD_SP_r_T1_A, {}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:SP,\s)?SP,\s#(?P<imm32>\d+)$', aarch32_ADD_SP_i_T2_A, {}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)$', aarch32_ADD_SP_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', aarch32_ADD_SP_i_T3_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\sSP,\s#(?P<imm32>\d+)$', aarch32_ADD_SP_i_T1_A, {}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\sPC,\s#(?P<imm32>\d+)$', aarch32_ADR_T1_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\sPC,\s#(?P<imm32>\d+)$', aarch32_ADR_T3_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', aarch32_ADD_SP_i_T3_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', aarch32_ADD_SP_i_T4_A, {}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_ADD_r_T2_A, {'DN': '1'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_ADD_r_T2_A, {'DN': '1'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T2_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T2_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_ADD_r_T2_A, {'DN': '1'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T2_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_ADD_SP_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_ADD_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_ADD_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T3_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_ADD_r_T1_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T1_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T3_A, {'S': '0'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T4_A, {}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_ADD_SP_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_ADD_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^ADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_ADD_r_T3_A, {'S': '0', 'stype': '11'}),
     ],
     'ADDS': [
-        (re.compile(r'^ADDS(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T2_A, {'S': '1'}),
-        (re.compile(r'^ADDS(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T2_A, {'S': '1'}),
-        (re.compile(r'^ADDS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T2_A, {'S': '1'}),
-        (re.compile(r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_SP_i_T3_A, {'S': '1'}),
-        (re.compile(r'^ADDS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADD_r_T3_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ADDS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T3_A, {'S': '1'}),
-        (re.compile(r'^ADDS(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T1_A, {'S': '1'}),
-        (re.compile(r'^ADDS(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ADD_r_T1_A, {'S': '1'}),
-        (re.compile(r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_ADD_SP_r_T3_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T3_A, {'S': '1'}),
-        (re.compile(r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_ADD_SP_r_T3_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_ADD_r_T3_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_ADD_r_T3_A, {'S': '1', 'stype': '11'}),
+        (r'^ADDS(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T2_A, {'S': '1'}),
+        (r'^ADDS(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T2_A, {'S': '1'}),
+        (r'^ADDS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T2_A, {'S': '1'}),
+        (r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', aarch32_ADD_SP_i_T3_A, {'S': '1'}),
+        (r'^ADDS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_ADD_r_T3_A, {'S': '1', 'stype': '11'}),
+        (r'^ADDS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T3_A, {'S': '1'}),
+        (r'^ADDS(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T1_A, {'S': '1'}),
+        (r'^ADDS(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_ADD_r_T1_A, {'S': '1'}),
+        (r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_ADD_SP_r_T3_A, {'S': '1', 'stype': '11'}),
+        (r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T3_A, {'S': '1'}),
+        (r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_ADD_SP_r_T3_A, {'S': '1', 'stype': '11'}),
+        (r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_ADD_r_T3_A, {'S': '1', 'stype': '11'}),
+        (r'^ADDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_ADD_r_T3_A, {'S': '1', 'stype': '11'}),
     ],
     'ADDW': [
-        (re.compile(r'^ADDW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\sPC,\s#(?P<imm32>\d+)$', re.I), aarch32_ADR_T3_A, {'S': '0'}),
-        (re.compile(r'^ADDW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_SP_i_T4_A, {}),
-        (re.compile(r'^ADDW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ADD_i_T4_A, {}),
+        (r'^ADDW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\sPC,\s#(?P<imm32>\d+)$', aarch32_ADR_T3_A, {'S': '0'}),
+        (r'^ADDW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', aarch32_ADD_SP_i_T4_A, {}),
+        (r'^ADDW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ADD_i_T4_A, {}),
     ],
     'ADR': [
-        (re.compile(r'^ADR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_ADR_T3_A, {}),
-        (re.compile(r'^ADR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_ADR_T1_A, {}),
-        (re.compile(r'^ADR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_ADR_T2_A, {}),
-        (re.compile(r'^ADR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_ADR_T3_A, {}),
+        (r'^ADR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_ADR_T3_A, {}),
+        (r'^ADR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_ADR_T1_A, {}),
+        (r'^ADR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_ADR_T2_A, {}),
+        (r'^ADR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_ADR_T3_A, {}),
     ],
     'AND': [
-        (re.compile(r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_AND_r_T1_A, {'S': '0'}),
-        (re.compile(r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_AND_r_T1_A, {'S': '0'}),
-        (re.compile(r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_AND_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_AND_i_T1_A, {'S': '0'}),
-        (re.compile(r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_AND_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_AND_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_AND_r_T1_A, {'S': '0'}),
+        (r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_AND_r_T1_A, {'S': '0'}),
+        (r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_AND_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_AND_i_T1_A, {'S': '0'}),
+        (r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_AND_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^AND(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_AND_r_T2_A, {'S': '0', 'stype': '11'}),
     ],
     'ANDS': [
-        (re.compile(r'^ANDS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_AND_r_T1_A, {'S': '1'}),
-        (re.compile(r'^ANDS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_AND_r_T1_A, {'S': '1'}),
-        (re.compile(r'^ANDS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_AND_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ANDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_AND_i_T1_A, {'S': '1'}),
-        (re.compile(r'^ANDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_AND_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ANDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_AND_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^ANDS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_AND_r_T1_A, {'S': '1'}),
+        (r'^ANDS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_AND_r_T1_A, {'S': '1'}),
+        (r'^ANDS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_AND_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^ANDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_AND_i_T1_A, {'S': '1'}),
+        (r'^ANDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_AND_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^ANDS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_AND_r_T2_A, {'S': '1', 'stype': '11'}),
     ],
     'ASR': [
-        (re.compile(r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '0'}),
+        (r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '0'}),
+        (r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '0'}),
+        (r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '0'}),
+        (r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>ASR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '0'}),
     ],
     'ASRS': [
-        (re.compile(r'^(?P<shift_t>ASR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>ASR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>ASR)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>ASR)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>ASR)S(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>ASR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>ASR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '1'}),
+        (r'^(?P<shift_t>ASR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '1'}),
+        (r'^(?P<shift_t>ASR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '1'}),
+        (r'^(?P<shift_t>ASR)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>ASR)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '1'}),
+        (r'^(?P<shift_t>ASR)S(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>ASR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>ASR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '1'}),
     ],
     'B': [
-        (re.compile(r'^B(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_B_T3_A, {}),
-        (re.compile(r'^B(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_B_T4_A, {}),
-        (re.compile(r'^B(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_B_T1_A, {}),
-        (re.compile(r'^B(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_B_T2_A, {}),
-        (re.compile(r'^B(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_B_T3_A, {}),
-        (re.compile(r'^B(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_B_T4_A, {}),
+        (r'^B(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_B_T3_A, {}),
+        (r'^B(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_B_T4_A, {}),
+        (r'^B(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_B_T1_A, {}),
+        (r'^B(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_B_T2_A, {}),
+        (r'^B(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_B_T3_A, {}),
+        (r'^B(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_B_T4_A, {}),
     ],
     'BFC': [
-        (re.compile(r'^BFC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<lsb>\d+),\s#(?P<width>\d+)$', re.I), aarch32_BFC_T1_A, {}),
+        (r'^BFC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<lsb>\d+),\s#(?P<width>\d+)$', aarch32_BFC_T1_A, {}),
     ],
     'BFI': [
-        (re.compile(r'^BFI(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<lsb>\d+),\s#(?P<width>\d+)$', re.I), aarch32_BFI_T1_A, {}),
+        (r'^BFI(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<lsb>\d+),\s#(?P<width>\d+)$', aarch32_BFI_T1_A, {}),
     ],
     'BIC': [
-        (re.compile(r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_BIC_r_T1_A, {'S': '0'}),
-        (re.compile(r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_BIC_r_T1_A, {'S': '0'}),
-        (re.compile(r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_BIC_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_BIC_i_T1_A, {'S': '0'}),
-        (re.compile(r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_BIC_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_BIC_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_BIC_r_T1_A, {'S': '0'}),
+        (r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_BIC_r_T1_A, {'S': '0'}),
+        (r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_BIC_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_BIC_i_T1_A, {'S': '0'}),
+        (r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_BIC_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^BIC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_BIC_r_T2_A, {'S': '0', 'stype': '11'}),
     ],
     'BICS': [
-        (re.compile(r'^BICS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_BIC_r_T1_A, {'S': '1'}),
-        (re.compile(r'^BICS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_BIC_r_T1_A, {'S': '1'}),
-        (re.compile(r'^BICS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_BIC_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^BICS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_BIC_i_T1_A, {'S': '1'}),
-        (re.compile(r'^BICS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_BIC_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^BICS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_BIC_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^BICS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_BIC_r_T1_A, {'S': '1'}),
+        (r'^BICS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_BIC_r_T1_A, {'S': '1'}),
+        (r'^BICS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_BIC_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^BICS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_BIC_i_T1_A, {'S': '1'}),
+        (r'^BICS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_BIC_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^BICS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_BIC_r_T2_A, {'S': '1', 'stype': '11'}),
     ],
     'BKPT': [
-        (re.compile(r'^BKPT(?:\.[NW])?\s#?(?P<imm32>[xa-f\d]+)$', re.I), aarch32_BKPT_T1_A, {}),
+        (r'^BKPT(?:\.[NW])?\s#?(?P<imm32>[xa-f\d]+)$', aarch32_BKPT_T1_A, {}),
     ],
     'BL': [
-        (re.compile(r'^BL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_BL_i_T1_A, {}),
+        (r'^BL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_BL_i_T1_A, {}),
     ],
     'BLX': [
-        (re.compile(r'^BLX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rm>\w+)$', re.I), aarch32_BLX_r_T1_A, {}),
-        (re.compile(r'^BLX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_BL_i_T2_A, {}),
+        (r'^BLX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rm>\w+)$', aarch32_BLX_r_T1_A, {}),
+        (r'^BLX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_BL_i_T2_A, {}),
     ],
     'BX': [
-        (re.compile(r'^BX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rm>\w+)$', re.I), aarch32_BX_T1_A, {}),
+        (r'^BX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rm>\w+)$', aarch32_BX_T1_A, {}),
     ],
     'CBNZ': [
-        (re.compile(r'^CBNZ(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_CBNZ_T1_A, {'op': '1'}),
+        (r'^CBNZ(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_CBNZ_T1_A, {'op': '1'}),
     ],
     'CBZ': [
-        (re.compile(r'^CBZ(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_CBNZ_T1_A, {'op': '0'}),
+        (r'^CBZ(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_CBNZ_T1_A, {'op': '0'}),
     ],
     'CLREX': [
-        (re.compile(r'^CLREX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?$', re.I), aarch32_CLREX_T1_A, {}),
+        (r'^CLREX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?$', aarch32_CLREX_T1_A, {}),
     ],
     'CLZ': [
-        (re.compile(r'^CLZ(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_CLZ_T1_A, {}),
+        (r'^CLZ(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_CLZ_T1_A, {}),
     ],
     'CMN': [
-        (re.compile(r'^CMN(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_CMN_r_T2_A, {'stype': '11'}),
-        (re.compile(r'^CMN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_CMN_r_T1_A, {}),
-        (re.compile(r'^CMN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_CMN_i_T1_A, {}),
-        (re.compile(r'^CMN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_CMN_r_T2_A, {'stype': '11'}),
-        (re.compile(r'^CMN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_CMN_r_T2_A, {'stype': '11'}),
+        (r'^CMN(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_CMN_r_T2_A, {'stype': '11'}),
+        (r'^CMN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_CMN_r_T1_A, {}),
+        (r'^CMN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_CMN_i_T1_A, {}),
+        (r'^CMN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_CMN_r_T2_A, {'stype': '11'}),
+        (r'^CMN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_CMN_r_T2_A, {'stype': '11'}),
     ],
     'CMP': [
-        (re.compile(r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_CMP_r_T3_A, {'stype': '11'}),
-        (re.compile(r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_CMP_i_T2_A, {}),
-        (re.compile(r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_CMP_r_T1_A, {}),
-        (re.compile(r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_CMP_r_T2_A, {}),
-        (re.compile(r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_CMP_i_T1_A, {}),
-        (re.compile(r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_CMP_i_T2_A, {}),
-        (re.compile(r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_CMP_r_T3_A, {'stype': '11'}),
-        (re.compile(r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+)$', re.I), aarch32_CMP_r_T3_A, {'stype': '11'}),
+        (r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_CMP_r_T3_A, {'stype': '11'}),
+        (r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_CMP_i_T2_A, {}),
+        (r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_CMP_r_T1_A, {}),
+        (r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_CMP_r_T2_A, {}),
+        (r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_CMP_i_T1_A, {}),
+        (r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_CMP_i_T2_A, {}),
+        (r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_CMP_r_T3_A, {'stype': '11'}),
+        (r'^CMP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+)$', aarch32_CMP_r_T3_A, {'stype': '11'}),
     ],
     'EOR': [
-        (re.compile(r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_EOR_r_T1_A, {'S': '0'}),
-        (re.compile(r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_EOR_r_T1_A, {'S': '0'}),
-        (re.compile(r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_EOR_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_EOR_i_T1_A, {'S': '0'}),
-        (re.compile(r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_EOR_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_EOR_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_EOR_r_T1_A, {'S': '0'}),
+        (r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_EOR_r_T1_A, {'S': '0'}),
+        (r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_EOR_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_EOR_i_T1_A, {'S': '0'}),
+        (r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_EOR_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^EOR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_EOR_r_T2_A, {'S': '0', 'stype': '11'}),
     ],
     'EORS': [
-        (re.compile(r'^EORS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_EOR_r_T1_A, {'S': '1'}),
-        (re.compile(r'^EORS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_EOR_r_T1_A, {'S': '1'}),
-        (re.compile(r'^EORS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_EOR_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^EORS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_EOR_i_T1_A, {'S': '1'}),
-        (re.compile(r'^EORS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_EOR_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^EORS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_EOR_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^EORS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_EOR_r_T1_A, {'S': '1'}),
+        (r'^EORS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_EOR_r_T1_A, {'S': '1'}),
+        (r'^EORS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_EOR_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^EORS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_EOR_i_T1_A, {'S': '1'}),
+        (r'^EORS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_EOR_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^EORS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_EOR_r_T2_A, {'S': '1', 'stype': '11'}),
     ],
     'IT': [
-        (re.compile(r'^IT(?P<mask>[ET]*)(?:\.[NW])?\s(?P<firstcond>\w\w)$', re.I), aarch32_IT_T1_A, {}),
+        (r'^IT(?P<mask>[ET]*)(?:\.[NW])?\s(?P<firstcond>\w\w)$', aarch32_IT_T1_A, {}),
     ],
     'LDM': [
-        (re.compile(r'^LDM(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\sSP!,\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_POP_T1_A, {}),
-        (re.compile(r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T2_A, {}),
-        (re.compile(r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T1_A, {}),
-        (re.compile(r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T2_A, {}),
-        (re.compile(r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T2_A, {}),
-        (re.compile(r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T1_A, {}),
-        (re.compile(r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T2_A, {}),
+        (r'^LDM(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\sSP!,\s\{(?P<registers>[^}]+)\}$', aarch32_POP_T1_A, {}),
+        (r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T2_A, {}),
+        (r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T1_A, {}),
+        (r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T2_A, {}),
+        (r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T2_A, {}),
+        (r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T1_A, {}),
+        (r'^LDM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T2_A, {}),
     ],
     'LDMDB': [
-        (re.compile(r'^LDMDB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDMDB_T1_A, {}),
-        (re.compile(r'^LDMDB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDMDB_T1_A, {}),
+        (r'^LDMDB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_LDMDB_T1_A, {}),
+        (r'^LDMDB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_LDMDB_T1_A, {}),
     ],
     'LDMEA': [
-        (re.compile(r'^LDMEA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDMDB_T1_A, {}),
-        (re.compile(r'^LDMEA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDMDB_T1_A, {}),
+        (r'^LDMEA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_LDMDB_T1_A, {}),
+        (r'^LDMEA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_LDMDB_T1_A, {}),
     ],
     'LDMFD': [
-        (re.compile(r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T2_A, {}),
-        (re.compile(r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T1_A, {}),
-        (re.compile(r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T2_A, {}),
-        (re.compile(r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T2_A, {}),
-        (re.compile(r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T1_A, {}),
-        (re.compile(r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_LDM_T2_A, {}),
+        (r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T2_A, {}),
+        (r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T1_A, {}),
+        (r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T2_A, {}),
+        (r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T2_A, {}),
+        (r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T1_A, {}),
+        (r'^LDMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_LDM_T2_A, {}),
     ],
     'LDR': [
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', re.I), aarch32_LDR_l_T2_A, {}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[SP(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDR_i_T2_A, {}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_LDR_l_T2_A, {}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_LDR_l_T1_A, {}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_LDR_l_T2_A, {}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_LDR_r_T2_A, {}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDR_i_T3_A, {}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_LDR_r_T1_A, {}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', re.I), aarch32_LDR_i_T4_A, {'P': '0', 'W': '1'}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', re.I), aarch32_LDR_i_T4_A, {'P': '1', 'U': '0', 'W': '0'}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', re.I), aarch32_LDR_i_T4_A, {'P': '1', 'W': '1'}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDR_i_T1_A, {}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDR_i_T3_A, {}),
-        (re.compile(r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', re.I), aarch32_LDR_r_T2_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', aarch32_LDR_l_T2_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[SP(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDR_i_T2_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_LDR_l_T2_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_LDR_l_T1_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_LDR_l_T2_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_LDR_r_T2_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDR_i_T3_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_LDR_r_T1_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', aarch32_LDR_i_T4_A, {'P': '0', 'W': '1'}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', aarch32_LDR_i_T4_A, {'P': '1', 'U': '0', 'W': '0'}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', aarch32_LDR_i_T4_A, {'P': '1', 'W': '1'}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDR_i_T1_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDR_i_T3_A, {}),
+        (r'^LDR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', aarch32_LDR_r_T2_A, {}),
     ],
     'LDRB': [
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', re.I), aarch32_LDRB_l_T1_A, {}),
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_LDRB_l_T1_A, {}),
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_LDRB_r_T2_A, {}),
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRB_i_T2_A, {}),
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_LDRB_r_T1_A, {}),
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', re.I), aarch32_LDRB_i_T3_A, {'P': '0', 'W': '1'}),
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', re.I), aarch32_LDRB_i_T3_A, {'P': '1', 'U': '0', 'W': '0'}),
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', re.I), aarch32_LDRB_i_T3_A, {'P': '1', 'W': '1'}),
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRB_i_T1_A, {}),
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRB_i_T2_A, {}),
-        (re.compile(r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', re.I), aarch32_LDRB_r_T2_A, {}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', aarch32_LDRB_l_T1_A, {}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_LDRB_l_T1_A, {}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_LDRB_r_T2_A, {}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRB_i_T2_A, {}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_LDRB_r_T1_A, {}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', aarch32_LDRB_i_T3_A, {'P': '0', 'W': '1'}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', aarch32_LDRB_i_T3_A, {'P': '1', 'U': '0', 'W': '0'}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', aarch32_LDRB_i_T3_A, {'P': '1', 'W': '1'}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRB_i_T1_A, {}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRB_i_T2_A, {}),
+        (r'^LDRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', aarch32_LDRB_r_T2_A, {}),
     ],
     'LDRBT': [
-        (re.compile(r'^LDRBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRBT_T1_A, {}),
+        (r'^LDRBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRBT_T1_A, {}),
     ],
     'LDRD': [
-        (re.compile(r'^LDRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', re.I), aarch32_LDRD_l_T1_A, {'P': '0', 'W': '0'}),
-        (re.compile(r'^LDRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_LDRD_l_T1_A, {'P': '0', 'W': '0'}),
-        (re.compile(r'^LDRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', re.I), aarch32_LDRD_i_T1_A, {'P': '0', 'W': '1'}),
-        (re.compile(r'^LDRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', re.I), aarch32_LDRD_i_T1_A, {'P': '1', 'W': '1'}),
-        (re.compile(r'^LDRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+-]?\d+))?\]$', re.I), aarch32_LDRD_i_T1_A, {'P': '1', 'W': '0'}),
+        (r'^LDRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', aarch32_LDRD_l_T1_A, {'P': '0', 'W': '0'}),
+        (r'^LDRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_LDRD_l_T1_A, {'P': '0', 'W': '0'}),
+        (r'^LDRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', aarch32_LDRD_i_T1_A, {'P': '0', 'W': '1'}),
+        (r'^LDRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', aarch32_LDRD_i_T1_A, {'P': '1', 'W': '1'}),
+        (r'^LDRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+-]?\d+))?\]$', aarch32_LDRD_i_T1_A, {'P': '1', 'W': '0'}),
     ],
     'LDREX': [
-        (re.compile(r'^LDREX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>\d+))?\]$', re.I), aarch32_LDREX_T1_A, {}),
+        (r'^LDREX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>\d+))?\]$', aarch32_LDREX_T1_A, {}),
     ],
     'LDREXB': [
-        (re.compile(r'^LDREXB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\]$', re.I), aarch32_LDREXB_T1_A, {}),
+        (r'^LDREXB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\]$', aarch32_LDREXB_T1_A, {}),
     ],
     'LDREXH': [
-        (re.compile(r'^LDREXH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\]$', re.I), aarch32_LDREXH_T1_A, {}),
+        (r'^LDREXH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\]$', aarch32_LDREXH_T1_A, {}),
     ],
     'LDRH': [
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', re.I), aarch32_LDRH_l_T1_A, {}),
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_LDRH_l_T1_A, {}),
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_LDRH_r_T2_A, {}),
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRH_i_T2_A, {}),
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_LDRH_r_T1_A, {}),
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', re.I), aarch32_LDRH_i_T3_A, {'P': '0', 'W': '1'}),
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', re.I), aarch32_LDRH_i_T3_A, {'P': '1', 'U': '0', 'W': '0'}),
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', re.I), aarch32_LDRH_i_T3_A, {'P': '1', 'W': '1'}),
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRH_i_T1_A, {}),
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRH_i_T2_A, {}),
-        (re.compile(r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', re.I), aarch32_LDRH_r_T2_A, {}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', aarch32_LDRH_l_T1_A, {}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_LDRH_l_T1_A, {}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_LDRH_r_T2_A, {}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRH_i_T2_A, {}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_LDRH_r_T1_A, {}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', aarch32_LDRH_i_T3_A, {'P': '0', 'W': '1'}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', aarch32_LDRH_i_T3_A, {'P': '1', 'U': '0', 'W': '0'}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', aarch32_LDRH_i_T3_A, {'P': '1', 'W': '1'}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRH_i_T1_A, {}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRH_i_T2_A, {}),
+        (r'^LDRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', aarch32_LDRH_r_T2_A, {}),
     ],
     'LDRHT': [
-        (re.compile(r'^LDRHT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRHT_T1_A, {}),
+        (r'^LDRHT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRHT_T1_A, {}),
     ],
     'LDRSB': [
-        (re.compile(r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', re.I), aarch32_LDRSB_l_T1_A, {}),
-        (re.compile(r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_LDRSB_l_T1_A, {}),
-        (re.compile(r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_LDRSB_r_T2_A, {}),
-        (re.compile(r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_LDRSB_r_T1_A, {}),
-        (re.compile(r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', re.I), aarch32_LDRSB_i_T2_A, {'P': '0', 'W': '1'}),
-        (re.compile(r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', re.I), aarch32_LDRSB_i_T2_A, {'P': '1', 'U': '0', 'W': '0'}),
-        (re.compile(r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', re.I), aarch32_LDRSB_i_T2_A, {'P': '1', 'W': '1'}),
-        (re.compile(r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRSB_i_T1_A, {}),
-        (re.compile(r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', re.I), aarch32_LDRSB_r_T2_A, {}),
+        (r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', aarch32_LDRSB_l_T1_A, {}),
+        (r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_LDRSB_l_T1_A, {}),
+        (r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_LDRSB_r_T2_A, {}),
+        (r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_LDRSB_r_T1_A, {}),
+        (r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', aarch32_LDRSB_i_T2_A, {'P': '0', 'W': '1'}),
+        (r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', aarch32_LDRSB_i_T2_A, {'P': '1', 'U': '0', 'W': '0'}),
+        (r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', aarch32_LDRSB_i_T2_A, {'P': '1', 'W': '1'}),
+        (r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRSB_i_T1_A, {}),
+        (r'^LDRSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', aarch32_LDRSB_r_T2_A, {}),
     ],
     'LDRSBT': [
-        (re.compile(r'^LDRSBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRSBT_T1_A, {}),
+        (r'^LDRSBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRSBT_T1_A, {}),
     ],
     'LDRSH': [
-        (re.compile(r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', re.I), aarch32_LDRSH_l_T1_A, {}),
-        (re.compile(r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', re.I), aarch32_LDRSH_l_T1_A, {}),
-        (re.compile(r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_LDRSH_r_T2_A, {}),
-        (re.compile(r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_LDRSH_r_T1_A, {}),
-        (re.compile(r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', re.I), aarch32_LDRSH_i_T2_A, {'P': '0', 'W': '1'}),
-        (re.compile(r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', re.I), aarch32_LDRSH_i_T2_A, {'P': '1', 'U': '0', 'W': '0'}),
-        (re.compile(r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', re.I), aarch32_LDRSH_i_T2_A, {'P': '1', 'W': '1'}),
-        (re.compile(r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRSH_i_T1_A, {}),
-        (re.compile(r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', re.I), aarch32_LDRSH_r_T2_A, {}),
+        (r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[PC,\s#(?P<imm32>[+-]?\d+)\]$', aarch32_LDRSH_l_T1_A, {}),
+        (r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<abs_address>[a-f\d]+)\s*.*$', aarch32_LDRSH_l_T1_A, {}),
+        (r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_LDRSH_r_T2_A, {}),
+        (r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_LDRSH_r_T1_A, {}),
+        (r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', aarch32_LDRSH_i_T2_A, {'P': '0', 'W': '1'}),
+        (r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', aarch32_LDRSH_i_T2_A, {'P': '1', 'U': '0', 'W': '0'}),
+        (r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', aarch32_LDRSH_i_T2_A, {'P': '1', 'W': '1'}),
+        (r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRSH_i_T1_A, {}),
+        (r'^LDRSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', aarch32_LDRSH_r_T2_A, {}),
     ],
     'LDRSHT': [
-        (re.compile(r'^LDRSHT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRSHT_T1_A, {}),
+        (r'^LDRSHT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRSHT_T1_A, {}),
     ],
     'LDRT': [
-        (re.compile(r'^LDRT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_LDRT_T1_A, {}),
+        (r'^LDRT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_LDRT_T1_A, {}),
     ],
     'LSL': [
-        (re.compile(r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSL)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '0'}),
     ],
     'LSLS': [
-        (re.compile(r'^(?P<shift_t>LSL)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSL)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSL)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSL)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSL)S(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSL)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSL)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSL)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSL)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSL)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSL)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSL)S(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSL)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSL)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '1'}),
     ],
     'LSR': [
-        (re.compile(r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>LSR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '0'}),
     ],
     'LSRS': [
-        (re.compile(r'^(?P<shift_t>LSR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSR)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSR)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSR)S(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>LSR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSR)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSR)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSR)S(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>LSR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '1'}),
     ],
     'MLA': [
-        (re.compile(r'^MLA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_MLA_T1_A, {}),
+        (r'^MLA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_MLA_T1_A, {}),
     ],
     'MLS': [
-        (re.compile(r'^MLS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_MLS_T1_A, {}),
+        (r'^MLS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_MLS_T1_A, {}),
     ],
     'MOV': [
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MOV_i_T2_A, {'S': '0'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_MOV_r_T1_A, {}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MOV_i_T1_A, {'S': '0'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MOV_i_T2_A, {'S': '0'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MOV_i_T3_A, {}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\sLSL\s#0)?$', re.I), aarch32_MOV_r_T3_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_MOV_r_T3_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>ASR)\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'op': '0100', 'S': '0'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>LSL)\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'op': '0010', 'S': '0'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>LSR)\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'op': '0011', 'S': '0'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>ROR)\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'op': '0111', 'S': '0'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>[LAR][SO][LR])\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '0'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>[LAR][SO][LR])\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '0'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_MOV_r_T3_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_MOV_r_T2_A, {'S': '0'}),
-        (re.compile(r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_MOV_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MOV_i_T2_A, {'S': '0'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_MOV_r_T1_A, {}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MOV_i_T1_A, {'S': '0'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MOV_i_T2_A, {'S': '0'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MOV_i_T3_A, {}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\sLSL\s#0)?$', aarch32_MOV_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_MOV_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>ASR)\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'op': '0100', 'S': '0'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>LSL)\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'op': '0010', 'S': '0'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>LSR)\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'op': '0011', 'S': '0'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>ROR)\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'op': '0111', 'S': '0'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>[LAR][SO][LR])\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '0'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>[LAR][SO][LR])\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '0'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_MOV_r_T3_A, {'S': '0', 'stype': '11'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_MOV_r_T2_A, {'S': '0'}),
+        (r'^MOV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_MOV_r_T3_A, {'S': '0', 'stype': '11'}),
     ],
     'MOVS': [
-        (re.compile(r'^MOVS.W\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MOV_i_T2_A, {'S': '1'}),
-        (re.compile(r'^MOVS(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MOV_i_T1_A, {'S': '1'}),
-        (re.compile(r'^MOVS(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>ASR)\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'op': '0100', 'S': '1'}),
-        (re.compile(r'^MOVS(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>LSL)\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'op': '0010', 'S': '1'}),
-        (re.compile(r'^MOVS(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>LSR)\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'op': '0011', 'S': '1'}),
-        (re.compile(r'^MOVS(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>ROR)\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'op': '0111', 'S': '1'}),
-        (re.compile(r'^MOVS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MOV_i_T2_A, {'S': '1'}),
-        (re.compile(r'^MOVS.W\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>[LAR][SO][LR])\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '1'}),
-        (re.compile(r'^MOVS.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_MOV_r_T3_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^MOVS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_MOV_r_T3_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^MOVS(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_MOV_r_T2_A, {'S': '1'}),
-        (re.compile(r'^MOVS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>[LAR][SO][LR])\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '1'}),
-        (re.compile(r'^MOVS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_MOV_r_T3_A, {'S': '1', 'stype': '11'}),
+        (r'^MOVS.W\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MOV_i_T2_A, {'S': '1'}),
+        (r'^MOVS(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MOV_i_T1_A, {'S': '1'}),
+        (r'^MOVS(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>ASR)\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'op': '0100', 'S': '1'}),
+        (r'^MOVS(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>LSL)\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'op': '0010', 'S': '1'}),
+        (r'^MOVS(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>LSR)\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'op': '0011', 'S': '1'}),
+        (r'^MOVS(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<shift_t>ROR)\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'op': '0111', 'S': '1'}),
+        (r'^MOVS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MOV_i_T2_A, {'S': '1'}),
+        (r'^MOVS.W\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>[LAR][SO][LR])\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '1'}),
+        (r'^MOVS.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_MOV_r_T3_A, {'S': '1', 'stype': '11'}),
+        (r'^MOVS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_MOV_r_T3_A, {'S': '1', 'stype': '11'}),
+        (r'^MOVS(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_MOV_r_T2_A, {'S': '1'}),
+        (r'^MOVS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>[LAR][SO][LR])\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '1'}),
+        (r'^MOVS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_MOV_r_T3_A, {'S': '1', 'stype': '11'}),
     ],
     'MOVT': [
-        (re.compile(r'^MOVT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MOVT_T1_A, {}),
+        (r'^MOVT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MOVT_T1_A, {}),
     ],
     'MOVW': [
-        (re.compile(r'^MOVW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MOV_i_T3_A, {}),
+        (r'^MOVW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MOV_i_T3_A, {}),
     ],
     'MRS': [
-        (re.compile(r'^MRS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<spec_reg>\w+)$', re.I), aarch32_MRS_T1_AS, {}),
+        (r'^MRS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<spec_reg>\w+)$', aarch32_MRS_T1_AS, {}),
     ],
     'MSR': [
-        (re.compile(r'^MSR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<spec_reg>\w+),\s(?P<Rn>\w+)$', re.I), aarch32_MSR_r_T1_AS, {}),
+        (r'^MSR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<spec_reg>\w+),\s(?P<Rn>\w+)$', aarch32_MSR_r_T1_AS, {}),
     ],
     'MUL': [
-        (re.compile(r'^MUL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rn>\w+)(?:,\s(?P=Rdm))?$', re.I), aarch32_MUL_T1_A, {'S': '0'}),
-        (re.compile(r'^MUL(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rn>\w+)(?:,\s(?P<Rm>\w+))?$', re.I), aarch32_MUL_T2_A, {}),
-        (re.compile(r'^MUL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+)(?:,\s(?P<Rm>\w+))?$', re.I), aarch32_MUL_T2_A, {}),
+        (r'^MUL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rn>\w+)(?:,\s(?P=Rdm))?$', aarch32_MUL_T1_A, {'S': '0'}),
+        (r'^MUL(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rn>\w+)(?:,\s(?P<Rm>\w+))?$', aarch32_MUL_T2_A, {}),
+        (r'^MUL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+)(?:,\s(?P<Rm>\w+))?$', aarch32_MUL_T2_A, {}),
     ],
     'MULS': [
-        (re.compile(r'^MULS(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rn>\w+)(?:,\s(?P=Rdm))?$', re.I), aarch32_MUL_T1_A, {'S': '1'}),
+        (r'^MULS(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rn>\w+)(?:,\s(?P=Rdm))?$', aarch32_MUL_T1_A, {'S': '1'}),
     ],
     'MVN': [
-        (re.compile(r'^MVN(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_MVN_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^MVN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_MVN_r_T1_A, {'S': '0'}),
-        (re.compile(r'^MVN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MVN_i_T1_A, {'S': '0'}),
-        (re.compile(r'^MVN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_MVN_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^MVN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_MVN_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^MVN(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_MVN_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^MVN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_MVN_r_T1_A, {'S': '0'}),
+        (r'^MVN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MVN_i_T1_A, {'S': '0'}),
+        (r'^MVN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_MVN_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^MVN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_MVN_r_T2_A, {'S': '0', 'stype': '11'}),
     ],
     'MVNS': [
-        (re.compile(r'^MVNS.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_MVN_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^MVNS(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_MVN_r_T1_A, {'S': '1'}),
-        (re.compile(r'^MVNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_MVN_i_T1_A, {'S': '1'}),
-        (re.compile(r'^MVNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_MVN_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^MVNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_MVN_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^MVNS.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_MVN_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^MVNS(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_MVN_r_T1_A, {'S': '1'}),
+        (r'^MVNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+)$', aarch32_MVN_i_T1_A, {'S': '1'}),
+        (r'^MVNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_MVN_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^MVNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_MVN_r_T2_A, {'S': '1', 'stype': '11'}),
     ],
     'NEG': [
-        (re.compile(r'^NEG(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+)$', re.I), aarch32_RSB_i_T1_A, {'S': '0'}),
+        (r'^NEG(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+)$', aarch32_RSB_i_T1_A, {'S': '0'}),
     ],
     'NEGS': [
-        (re.compile(r'^NEGS(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+)$', re.I), aarch32_RSB_i_T1_A, {'S': '1'}),
+        (r'^NEGS(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+)$', aarch32_RSB_i_T1_A, {'S': '1'}),
     ],
     'NOP': [
-        (re.compile(r'^NOP(?P<c>[ACEGHLMNPV][CEILQST])?.W$', re.I), aarch32_NOP_T2_A, {}),
-        (re.compile(r'^NOP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?$', re.I), aarch32_NOP_T1_A, {}),
+        (r'^NOP(?P<c>[ACEGHLMNPV][CEILQST])?.W$', aarch32_NOP_T2_A, {}),
+        (r'^NOP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?$', aarch32_NOP_T1_A, {}),
     ],
     'ORN': [
-        (re.compile(r'^ORN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ORN_i_T1_A, {'S': '0'}),
-        (re.compile(r'^ORN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_ORN_r_T1_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ORN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_ORN_r_T1_A, {'S': '0', 'stype': '11'}),
+        (r'^ORN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ORN_i_T1_A, {'S': '0'}),
+        (r'^ORN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_ORN_r_T1_A, {'S': '0', 'stype': '11'}),
+        (r'^ORN(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_ORN_r_T1_A, {'S': '0', 'stype': '11'}),
     ],
     'ORNS': [
-        (re.compile(r'^ORNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ORN_i_T1_A, {'S': '1'}),
-        (re.compile(r'^ORNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_ORN_r_T1_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ORNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_ORN_r_T1_A, {'S': '1', 'stype': '11'}),
+        (r'^ORNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ORN_i_T1_A, {'S': '1'}),
+        (r'^ORNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_ORN_r_T1_A, {'S': '1', 'stype': '11'}),
+        (r'^ORNS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_ORN_r_T1_A, {'S': '1', 'stype': '11'}),
     ],
     'ORR': [
-        (re.compile(r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ORR_r_T1_A, {'S': '0'}),
-        (re.compile(r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_ORR_r_T1_A, {'S': '0'}),
-        (re.compile(r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ORR_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ORR_i_T1_A, {'S': '0'}),
-        (re.compile(r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_ORR_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_ORR_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_ORR_r_T1_A, {'S': '0'}),
+        (r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_ORR_r_T1_A, {'S': '0'}),
+        (r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_ORR_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ORR_i_T1_A, {'S': '0'}),
+        (r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_ORR_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^ORR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_ORR_r_T2_A, {'S': '0', 'stype': '11'}),
     ],
     'ORRS': [
-        (re.compile(r'^ORRS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ORR_r_T1_A, {'S': '1'}),
-        (re.compile(r'^ORRS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_ORR_r_T1_A, {'S': '1'}),
-        (re.compile(r'^ORRS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_ORR_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ORRS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_ORR_i_T1_A, {'S': '1'}),
-        (re.compile(r'^ORRS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_ORR_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^ORRS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_ORR_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^ORRS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_ORR_r_T1_A, {'S': '1'}),
+        (r'^ORRS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_ORR_r_T1_A, {'S': '1'}),
+        (r'^ORRS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_ORR_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^ORRS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_ORR_i_T1_A, {'S': '1'}),
+        (r'^ORRS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_ORR_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^ORRS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_ORR_r_T2_A, {'S': '1', 'stype': '11'}),
     ],
     'PKHBT': [
-        (re.compile(r'^PKHBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?$', re.I), aarch32_PKH_T1_A, {'tb': '0'}),
+        (r'^PKHBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?$', aarch32_PKH_T1_A, {'tb': '0'}),
     ],
     'PKHTB': [
-        (re.compile(r'^PKHTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ASR)\s#(?P<shift_n>\d+))?$', re.I), aarch32_PKH_T1_A, {'tb': '1'}),
+        (r'^PKHTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ASR)\s#(?P<shift_n>\d+))?$', aarch32_PKH_T1_A, {'tb': '1'}),
     ],
     'POP': [
-        (re.compile(r'^POP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_POP_T1_A, {}),
+        (r'^POP(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s\{(?P<registers>[^}]+)\}$', aarch32_POP_T1_A, {}),
     ],
     'PUSH': [
-        (re.compile(r'^PUSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_PUSH_T1_A, {}),
+        (r'^PUSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s\{(?P<registers>[^}]+)\}$', aarch32_PUSH_T1_A, {}),
     ],
     'QADD': [
-        (re.compile(r'^QADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rn>\w+)$', re.I), aarch32_QADD_T1_A, {}),
+        (r'^QADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rn>\w+)$', aarch32_QADD_T1_A, {}),
     ],
     'QADD16': [
-        (re.compile(r'^QADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_QADD16_T1_A, {}),
+        (r'^QADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_QADD16_T1_A, {}),
     ],
     'QADD8': [
-        (re.compile(r'^QADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_QADD8_T1_A, {}),
+        (r'^QADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_QADD8_T1_A, {}),
     ],
     'QASX': [
-        (re.compile(r'^QASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_QASX_T1_A, {}),
+        (r'^QASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_QASX_T1_A, {}),
     ],
     'QDADD': [
-        (re.compile(r'^QDADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rn>\w+)$', re.I), aarch32_QDADD_T1_A, {}),
+        (r'^QDADD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rn>\w+)$', aarch32_QDADD_T1_A, {}),
     ],
     'QDSUB': [
-        (re.compile(r'^QDSUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rn>\w+)$', re.I), aarch32_QDSUB_T1_A, {}),
+        (r'^QDSUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rn>\w+)$', aarch32_QDSUB_T1_A, {}),
     ],
     'QSAX': [
-        (re.compile(r'^QSAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_QSAX_T1_A, {}),
+        (r'^QSAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_QSAX_T1_A, {}),
     ],
     'QSUB': [
-        (re.compile(r'^QSUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rn>\w+)$', re.I), aarch32_QSUB_T1_A, {}),
+        (r'^QSUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rn>\w+)$', aarch32_QSUB_T1_A, {}),
     ],
     'QSUB16': [
-        (re.compile(r'^QSUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_QSUB16_T1_A, {}),
+        (r'^QSUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_QSUB16_T1_A, {}),
     ],
     'QSUB8': [
-        (re.compile(r'^QSUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_QSUB8_T1_A, {}),
+        (r'^QSUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_QSUB8_T1_A, {}),
     ],
     'RBIT': [
-        (re.compile(r'^RBIT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_RBIT_T1_A, {}),
+        (r'^RBIT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_RBIT_T1_A, {}),
     ],
     'REV': [
-        (re.compile(r'^REV(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_REV_T2_A, {}),
-        (re.compile(r'^REV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_REV_T1_A, {}),
-        (re.compile(r'^REV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_REV_T2_A, {}),
+        (r'^REV(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_REV_T2_A, {}),
+        (r'^REV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_REV_T1_A, {}),
+        (r'^REV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_REV_T2_A, {}),
     ],
     'REV16': [
-        (re.compile(r'^REV16(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_REV16_T2_A, {}),
-        (re.compile(r'^REV16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_REV16_T1_A, {}),
-        (re.compile(r'^REV16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_REV16_T2_A, {}),
+        (r'^REV16(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_REV16_T2_A, {}),
+        (r'^REV16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_REV16_T1_A, {}),
+        (r'^REV16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_REV16_T2_A, {}),
     ],
     'REVSH': [
-        (re.compile(r'^REVSH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_REVSH_T2_A, {}),
-        (re.compile(r'^REVSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_REVSH_T1_A, {}),
-        (re.compile(r'^REVSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_REVSH_T2_A, {}),
+        (r'^REVSH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_REVSH_T2_A, {}),
+        (r'^REVSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_REVSH_T1_A, {}),
+        (r'^REVSH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rm>\w+)$', aarch32_REVSH_T2_A, {}),
     ],
     'ROR': [
-        (re.compile(r'^(?P<shift_t>ROR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>ROR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>ROR)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>ROR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '0'}),
-        (re.compile(r'^(?P<shift_t>ROR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '0'}),
+        (r'^(?P<shift_t>ROR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '0'}),
+        (r'^(?P<shift_t>ROR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '0'}),
+        (r'^(?P<shift_t>ROR)(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>ROR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '0'}),
+        (r'^(?P<shift_t>ROR)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '0'}),
     ],
     'RORS': [
-        (re.compile(r'^(?P<shift_t>ROR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>ROR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T1_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>ROR)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>ROR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', re.I), aarch32_MOV_rr_T2_A, {'S': '1'}),
-        (re.compile(r'^(?P<shift_t>ROR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', re.I), aarch32_MOV_r_T3_A, {'S': '1'}),
+        (r'^(?P<shift_t>ROR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '1'}),
+        (r'^(?P<shift_t>ROR)S(?:\.[NW])?\s(?P<Rdm>\w+),\s(?P=Rdm),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T1_A, {'S': '1'}),
+        (r'^(?P<shift_t>ROR)S.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>ROR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s(?P<Rs>\w+)$', aarch32_MOV_rr_T2_A, {'S': '1'}),
+        (r'^(?P<shift_t>ROR)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+),\s#(?P<shift_n>\d+)$', aarch32_MOV_r_T3_A, {'S': '1'}),
     ],
     'RRX': [
-        (re.compile(r'^(?P<shift_t>RRX)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', re.I), aarch32_MOV_r_T3_A, {'S': '0'}),
+        (r'^(?P<shift_t>RRX)(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', aarch32_MOV_r_T3_A, {'S': '0'}),
     ],
     'RRXS': [
-        (re.compile(r'^(?P<shift_t>RRX)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', re.I), aarch32_MOV_r_T3_A, {'S': '1'}),
+        (r'^(?P<shift_t>RRX)S(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', aarch32_MOV_r_T3_A, {'S': '1'}),
     ],
     'RSB': [
-        (re.compile(r'^RSB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#0$', re.I), aarch32_RSB_i_T2_A, {'S': '0'}),
-        (re.compile(r'^RSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#0$', re.I), aarch32_RSB_i_T1_A, {'S': '0'}),
-        (re.compile(r'^RSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_RSB_i_T2_A, {'S': '0'}),
-        (re.compile(r'^RSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_RSB_r_T1_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^RSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_RSB_r_T1_A, {'S': '0', 'stype': '11'}),
+        (r'^RSB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#0$', aarch32_RSB_i_T2_A, {'S': '0'}),
+        (r'^RSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#0$', aarch32_RSB_i_T1_A, {'S': '0'}),
+        (r'^RSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_RSB_i_T2_A, {'S': '0'}),
+        (r'^RSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_RSB_r_T1_A, {'S': '0', 'stype': '11'}),
+        (r'^RSB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_RSB_r_T1_A, {'S': '0', 'stype': '11'}),
     ],
     'RSBS': [
-        (re.compile(r'^RSBS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#0$', re.I), aarch32_RSB_i_T2_A, {'S': '1'}),
-        (re.compile(r'^RSBS(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#0$', re.I), aarch32_RSB_i_T1_A, {'S': '1'}),
-        (re.compile(r'^RSBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_RSB_i_T2_A, {'S': '1'}),
-        (re.compile(r'^RSBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_RSB_r_T1_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^RSBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_RSB_r_T1_A, {'S': '1', 'stype': '11'}),
+        (r'^RSBS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#0$', aarch32_RSB_i_T2_A, {'S': '1'}),
+        (r'^RSBS(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#0$', aarch32_RSB_i_T1_A, {'S': '1'}),
+        (r'^RSBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_RSB_i_T2_A, {'S': '1'}),
+        (r'^RSBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_RSB_r_T1_A, {'S': '1', 'stype': '11'}),
+        (r'^RSBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_RSB_r_T1_A, {'S': '1', 'stype': '11'}),
     ],
     'SADD16': [
-        (re.compile(r'^SADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SADD16_T1_A, {}),
+        (r'^SADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SADD16_T1_A, {}),
     ],
     'SADD8': [
-        (re.compile(r'^SADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SADD8_T1_A, {}),
+        (r'^SADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SADD8_T1_A, {}),
     ],
     'SASX': [
-        (re.compile(r'^SASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SASX_T1_A, {}),
+        (r'^SASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SASX_T1_A, {}),
     ],
     'SBC': [
-        (re.compile(r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SBC_r_T1_A, {'S': '0'}),
-        (re.compile(r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_SBC_r_T1_A, {'S': '0'}),
-        (re.compile(r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SBC_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SBC_i_T1_A, {'S': '0'}),
-        (re.compile(r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_SBC_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_SBC_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_SBC_r_T1_A, {'S': '0'}),
+        (r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_SBC_r_T1_A, {'S': '0'}),
+        (r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SBC_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_SBC_i_T1_A, {'S': '0'}),
+        (r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_SBC_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^SBC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_SBC_r_T2_A, {'S': '0', 'stype': '11'}),
     ],
     'SBCS': [
-        (re.compile(r'^SBCS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SBC_r_T1_A, {'S': '1'}),
-        (re.compile(r'^SBCS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', re.I), aarch32_SBC_r_T1_A, {'S': '1'}),
-        (re.compile(r'^SBCS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SBC_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^SBCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SBC_i_T1_A, {'S': '1'}),
-        (re.compile(r'^SBCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_SBC_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^SBCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_SBC_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^SBCS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P<Rm>\w+)$', aarch32_SBC_r_T1_A, {'S': '1'}),
+        (r'^SBCS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s(?P<Rm>\w+)$', aarch32_SBC_r_T1_A, {'S': '1'}),
+        (r'^SBCS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SBC_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^SBCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_SBC_i_T1_A, {'S': '1'}),
+        (r'^SBCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_SBC_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^SBCS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_SBC_r_T2_A, {'S': '1', 'stype': '11'}),
     ],
     'SBFX': [
-        (re.compile(r'^SBFX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<lsb>\d+),\s#(?P<width>\d+)$', re.I), aarch32_SBFX_T1_A, {}),
+        (r'^SBFX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<lsb>\d+),\s#(?P<width>\d+)$', aarch32_SBFX_T1_A, {}),
     ],
     'SDIV': [
-        (re.compile(r'^SDIV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SDIV_T1_A, {}),
+        (r'^SDIV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SDIV_T1_A, {}),
     ],
     'SEL': [
-        (re.compile(r'^SEL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SEL_T1_A, {}),
+        (r'^SEL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SEL_T1_A, {}),
     ],
     'SHADD16': [
-        (re.compile(r'^SHADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SHADD16_T1_A, {}),
+        (r'^SHADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SHADD16_T1_A, {}),
     ],
     'SHADD8': [
-        (re.compile(r'^SHADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SHADD8_T1_A, {}),
+        (r'^SHADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SHADD8_T1_A, {}),
     ],
     'SHASX': [
-        (re.compile(r'^SHASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SHASX_T1_A, {}),
+        (r'^SHASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SHASX_T1_A, {}),
     ],
     'SHSAX': [
-        (re.compile(r'^SHSAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SHSAX_T1_A, {}),
+        (r'^SHSAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SHSAX_T1_A, {}),
     ],
     'SHSUB16': [
-        (re.compile(r'^SHSUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SHSUB16_T1_A, {}),
+        (r'^SHSUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SHSUB16_T1_A, {}),
     ],
     'SHSUB8': [
-        (re.compile(r'^SHSUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SHSUB8_T1_A, {}),
+        (r'^SHSUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SHSUB8_T1_A, {}),
     ],
     'SMLABB': [
-        (re.compile(r'^SMLABB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMLABB_T1_A, {'N': '0', 'M': '0'}),
+        (r'^SMLABB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMLABB_T1_A, {'N': '0', 'M': '0'}),
     ],
     'SMLABT': [
-        (re.compile(r'^SMLABT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMLABB_T1_A, {'N': '0', 'M': '1'}),
+        (r'^SMLABT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMLABB_T1_A, {'N': '0', 'M': '1'}),
     ],
     'SMLAD': [
-        (re.compile(r'^SMLAD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMLAD_T1_A, {'M': '0'}),
+        (r'^SMLAD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMLAD_T1_A, {'M': '0'}),
     ],
     'SMLADX': [
-        (re.compile(r'^SMLADX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMLAD_T1_A, {'M': '1'}),
+        (r'^SMLADX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMLAD_T1_A, {'M': '1'}),
     ],
     'SMLAL': [
-        (re.compile(r'^SMLAL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMLAL_T1_A, {}),
+        (r'^SMLAL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMLAL_T1_A, {}),
     ],
     'SMLALBB': [
-        (re.compile(r'^SMLALBB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMLALBB_T1_A, {'N': '0', 'M': '0'}),
+        (r'^SMLALBB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMLALBB_T1_A, {'N': '0', 'M': '0'}),
     ],
     'SMLALBT': [
-        (re.compile(r'^SMLALBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMLALBB_T1_A, {'N': '0', 'M': '1'}),
+        (r'^SMLALBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMLALBB_T1_A, {'N': '0', 'M': '1'}),
     ],
     'SMLALD': [
-        (re.compile(r'^SMLALD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMLALD_T1_A, {'M': '0'}),
+        (r'^SMLALD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMLALD_T1_A, {'M': '0'}),
     ],
     'SMLALDX': [
-        (re.compile(r'^SMLALDX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMLALD_T1_A, {'M': '1'}),
+        (r'^SMLALDX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMLALD_T1_A, {'M': '1'}),
     ],
     'SMLALTB': [
-        (re.compile(r'^SMLALTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMLALBB_T1_A, {'N': '1', 'M': '0'}),
+        (r'^SMLALTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMLALBB_T1_A, {'N': '1', 'M': '0'}),
     ],
     'SMLALTT': [
-        (re.compile(r'^SMLALTT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMLALBB_T1_A, {'N': '1', 'M': '1'}),
+        (r'^SMLALTT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMLALBB_T1_A, {'N': '1', 'M': '1'}),
     ],
     'SMLATB': [
-        (re.compile(r'^SMLATB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMLABB_T1_A, {'N': '1', 'M': '0'}),
+        (r'^SMLATB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMLABB_T1_A, {'N': '1', 'M': '0'}),
     ],
     'SMLATT': [
-        (re.compile(r'^SMLATT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMLABB_T1_A, {'N': '1', 'M': '1'}),
+        (r'^SMLATT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMLABB_T1_A, {'N': '1', 'M': '1'}),
     ],
     'SMLAWB': [
-        (re.compile(r'^SMLAWB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMLAWB_T1_A, {'M': '0'}),
+        (r'^SMLAWB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMLAWB_T1_A, {'M': '0'}),
     ],
     'SMLAWT': [
-        (re.compile(r'^SMLAWT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMLAWB_T1_A, {'M': '1'}),
+        (r'^SMLAWT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMLAWB_T1_A, {'M': '1'}),
     ],
     'SMLSD': [
-        (re.compile(r'^SMLSD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMLSD_T1_A, {'M': '0'}),
+        (r'^SMLSD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMLSD_T1_A, {'M': '0'}),
     ],
     'SMLSDX': [
-        (re.compile(r'^SMLSDX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMLSD_T1_A, {'M': '1'}),
+        (r'^SMLSDX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMLSD_T1_A, {'M': '1'}),
     ],
     'SMLSLD': [
-        (re.compile(r'^SMLSLD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMLSLD_T1_A, {'M': '0'}),
+        (r'^SMLSLD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMLSLD_T1_A, {'M': '0'}),
     ],
     'SMLSLDX': [
-        (re.compile(r'^SMLSLDX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMLSLD_T1_A, {'M': '1'}),
+        (r'^SMLSLDX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMLSLD_T1_A, {'M': '1'}),
     ],
     'SMMLA': [
-        (re.compile(r'^SMMLA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMMLA_T1_A, {'R': '0'}),
+        (r'^SMMLA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMMLA_T1_A, {'R': '0'}),
     ],
     'SMMLAR': [
-        (re.compile(r'^SMMLAR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMMLA_T1_A, {'R': '1'}),
+        (r'^SMMLAR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMMLA_T1_A, {'R': '1'}),
     ],
     'SMMLS': [
-        (re.compile(r'^SMMLS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMMLS_T1_A, {'R': '0'}),
+        (r'^SMMLS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMMLS_T1_A, {'R': '0'}),
     ],
     'SMMLSR': [
-        (re.compile(r'^SMMLSR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_SMMLS_T1_A, {'R': '1'}),
+        (r'^SMMLSR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_SMMLS_T1_A, {'R': '1'}),
     ],
     'SMMUL': [
-        (re.compile(r'^SMMUL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMMUL_T1_A, {'R': '0'}),
+        (r'^SMMUL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMMUL_T1_A, {'R': '0'}),
     ],
     'SMMULR': [
-        (re.compile(r'^SMMULR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMMUL_T1_A, {'R': '1'}),
+        (r'^SMMULR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMMUL_T1_A, {'R': '1'}),
     ],
     'SMUAD': [
-        (re.compile(r'^SMUAD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMUAD_T1_A, {'M': '0'}),
+        (r'^SMUAD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMUAD_T1_A, {'M': '0'}),
     ],
     'SMUADX': [
-        (re.compile(r'^SMUADX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMUAD_T1_A, {'M': '1'}),
+        (r'^SMUADX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMUAD_T1_A, {'M': '1'}),
     ],
     'SMULBB': [
-        (re.compile(r'^SMULBB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMULBB_T1_A, {'N': '0', 'M': '0'}),
+        (r'^SMULBB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMULBB_T1_A, {'N': '0', 'M': '0'}),
     ],
     'SMULBT': [
-        (re.compile(r'^SMULBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMULBB_T1_A, {'N': '0', 'M': '1'}),
+        (r'^SMULBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMULBB_T1_A, {'N': '0', 'M': '1'}),
     ],
     'SMULL': [
-        (re.compile(r'^SMULL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMULL_T1_A, {}),
+        (r'^SMULL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMULL_T1_A, {}),
     ],
     'SMULTB': [
-        (re.compile(r'^SMULTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMULBB_T1_A, {'N': '1', 'M': '0'}),
+        (r'^SMULTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMULBB_T1_A, {'N': '1', 'M': '0'}),
     ],
     'SMULTT': [
-        (re.compile(r'^SMULTT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMULBB_T1_A, {'N': '1', 'M': '1'}),
+        (r'^SMULTT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMULBB_T1_A, {'N': '1', 'M': '1'}),
     ],
     'SMULWB': [
-        (re.compile(r'^SMULWB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMULWB_T1_A, {'M': '0'}),
+        (r'^SMULWB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMULWB_T1_A, {'M': '0'}),
     ],
     'SMULWT': [
-        (re.compile(r'^SMULWT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMULWB_T1_A, {'M': '1'}),
+        (r'^SMULWT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMULWB_T1_A, {'M': '1'}),
     ],
     'SMUSD': [
-        (re.compile(r'^SMUSD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMUSD_T1_A, {'M': '0'}),
+        (r'^SMUSD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMUSD_T1_A, {'M': '0'}),
     ],
     'SMUSDX': [
-        (re.compile(r'^SMUSDX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SMUSD_T1_A, {'M': '1'}),
+        (r'^SMUSDX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SMUSD_T1_A, {'M': '1'}),
     ],
     'SSAT': [
-        (re.compile(r'^SSAT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+),\s(?P<shift_t>ASR)\s#(?P<shift_n>\d+)$', re.I), aarch32_SSAT_T1_A, {'sh': '1'}),
-        (re.compile(r'^SSAT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?$', re.I), aarch32_SSAT_T1_A, {'sh': '0'}),
+        (r'^SSAT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+),\s(?P<shift_t>ASR)\s#(?P<shift_n>\d+)$', aarch32_SSAT_T1_A, {'sh': '1'}),
+        (r'^SSAT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?$', aarch32_SSAT_T1_A, {'sh': '0'}),
     ],
     'SSAT16': [
-        (re.compile(r'^SSAT16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+)$', re.I), aarch32_SSAT16_T1_A, {}),
+        (r'^SSAT16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+)$', aarch32_SSAT16_T1_A, {}),
     ],
     'SSAX': [
-        (re.compile(r'^SSAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SSAX_T1_A, {}),
+        (r'^SSAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SSAX_T1_A, {}),
     ],
     'SSUB16': [
-        (re.compile(r'^SSUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SSUB16_T1_A, {}),
+        (r'^SSUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SSUB16_T1_A, {}),
     ],
     'SSUB8': [
-        (re.compile(r'^SSUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SSUB8_T1_A, {}),
+        (r'^SSUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SSUB8_T1_A, {}),
     ],
     'STM': [
-        (re.compile(r'^STM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STM_T2_A, {}),
-        (re.compile(r'^STM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STM_T2_A, {}),
-        (re.compile(r'^STM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)!,\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STM_T1_A, {}),
-        (re.compile(r'^STM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STM_T2_A, {}),
-        (re.compile(r'^STM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STM_T2_A, {}),
+        (r'^STM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_STM_T2_A, {}),
+        (r'^STM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_STM_T2_A, {}),
+        (r'^STM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)!,\s\{(?P<registers>[^}]+)\}$', aarch32_STM_T1_A, {}),
+        (r'^STM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_STM_T2_A, {}),
+        (r'^STM(?:IA)?(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_STM_T2_A, {}),
     ],
     'STMDB': [
-        (re.compile(r'^STMDB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\sSP!,\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_PUSH_T1_A, {}),
-        (re.compile(r'^STMDB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STMDB_T1_A, {}),
-        (re.compile(r'^STMDB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STMDB_T1_A, {}),
+        (r'^STMDB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\sSP!,\s\{(?P<registers>[^}]+)\}$', aarch32_PUSH_T1_A, {}),
+        (r'^STMDB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_STMDB_T1_A, {}),
+        (r'^STMDB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_STMDB_T1_A, {}),
     ],
     'STMEA': [
-        (re.compile(r'^STMEA(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STM_T2_A, {}),
-        (re.compile(r'^STMEA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STM_T2_A, {}),
-        (re.compile(r'^STMEA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)!,\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STM_T1_A, {}),
-        (re.compile(r'^STMEA(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STM_T2_A, {}),
-        (re.compile(r'^STMEA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STM_T2_A, {}),
+        (r'^STMEA(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_STM_T2_A, {}),
+        (r'^STMEA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_STM_T2_A, {}),
+        (r'^STMEA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)!,\s\{(?P<registers>[^}]+)\}$', aarch32_STM_T1_A, {}),
+        (r'^STMEA(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_STM_T2_A, {}),
+        (r'^STMEA(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_STM_T2_A, {}),
     ],
     'STMFD': [
-        (re.compile(r'^STMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STMDB_T1_A, {}),
-        (re.compile(r'^STMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', re.I), aarch32_STMDB_T1_A, {}),
+        (r'^STMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s\{(?P<registers>[^}]+)\}$', aarch32_STMDB_T1_A, {}),
+        (r'^STMFD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+)(?P<wback>!),\s\{(?P<registers>[^}]+)\}$', aarch32_STMDB_T1_A, {}),
     ],
     'STR': [
-        (re.compile(r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[SP(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STR_i_T2_A, {}),
-        (re.compile(r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_STR_r_T2_A, {}),
-        (re.compile(r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STR_i_T3_A, {}),
-        (re.compile(r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_STR_r_T1_A, {}),
-        (re.compile(r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', re.I), aarch32_STR_i_T4_A, {'P': '0', 'W': '1'}),
-        (re.compile(r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', re.I), aarch32_STR_i_T4_A, {'P': '1', 'U': '0', 'W': '0'}),
-        (re.compile(r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', re.I), aarch32_STR_i_T4_A, {'P': '1', 'W': '1'}),
-        (re.compile(r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STR_i_T1_A, {}),
-        (re.compile(r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STR_i_T3_A, {}),
-        (re.compile(r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', re.I), aarch32_STR_r_T2_A, {}),
+        (r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[SP(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STR_i_T2_A, {}),
+        (r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_STR_r_T2_A, {}),
+        (r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STR_i_T3_A, {}),
+        (r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_STR_r_T1_A, {}),
+        (r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', aarch32_STR_i_T4_A, {'P': '0', 'W': '1'}),
+        (r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', aarch32_STR_i_T4_A, {'P': '1', 'U': '0', 'W': '0'}),
+        (r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', aarch32_STR_i_T4_A, {'P': '1', 'W': '1'}),
+        (r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STR_i_T1_A, {}),
+        (r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STR_i_T3_A, {}),
+        (r'^STR(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', aarch32_STR_r_T2_A, {}),
     ],
     'STRB': [
-        (re.compile(r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_STRB_r_T2_A, {}),
-        (re.compile(r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STRB_i_T2_A, {}),
-        (re.compile(r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_STRB_r_T1_A, {}),
-        (re.compile(r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', re.I), aarch32_STRB_i_T3_A, {'P': '0', 'W': '1'}),
-        (re.compile(r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', re.I), aarch32_STRB_i_T3_A, {'P': '1', 'U': '0', 'W': '0'}),
-        (re.compile(r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', re.I), aarch32_STRB_i_T3_A, {'P': '1', 'W': '1'}),
-        (re.compile(r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STRB_i_T1_A, {}),
-        (re.compile(r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STRB_i_T2_A, {}),
-        (re.compile(r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', re.I), aarch32_STRB_r_T2_A, {}),
+        (r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_STRB_r_T2_A, {}),
+        (r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STRB_i_T2_A, {}),
+        (r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_STRB_r_T1_A, {}),
+        (r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', aarch32_STRB_i_T3_A, {'P': '0', 'W': '1'}),
+        (r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', aarch32_STRB_i_T3_A, {'P': '1', 'U': '0', 'W': '0'}),
+        (r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', aarch32_STRB_i_T3_A, {'P': '1', 'W': '1'}),
+        (r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STRB_i_T1_A, {}),
+        (r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STRB_i_T2_A, {}),
+        (r'^STRB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', aarch32_STRB_r_T2_A, {}),
     ],
     'STRBT': [
-        (re.compile(r'^STRBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STRBT_T1_A, {}),
+        (r'^STRBT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STRBT_T1_A, {}),
     ],
     'STRD': [
-        (re.compile(r'^STRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', re.I), aarch32_STRD_i_T1_A, {'P': '0', 'W': '1'}),
-        (re.compile(r'^STRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', re.I), aarch32_STRD_i_T1_A, {'P': '1', 'W': '1'}),
-        (re.compile(r'^STRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+-]?\d+))?\]$', re.I), aarch32_STRD_i_T1_A, {'P': '1', 'W': '0'}),
+        (r'^STRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', aarch32_STRD_i_T1_A, {'P': '0', 'W': '1'}),
+        (r'^STRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', aarch32_STRD_i_T1_A, {'P': '1', 'W': '1'}),
+        (r'^STRD(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s(?P<Rt2>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+-]?\d+))?\]$', aarch32_STRD_i_T1_A, {'P': '1', 'W': '0'}),
     ],
     'STREX': [
-        (re.compile(r'^STREX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>\d+))?\]$', re.I), aarch32_STREX_T1_A, {}),
+        (r'^STREX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>\d+))?\]$', aarch32_STREX_T1_A, {}),
     ],
     'STREXB': [
-        (re.compile(r'^STREXB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\]$', re.I), aarch32_STREXB_T1_A, {}),
+        (r'^STREXB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\]$', aarch32_STREXB_T1_A, {}),
     ],
     'STREXH': [
-        (re.compile(r'^STREXH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\]$', re.I), aarch32_STREXH_T1_A, {}),
+        (r'^STREXH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\]$', aarch32_STREXH_T1_A, {}),
     ],
     'STRH': [
-        (re.compile(r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_STRH_r_T2_A, {}),
-        (re.compile(r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STRH_i_T2_A, {}),
-        (re.compile(r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', re.I), aarch32_STRH_r_T1_A, {}),
-        (re.compile(r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', re.I), aarch32_STRH_i_T3_A, {'P': '0', 'W': '1'}),
-        (re.compile(r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', re.I), aarch32_STRH_i_T3_A, {'P': '1', 'U': '0', 'W': '0'}),
-        (re.compile(r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', re.I), aarch32_STRH_i_T3_A, {'P': '1', 'W': '1'}),
-        (re.compile(r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STRH_i_T1_A, {}),
-        (re.compile(r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STRH_i_T2_A, {}),
-        (re.compile(r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', re.I), aarch32_STRH_r_T2_A, {}),
+        (r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_STRH_r_T2_A, {}),
+        (r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STRH_i_T2_A, {}),
+        (r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)\]$', aarch32_STRH_r_T1_A, {}),
+        (r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)\],\s#(?P<imm32>[+-]?\d+)$', aarch32_STRH_i_T3_A, {'P': '0', 'W': '1'}),
+        (r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#-(?P<imm32>\d+))?\]$', aarch32_STRH_i_T3_A, {'P': '1', 'U': '0', 'W': '0'}),
+        (r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s#(?P<imm32>[+-]?\d+)\]!$', aarch32_STRH_i_T3_A, {'P': '1', 'W': '1'}),
+        (r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STRH_i_T1_A, {}),
+        (r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STRH_i_T2_A, {}),
+        (r'^STRH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+),\s[+]?(?P<Rm>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?\]$', aarch32_STRH_r_T2_A, {}),
     ],
     'STRHT': [
-        (re.compile(r'^STRHT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STRHT_T1_A, {}),
+        (r'^STRHT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STRHT_T1_A, {}),
     ],
     'STRT': [
-        (re.compile(r'^STRT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', re.I), aarch32_STRT_T1_A, {}),
+        (r'^STRT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rt>\w+),\s\[(?P<Rn>\w+)(?:,\s#(?P<imm32>[+]?\d+))?\]$', aarch32_STRT_T1_A, {}),
     ],
     'SUB': [
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:SP,\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_SP_i_T1_A, {}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)$', re.I), aarch32_SUB_SP_r_T1_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_SP_i_T2_A, {'S': '0'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\sPC,\s#(?P<imm32>\d+)$', re.I), aarch32_ADR_T2_A, {'S': '0'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_SP_i_T2_A, {'S': '0'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_SP_i_T3_A, {}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T2_A, {'S': '0'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T2_A, {'S': '0'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T2_A, {'S': '0'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_SUB_SP_r_T1_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SUB_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T3_A, {'S': '0'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SUB_r_T1_A, {'S': '0'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T1_A, {'S': '0'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T3_A, {'S': '0'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T4_A, {}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_SUB_SP_r_T1_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_SUB_r_T2_A, {'S': '0', 'stype': '11'}),
-        (re.compile(r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_SUB_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:SP,\s)?SP,\s#(?P<imm32>\d+)$', aarch32_SUB_SP_i_T1_A, {}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)$', aarch32_SUB_SP_r_T1_A, {'S': '0', 'stype': '11'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', aarch32_SUB_SP_i_T2_A, {'S': '0'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\sPC,\s#(?P<imm32>\d+)$', aarch32_ADR_T2_A, {'S': '0'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', aarch32_SUB_SP_i_T2_A, {'S': '0'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', aarch32_SUB_SP_i_T3_A, {}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T2_A, {'S': '0'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T2_A, {'S': '0'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T2_A, {'S': '0'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_SUB_SP_r_T1_A, {'S': '0', 'stype': '11'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SUB_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T3_A, {'S': '0'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SUB_r_T1_A, {'S': '0'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T1_A, {'S': '0'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T3_A, {'S': '0'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T4_A, {}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_SUB_SP_r_T1_A, {'S': '0', 'stype': '11'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_SUB_r_T2_A, {'S': '0', 'stype': '11'}),
+        (r'^SUB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_SUB_r_T2_A, {'S': '0', 'stype': '11'}),
     ],
     'SUBS': [
-        (re.compile(r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\sPC,\sLR,\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T5_AS, {}),
-        (re.compile(r'^SUBS(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T2_A, {'S': '1'}),
-        (re.compile(r'^SUBS(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T2_A, {'S': '1'}),
-        (re.compile(r'^SUBS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T2_A, {'S': '1'}),
-        (re.compile(r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_SP_i_T2_A, {'S': '1'}),
-        (re.compile(r'^SUBS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SUB_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^SUBS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T3_A, {'S': '1'}),
-        (re.compile(r'^SUBS(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T1_A, {'S': '1'}),
-        (re.compile(r'^SUBS(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_SUB_r_T1_A, {'S': '1'}),
-        (re.compile(r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_SUB_SP_r_T1_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T3_A, {'S': '1'}),
-        (re.compile(r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_SUB_SP_r_T1_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_SUB_r_T2_A, {'S': '1', 'stype': '11'}),
-        (re.compile(r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_SUB_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\sPC,\sLR,\s#(?P<imm32>\d+)$', aarch32_SUB_i_T5_AS, {}),
+        (r'^SUBS(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T2_A, {'S': '1'}),
+        (r'^SUBS(?:\.[NW])?\s(?P<Rdn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T2_A, {'S': '1'}),
+        (r'^SUBS(?:\.[NW])?\s(?P<Rdn>\w+),\s(?P=Rdn),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T2_A, {'S': '1'}),
+        (r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', aarch32_SUB_SP_i_T2_A, {'S': '1'}),
+        (r'^SUBS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SUB_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^SUBS.W\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T3_A, {'S': '1'}),
+        (r'^SUBS(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T1_A, {'S': '1'}),
+        (r'^SUBS(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_SUB_r_T1_A, {'S': '1'}),
+        (r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_SUB_SP_r_T1_A, {'S': '1', 'stype': '11'}),
+        (r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T3_A, {'S': '1'}),
+        (r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_SUB_SP_r_T1_A, {'S': '1', 'stype': '11'}),
+        (r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_SUB_r_T2_A, {'S': '1', 'stype': '11'}),
+        (r'^SUBS(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_SUB_r_T2_A, {'S': '1', 'stype': '11'}),
     ],
     'SUBW': [
-        (re.compile(r'^SUBW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_SP_i_T3_A, {}),
-        (re.compile(r'^SUBW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_SUB_i_T4_A, {}),
+        (r'^SUBW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?SP,\s#(?P<imm32>\d+)$', aarch32_SUB_SP_i_T3_A, {}),
+        (r'^SUBW(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_SUB_i_T4_A, {}),
     ],
     'SVC': [
-        (re.compile(r'^SVC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s#?(?P<imm32>[xa-f\d]+)$', re.I), aarch32_SVC_T1_A, {}),
+        (r'^SVC(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s#?(?P<imm32>[xa-f\d]+)$', aarch32_SVC_T1_A, {}),
     ],
     'SXTAB': [
-        (re.compile(r'^SXTAB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_SXTAB_T1_A, {}),
+        (r'^SXTAB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_SXTAB_T1_A, {}),
     ],
     'SXTAB16': [
-        (re.compile(r'^SXTAB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_SXTAB16_T1_A, {}),
+        (r'^SXTAB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_SXTAB16_T1_A, {}),
     ],
     'SXTAH': [
-        (re.compile(r'^SXTAH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_SXTAH_T1_A, {}),
+        (r'^SXTAH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_SXTAH_T1_A, {}),
     ],
     'SXTB': [
-        (re.compile(r'^SXTB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', re.I), aarch32_SXTB_T2_A, {}),
-        (re.compile(r'^SXTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', re.I), aarch32_SXTB_T1_A, {}),
-        (re.compile(r'^SXTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_SXTB_T2_A, {}),
+        (r'^SXTB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', aarch32_SXTB_T2_A, {}),
+        (r'^SXTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', aarch32_SXTB_T1_A, {}),
+        (r'^SXTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_SXTB_T2_A, {}),
     ],
     'SXTB16': [
-        (re.compile(r'^SXTB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_SXTB16_T1_A, {}),
+        (r'^SXTB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_SXTB16_T1_A, {}),
     ],
     'SXTH': [
-        (re.compile(r'^SXTH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', re.I), aarch32_SXTH_T2_A, {}),
-        (re.compile(r'^SXTH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', re.I), aarch32_SXTH_T1_A, {}),
-        (re.compile(r'^SXTH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_SXTH_T2_A, {}),
+        (r'^SXTH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', aarch32_SXTH_T2_A, {}),
+        (r'^SXTH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', aarch32_SXTH_T1_A, {}),
+        (r'^SXTH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_SXTH_T2_A, {}),
     ],
     'TBB': [
-        (re.compile(r'^TBB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s\[(?P<Rn>\w+),\s(?P<Rm>\w+)\]$', re.I), aarch32_TBB_T1_A, {'H': '0'}),
+        (r'^TBB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s\[(?P<Rn>\w+),\s(?P<Rm>\w+)\]$', aarch32_TBB_T1_A, {'H': '0'}),
     ],
     'TBH': [
-        (re.compile(r'^TBH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s\[(?P<Rn>\w+),\s(?P<Rm>\w+),\sLSL\s#1\]$', re.I), aarch32_TBB_T1_A, {'H': '1'}),
+        (r'^TBH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s\[(?P<Rn>\w+),\s(?P<Rm>\w+),\sLSL\s#1\]$', aarch32_TBB_T1_A, {'H': '1'}),
     ],
     'TEQ': [
-        (re.compile(r'^TEQ(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_TEQ_i_T1_A, {}),
-        (re.compile(r'^TEQ(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_TEQ_r_T1_A, {'stype': '11'}),
-        (re.compile(r'^TEQ(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_TEQ_r_T1_A, {'stype': '11'}),
+        (r'^TEQ(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_TEQ_i_T1_A, {}),
+        (r'^TEQ(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_TEQ_r_T1_A, {'stype': '11'}),
+        (r'^TEQ(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_TEQ_r_T1_A, {'stype': '11'}),
     ],
     'TST': [
-        (re.compile(r'^TST(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_TST_r_T2_A, {'stype': '11'}),
-        (re.compile(r'^TST(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_TST_r_T1_A, {}),
-        (re.compile(r'^TST(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', re.I), aarch32_TST_i_T1_A, {}),
-        (re.compile(r'^TST(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', re.I), aarch32_TST_r_T2_A, {'stype': '11'}),
-        (re.compile(r'^TST(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', re.I), aarch32_TST_r_T2_A, {'stype': '11'}),
+        (r'^TST(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_TST_r_T2_A, {'stype': '11'}),
+        (r'^TST(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_TST_r_T1_A, {}),
+        (r'^TST(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s#(?P<imm32>\d+)$', aarch32_TST_i_T1_A, {}),
+        (r'^TST(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<shift_t>RRX)$', aarch32_TST_r_T2_A, {'stype': '11'}),
+        (r'^TST(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>[LAR][SO][LR])\s#(?P<shift_n>\d+))?$', aarch32_TST_r_T2_A, {'stype': '11'}),
     ],
     'UADD16': [
-        (re.compile(r'^UADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UADD16_T1_A, {}),
+        (r'^UADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UADD16_T1_A, {}),
     ],
     'UADD8': [
-        (re.compile(r'^UADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UADD8_T1_A, {}),
+        (r'^UADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UADD8_T1_A, {}),
     ],
     'UASX': [
-        (re.compile(r'^UASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UASX_T1_A, {}),
+        (r'^UASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UASX_T1_A, {}),
     ],
     'UBFX': [
-        (re.compile(r'^UBFX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<lsb>\d+),\s#(?P<width>\d+)$', re.I), aarch32_UBFX_T1_A, {}),
+        (r'^UBFX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s#(?P<lsb>\d+),\s#(?P<width>\d+)$', aarch32_UBFX_T1_A, {}),
     ],
     'UDF': [
-        (re.compile(r'^UDF(?P<c>[ACEGHLMNPV][CEILQST])?.W\s#?(?P<imm32>[xa-f\d]+)$', re.I), aarch32_UDF_T2_A, {}),
-        (re.compile(r'^UDF(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s#?(?P<imm32>[xa-f\d]+)$', re.I), aarch32_UDF_T1_A, {}),
-        (re.compile(r'^UDF(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s#?(?P<imm32>[xa-f\d]+)$', re.I), aarch32_UDF_T2_A, {}),
+        (r'^UDF(?P<c>[ACEGHLMNPV][CEILQST])?.W\s#?(?P<imm32>[xa-f\d]+)$', aarch32_UDF_T2_A, {}),
+        (r'^UDF(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s#?(?P<imm32>[xa-f\d]+)$', aarch32_UDF_T1_A, {}),
+        (r'^UDF(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s#?(?P<imm32>[xa-f\d]+)$', aarch32_UDF_T2_A, {}),
     ],
     'UDIV': [
-        (re.compile(r'^UDIV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UDIV_T1_A, {}),
+        (r'^UDIV(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UDIV_T1_A, {}),
     ],
     'UHADD16': [
-        (re.compile(r'^UHADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UHADD16_T1_A, {}),
+        (r'^UHADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UHADD16_T1_A, {}),
     ],
     'UHADD8': [
-        (re.compile(r'^UHADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UHADD8_T1_A, {}),
+        (r'^UHADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UHADD8_T1_A, {}),
     ],
     'UHASX': [
-        (re.compile(r'^UHASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UHASX_T1_A, {}),
+        (r'^UHASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UHASX_T1_A, {}),
     ],
     'UHSAX': [
-        (re.compile(r'^UHSAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UHSAX_T1_A, {}),
+        (r'^UHSAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UHSAX_T1_A, {}),
     ],
     'UHSUB16': [
-        (re.compile(r'^UHSUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UHSUB16_T1_A, {}),
+        (r'^UHSUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UHSUB16_T1_A, {}),
     ],
     'UHSUB8': [
-        (re.compile(r'^UHSUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UHSUB8_T1_A, {}),
+        (r'^UHSUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UHSUB8_T1_A, {}),
     ],
     'UMAAL': [
-        (re.compile(r'^UMAAL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UMAAL_T1_A, {}),
+        (r'^UMAAL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UMAAL_T1_A, {}),
     ],
     'UMLAL': [
-        (re.compile(r'^UMLAL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UMLAL_T1_A, {}),
+        (r'^UMLAL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UMLAL_T1_A, {}),
     ],
     'UMULL': [
-        (re.compile(r'^UMULL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UMULL_T1_A, {}),
+        (r'^UMULL(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<RdLo>\w+),\s(?P<RdHi>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UMULL_T1_A, {}),
     ],
     'UQADD16': [
-        (re.compile(r'^UQADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UQADD16_T1_A, {}),
+        (r'^UQADD16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UQADD16_T1_A, {}),
     ],
     'UQADD8': [
-        (re.compile(r'^UQADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UQADD8_T1_A, {}),
+        (r'^UQADD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UQADD8_T1_A, {}),
     ],
     'UQASX': [
-        (re.compile(r'^UQASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UQASX_T1_A, {}),
+        (r'^UQASX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UQASX_T1_A, {}),
     ],
     'UQSAX': [
-        (re.compile(r'^UQSAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UQSAX_T1_A, {}),
+        (r'^UQSAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UQSAX_T1_A, {}),
     ],
     'UQSUB16': [
-        (re.compile(r'^UQSUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UQSUB16_T1_A, {}),
+        (r'^UQSUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UQSUB16_T1_A, {}),
     ],
     'UQSUB8': [
-        (re.compile(r'^UQSUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_UQSUB8_T1_A, {}),
+        (r'^UQSUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_UQSUB8_T1_A, {}),
     ],
     'USAD8': [
-        (re.compile(r'^USAD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_USAD8_T1_A, {}),
+        (r'^USAD8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_USAD8_T1_A, {}),
     ],
     'USADA8': [
-        (re.compile(r'^USADA8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', re.I), aarch32_USADA8_T1_A, {}),
+        (r'^USADA8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s(?P<Rn>\w+),\s(?P<Rm>\w+),\s(?P<Ra>\w+)$', aarch32_USADA8_T1_A, {}),
     ],
     'USAT': [
-        (re.compile(r'^USAT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+),\s(?P<shift_t>ASR)\s#(?P<shift_n>\d+)$', re.I), aarch32_USAT_T1_A, {'sh': '1'}),
-        (re.compile(r'^USAT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?$', re.I), aarch32_USAT_T1_A, {'sh': '0'}),
+        (r'^USAT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+),\s(?P<shift_t>ASR)\s#(?P<shift_n>\d+)$', aarch32_USAT_T1_A, {'sh': '1'}),
+        (r'^USAT(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+)(?:,\s(?P<shift_t>LSL)\s#(?P<shift_n>\d+))?$', aarch32_USAT_T1_A, {'sh': '0'}),
     ],
     'USAT16': [
-        (re.compile(r'^USAT16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+)$', re.I), aarch32_USAT16_T1_A, {}),
+        (r'^USAT16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?P<Rd>\w+),\s#(?P<imm32>\d+),\s(?P<Rn>\w+)$', aarch32_USAT16_T1_A, {}),
     ],
     'USAX': [
-        (re.compile(r'^USAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_USAX_T1_A, {}),
+        (r'^USAX(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_USAX_T1_A, {}),
     ],
     'USUB16': [
-        (re.compile(r'^USUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_USUB16_T1_A, {}),
+        (r'^USUB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_USUB16_T1_A, {}),
     ],
     'USUB8': [
-        (re.compile(r'^USUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', re.I), aarch32_USUB8_T1_A, {}),
+        (r'^USUB8(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)$', aarch32_USUB8_T1_A, {}),
     ],
     'UXTAB': [
-        (re.compile(r'^UXTAB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_UXTAB_T1_A, {}),
+        (r'^UXTAB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_UXTAB_T1_A, {}),
     ],
     'UXTAB16': [
-        (re.compile(r'^UXTAB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_UXTAB16_T1_A, {}),
+        (r'^UXTAB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_UXTAB16_T1_A, {}),
     ],
     'UXTAH': [
-        (re.compile(r'^UXTAH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_UXTAH_T1_A, {}),
+        (r'^UXTAH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rn>\w+),\s(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_UXTAH_T1_A, {}),
     ],
     'UXTB': [
-        (re.compile(r'^UXTB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', re.I), aarch32_UXTB_T2_A, {}),
-        (re.compile(r'^UXTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', re.I), aarch32_UXTB_T1_A, {}),
-        (re.compile(r'^UXTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_UXTB_T2_A, {}),
+        (r'^UXTB(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', aarch32_UXTB_T2_A, {}),
+        (r'^UXTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', aarch32_UXTB_T1_A, {}),
+        (r'^UXTB(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_UXTB_T2_A, {}),
     ],
     'UXTB16': [
-        (re.compile(r'^UXTB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_UXTB16_T1_A, {}),
+        (r'^UXTB16(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_UXTB16_T1_A, {}),
     ],
     'UXTH': [
-        (re.compile(r'^UXTH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', re.I), aarch32_UXTH_T2_A, {}),
-        (re.compile(r'^UXTH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', re.I), aarch32_UXTH_T1_A, {}),
-        (re.compile(r'^UXTH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', re.I), aarch32_UXTH_T2_A, {}),
+        (r'^UXTH(?P<c>[ACEGHLMNPV][CEILQST])?.W\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', aarch32_UXTH_T2_A, {}),
+        (r'^UXTH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)$', aarch32_UXTH_T1_A, {}),
+        (r'^UXTH(?P<c>[ACEGHLMNPV][CEILQST])?(?:\.[NW])?\s(?:(?P<Rd>\w+),\s)?(?P<Rm>\w+)(?:,\s(?P<shift_t>ROR)\s#(?P<rotation>\d+))?$', aarch32_UXTH_T2_A, {}),
     ],
 }
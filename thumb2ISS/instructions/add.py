@@ -34,7 +34,8 @@ def aarch32_ADD_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_i_T1_A_exec skipped')
     return aarch32_ADD_i_T1_A_exec
 
 # pattern ADD<c>{<q>} <Rdn>, #<imm8> with bitdiffs=[('S', '0')]
@@ -66,7 +67,8 @@ def aarch32_ADD_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_i_T2_A_exec skipped')
     return aarch32_ADD_i_T2_A_exec
 
 # pattern ADD<c>.W {<Rd>,} <Rn>, #<const> with bitdiffs=[('S', '0')]
@@ -101,7 +103,8 @@ def aarch32_ADD_i_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_i_T3_A_exec skipped')
     return aarch32_ADD_i_T3_A_exec
 
 # pattern ADD{<c>}{<q>} {<Rd>,} <Rn>, #<imm12> with bitdiffs=[]
@@ -131,7 +134,8 @@ def aarch32_ADD_i_T4_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_i_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_i_T4_A_exec skipped')
     return aarch32_ADD_i_T4_A_exec
 
 
@@ -169,7 +173,8 @@ def aarch32_ADD_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_r_T1_A_exec skipped')
     return aarch32_ADD_r_T1_A_exec
 
 # pattern ADD<c>{<q>} <Rdn>, <Rm> with bitdiffs=[('DN', '1')]
@@ -204,7 +209,8 @@ def aarch32_ADD_r_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_r_T2_A_exec skipped')
     return aarch32_ADD_r_T2_A_exec
 
 # pattern ADD{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -259,7 +265,8 @@ def aarch32_ADD_r_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_r_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_r_T3_A_exec skipped')
     return aarch32_ADD_r_T3_A_exec
 
 
@@ -290,7 +297,8 @@ def aarch32_ADD_SP_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_i_T1_A_exec skipped')
     return aarch32_ADD_SP_i_T1_A_exec
 
 # pattern ADD{<c>}{<q>} {SP,} SP, #<imm7> with bitdiffs=[]
@@ -318,7 +326,8 @@ def aarch32_ADD_SP_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_i_T2_A_exec skipped')
     return aarch32_ADD_SP_i_T2_A_exec
 
 # pattern ADD{<c>}.W {<Rd>,} SP, #<const> with bitdiffs=[('S', '0')]
@@ -354,7 +363,8 @@ def aarch32_ADD_SP_i_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_i_T3_A_exec skipped')
     return aarch32_ADD_SP_i_T3_A_exec
 
 # pattern ADD{<c>}{<q>} {<Rd>,} SP, #<imm12> with bitdiffs=[]
@@ -387,7 +397,8 @@ def aarch32_ADD_SP_i_T4_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_i_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_i_T4_A_exec skipped')
     return aarch32_ADD_SP_i_T4_A_exec
 
 
@@ -419,7 +430,8 @@ def aarch32_ADD_SP_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_r_T1_A_exec skipped')
     return aarch32_ADD_SP_r_T1_A_exec
 
 # pattern ADD{<c>}{<q>} {SP,} SP, <Rm> with bitdiffs=[]
@@ -448,7 +460,8 @@ def aarch32_ADD_SP_r_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_r_T2_A_exec skipped')
     return aarch32_ADD_SP_r_T2_A_exec
 
 # pattern ADD{<c>}{<q>} {<Rd>,} SP, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -495,7 +508,8 @@ def aarch32_ADD_SP_r_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_ADD_SP_r_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADD_SP_r_T3_A_exec skipped')
     return aarch32_ADD_SP_r_T3_A_exec
 
 
@@ -36,7 +36,8 @@ def aarch32_ADR_T1_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_ADR_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADR_T1_A_exec skipped')
     return aarch32_ADR_T1_A_exec
 
 # pattern ADR{<c>}{<q>} <Rd>, <label> with bitdiffs=[]
@@ -67,7 +68,8 @@ def aarch32_ADR_T2_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_ADR_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADR_T2_A_exec skipped')
     return aarch32_ADR_T2_A_exec
 
 # pattern ADR{<c>}.W <Rd>, <label> with bitdiffs=[]
@@ -102,7 +104,8 @@ def aarch32_ADR_T3_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_ADR_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ADR_T3_A_exec skipped')
     return aarch32_ADR_T3_A_exec
 
 
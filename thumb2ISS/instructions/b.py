@@ -25,7 +25,8 @@ def aarch32_B_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.BranchWritePC(abs_address, 'DIR');
         else:
-            log.debug(f'aarch32_B_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_B_T1_A_exec skipped')
     return aarch32_B_T1_A_exec
 
 # pattern B{<c>}{<q>} <label> with bitdiffs=[]
@@ -43,7 +44,8 @@ def aarch32_B_T2_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.BranchWritePC(abs_address, 'DIR');
         else:
-            log.debug(f'aarch32_B_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_B_T2_A_exec skipped')
     return aarch32_B_T2_A_exec
 
 # pattern B<c>.W <label> with bitdiffs=[]
@@ -63,7 +65,8 @@ def aarch32_B_T3_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.BranchWritePC(abs_address, 'DIR');
         else:
-            log.debug(f'aarch32_B_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_B_T3_A_exec skipped')
     return aarch32_B_T3_A_exec
 
 # pattern B{<c>}.W <label> with bitdiffs=[]
@@ -83,7 +86,8 @@ def aarch32_B_T4_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.BranchWritePC(abs_address, 'DIR');
         else:
-            log.debug(f'aarch32_B_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_B_T4_A_exec skipped')
     return aarch32_B_T4_A_exec
 
 
@@ -32,7 +32,8 @@ def aarch32_BFC_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.readR(d) & ~((0xffffffff >> (31 - msbit + lsbit)) << lsbit));
             # Other bits of core.readR(d) are unchanged
         else:
-            log.debug(f'aarch32_BFC_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BFC_T1_A_exec skipped')
     return aarch32_BFC_T1_A_exec
 
 
@@ -35,7 +35,8 @@ def aarch32_BFI_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, tmp_Rd | ((core.UInt(core.readR(n)) & mask) << lsbit));
             # Other bits of core.readR(d) are unchanged
         else:
-            log.debug(f'aarch32_BFI_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BFI_T1_A_exec skipped')
     return aarch32_BFI_T1_A_exec
 
 
@@ -27,7 +27,8 @@ def aarch32_BL_i_T1_A(core, regex_match, bitdiffs):
                 targetAddress = abs_address;
             core.BranchWritePC(targetAddress, 'DIRCALL');
         else:
-            log.debug(f'aarch32_BL_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BL_i_T1_A_exec skipped')
     return aarch32_BL_i_T1_A_exec
 
 # pattern BLX{<c>}{<q>} <label> with bitdiffs=[]
@@ -50,7 +51,8 @@ def aarch32_BL_i_T2_A(core, regex_match, bitdiffs):
                 targetAddress = abs_address;
             core.BranchWritePC(targetAddress, 'DIRCALL');
         else:
-            log.debug(f'aarch32_BL_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BL_i_T2_A_exec skipped')
     return aarch32_BL_i_T2_A_exec
 
 
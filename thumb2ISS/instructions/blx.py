@@ -28,7 +28,8 @@ def aarch32_BLX_r_T1_A(core, regex_match, bitdiffs):
             target = core.readR(m);
             core.BXWritePC(target, 'INDCALL');
         else:
-            log.debug(f'aarch32_BLX_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BLX_r_T1_A_exec skipped')
     return aarch32_BLX_r_T1_A_exec
 
 
@@ -25,7 +25,8 @@ def aarch32_BX_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.BXWritePC(core.readR(m), 'INDIR');
         else:
-            log.debug(f'aarch32_BX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_BX_T1_A_exec skipped')
     return aarch32_BX_T1_A_exec
 
 
@@ -24,7 +24,8 @@ def aarch32_CLREX_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.ClearExclusiveLocal(core.ProcessorID());
         else:
-            log.debug(f'aarch32_CLREX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CLREX_T1_A_exec skipped')
     return aarch32_CLREX_T1_A_exec
 
 
@@ -30,7 +30,8 @@ def aarch32_CLZ_T1_A(core, regex_match, bitdiffs):
             result = core.CountLeadingZeroBits(core.readR(m));
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_CLZ_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CLZ_T1_A_exec skipped')
     return aarch32_CLZ_T1_A_exec
 
 
@@ -29,7 +29,8 @@ def aarch32_CMN_i_T1_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), imm32, '0');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMN_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMN_i_T1_A_exec skipped')
     return aarch32_CMN_i_T1_A_exec
 
 
@@ -53,7 +54,8 @@ def aarch32_CMN_r_T1_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), shifted, '0');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMN_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMN_r_T1_A_exec skipped')
     return aarch32_CMN_r_T1_A_exec
 
 # pattern CMN{<c>}{<q>} <Rn>, <Rm>, RRX with bitdiffs=[('stype', '11')]
@@ -87,7 +89,8 @@ def aarch32_CMN_r_T2_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), shifted, '0');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMN_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMN_r_T2_A_exec skipped')
     return aarch32_CMN_r_T2_A_exec
 
 
@@ -27,7 +27,8 @@ def aarch32_CMP_i_T1_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), core.NOT(imm32), '1');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMP_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMP_i_T1_A_exec skipped')
     return aarch32_CMP_i_T1_A_exec
 
 # pattern CMP{<c>}.W <Rn>, #<const> with bitdiffs=[]
@@ -51,7 +52,8 @@ def aarch32_CMP_i_T2_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), core.NOT(imm32), '1');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMP_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMP_i_T2_A_exec skipped')
     return aarch32_CMP_i_T2_A_exec
 
 
@@ -75,7 +77,8 @@ def aarch32_CMP_r_T1_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), core.NOT(shifted), '1');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMP_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMP_r_T1_A_exec skipped')
     return aarch32_CMP_r_T1_A_exec
 
 # pattern CMP{<c>}{<q>} <Rn>, <Rm> with bitdiffs=[]
@@ -101,7 +104,8 @@ def aarch32_CMP_r_T2_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), core.NOT(shifted), '1');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMP_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMP_r_T2_A_exec skipped')
     return aarch32_CMP_r_T2_A_exec
 
 # pattern CMP{<c>}{<q>} <Rn>, <Rm>, RRX with bitdiffs=[('stype', '11')]
@@ -131,7 +135,8 @@ def aarch32_CMP_r_T3_A(core, regex_match, bitdiffs):
             (result, nzcv) = core.AddWithCarry(core.readR(n), core.NOT(shifted), '1');
             core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_CMP_r_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_CMP_r_T3_A_exec skipped')
     return aarch32_CMP_r_T3_A_exec
 
 
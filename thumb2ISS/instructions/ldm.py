@@ -43,7 +43,8 @@ def aarch32_LDM_T1_A(core, regex_match, bitdiffs):
             if wback and registers[n] == '1':
                  core.writeR(n, UNKNOWN = 0);
         else:
-            log.debug(f'aarch32_LDM_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDM_T1_A_exec skipped')
     return aarch32_LDM_T1_A_exec
 
 # pattern LDM{IA}{<c>}.W <Rn>{!}, <registers> with bitdiffs=[]
@@ -92,7 +93,8 @@ def aarch32_LDM_T2_A(core, regex_match, bitdiffs):
             if wback and registers[n] == '1':
                  core.writeR(n, UNKNOWN = 0);
         else:
-            log.debug(f'aarch32_LDM_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDM_T2_A_exec skipped')
     return aarch32_LDM_T2_A_exec
 
 
@@ -50,7 +50,8 @@ def aarch32_LDMDB_T1_A(core, regex_match, bitdiffs):
             if wback and registers[n] == '1':
                  core.writeR(n, UNKNOWN = 0);
         else:
-            log.debug(f'aarch32_LDMDB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDMDB_T1_A_exec skipped')
     return aarch32_LDMDB_T1_A_exec
 
 
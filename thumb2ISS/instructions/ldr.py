@@ -19,7 +19,7 @@ def aarch32_LDR_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDR_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -42,7 +42,8 @@ def aarch32_LDR_i_T1_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_i_T1_A_exec skipped')
     return aarch32_LDR_i_T1_A_exec
 
 # pattern LDR{<c>}{<q>} <Rt>, [SP{, #{+}<imm>}] with bitdiffs=[]
@@ -53,7 +54,7 @@ def aarch32_LDR_i_T2_A(core, regex_match, bitdiffs):
     Rt = regex_groups.get('Rt', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDR_i_T2_A Rt={Rt} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = 13;  
@@ -76,7 +77,8 @@ def aarch32_LDR_i_T2_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_i_T2_A_exec skipped')
     return aarch32_LDR_i_T2_A_exec
 
 # pattern LDR{<c>}.W <Rt>, [<Rn> {, #{+}<imm>}] with bitdiffs=[]
@@ -90,7 +92,7 @@ def aarch32_LDR_i_T3_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDR_i_T3_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  index = True;  add = True;
@@ -113,7 +115,8 @@ def aarch32_LDR_i_T3_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_i_T3_A_exec skipped')
     return aarch32_LDR_i_T3_A_exec
 
 # pattern LDR{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -132,7 +135,7 @@ def aarch32_LDR_i_T4_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDR_i_T4_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if P == '0' and W == '0':
@@ -157,7 +160,8 @@ def aarch32_LDR_i_T4_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_i_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_i_T4_A_exec skipped')
     return aarch32_LDR_i_T4_A_exec
 
 
@@ -188,7 +192,8 @@ def aarch32_LDR_l_T1_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_l_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_l_T1_A_exec skipped')
     return aarch32_LDR_l_T1_A_exec
 
 # pattern LDR{<c>}.W <Rt>, <label> with bitdiffs=[]
@@ -227,7 +232,8 @@ def aarch32_LDR_l_T2_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_l_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_l_T2_A_exec skipped')
     return aarch32_LDR_l_T2_A_exec
 
 
@@ -261,7 +267,8 @@ def aarch32_LDR_r_T1_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_r_T1_A_exec skipped')
     return aarch32_LDR_r_T1_A_exec
 
 # pattern LDR{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -302,7 +309,8 @@ def aarch32_LDR_r_T2_A(core, regex_match, bitdiffs):
                 else:
                     core.writeR(t, data);
         else:
-            log.debug(f'aarch32_LDR_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDR_r_T2_A_exec skipped')
     return aarch32_LDR_r_T2_A_exec
 
 
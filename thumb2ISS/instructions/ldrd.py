@@ -27,7 +27,7 @@ def aarch32_LDRD_i_T1_A(core, regex_match, bitdiffs):
     W = bitdiffs.get('W', '0')
     U = bitdiffs.get('U', '1')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRD_i_T1_A Rt={Rt} Rt2={Rt2} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  t2 = core.reg_num[Rt2];  n = core.reg_num[Rn];  
@@ -56,7 +56,8 @@ def aarch32_LDRD_i_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRD_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRD_i_T1_A_exec skipped')
     return aarch32_LDRD_i_T1_A_exec
 
 
@@ -102,7 +103,8 @@ def aarch32_LDRD_l_T1_A(core, regex_match, bitdiffs):
                 core.writeR(t, core.ReadMemA(address,4));
                 core.writeR(t2, core.ReadMemA(address+4,4));
         else:
-            log.debug(f'aarch32_LDRD_l_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRD_l_T1_A_exec skipped')
     return aarch32_LDRD_l_T1_A_exec
 
 
@@ -30,7 +30,8 @@ def aarch32_LDREXB_T1_A(core, regex_match, bitdiffs):
             core.SetExclusiveMonitors(address,1);
             core.writeR(t, core.ZeroExtend(core.ReadMemA(address,1), 32));
         else:
-            log.debug(f'aarch32_LDREXB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDREXB_T1_A_exec skipped')
     return aarch32_LDREXB_T1_A_exec
 
 
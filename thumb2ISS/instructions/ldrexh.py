@@ -30,7 +30,8 @@ def aarch32_LDREXH_T1_A(core, regex_match, bitdiffs):
             core.SetExclusiveMonitors(address,2);
             core.writeR(t, core.ZeroExtend(core.ReadMemA(address,2), 32));
         else:
-            log.debug(f'aarch32_LDREXH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDREXH_T1_A_exec skipped')
     return aarch32_LDREXH_T1_A_exec
 
 
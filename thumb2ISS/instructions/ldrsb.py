@@ -19,7 +19,7 @@ def aarch32_LDRSB_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSB_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -35,7 +35,8 @@ def aarch32_LDRSB_i_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRSB_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSB_i_T1_A_exec skipped')
     return aarch32_LDRSB_i_T1_A_exec
 
 # pattern LDRSB{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -54,7 +55,7 @@ def aarch32_LDRSB_i_T2_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSB_i_T2_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if P == '0' and W == '0':
@@ -74,7 +75,8 @@ def aarch32_LDRSB_i_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRSB_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSB_i_T2_A_exec skipped')
     return aarch32_LDRSB_i_T2_A_exec
 
 
@@ -107,7 +109,8 @@ def aarch32_LDRSB_l_T1_A(core, regex_match, bitdiffs):
                 address = abs_address;
             core.writeR(t, core.SignExtend(core.ReadMemU(address,1), 32));
         else:
-            log.debug(f'aarch32_LDRSB_l_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSB_l_T1_A_exec skipped')
     return aarch32_LDRSB_l_T1_A_exec
 
 
@@ -136,7 +139,8 @@ def aarch32_LDRSB_r_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRSB_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSB_r_T1_A_exec skipped')
     return aarch32_LDRSB_r_T1_A_exec
 
 # pattern LDRSB{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -172,7 +176,8 @@ def aarch32_LDRSB_r_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRSB_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSB_r_T2_A_exec skipped')
     return aarch32_LDRSB_r_T2_A_exec
 
 
@@ -19,7 +19,7 @@ def aarch32_LDRSBT_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSBT_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  postindex = False;  add = True;
@@ -39,7 +39,8 @@ def aarch32_LDRSBT_T1_A(core, regex_match, bitdiffs):
             if postindex:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_LDRSBT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSBT_T1_A_exec skipped')
     return aarch32_LDRSBT_T1_A_exec
 
 
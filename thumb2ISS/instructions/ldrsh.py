@@ -19,7 +19,7 @@ def aarch32_LDRSH_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSH_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -36,7 +36,8 @@ def aarch32_LDRSH_i_T1_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSH_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSH_i_T1_A_exec skipped')
     return aarch32_LDRSH_i_T1_A_exec
 
 # pattern LDRSH{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -55,7 +56,7 @@ def aarch32_LDRSH_i_T2_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_LDRSH_i_T2_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if P == '0' and W == '0':
@@ -76,7 +77,8 @@ def aarch32_LDRSH_i_T2_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSH_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSH_i_T2_A_exec skipped')
     return aarch32_LDRSH_i_T2_A_exec
 
 
@@ -110,7 +112,8 @@ def aarch32_LDRSH_l_T1_A(core, regex_match, bitdiffs):
             data = core.ReadMemU(address,2);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSH_l_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSH_l_T1_A_exec skipped')
     return aarch32_LDRSH_l_T1_A_exec
 
 
@@ -140,7 +143,8 @@ def aarch32_LDRSH_r_T1_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSH_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSH_r_T1_A_exec skipped')
     return aarch32_LDRSH_r_T1_A_exec
 
 # pattern LDRSH{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -177,7 +181,8 @@ def aarch32_LDRSH_r_T2_A(core, regex_match, bitdiffs):
                  core.writeR(n, offset_addr);
             core.writeR(t, core.SignExtend(data, 32));
         else:
-            log.debug(f'aarch32_LDRSH_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_LDRSH_r_T2_A_exec skipped')
     return aarch32_LDRSH_r_T2_A_exec
 
 
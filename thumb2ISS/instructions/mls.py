@@ -35,7 +35,8 @@ def aarch32_MLS_T1_A(core, regex_match, bitdiffs):
             result = addend - operand1 * operand2;
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_MLS_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MLS_T1_A_exec skipped')
     return aarch32_MLS_T1_A_exec
 
 
@@ -22,7 +22,7 @@ def aarch32_MOV_i_T1_A(core, regex_match, bitdiffs):
     S = bitdiffs.get('S', '0')
     log.debug(f'aarch32_MOV_i_T1_A Rd={Rd} imm32={imm32} cond={cond}')
     # decode
-    d = core.reg_num[Rd];  setflags = (S == '1');  carry = core.APSR.C;
+    d = core.reg_num[Rd];  setflags = (S == '1');
 
     def aarch32_MOV_i_T1_A_exec():
         # execute
@@ -39,10 +39,11 @@ def aarch32_MOV_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.N = core.Bit(result,31);
                     core.APSR.Z = core.IsZeroBit(result);
-                    core.APSR.C = carry;
+                    core.APSR.C = core.T32ExpandImmCarry(imm32);
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_i_T1_A_exec skipped')
     return aarch32_MOV_i_T1_A_exec
 
 # pattern MOV<c>.W <Rd>, #<const> with bitdiffs=[('S', '0')]
@@ -61,7 +62,7 @@ def aarch32_MOV_i_T2_A(core, regex_match, bitdiffs):
     S = bitdiffs.get('S', '0')
     log.debug(f'aarch32_MOV_i_T2_A Rd={Rd} imm32={imm32} cond={cond}')
     # decode
-    d = core.reg_num[Rd];  setflags = (S == '1');  carry = core.APSR.C;
+    d = core.reg_num[Rd];  setflags = (S == '1');
     if d == 15:
         raise Exception('UNPREDICTABLE'); # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -80,10 +81,11 @@ def aarch32_MOV_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.N = core.Bit(result,31);
                     core.APSR.Z = core.IsZeroBit(result);
-                    core.APSR.C = carry;
+                    core.APSR.C = core.T32ExpandImmCarry(imm32);
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_i_T2_A_exec skipped')
     return aarch32_MOV_i_T2_A_exec
 
 # pattern MOV{<c>}{<q>} <Rd>, #<imm16> with bitdiffs=[]
@@ -119,7 +121,8 @@ def aarch32_MOV_i_T3_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_i_T3_A_exec skipped')
     return aarch32_MOV_i_T3_A_exec
 
 
@@ -154,7 +157,8 @@ def aarch32_MOV_r_T1_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_r_T1_A_exec skipped')
     return aarch32_MOV_r_T1_A_exec
 
 # pattern MOV<c>{<q>} <Rd>, <Rm> {, <shift> #<amount>} with bitdiffs=[('S', '0')]
@@ -207,7 +211,8 @@ def aarch32_MOV_r_T2_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_r_T2_A_exec skipped')
     return aarch32_MOV_r_T2_A_exec
 
 # pattern MOV{<c>}{<q>} <Rd>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -293,7 +298,8 @@ def aarch32_MOV_r_T3_A(core, regex_match, bitdiffs):
                     core.APSR.C = carry;
                     # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_r_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_r_T3_A_exec skipped')
     return aarch32_MOV_r_T3_A_exec
 
 
@@ -363,7 +369,8 @@ def aarch32_MOV_rr_T1_A(core, regex_match, bitdiffs):
                 core.APSR.C = carry;
                 # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_rr_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_rr_T1_A_exec skipped')
     return aarch32_MOV_rr_T1_A_exec
 
 # pattern MOVS.W <Rd>, <Rm>, <shift> <Rs> with bitdiffs=[('S', '1')]
@@ -433,7 +440,8 @@ def aarch32_MOV_rr_T2_A(core, regex_match, bitdiffs):
                 core.APSR.C = carry;
                 # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MOV_rr_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOV_rr_T2_A_exec skipped')
     return aarch32_MOV_rr_T2_A_exec
 
 
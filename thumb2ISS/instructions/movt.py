@@ -29,7 +29,8 @@ def aarch32_MOVT_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),31,16,imm32));
             # core.Field(core.readR(d),15,0) unchanged
         else:
-            log.debug(f'aarch32_MOVT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MOVT_T1_A_exec skipped')
     return aarch32_MOVT_T1_A_exec
 
 
@@ -29,7 +29,8 @@ def aarch32_MRS_T1_AS(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.writeR(d, core.ReadSpecReg(spec_reg));
         else:
-            log.debug(f'aarch32_MRS_T1_AS_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MRS_T1_AS_exec skipped')
     return aarch32_MRS_T1_AS_exec
 
 
@@ -31,7 +31,8 @@ def aarch32_MSR_r_T1_AS(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.WriteSpecReg(spec_reg, core.readR(n));
         else:
-            log.debug(f'aarch32_MSR_r_T1_AS_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MSR_r_T1_AS_exec skipped')
     return aarch32_MSR_r_T1_AS_exec
 
 
@@ -36,7 +36,8 @@ def aarch32_MUL_T1_A(core, regex_match, bitdiffs):
                 core.APSR.Z = core.IsZeroBit(core.Field(result,31,0));
                 # core.APSR.C, core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MUL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MUL_T1_A_exec skipped')
     return aarch32_MUL_T1_A_exec
 
 # pattern MUL<c>.W <Rd>, <Rn>{, <Rm>} with bitdiffs=[]
@@ -69,7 +70,8 @@ def aarch32_MUL_T2_A(core, regex_match, bitdiffs):
                 core.APSR.Z = core.IsZeroBit(core.Field(result,31,0));
                 # core.APSR.C, core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_MUL_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_MUL_T2_A_exec skipped')
     return aarch32_MUL_T2_A_exec
 
 
@@ -24,7 +24,8 @@ def aarch32_NOP_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             pass # Do nothing
         else:
-            log.debug(f'aarch32_NOP_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_NOP_T1_A_exec skipped')
     return aarch32_NOP_T1_A_exec
 
 # pattern NOP{<c>}.W with bitdiffs=[]
@@ -41,7 +42,8 @@ def aarch32_NOP_T2_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             pass # Do nothing
         else:
-            log.debug(f'aarch32_NOP_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_NOP_T2_A_exec skipped')
     return aarch32_NOP_T2_A_exec
 
 
@@ -26,7 +26,6 @@ def aarch32_ORN_i_T1_A(core, regex_match, bitdiffs):
     log.debug(f'aarch32_ORN_i_T1_A Rd={Rd} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     d = core.reg_num[Rd];  n = core.reg_num[Rn];  setflags = (S == '1');
-    carry = core.APSR.C;
     if d == 15:
         raise Exception('UNPREDICTABLE'); # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -38,10 +37,11 @@ def aarch32_ORN_i_T1_A(core, regex_match, bitdiffs):
             if setflags:
                 core.APSR.N = core.Bit(result,31);
                 core.APSR.Z = core.IsZeroBit(result);
-                core.APSR.C = carry;
+                core.APSR.C = core.T32ExpandImmCarry(imm32);
                 # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_ORN_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ORN_i_T1_A_exec skipped')
     return aarch32_ORN_i_T1_A_exec
 
 
@@ -88,7 +88,8 @@ def aarch32_ORN_r_T1_A(core, regex_match, bitdiffs):
                 core.APSR.C = carry;
                 # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_ORN_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_ORN_r_T1_A_exec skipped')
     return aarch32_ORN_r_T1_A_exec
 
 
@@ -46,7 +46,8 @@ def aarch32_PKH_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(operand2,15,0) if tbform else core.Field(core.readR(n),15,0)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(core.readR(n),31,16)    if tbform else core.Field(operand2,31,16)));
         else:
-            log.debug(f'aarch32_PKH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_PKH_T1_A_exec skipped')
     return aarch32_PKH_T1_A_exec
 
 
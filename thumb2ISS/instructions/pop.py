@@ -46,7 +46,8 @@ def aarch32_POP_T1_A(core, regex_match, bitdiffs):
             if registers[13] == '1':
                  core.writeR(13, UNKNOWN = 0);
         else:
-            log.debug(f'aarch32_POP_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_POP_T1_A_exec skipped')
     return aarch32_POP_T1_A_exec
 
 
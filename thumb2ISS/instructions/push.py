@@ -47,7 +47,8 @@ def aarch32_PUSH_T1_A(core, regex_match, bitdiffs):
                     core.WriteMemA(address,4, core.PCStoreValue());
             core.writeR(13, core.readR(13) - 4*registers.count('1'));
         else:
-            log.debug(f'aarch32_PUSH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_PUSH_T1_A_exec skipped')
     return aarch32_PUSH_T1_A_exec
 
 
@@ -34,7 +34,8 @@ def aarch32_QADD_T1_A(core, regex_match, bitdiffs):
             if sat:
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_QADD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QADD_T1_A_exec skipped')
     return aarch32_QADD_T1_A_exec
 
 
@@ -38,7 +38,8 @@ def aarch32_QADD8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.SignedSat(sum3, 8)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.SignedSat(sum4, 8)));
         else:
-            log.debug(f'aarch32_QADD8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QADD8_T1_A_exec skipped')
     return aarch32_QADD8_T1_A_exec
 
 
@@ -34,7 +34,8 @@ def aarch32_QSAX_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.SignedSat(sum, 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.SignedSat(diff, 16)));
         else:
-            log.debug(f'aarch32_QSAX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QSAX_T1_A_exec skipped')
     return aarch32_QSAX_T1_A_exec
 
 
@@ -38,7 +38,8 @@ def aarch32_QSUB8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.SignedSat(diff3, 8)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.SignedSat(diff4, 8)));
         else:
-            log.debug(f'aarch32_QSUB8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_QSUB8_T1_A_exec skipped')
     return aarch32_QSUB8_T1_A_exec
 
 
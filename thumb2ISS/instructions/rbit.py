@@ -29,7 +29,8 @@ def aarch32_RBIT_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.writeR(d, core.Field(int(f'{core.UInt(core.readR(m)):032b}'[::-1],2)))
         else:
-            log.debug(f'aarch32_RBIT_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_RBIT_T1_A_exec skipped')
     return aarch32_RBIT_T1_A_exec
 
 
@@ -31,7 +31,8 @@ def aarch32_REV_T1_A(core, regex_match, bitdiffs):
             result = core.SetField(result,7,0,core.Field(core.readR(m),31,24));
             core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_REV_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_REV_T1_A_exec skipped')
     return aarch32_REV_T1_A_exec
 
 # pattern REV{<c>}.W <Rd>, <Rm> with bitdiffs=[]
@@ -59,7 +60,8 @@ def aarch32_REV_T2_A(core, regex_match, bitdiffs):
             result = core.SetField(result,7,0,core.Field(core.readR(m),31,24));
             core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_REV_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_REV_T2_A_exec skipped')
     return aarch32_REV_T2_A_exec
 
 
@@ -29,7 +29,8 @@ def aarch32_REVSH_T1_A(core, regex_match, bitdiffs):
             result = core.SetField(result,7,0,core.Field(core.readR(m),15,8));
             core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_REVSH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_REVSH_T1_A_exec skipped')
     return aarch32_REVSH_T1_A_exec
 
 # pattern REVSH{<c>}.W <Rd>, <Rm> with bitdiffs=[]
@@ -55,7 +56,8 @@ def aarch32_REVSH_T2_A(core, regex_match, bitdiffs):
             result = core.SetField(result,7,0,core.Field(core.readR(m),15,8));
             core.writeR(d, core.Field(result));
         else:
-            log.debug(f'aarch32_REVSH_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_REVSH_T2_A_exec skipped')
     return aarch32_REVSH_T2_A_exec
 
 
@@ -45,7 +45,8 @@ def aarch32_RSB_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_RSB_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_RSB_i_T1_A_exec skipped')
     return aarch32_RSB_i_T1_A_exec
 
 # pattern RSB<c>.W {<Rd>,} <Rn>, #0 with bitdiffs=[('S', '0')]
@@ -86,7 +87,8 @@ def aarch32_RSB_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_RSB_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_RSB_i_T2_A_exec skipped')
     return aarch32_RSB_i_T2_A_exec
 
 
@@ -137,7 +139,8 @@ def aarch32_RSB_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_RSB_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_RSB_r_T1_A_exec skipped')
     return aarch32_RSB_r_T1_A_exec
 
 
@@ -44,7 +44,8 @@ def aarch32_SBC_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SBC_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SBC_i_T1_A_exec skipped')
     return aarch32_SBC_i_T1_A_exec
 
 
@@ -82,7 +83,8 @@ def aarch32_SBC_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SBC_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SBC_r_T1_A_exec skipped')
     return aarch32_SBC_r_T1_A_exec
 
 # pattern SBC{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -135,7 +137,8 @@ def aarch32_SBC_r_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SBC_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SBC_r_T2_A_exec skipped')
     return aarch32_SBC_r_T2_A_exec
 
 
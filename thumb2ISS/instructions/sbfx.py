@@ -34,7 +34,8 @@ def aarch32_SBFX_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.writeR(d, core.SignExtendSubField(core.readR(n), msbit, lsbit, 32));
         else:
-            log.debug(f'aarch32_SBFX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SBFX_T1_A_exec skipped')
     return aarch32_SBFX_T1_A_exec
 
 
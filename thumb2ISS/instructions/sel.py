@@ -34,7 +34,8 @@ def aarch32_SEL_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.Field(core.readR(n),23,16) if core.APSR.GE[2] else core.Field(core.readR(m),23,16)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.Field(core.readR(n),31,24) if core.APSR.GE[3] else core.Field(core.readR(m),31,24)));
         else:
-            log.debug(f'aarch32_SEL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SEL_T1_A_exec skipped')
     return aarch32_SEL_T1_A_exec
 
 
@@ -34,7 +34,8 @@ def aarch32_SHSUB16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.Field(diff1,16,1)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.Field(diff2,16,1)));
         else:
-            log.debug(f'aarch32_SHSUB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SHSUB16_T1_A_exec skipped')
     return aarch32_SHSUB16_T1_A_exec
 
 
@@ -45,7 +45,8 @@ def aarch32_SMLABB_T1_A(core, regex_match, bitdiffs):
                   # Signed overflow
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_SMLABB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMLABB_T1_A_exec skipped')
     return aarch32_SMLABB_T1_A_exec
 
 
@@ -41,7 +41,8 @@ def aarch32_SMLALD_T1_A(core, regex_match, bitdiffs):
             core.writeR(dHi, core.Field(result,63,32));
             core.writeR(dLo, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_SMLALD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMLALD_T1_A_exec skipped')
     return aarch32_SMLALD_T1_A_exec
 
 
@@ -36,7 +36,8 @@ def aarch32_SMMLA_T1_A(core, regex_match, bitdiffs):
                  result = result + 0x80000000;
             core.writeR(d, core.Field(result,63,32));
         else:
-            log.debug(f'aarch32_SMMLA_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMMLA_T1_A_exec skipped')
     return aarch32_SMMLA_T1_A_exec
 
 
@@ -39,7 +39,8 @@ def aarch32_SMULL_T1_A(core, regex_match, bitdiffs):
                 core.APSR.Z = core.IsZeroBit(core.Field(result,63,0));
                 # core.APSR.C, core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_SMULL_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMULL_T1_A_exec skipped')
     return aarch32_SMULL_T1_A_exec
 
 
@@ -37,7 +37,8 @@ def aarch32_SMULWB_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.Field(product,47,16));
             # Signed overflow cannot occur
         else:
-            log.debug(f'aarch32_SMULWB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMULWB_T1_A_exec skipped')
     return aarch32_SMULWB_T1_A_exec
 
 
@@ -39,7 +39,8 @@ def aarch32_SMUSD_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.Field(result,31,0));
             # Signed overflow cannot occur
         else:
-            log.debug(f'aarch32_SMUSD_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SMUSD_T1_A_exec skipped')
     return aarch32_SMUSD_T1_A_exec
 
 
@@ -42,7 +42,8 @@ def aarch32_SSUB8_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetBit(core.APSR.GE,2,'1' if diff3 >= 0 else '0')
             core.APSR.GE = core.SetBit(core.APSR.GE,3,'1' if diff4 >= 0 else '0')
         else:
-            log.debug(f'aarch32_SSUB8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SSUB8_T1_A_exec skipped')
     return aarch32_SSUB8_T1_A_exec
 
 
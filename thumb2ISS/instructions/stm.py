@@ -43,7 +43,8 @@ def aarch32_STM_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, core.readR(n) + 4*registers.count('1'));
         else:
-            log.debug(f'aarch32_STM_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STM_T1_A_exec skipped')
     return aarch32_STM_T1_A_exec
 
 # pattern STM{IA}{<c>}.W <Rn>{!}, <registers> with bitdiffs=[]
@@ -95,7 +96,8 @@ def aarch32_STM_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, core.readR(n) + 4*registers.count('1'));
         else:
-            log.debug(f'aarch32_STM_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STM_T2_A_exec skipped')
     return aarch32_STM_T2_A_exec
 
 
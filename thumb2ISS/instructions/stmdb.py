@@ -53,7 +53,8 @@ def aarch32_STMDB_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, core.readR(n) - 4*registers.count('1'));
         else:
-            log.debug(f'aarch32_STMDB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STMDB_T1_A_exec skipped')
     return aarch32_STMDB_T1_A_exec
 
 
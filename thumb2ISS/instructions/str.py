@@ -19,7 +19,7 @@ def aarch32_STR_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STR_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -35,7 +35,8 @@ def aarch32_STR_i_T1_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_i_T1_A_exec skipped')
     return aarch32_STR_i_T1_A_exec
 
 # pattern STR{<c>}{<q>} <Rt>, [SP{, #{+}<imm>}] with bitdiffs=[]
@@ -46,7 +47,7 @@ def aarch32_STR_i_T2_A(core, regex_match, bitdiffs):
     Rt = regex_groups.get('Rt', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STR_i_T2_A Rt={Rt} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = 13;  
@@ -62,7 +63,8 @@ def aarch32_STR_i_T2_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_i_T2_A_exec skipped')
     return aarch32_STR_i_T2_A_exec
 
 # pattern STR{<c>}.W <Rt>, [<Rn> {, #{+}<imm>}] with bitdiffs=[]
@@ -76,7 +78,7 @@ def aarch32_STR_i_T3_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STR_i_T3_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111':
@@ -96,7 +98,8 @@ def aarch32_STR_i_T3_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_i_T3_A_exec skipped')
     return aarch32_STR_i_T3_A_exec
 
 # pattern STR{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -115,7 +118,7 @@ def aarch32_STR_i_T4_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STR_i_T4_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111' or (P == '0' and W == '0'):
@@ -135,7 +138,8 @@ def aarch32_STR_i_T4_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_i_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_i_T4_A_exec skipped')
     return aarch32_STR_i_T4_A_exec
 
 
@@ -170,7 +174,8 @@ def aarch32_STR_r_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_r_T1_A_exec skipped')
     return aarch32_STR_r_T1_A_exec
 
 # pattern STR{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -214,7 +219,8 @@ def aarch32_STR_r_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STR_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STR_r_T2_A_exec skipped')
     return aarch32_STR_r_T2_A_exec
 
 
@@ -27,7 +27,7 @@ def aarch32_STRD_i_T1_A(core, regex_match, bitdiffs):
     W = bitdiffs.get('W', '0')
     U = bitdiffs.get('U', '1')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRD_i_T1_A Rt={Rt} Rt2={Rt2} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  t2 = core.reg_num[Rt2];  n = core.reg_num[Rn];  
@@ -54,7 +54,8 @@ def aarch32_STRD_i_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRD_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRD_i_T1_A_exec skipped')
     return aarch32_STRD_i_T1_A_exec
 
 
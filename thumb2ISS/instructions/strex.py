@@ -20,7 +20,7 @@ def aarch32_STREX_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STREX_T1_A Rd={Rd} Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     d = core.reg_num[Rd];  t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -39,7 +39,8 @@ def aarch32_STREX_T1_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.ZeroExtend('1', 32));
         else:
-            log.debug(f'aarch32_STREX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STREX_T1_A_exec skipped')
     return aarch32_STREX_T1_A_exec
 
 
@@ -36,7 +36,8 @@ def aarch32_STREXB_T1_A(core, regex_match, bitdiffs):
             else:
                 core.writeR(d, core.ZeroExtend('1', 32));
         else:
-            log.debug(f'aarch32_STREXB_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STREXB_T1_A_exec skipped')
     return aarch32_STREXB_T1_A_exec
 
 
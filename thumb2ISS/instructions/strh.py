@@ -19,7 +19,7 @@ def aarch32_STRH_i_T1_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRH_i_T1_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     t = core.reg_num[Rt];  n = core.reg_num[Rn];  
@@ -35,7 +35,8 @@ def aarch32_STRH_i_T1_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRH_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRH_i_T1_A_exec skipped')
     return aarch32_STRH_i_T1_A_exec
 
 # pattern STRH{<c>}.W <Rt>, [<Rn> {, #{+}<imm>}] with bitdiffs=[]
@@ -49,7 +50,7 @@ def aarch32_STRH_i_T2_A(core, regex_match, bitdiffs):
     Rn = regex_groups.get('Rn', None)
     imm32 = regex_groups.get('imm32', None)
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRH_i_T2_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111':
@@ -69,7 +70,8 @@ def aarch32_STRH_i_T2_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRH_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRH_i_T2_A_exec skipped')
     return aarch32_STRH_i_T2_A_exec
 
 # pattern STRH{<c>}{<q>} <Rt>, [<Rn> {, #-<imm>}] with bitdiffs=[('P', '1'), ('U', '0'), ('W', '0')]
@@ -88,7 +90,7 @@ def aarch32_STRH_i_T3_A(core, regex_match, bitdiffs):
     U = bitdiffs.get('U', '1')
     W = bitdiffs.get('W', '0')
     if imm32 is None:
-        imm32 = '0'
+        imm32 = 0
     log.debug(f'aarch32_STRH_i_T3_A Rt={Rt} Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     if Rn == '1111' or (P == '0' and W == '0'):
@@ -108,7 +110,8 @@ def aarch32_STRH_i_T3_A(core, regex_match, bitdiffs):
                 if wback:
                      core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRH_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRH_i_T3_A_exec skipped')
     return aarch32_STRH_i_T3_A_exec
 
 
@@ -137,7 +140,8 @@ def aarch32_STRH_r_T1_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRH_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRH_r_T1_A_exec skipped')
     return aarch32_STRH_r_T1_A_exec
 
 # pattern STRH{<c>}.W <Rt>, [<Rn>, {+}<Rm>] with bitdiffs=[]
@@ -175,7 +179,8 @@ def aarch32_STRH_r_T2_A(core, regex_match, bitdiffs):
             if wback:
                  core.writeR(n, offset_addr);
         else:
-            log.debug(f'aarch32_STRH_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_STRH_r_T2_A_exec skipped')
     return aarch32_STRH_r_T2_A_exec
 
 
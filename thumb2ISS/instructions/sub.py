@@ -39,7 +39,8 @@ def aarch32_SUB_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_i_T1_A_exec skipped')
     return aarch32_SUB_i_T1_A_exec
 
 # pattern SUB<c>{<q>} <Rdn>, #<imm8> with bitdiffs=[('S', '0')]
@@ -76,7 +77,8 @@ def aarch32_SUB_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_i_T2_A_exec skipped')
     return aarch32_SUB_i_T2_A_exec
 
 # pattern SUB<c>.W {<Rd>,} <Rn>, #<const> with bitdiffs=[('S', '0')]
@@ -116,7 +118,8 @@ def aarch32_SUB_i_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_i_T3_A_exec skipped')
     return aarch32_SUB_i_T3_A_exec
 
 # pattern SUB{<c>}{<q>} {<Rd>,} <Rn>, #<imm12> with bitdiffs=[]
@@ -151,7 +154,8 @@ def aarch32_SUB_i_T4_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_i_T4_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_i_T4_A_exec skipped')
     return aarch32_SUB_i_T4_A_exec
 
 # pattern SUBS{<c>}{<q>} PC, LR, #<imm8> with bitdiffs=[]
@@ -180,7 +184,8 @@ def aarch32_SUB_i_T5_AS(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_i_T5_AS_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_i_T5_AS_exec skipped')
     return aarch32_SUB_i_T5_AS_exec
 
 
@@ -219,7 +224,8 @@ def aarch32_SUB_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_r_T1_A_exec skipped')
     return aarch32_SUB_r_T1_A_exec
 
 # pattern SUB{<c>}{<q>} {<Rd>,} <Rn>, <Rm>, RRX with bitdiffs=[('S', '0'), ('stype', '11')]
@@ -273,7 +279,8 @@ def aarch32_SUB_r_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_r_T2_A_exec skipped')
     return aarch32_SUB_r_T2_A_exec
 
 
@@ -303,7 +310,8 @@ def aarch32_SUB_SP_i_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_SP_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_SP_i_T1_A_exec skipped')
     return aarch32_SUB_SP_i_T1_A_exec
 
 # pattern SUB{<c>}.W {<Rd>,} SP, #<const> with bitdiffs=[('S', '0')]
@@ -339,7 +347,8 @@ def aarch32_SUB_SP_i_T2_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_SP_i_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_SP_i_T2_A_exec skipped')
     return aarch32_SUB_SP_i_T2_A_exec
 
 # pattern SUB{<c>}{<q>} {<Rd>,} SP, #<imm12> with bitdiffs=[]
@@ -372,7 +381,8 @@ def aarch32_SUB_SP_i_T3_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_SP_i_T3_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_SP_i_T3_A_exec skipped')
     return aarch32_SUB_SP_i_T3_A_exec
 
 
@@ -422,7 +432,8 @@ def aarch32_SUB_SP_r_T1_A(core, regex_match, bitdiffs):
                 if setflags:
                     core.APSR.update(nzcv);
         else:
-            log.debug(f'aarch32_SUB_SP_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SUB_SP_r_T1_A_exec skipped')
     return aarch32_SUB_SP_r_T1_A_exec
 
 
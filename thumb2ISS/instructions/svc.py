@@ -25,7 +25,8 @@ def aarch32_SVC_T1_A(core, regex_match, bitdiffs):
             core.CheckForSVCTrap(core.Field(imm32,15,0));
             core.CallSupervisor(core.Field(imm32,15,0));
         else:
-            log.debug(f'aarch32_SVC_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SVC_T1_A_exec skipped')
     return aarch32_SVC_T1_A_exec
 
 
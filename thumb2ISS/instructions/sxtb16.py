@@ -36,7 +36,8 @@ def aarch32_SXTB16_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),15,0,core.SignExtend(core.Field(rotated,7,0), 16)));
             core.writeR(d, core.SetField(core.readR(d),31,16,core.SignExtend(core.Field(rotated,23,16), 16)));
         else:
-            log.debug(f'aarch32_SXTB16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_SXTB16_T1_A_exec skipped')
     return aarch32_SXTB16_T1_A_exec
 
 
@@ -20,7 +20,6 @@ def aarch32_TST_i_T1_A(core, regex_match, bitdiffs):
     log.debug(f'aarch32_TST_i_T1_A Rn={Rn} imm32={imm32} cond={cond}')
     # decode
     n = core.reg_num[Rn];
-    carry = core.APSR.C;
     if n == 15:
         raise Exception('UNPREDICTABLE'); # Armv8-A removes raise Exception('UNPREDICTABLE') for R13
 
@@ -30,10 +29,11 @@ def aarch32_TST_i_T1_A(core, regex_match, bitdiffs):
             result = core.readR(n) & imm32;
             core.APSR.N = core.Bit(result,31);
             core.APSR.Z = core.IsZeroBit(result);
-            core.APSR.C = carry;
+            core.APSR.C = core.T32ExpandImmCarry(imm32);
             # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_TST_i_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_TST_i_T1_A_exec skipped')
     return aarch32_TST_i_T1_A_exec
 
 
@@ -60,7 +60,8 @@ def aarch32_TST_r_T1_A(core, regex_match, bitdiffs):
             core.APSR.C = carry;
             # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_TST_r_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_TST_r_T1_A_exec skipped')
     return aarch32_TST_r_T1_A_exec
 
 # pattern TST{<c>}{<q>} <Rn>, <Rm>, RRX with bitdiffs=[('stype', '11')]
@@ -97,7 +98,8 @@ def aarch32_TST_r_T2_A(core, regex_match, bitdiffs):
             core.APSR.C = carry;
             # core.APSR.V unchanged
         else:
-            log.debug(f'aarch32_TST_r_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_TST_r_T2_A_exec skipped')
     return aarch32_TST_r_T2_A_exec
 
 
@@ -34,7 +34,8 @@ def aarch32_UBFX_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             core.writeR(d, core.ZeroExtendSubField(core.readR(n), msbit, lsbit, 32));
         else:
-            log.debug(f'aarch32_UBFX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UBFX_T1_A_exec skipped')
     return aarch32_UBFX_T1_A_exec
 
 
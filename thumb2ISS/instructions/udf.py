@@ -25,7 +25,8 @@ def aarch32_UDF_T1_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             raise Exception('UNDEFINED');
         else:
-            log.debug(f'aarch32_UDF_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UDF_T1_A_exec skipped')
     return aarch32_UDF_T1_A_exec
 
 # pattern UDF{<c>}.W {#}<imm> with bitdiffs=[]
@@ -45,7 +46,8 @@ def aarch32_UDF_T2_A(core, regex_match, bitdiffs):
         if core.ConditionPassed(cond):
             raise Exception('UNDEFINED');
         else:
-            log.debug(f'aarch32_UDF_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UDF_T2_A_exec skipped')
     return aarch32_UDF_T2_A_exec
 
 
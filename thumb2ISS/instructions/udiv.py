@@ -37,7 +37,8 @@ def aarch32_UDIV_T1_A(core, regex_match, bitdiffs):
                 result = core.RoundTowardsZero(core.Real(core.UInt(core.readR(n))) / core.Real(core.UInt(core.readR(m))));
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_UDIV_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UDIV_T1_A_exec skipped')
     return aarch32_UDIV_T1_A_exec
 
 
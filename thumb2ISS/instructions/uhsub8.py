@@ -38,7 +38,8 @@ def aarch32_UHSUB8_T1_A(core, regex_match, bitdiffs):
             core.writeR(d, core.SetField(core.readR(d),23,16,core.Field(diff3,8,1)));
             core.writeR(d, core.SetField(core.readR(d),31,24,core.Field(diff4,8,1)));
         else:
-            log.debug(f'aarch32_UHSUB8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UHSUB8_T1_A_exec skipped')
     return aarch32_UHSUB8_T1_A_exec
 
 
@@ -36,7 +36,8 @@ def aarch32_USAD8_T1_A(core, regex_match, bitdiffs):
             result = absdiff1 + absdiff2 + absdiff3 + absdiff4;
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_USAD8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USAD8_T1_A_exec skipped')
     return aarch32_USAD8_T1_A_exec
 
 
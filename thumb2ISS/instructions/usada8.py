@@ -35,7 +35,8 @@ def aarch32_USADA8_T1_A(core, regex_match, bitdiffs):
             result = core.UInt(core.readR(a)) + absdiff1 + absdiff2 + absdiff3 + absdiff4;
             core.writeR(d, core.Field(result,31,0));
         else:
-            log.debug(f'aarch32_USADA8_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USADA8_T1_A_exec skipped')
     return aarch32_USADA8_T1_A_exec
 
 
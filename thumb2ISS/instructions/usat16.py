@@ -34,7 +34,8 @@ def aarch32_USAT16_T1_A(core, regex_match, bitdiffs):
             if sat1 or sat2:
                 core.APSR.Q = bool(1);
         else:
-            log.debug(f'aarch32_USAT16_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USAT16_T1_A_exec skipped')
     return aarch32_USAT16_T1_A_exec
 
 
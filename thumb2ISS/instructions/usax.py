@@ -36,7 +36,8 @@ def aarch32_USAX_T1_A(core, regex_match, bitdiffs):
             core.APSR.GE = core.SetField(core.APSR.GE,1,0,'11' if sum  >= 0x10000 else '00');
             core.APSR.GE = core.SetField(core.APSR.GE,3,2,'11' if diff >= 0 else '00');
         else:
-            log.debug(f'aarch32_USAX_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_USAX_T1_A_exec skipped')
     return aarch32_USAX_T1_A_exec
 
 
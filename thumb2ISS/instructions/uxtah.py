@@ -38,7 +38,8 @@ def aarch32_UXTAH_T1_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.readR(n) + core.ZeroExtend(core.Field(rotated,15,0), 32));
         else:
-            log.debug(f'aarch32_UXTAH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTAH_T1_A_exec skipped')
     return aarch32_UXTAH_T1_A_exec
 
 
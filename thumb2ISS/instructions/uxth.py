@@ -27,7 +27,8 @@ def aarch32_UXTH_T1_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.ZeroExtend(core.Field(rotated,15,0), 32));
         else:
-            log.debug(f'aarch32_UXTH_T1_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTH_T1_A_exec skipped')
     return aarch32_UXTH_T1_A_exec
 
 # pattern UXTH{<c>}.W {<Rd>,} <Rm> with bitdiffs=[]
@@ -57,7 +58,8 @@ def aarch32_UXTH_T2_A(core, regex_match, bitdiffs):
             rotated = core.ROR(core.readR(m), rotation);
             core.writeR(d, core.ZeroExtend(core.Field(rotated,15,0), 32));
         else:
-            log.debug(f'aarch32_UXTH_T2_A_exec skipped')
+            if core.trace:
+                log.debug(f'aarch32_UXTH_T2_A_exec skipped')
     return aarch32_UXTH_T2_A_exec
 
 
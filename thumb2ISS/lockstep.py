@@ -0,0 +1,161 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import click
+import logging
+import contextlib
+import io
+import sys
+from .sim import Simulator, EndOfExecutionException, max_block_length
+from .timings import Architecture
+from .thumb2ISS import loadImage
+from .tracer import RecordingMemory, WRITE
+from .version import __version__
+
+log = logging.getLogger('thumb2ISS.lockstep')
+
+# execution engines : 'step' single steps instructions with their reference executors, 'block' runs compiled blocks,
+# 'eager-' prefix decodes every instruction at load instead of on first execution
+engines = ['step', 'block', 'eager-step', 'eager-block']
+
+
+class Engine:
+    ''' Loaded simulator run by one engine, logging its memory writes and target output '''
+
+    def __init__(self, elf_file, engine, cpu='M4'):
+        self.name = engine
+        self.stdout = io.StringIO()
+        self.sim = Simulator(t_arch=Architecture.fromString(cpu), log_root=log.getChild(engine))
+        if not loadImage(self.sim, elf_file, lazy=not engine.startswith('eager-')):
+            raise Exception(f'Unable to load {elf_file}')
+        self.blocks = engine.endswith('block')
+        self.writes = RecordingMemory(self.sim.memory)
+        self.sim.memory = self.sim.core.memory = self.writes
+        self.ended = False
+        self.error = None
+
+    def step(self, count=None):
+        ''' Executes count instructions (one block, or one instruction when stepped, if None), returns the count of
+            executed instructions, which is not known when end of execution (or an error) is reached '''
+        sim = self.sim
+        start = sim.retired
+        try:
+            with contextlib.redirect_stdout(self.stdout):
+                if count is None:
+                    if self.blocks:
+                        return sim.step_block()
+                    sim.step_in()
+                    return 1
+                for _ in range(count):
+                    sim.step_in()
+        except EndOfExecutionException:
+            self.ended = True
+            return None
+        except Exception as e:
+            self.ended = True
+            self.error = f'{type(e).__name__}: {e}'
+            return None
+        return sim.retired - start
+
+    def state(self):
+        ''' Registers, flags, cycles, target output and error, with memory writes since last call '''
+        core = self.sim.core
+        apsr = core.APSR
+        state = {f'r{i}': hex(core.R[i]) for i in range(16)}
+        state.update({'nzcv': f'{apsr.nzcv:04b}', 'q': apsr.Q, 'ge': apsr.GE, 'it': apsr.ITsteps, 'cycles': self.sim.cycles['total']})
+        state['stdout'] = self.stdout.getvalue()
+        state['error'] = self.error
+        state['writes'] = [(hex(address), data.hex()) for kind, address, data in self.writes.accesses if kind == WRITE]
+        self.writes.accesses.clear()
+        return state
+
+def diffStates(reference, candidate):
+    ''' Differing entries of two states, memory writes being compared up to the first differing one '''
+    diff = [f'{key}: {reference[key]} != {candidate[key]}' for key in reference if key != 'writes' and reference[key] != candidate[key]]
+    writes = (reference['writes'], candidate['writes'])
+    for i in range(max(len(writes[0]), len(writes[1]))):
+        expected, actual = [w[i] if i < len(w) else None for w in writes]
+        if expected != actual:
+            diff.append(f'write #{i}: {expected} != {actual}')
+            break
+    return diff
+
+def lockstep(elf_file, reference='step', candidate='block', interval=None, max_instructions=None, cpu='M4', compare_cycles=True):
+    ''' Runs elf_file on reference and candidate engines in lockstep, see runLockstep '''
+    return runLockstep(Engine(elf_file, reference, cpu), Engine(elf_file, candidate, cpu), interval, max_instructions, compare_cycles)
+
+def runLockstep(reference, candidate, interval=None, max_instructions=None, compare_cycles=True):
+    ''' Runs both engines in lockstep, comparing their states every interval instructions (at every block or
+        instruction of candidate when None). Returns a result with status ('match' up to end of execution,
+        'limit' when max_instructions are executed, or 'diverged'), count of instructions executed by both,
+        PC and count of instructions of the last matching comparison, and differences at divergence '''
+    engines = reference, candidate
+    result = {'status': 'match', 'instructions': 0, 'last_match': 0, 'last_match_pc': hex(engines[0].sim.core.getPC()), 'diff': []}
+    since_check = 0
+    while True:
+        count = engines[1].step()
+        if count is None:
+            # block raising end of execution is not counted : reference ends within the same block
+            for _ in range(max_block_length):
+                if engines[0].step(1) is None:
+                    break
+        elif engines[0].step(count) is None:
+            count = None
+        else:
+            result['instructions'] += count
+            since_check += count
+        ended = count is None
+        if ended or interval is None or since_check >= interval or (max_instructions and result['instructions'] >= max_instructions):
+            states = [engine.state() for engine in engines]
+            if not compare_cycles:
+                for state in states:
+                    del state['cycles']
+            diff = diffStates(*states)
+            if engines[0].ended != engines[1].ended:
+                diff.insert(0, f'end of execution: {engines[0].ended} != {engines[1].ended}')
+            if len(diff) > 0:
+                result['status'] = 'diverged'
+                result['diff'] = diff
+                return result
+            result['last_match'] = result['instructions']
+            result['last_match_pc'] = states[0]['r15']
+            since_check = 0
+            if ended:
+                return result
+            if max_instructions and result['instructions'] >= max_instructions:
+                result['status'] = 'limit'
+                return result
+
+@click.command()
+@click.argument('elf_file', type=click.Path(exists=True, dir_okay=False))
+@click.option('-r', '--reference', type=click.Choice(engines), default='step', show_default=True, help='Reference execution engine')
+@click.option('-e', '--candidate', type=click.Choice(engines), default='block', show_default=True, help='Execution engine checked against reference')
+@click.option('-n', '--interval', type=click.IntRange(min=1), help='Compare states every this count of instructions  [default: every candidate block]')
+@click.option('--max-instructions', type=click.IntRange(min=1), help='Stop once this count of instructions is executed by both engines')
+@click.option('--ignore-cycles', is_flag=True, default=False, help='Do not compare simulated cycles')
+@click.option('-c', '--cpu', type=click.Choice(['M0', 'M0+', 'M3', 'M4', 'M23', 'M33'], case_sensitive=False), default='M4', help='Tune target (cycle counting)')
+@click.option('-v', '--verbose', count=True, help='Tune stderr output verbosity')
+@click.version_option(__version__)
+def run(elf_file, reference, candidate, interval, max_instructions, ignore_cycles, cpu, verbose):
+    ''' Runs ELF_FILE on two execution engines of thumb2 Instruction Set Simulator in lockstep, up to their first
+        difference of registers, flags, cycles, memory writes or output'''
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, stream=sys.stderr)
+    log.setLevel(logging.INFO if verbose > 1 else logging.ERROR)
+
+    result = lockstep(elf_file, reference, candidate, interval, max_instructions, cpu, not ignore_cycles)
+    if result['status'] == 'diverged':
+        print(f'{candidate} diverged from {reference} within {result["instructions"] - result["last_match"]} instructions '
+            f'after instruction #{result["last_match"]} (pc {result["last_match_pc"]})')
+        for line in result['diff']:
+            print(f'  {line}')
+        sys.exit(1)
+    ending = 'end of execution' if result['status'] == 'match' else 'instructions limit'
+    print(f'{candidate} matches {reference} over {result["instructions"]} instructions, up to {ending}')
+
+if __name__ == '__main__':
+    run()
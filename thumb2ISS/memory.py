@@ -0,0 +1,176 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import mmap
+import struct
+from bisect import bisect_right
+
+_formats = {1: struct.Struct('<B'), 2: struct.Struct('<H'), 4: struct.Struct('<L'), 8: struct.Struct('<Q')}
+_unpackers = {size: fmt.unpack_from for size, fmt in _formats.items()}
+_packers = {size: fmt.pack_into for size, fmt in _formats.items()}
+_masks = {size: (1 << (8*size)) - 1 for size in _formats}
+
+
+def mapFile(path, writable=True):
+    ''' Maps a flat binary image in memory, either copy-on-write (private to the process,
+        pages stay shared with other processes until written) or read-only '''
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY if writable else mmap.ACCESS_READ)
+
+
+class MemoryMap:
+    ''' Target address space made of contiguous regions, each one backed by a single buffer '''
+
+    def __init__(self, chunks=()):
+        self.regions = []   # (start, end, buffer) sorted by start address, end excluded
+        self._starts = []
+        self._last = (0, 0, None)
+        if chunks:
+            self.load(chunks)
+
+    def load(self, chunks):
+        ''' Lays out (address, data) chunks into regions, merging overlapping or adjacent chunks.
+            Like successive dict updates, a chunk overrides the content of the previous ones.
+            Memory mapped chunks are used as is (never copied nor written), other chunks are
+            clipped to the area outside of them. '''
+        mapped = [(address, data) for address, data in chunks if isinstance(data, mmap.mmap)]
+        chunks = [(address, data) for address, data in chunks if not isinstance(data, mmap.mmap)]
+        for map_start, buffer in mapped:
+            self.addRegion(map_start, buffer)
+            map_end = map_start + len(buffer)
+            clipped = []
+            for address, data in chunks:
+                if address < map_start:
+                    clipped.append((address, data[:map_start - address]))
+                if address + len(data) > map_end:
+                    clipped.append((max(address, map_end), data[max(address, map_end) - address:]))
+            chunks = clipped
+
+        chunks = [(address, data) for address, data in chunks if len(data) > 0]
+        spans = []
+        for start, end in sorted((address, address + len(data)) for address, data in chunks):
+            if len(spans) > 0 and start <= spans[-1][1]:
+                spans[-1][1] = max(end, spans[-1][1])
+            else:
+                spans.append([start, end])
+        for start, end in spans:
+            self.addRegion(start, bytearray(end - start))
+        for address, data in chunks:
+            self.writeBytes(address, data)
+
+    def addRegion(self, start, buffer):
+        end = start + len(buffer)
+        i = bisect_right(self._starts, start)
+        if (i > 0 and self.regions[i-1][1] > start) or (i < len(self.regions) and self.regions[i][0] < end):
+            raise Exception(f'Memory region {hex(start)} - {hex(end - 1)} overlaps an existing region')
+        self.regions.insert(i, (start, end, buffer))
+        self._starts.insert(i, start)
+
+    def _region(self, address, size):
+        ''' Region holding the access, None when it goes on in the following adjacent regions (see _pieces) '''
+        region = self._last
+        if region[0] <= address and address + size <= region[1]:
+            return region
+        i = bisect_right(self._starts, address) - 1
+        if i >= 0:
+            region = self.regions[i]
+            if address + size <= region[1]:
+                self._last = region
+                return region
+            if address < region[1]:
+                return None
+        raise Exception(f'Illegal memory access between {hex(address)} and {hex(address + size - 1)}')
+
+    def _pieces(self, address, size):
+        ''' (buffer, offset, size) parts of an access spanning adjacent regions (a memory mapped image next to the
+            chunks around it for instance) '''
+        pieces = []
+        i = bisect_right(self._starts, address) - 1
+        current, remaining = address, size
+        while remaining > 0:
+            if i >= len(self.regions) or self.regions[i][0] > current:
+                raise Exception(f'Illegal memory access between {hex(address)} and {hex(address + size - 1)}')
+            start, end, buffer = self.regions[i]
+            count = min(remaining, end - current)
+            pieces.append((buffer, current - start, count))
+            current += count
+            remaining -= count
+            i += 1
+        return pieces
+
+    def read(self, address, size):
+        ''' Reads an unsigned little endian value of size bytes '''
+        region = self._region(address, size)
+        if region is None:
+            return int.from_bytes(self.readBytes(address, size), 'little')
+        start, _, buffer = region
+        return _unpackers[size](buffer, address - start)[0]
+
+    def write(self, address, size, value):
+        ''' Writes value as an unsigned little endian value of size bytes '''
+        region = self._region(address, size)
+        if region is None:
+            return self.writeBytes(address, (value & _masks[size]).to_bytes(size, 'little'))
+        start, _, buffer = region
+        try:
+            _packers[size](buffer, address - start, value & _masks[size])
+        except TypeError:
+            raise Exception(f'Illegal write access to read-only memory at {hex(address)}')
+
+    def readBytes(self, address, size):
+        region = self._region(address, size)
+        if region is None:
+            return b''.join(bytes(buffer[offset:offset + count]) for buffer, offset, count in self._pieces(address, size))
+        start, _, buffer = region
+        return bytes(buffer[address - start:address - start + size])
+
+    def writeBytes(self, address, data):
+        region = self._region(address, len(data))
+        if region is None:
+            pieces = self._pieces(address, len(data))
+            # nothing is written when any part is read-only
+            if any(memoryview(buffer).readonly for buffer, _, _ in pieces):
+                raise Exception(f'Illegal write access to read-only memory at {hex(address)}')
+            position = 0
+            for buffer, offset, count in pieces:
+                buffer[offset:offset + count] = data[position:position + count]
+                position += count
+            return
+        start, _, buffer = region
+        try:
+            buffer[address - start:address - start + len(data)] = data
+        except TypeError:
+            raise Exception(f'Illegal write access to read-only memory at {hex(address)}')
+
+    def find(self, address, value, size=None):
+        ''' Offset from address of the first byte equal to value, among size bytes (up to the end of the region
+            when size is None or exceeds it), -1 when none is found '''
+        start, end, buffer = self._region(address, 1)
+        stop = end if size is None else min(end, address + size)
+        index = buffer.find(bytes([value]), address - start, stop - start)
+        return index - (address - start) if index >= 0 else -1
+
+    def snapshot(self):
+        ''' Content of regions as (start, end, data), data being an immutable copy of the buffer (shared by every
+            restore of the snapshot), or None for read-only regions which never change '''
+        return [(start, end, None if memoryview(buffer).readonly else bytes(buffer)) for start, end, buffer in self.regions]
+
+    def restore(self, regions):
+        ''' Writes back the content of a snapshot, taken on the same regions layout '''
+        if [(start, end) for start, end, _ in regions] != [(start, end) for start, end, _ in self.regions]:
+            raise Exception('Snapshot memory regions do not match simulated memory regions')
+        for (_, _, data), (_, _, buffer) in zip(regions, self.regions):
+            if data is not None:
+                buffer[:] = data
+
+    def isAddressValid(self, address):
+        i = bisect_right(self._starts, address) - 1
+        return i >= 0 and address < self.regions[i][1]
+
+    def limits(self):
+        return [(start, end - 1) for start, end, _ in self.regions]
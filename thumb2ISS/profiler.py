@@ -0,0 +1,149 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+from bisect import bisect_right
+from collections import defaultdict
+
+
+class Profiler:
+    ''' Attributes executed instructions and their cycles to PCs, then to functions (nearest label at or before PC).
+        A call stack, pushed on calls (PC leaves sequence with LR set to the next instruction) and popped on return to
+        the caller, gives inclusive counts of functions and their call graph. A branch to the start of another
+        function is a tail call : the callee replaces the caller on the stack.
+        Attached to a loaded simulator, which single steps instructions while profiled '''
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.core = sim.core
+        self.by_pc = {}         # [instructions, cycles] by PC
+        self.instructions = 0
+        self.cycles = 0
+        self.inclusive = defaultdict(lambda: [0, 0])
+        self.edges = defaultdict(lambda: [0, 0, 0])    # [calls, instructions, cycles] by (caller, callee)
+        self._starts = sorted(sim.label_by_address)
+        self._functions = {}
+        self._active = defaultdict(int)
+        # (function, return address, caller, instructions and cycles on entry), from root function
+        self.frames = []
+        self.enter(None, self.core.getPC(), None)
+        # monitored code is single stepped
+        sim.monitors.append(self)
+        sim.blocks = {}
+
+    def function(self, pc):
+        name = self._functions.get(pc)
+        if name is None:
+            i = bisect_right(self._starts, pc) - 1
+            name = self.sim.label_by_address[self._starts[i]] if i >= 0 else f'0x{pc:08x}'
+            self._functions[pc] = name
+        return name
+
+    def record(self, pc, length, cycles):
+        ''' Accounts the instruction executed at pc, PC and LR being updated by it '''
+        stats = self.by_pc.get(pc)
+        if stats is None:
+            stats = self.by_pc[pc] = [0, 0]
+        stats[0] += 1
+        stats[1] += cycles
+        self.instructions += 1
+        self.cycles += cycles
+        R = self.core.R
+        next_pc = pc + length
+        target = R[15]
+        if target != next_pc:
+            if R[14] == next_pc | 1:
+                self.enter(self.function(pc), target, next_pc)
+            elif len(self.frames) > 1 and target == self.frames[-1][1]:
+                self.leave()
+            elif target in self.sim.label_by_address and self.function(target) != self.function(pc):
+                return_address = self.frames[-1][1]
+                self.leave()
+                self.enter(self.function(pc), target, return_address)
+
+    def enter(self, caller, target, return_address):
+        function = self.function(target)
+        self._active[function] += 1
+        if caller is not None:
+            self.edges[(caller, function)][0] += 1
+        self.frames.append((function, return_address, caller, self.instructions, self.cycles))
+
+    def leave(self):
+        function, _, caller, instructions, cycles = self.frames.pop()
+        self._active[function] -= 1
+        if self._active[function] == 0:
+            # recursive calls are part of the outermost one
+            inclusive = self.inclusive[function]
+            inclusive[0] += self.instructions - instructions
+            inclusive[1] += self.cycles - cycles
+        if caller is not None:
+            edge = self.edges[(caller, function)]
+            edge[1] += self.instructions - instructions
+            edge[2] += self.cycles - cycles
+
+    def totals(self):
+        ''' Inclusive [instructions, cycles] by function and [calls, instructions, cycles] by (caller, callee),
+            calls still on the stack being accounted up to now '''
+        inclusive = defaultdict(lambda: [0, 0], {function: list(stats) for function, stats in self.inclusive.items()})
+        edges = {edge: list(stats) for edge, stats in self.edges.items()}
+        seen = set()
+        for function, _, caller, instructions, cycles in self.frames:
+            if function not in seen:
+                seen.add(function)
+                inclusive[function][0] += self.instructions - instructions
+                inclusive[function][1] += self.cycles - cycles
+            if caller is not None:
+                edges[(caller, function)][1] += self.instructions - instructions
+                edges[(caller, function)][2] += self.cycles - cycles
+        return inclusive, edges
+
+    def functions(self):
+        ''' {function: (instructions, cycles, inclusive instructions, inclusive cycles, calls)} '''
+        exclusive = defaultdict(lambda: [0, 0])
+        for pc, (instructions, cycles) in self.by_pc.items():
+            stats = exclusive[self.function(pc)]
+            stats[0] += instructions
+            stats[1] += cycles
+        inclusive, edges = self.totals()
+        calls = defaultdict(int)
+        for (_, callee), (count, _, _) in edges.items():
+            calls[callee] += count
+        return {function: tuple(exclusive[function]) + tuple(inclusive[function]) + (calls[function],)
+            for function in set(exclusive) | set(inclusive)}
+
+    def flatReport(self, f, hot_spots=20):
+        ''' Functions by decreasing exclusive cycles, then the hot_spots most expensive instructions '''
+        total = max(self.cycles, 1)
+        print(f'Flat profile : {self.instructions} instructions, {self.cycles} cycles', file=f)
+        print(f'{"cycles":>10} {"%":>6} {"instrs":>10} {"incl. cycles":>12} {"%":>6} {"calls":>8}  function', file=f)
+        functions = self.functions()
+        for name, (instructions, cycles, _, incl_cycles, calls) in sorted(functions.items(), key=lambda x: (-x[1][1], x[0])):
+            print(f'{cycles:>10} {100*cycles/total:>6.2f} {instructions:>10} {incl_cycles:>12} {100*incl_cycles/total:>6.2f} {calls:>8}  {name}', file=f)
+        print(file=f)
+        print('Hot spots', file=f)
+        print(f'{"cycles":>10} {"%":>6} {"instrs":>10}  address', file=f)
+        for pc, (instructions, cycles) in sorted(self.by_pc.items(), key=lambda x: (-x[1][1], x[0]))[:hot_spots]:
+            function = self.function(pc)
+            offset = pc - self.sim.labels.get(function, pc)
+            text = self.sim.dis[pc].strip() if pc in self.sim.dis else ''
+            print(f'{cycles:>10} {100*cycles/total:>6.2f} {instructions:>10}  {pc:08x} <{function}+{offset:#x}> {text}', file=f)
+        print(file=f)
+
+    def callGraphReport(self, f):
+        ''' Functions by decreasing inclusive cycles, each one with its callers and callees (calls and inclusive cycles) '''
+        total = max(self.cycles, 1)
+        print(f'Call graph : {self.instructions} instructions, {self.cycles} cycles', file=f)
+        edges = sorted(self.totals()[1].items(), key=lambda x: -x[1][2])
+        for name, (_, cycles, _, incl_cycles, calls) in sorted(self.functions().items(), key=lambda x: (-x[1][3], x[0])):
+            print(f'{name} : {incl_cycles} cycles ({100*incl_cycles/total:.2f}%), {cycles} self, {calls} calls', file=f)
+            for (caller, callee), (count, _, edge_cycles) in edges:
+                if callee == name and caller is not None:
+                    print(f'    <- {caller} : {count} calls, {edge_cycles} cycles', file=f)
+            for (caller, callee), (count, _, edge_cycles) in edges:
+                if caller == name:
+                    print(f'    -> {callee} : {count} calls, {edge_cycles} cycles', file=f)
+        print(file=f)
@@ -0,0 +1,75 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import json
+import xml.etree.ElementTree as ET
+
+# exit code of a simulation, by reason for stopping
+exit_codes = {'exit': 0, 'timeout': 124, 'cycle-limit': 124, 'instruction-limit': 124, 'error': 1}
+
+def newResult(image):
+    ''' Result of the simulation of image, as reported by thumb2ISS and thumb2ISS-batch :
+         - reason : 'exit' (semihosting end of execution), 'timeout' (host wall-clock time), 'cycle-limit', 'instruction-limit'
+                    or 'error' (exception raised)
+         - exit_code : process exit code matching reason, or target exit status (low byte, 1 if it is 0) when
+                       target exits with failure
+         - cycles / instructions : simulated cycles and retired instructions
+         - wall_time : host time (s) spent in simulation
+         - stdout : target output through semihosting
+         - error : exception details when reason is 'error' '''
+    return {'image': image, 'reason': 'error', 'exit_code': exit_codes['error'], 'cycles': 0, 'instructions': 0,
+            'wall_time': 0.0, 'stdout': '', 'error': None}
+
+def setReason(result, reason, status=None):
+    ''' Sets reason for stopping, status being the exit status of the target when reason is 'exit' '''
+    result['reason'] = reason
+    if reason == 'exit' and status:
+        result['exit_code'] = status & 0xff or 1
+    else:
+        result['exit_code'] = exit_codes[reason]
+
+class Tee:
+    ''' Text stream duplicating writes to several streams '''
+    def __init__(self, *streams):
+        self.streams = streams
+
+    def write(self, text):
+        for stream in self.streams:
+            stream.write(text)
+        return len(text)
+
+    def flush(self):
+        for stream in self.streams:
+            stream.flush()
+
+def writeJsonLine(result, f):
+    ''' One JSON object per line, flushed so that results can be followed while a batch runs '''
+    print(json.dumps(result), file=f, flush=True)
+
+def writeJUnit(results, f, name='thumb2ISS'):
+    ''' JUnit XML test suite, one test case per image : failing exits, timeouts and exhausted budgets are failures,
+        exceptions are errors '''
+    suite = ET.Element('testsuite', name=name, tests=str(len(results)),
+        failures=str(sum(r['reason'] != 'error' and r['exit_code'] != 0 for r in results)),
+        errors=str(sum(r['reason'] == 'error' for r in results)),
+        time=f'{sum(r["wall_time"] for r in results):.6f}')
+    for result in results:
+        case = ET.SubElement(suite, 'testcase', name=result['image'], classname=name, time=f'{result["wall_time"]:.6f}')
+        properties = ET.SubElement(case, 'properties')
+        for key in ['reason', 'exit_code', 'cycles', 'instructions']:
+            ET.SubElement(properties, 'property', name=key, value=str(result[key]))
+        if result['reason'] == 'error':
+            ET.SubElement(case, 'error', message=str(result['error']), type='error')
+        elif result['reason'] != 'exit':
+            ET.SubElement(case, 'failure', message=f'Simulation ended by {result["reason"]} after {result["cycles"]} cycles', type=result['reason'])
+        elif result['exit_code'] != 0:
+            ET.SubElement(case, 'failure', message=f'Target exited with status {result["exit_code"]}', type='exit')
+        ET.SubElement(case, 'system-out').text = result['stdout']
+    ET.indent(suite)
+    f.write(ET.tostring(suite, encoding='unicode', xml_declaration=True))
+    f.write('\n')
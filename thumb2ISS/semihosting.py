@@ -37,31 +37,34 @@ SYS_HEAPINFO    = 0x16
 
 SYS_EXIT        = 0x18
 
+SYS_EXIT_EXTENDED = 0x20
+
+# only successful reason for stopping of SYS_EXIT
+ADP_Stopped_ApplicationExit = 0x20026
+
 
 # byte 0: SHFB_MAGIC_0 0x53
 # byte 1: SHFB_MAGIC_1 0x48
 # byte 2: SHFB_MAGIC_2 0x46
 # byte 3: SHFB_MAGIC_3 0x42
-# byte 4: feature bits
+# byte 4: feature bits (bit 0: SH_EXT_EXIT_EXTENDED)
 
-FEATURE_DATA = b'SHFB\x00' #[0x53, 0x48, 0x46, 0x42, 0]
+FEATURE_DATA = b'SHFB\x01' #[0x53, 0x48, 0x46, 0x42, 1]
 
 opening_mode = ['r', 'rb', 'r+', 'rb+', 'w', 'wb', 'w+', 'wb+', 'a', 'ab', 'a+', 'ab+']
 
+# opening modes of restored files, which must not be truncated
+reopening_mode = {'w': 'r+', 'wb': 'rb+', 'w+': 'r+', 'wb+': 'rb+'}
+
 standard_io = ':tt'
 sm_features = ':semihosting-features'
-feature_pos = 0
-
-sh_handles = {}
 
 
 def readFromMemory(core, address, size):
-    byte_seq = b''.join(core.memory[i] for i in range(address, address + size))
-    return byte_seq
+    return core.memory.readBytes(address, size)
 
 def writeToMemory(core, data, address, size):
-    for i in range(size):
-        core.memory[address + i] = data[i:i+1]
+    core.memory.writeBytes(address, data[:size])
 
 def loadParameters(core, pointer, cnt=3):
     params = []
@@ -83,15 +86,54 @@ def writeString(core, src, pointer, cnt):
 
 
 
+def saveHandles(core):
+    ''' Opened handles as plain values : host standard streams by name, target files by name, mode and position '''
+    saved = {}
+    for f_h, file_handle in core.sh_handles.items():
+        if file_handle in core.sh_files:
+            saved[f_h] = core.sh_files[file_handle] + (file_handle.tell(),)
+        elif file_handle is None or file_handle == 'features':
+            saved[f_h] = file_handle
+        else:
+            saved[f_h] = 'stdin' if file_handle in [sys.stdin, sys.__stdin__] else 'stdout'
+    return saved, core.sh_feature_pos
+
+def restoreHandles(core, saved):
+    ''' Reopens handles saved by saveHandles : standard streams are the current host ones, target files are reopened
+        without truncation, then cut at their saved position '''
+    for file_handle in core.sh_files:
+        file_handle.close()
+    core.sh_files = {}
+    handles, core.sh_feature_pos = saved
+    core.sh_handles = {}
+    for f_h, file_handle in handles.items():
+        if type(file_handle) is tuple:
+            filename, mode, position = file_handle
+            file_handle = open(filename, reopening_mode.get(mode, mode))
+            core.sh_files[file_handle] = (filename, mode)
+            file_handle.seek(position)
+            if mode[0] != 'r':
+                # drop what was written after the snapshot
+                file_handle.truncate()
+        elif file_handle == 'stdin':
+            file_handle = sys.stdin
+        elif file_handle == 'stdout':
+            file_handle = sys.stdout
+        core.sh_handles[f_h] = file_handle
+
 def ExecuteCmd(core):
-    global feature_pos
+    sh_handles = core.sh_handles
     cmd = core.UInt(core.R[0])
 
     log.debug(f'Executing {hex(cmd)} semihosting command')
 
-    if cmd == SYS_EXIT and core.UInt(core.R[1]) == 0x20026:
-        core.Exit()
-    if cmd == SYS_OPEN:
+    if cmd == SYS_EXIT:
+        # reason for stopping only, any other reason than application exit is a failure
+        core.Exit(0 if core.UInt(core.R[1]) == ADP_Stopped_ApplicationExit else 1)
+    elif cmd == SYS_EXIT_EXTENDED:
+        reason, status = loadParameters(core, core.R[1], cnt=2)
+        core.Exit(status if reason == ADP_Stopped_ApplicationExit else status or 1)
+    elif cmd == SYS_OPEN:
         str_p, mode, str_l = loadParameters(core, core.R[1])
         filename = readString(core, str_p, str_l)
 
@@ -99,9 +141,10 @@ def ExecuteCmd(core):
             file_handle = sys.stdout if mode == opening_mode.index('w') else sys.stdin
         elif filename == sm_features:
             file_handle = 'features'
-            feature_pos = 0
+            core.sh_feature_pos = 0
         else:
             file_handle = open(filename, opening_mode[mode])
+            core.sh_files[file_handle] = (filename, opening_mode[mode])
 
         sh_handles[1+len(sh_handles)] = file_handle
         core.R[0] = core.Field(len(sh_handles))
@@ -110,8 +153,10 @@ def ExecuteCmd(core):
         file_handle = sh_handles[f_h]
         if file_handle == 'features':
             pass
-        elif file_handle is not None:
+        elif file_handle is not None and file_handle not in [sys.stdin, sys.stdout]:
+            # host standard streams are shared with the other simulations
             file_handle.close()
+            core.sh_files.pop(file_handle, None)
         sh_handles[f_h] = None
         core.R[0] = core.Field(0)
     elif cmd == SYS_WRITE:
@@ -122,10 +167,11 @@ def ExecuteCmd(core):
     elif cmd == SYS_READ:
         f_h, str_p, str_l = loadParameters(core, core.R[1])
         if sh_handles[f_h] == 'features':
+            feature_pos = core.sh_feature_pos
             data_to_write = FEATURE_DATA[feature_pos:feature_pos+str_l]
-            feature_pos += len(data_to_write)
+            core.sh_feature_pos += len(data_to_write)
             writeString(core, data_to_write, str_p, len(data_to_write))
-            core.R[0] = core.Field(len(FEATURE_DATA)-feature_pos)
+            core.R[0] = core.Field(len(FEATURE_DATA)-core.sh_feature_pos)
         else:
             raise Exception(f'Read command not implemented on regular streams')
     elif cmd == SYS_FLEN:
@@ -146,7 +192,7 @@ def ExecuteCmd(core):
     elif cmd == SYS_SEEK:
         f_h, t_pos = loadParameters(core, core.R[1], cnt=2)
         if sh_handles[f_h] == 'features':
-            feature_pos = t_pos
+            core.sh_feature_pos = t_pos
             core.R[0] = core.Field(0)
         else:
             print(sh_handles)
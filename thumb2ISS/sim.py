@@ -7,17 +7,159 @@
 # License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
 #
 import re
+import os
 import logging
 import binascii
+import hashlib
+import json
 import struct
-from itertools import groupby
-from .core import Core, EndOfExecutionException,Singleton
+import time
+import contextlib
+from collections import namedtuple
+from .core import Core, EndOfExecutionException
+from .decoder import Decoder, Decoded, Operands, decode, instructionLength
+from .inline import RegisterLocals, inlined, inlineSource
+from . import hostlib
+from .memory import MemoryMap
 from .timings import Architecture, Timings
+from .version import __version__
 
-class Simulator(object, metaclass=Singleton):
+# instruction as found in image, before decoding (assembly text only available from disassembly)
+RawInstruction = namedtuple('RawInstruction', 'encoding cond assembly')
 
-    def __init__(self, t_arch=Architecture.CortexM4, log_root=None):
+# bumped whenever decoded program representation changes
+cache_format = 2
+# bumped whenever simulation state representation changes (see Simulator.snapshot)
+snapshot_format = 2
+
+# longest straight-line sequence compiled in a single function
+max_block_length = 64
+# blocks are compiled once entered that many times, cold code is single stepped
+hot_block_count = 16
+
+_branch_mnems = {'B', 'BL', 'BX', 'BLX', 'CBZ', 'CBNZ', 'TBB', 'TBH', 'BKPT', 'SVC'}
+_dest_fields = ['Rd', 'Rdn', 'Rdm', 'Rt', 'Rt2', 'RdLo', 'RdHi']
+
+def endsBlock(instruction):
+    ''' True when instruction may write PC (only known from its assembly text when not decoded) '''
+    if not isinstance(instruction, Decoded):
+        return True
+    ops = instruction.operands
+    return instruction.mnem in _branch_mnems or any(ops.get(name) == 'pc' for name in _dest_fields) \
+        or ops.get('registers', '').endswith('pc')
+
+def fusionKind(instruction):
+    ''' 'alu' for instructions only working on registers, 'store' for memory writes, None for anything else
+        (memory reads, PC reads or writes, undecoded instructions) '''
+    if not isinstance(instruction, Decoded) or endsBlock(instruction) or instruction.mnem == 'ADR':
+        return None
+    ops = instruction.operands
+    if any(value == 'pc' for value in ops.values()) or 'pc' in ops.get('registers', ''):
+        return None
+    if instruction.mnem.startswith('LD') or instruction.mnem == 'POP':
+        return None
+    if instruction.mnem.startswith('ST') or instruction.mnem == 'PUSH':
+        return 'store'
+    return 'alu'
+
+def writeSnapshot(path, snapshot):
+    ''' Snapshot file : state as a JSON line, followed by the content of writable memory regions, in order.
+        Restoring it runs no code, but host files opened by the target are reopened and cut at their saved
+        position : as for images, only restore snapshots of trusted origin '''
+    core = snapshot['core']
+    handles, feature_pos = core['semihosting']
+    header = {
+        'format' : snapshot['format'],
+        'core' : {
+            'R' : core['R'],
+            'APSR' : core['APSR'],
+            'pipeline' : core['pipeline'][:4] + (sorted(core['pipeline'][4]), core['pipeline'][5]),
+            'semihosting' : ([[f_h, file_handle] for f_h, file_handle in handles.items()], feature_pos),
+        },
+        'memory' : [(start, end, None if data is None else len(data)) for start, end, data in snapshot['memory']],
+        'cycles' : snapshot['cycles'],
+        'retired' : snapshot['retired'],
+    }
+    with open(path, 'wb') as f:
+        f.write(json.dumps(header, separators=(',', ':')).encode() + b'\n')
+        for _, _, data in snapshot['memory']:
+            if data is not None:
+                f.write(data)
+
+def readSnapshot(path):
+    ''' Snapshot written by writeSnapshot, as returned by Simulator.snapshot '''
+    with open(path, 'rb') as f:
+        try:
+            header = json.loads(f.readline())
+        except ValueError:
+            raise Exception(f'{path} is not a snapshot file')
+        if type(header) is not dict or header.get('format') != snapshot_format:
+            raise Exception(f'Unsupported snapshot format {header.get("format") if type(header) is dict else None}')
+        memory = []
+        for start, end, size in header['memory']:
+            data = None if size is None else f.read(size)
+            if data is not None and len(data) != size:
+                raise Exception(f'{path} is truncated')
+            memory.append((start, end, data))
+    core = header['core']
+    nzcv, pending, Q, GE, it_steps, it_cond = core['APSR']
+    handles, feature_pos = core['semihosting']
+    return {
+        'format' : header['format'],
+        'core' : {
+            'R' : core['R'],
+            'APSR' : (nzcv, None if pending is None else tuple(pending), Q, GE, it_steps, it_cond),
+            'pipeline' : tuple(core['pipeline'][:4]) + (set(core['pipeline'][4]), core['pipeline'][5]),
+            'semihosting' : ({f_h : tuple(file_handle) if type(file_handle) is list else file_handle
+                for f_h, file_handle in handles}, feature_pos),
+        },
+        'memory' : memory,
+        'cycles' : header['cycles'],
+        'retired' : header['retired'],
+    }
+
+class Disassembly(dict):
+    ''' Assembly text by address, text of instructions decoded from their encoding is only formatted on first access '''
+
+    def __getitem__(self, address):
+        text = dict.__getitem__(self, address)
+        if type(text) is tuple:
+            encoding, cond = text
+            decoded = decode(encoding, address, cond)
+            text = f'    {decoded}' if decoded is not None else f'    #{encoding.hex()}'
+            self[address] = text
+        return text
+
+
+class Phases(dict):
+    ''' Wall time (s) spent in named phases, in order of first entry : with phases('name'): ... '''
+
+    @contextlib.contextmanager
+    def __call__(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self[name] = self.get(name, 0.0) + time.perf_counter() - start
+
+
+class Simulator(object):
+    _current = None
+
+    @classmethod
+    def current(cls):
+        ''' Last created simulator, for code written when Simulator was a singleton '''
+        return cls._current
+
+    def __init__(self, t_arch=Architecture.CortexM4, log_root=None, trace=False):
+        start = time.perf_counter()
+        # start up time by phase, see loadChunks and thumb2ISS.loadImage
+        self.phases = Phases()
+        Simulator._current = self
+        self.core = None
+        self.monitors = []
         self.t_arch = t_arch
+        self.trace = trace
         if log_root is not None:
             self.log = log_root.getChild('Sim')
         else:
@@ -38,6 +180,7 @@ class Simulator(object, metaclass=Singleton):
                 lambda m: self.genConst(int(m.group('address'), 16), m.group('values'), '.table')),
         ]
         self.mnem_extract = re.compile(r'(?P<mnem>\w+?)(?:[ACEGHLMNPV][CEILQST])?(?:\.[NW])?', re.I)
+        self.phases['simulator'] = time.perf_counter() - start
 
 
     def genLbl(self, label, address):
@@ -61,11 +204,65 @@ class Simulator(object, metaclass=Singleton):
         full_assembly = f'{mnemonic}'
         if args is not None:
             full_assembly+=f' {args}'
-        mnemonic = mnemonic.split('.')[0]
-        self.log.getChild('genIsn').debug(f'Get Execution for <{mnemonic}> ({full_assembly}) {self.core}')
-        self.code[address] = (self.core.getExec(mnemonic, full_assembly, address, self.timings_logic), len(data))
+        cond = self.decoder.condition(data, address)
+        self.genExec(address, RawInstruction(data, cond, full_assembly), len(data))
         self.dis[address] = f'    {full_assembly}'
 
+    def genCode(self, start, data):
+        self.log.getChild('genCode').debug(f'Decoding code from {hex(start)} to {hex(start+len(data)-1)}')
+        offset = 0
+        while offset + 2 <= len(data):
+            address = start + offset
+            length = instructionLength(data[offset] | data[offset+1] << 8)
+            encoding = bytes(data[offset:offset+length])
+            if len(encoding) < length:
+                break
+            cond = self.decoder.condition(encoding, address)
+            self.genExec(address, RawInstruction(encoding, cond, None), length)
+            self.dis[address] = (encoding, cond)
+            offset += length
+
+    def genExec(self, address, instruction, length):
+        self.instructions[address] = (instruction, length)
+        if self.lazy:
+            self.code[address] = (self.lazyExec(address, instruction, length), length)
+        else:
+            self.code[address] = (self.buildExec(address, instruction), length)
+
+    def resolveInstruction(self, address, instruction):
+        ''' Decoded instruction, assembly text when its encoding is unknown to the decoder, encoding alone when undefined '''
+        decoded = decode(instruction.encoding, address, instruction.cond)
+        if decoded is not None:
+            return decoded
+        if instruction.assembly is not None:
+            return instruction.assembly
+        return instruction.encoding
+
+    def buildExec(self, address, instruction):
+        if type(instruction) is RawInstruction:
+            instruction = self.resolveInstruction(address, instruction)
+            self.instructions[address] = (instruction, self.instructions[address][1])
+        core = self.core
+        if type(instruction) is str:
+            # encoding unknown to the decoder, fall back on assembly text
+            mnemonic = instruction.split(' ')[0].split('.')[0]
+            self.log.getChild('genIsn').debug(f'Get Execution for <{mnemonic}> ({instruction}) {core}')
+            return core.getExec(mnemonic, instruction, address, self.timings_logic)
+        if type(instruction) is bytes:
+            return core.getUndefinedExec(instruction, address)
+        return core.getDecodedExec(instruction, address, self.timings_logic)
+
+    def lazyExec(self, address, instruction, length):
+        def lazy_exec():
+            # build actual execution on first fetch and replace this one by it
+            entry = (self.buildExec(address, instruction), length)
+            if address in self.breakpoints:
+                self.breakpoints[address] = entry
+            else:
+                self.code[address] = entry
+            return entry[0]()
+        return lazy_exec
+
     def genConst(self, address, value_str, data_type):
         self.log.getChild('genConst').debug(f'Creating Constant @{hex(address)} : {value_str}')
         if data_type != '.table':
@@ -83,42 +280,157 @@ class Simulator(object, metaclass=Singleton):
                 else:
                     data+= raw_data
         self.log.getChild('genConst').debug(f'Got {len(data)} from {hex(address)} to {hex(address+len(data)-1)}')
-        for i in range(len(data)):
-            self.memory[address+i] = data[i:i+1]
+        self.const_data.append((address, data))
 
-    def load(self, disassembly, rom_memory, rom_start, ram_memorys, profile=False):
+    def load(self, disassembly, rom_memory, rom_start, ram_memorys, profile=False, lazy=False, cache_dir=None):
+        # rom_memory may be an mmap (see memory.mapFile), then used without any copy
+        # lazy defers instruction decoding to their first execution
+        # cache_dir keeps decoded programs across runs, see loadChunks
+        self.rom_start = rom_start
+        return self.loadChunks(disassembly, [(rom_start, rom_memory)] + list(ram_memorys), [], profile, lazy=lazy, cache_dir=cache_dir)
+
+    def loadElf(self, elf, disassembly=None, rom_memory=None, profile=False, lazy=False, cache_dir=None):
+        # memory layout and labels are taken from elf.ElfFile, rom_memory optionally replaces loadable segments content
+        # without disassembly, code is decoded from elf executable sections
+        with self.phases('image'):
+            rom_chunks = elf.romChunks()
+            self.rom_start = min(address for address, _ in rom_chunks)
+            if rom_memory is not None:
+                rom_chunks = [(self.rom_start, rom_memory)]
+            code_chunks = elf.thumbChunks() if disassembly is None else []
+            memory_chunks = elf.ramChunks() + rom_chunks
+            symbols = elf.codeSymbols()
+        return self.loadChunks(disassembly, memory_chunks, symbols, profile, code_chunks, lazy, cache_dir)
+
+    def loadChunks(self, disassembly, memory_chunks, symbols, profile=False, code_chunks=(), lazy=False, cache_dir=None):
+        # with cache_dir, decoded program (instructions, labels, disassembly and constants) is stored in a file
+        # named after the hash of disassembly, code and symbols, then reloaded instead of parsing and decoding.
+        # Lazy decoding of code chunks alone is faster than reloading it, such programs are not cached
         self.labels = {}
         self.label_by_address = {}
-        self.memory = {}
+        self.memory = MemoryMap()
+        self.const_data = []
         self.code   = {}
-        self.dis    = {}
+        self.dis    = Disassembly()
+        self.instructions = {}
+        self.blocks = {}
         self.breakpoints = {}
-        self.core = Core(self.log, profile=profile)
+        self.host_calls = {}    # routine name by entry address, see accelerate
+        self.host_check = False
+        self.monitors = []      # notified of every executed instruction, see Profiler and Tracer
+        self.lazy = lazy
+        phases = self.phases
+        with phases('instruction tables'):
+            # imported by the first core only
+            from .instructions import _all
+        with phases('core'):
+            self.core = core = Core(self.log, profile=profile, trace=self.trace)
+            self.decoder = Decoder()
         self.cycles = {'step' : 0, 'total': 0}
-        
-        for line in disassembly.splitlines():
-            if len(line.strip()) > 0:
-                for pat, action in self.dis_patt:
-                    m = pat.match(line.lower())
-                    if m is not None:
-                        action(m)
-                        break
-        self.core = None
-        self.rom_start = rom_start
-        self.memory.update({rom_start+i : rom_memory[i:i+1] for i in range(len(rom_memory))})
-        for ram_start, ram_memory in ram_memorys:
-            self.memory.update({ram_start+i : ram_memory[i:i+1] for i in range(len(ram_memory))})
-
-        self.address_ranges = [[v for _,v in g] for _,g in groupby(enumerate(sorted(self.memory.keys())), lambda x:x[0]-x[1])]
-        self.address_limits = []
-        for crange in self.address_ranges:
-            self.address_limits += [(min(crange), max(crange))]
+        # count of executed instructions
+        self.retired = 0
+
+        cache_file = None
+        if cache_dir is not None and (disassembly or not lazy):
+            cache_file = os.path.join(cache_dir, self.programHash(disassembly, code_chunks, symbols) + '.json')
+        cached = False
+        if cache_file is not None:
+            with phases('cache load'):
+                cached = self.loadCache(cache_file)
+        if not cached:
+            with phases('disassembly'):
+                for line in (disassembly or '').splitlines():
+                    if len(line.strip()) > 0:
+                        for pat, action in self.dis_patt:
+                            m = pat.match(line.lower())
+                            if m is not None:
+                                action(m)
+                                break
+            with phases('decoding'):
+                for address, data in code_chunks:
+                    self.genCode(address, data)
+            with phases('labels'):
+                for label, address in symbols:
+                    self.genLbl(label.lower(), address)
+            if cache_file is not None:
+                with phases('cache store'):
+                    self.saveCache(cache_file)
+        with phases('memory'):
+            # constants found in disassembly are overridden by actual memory content
+            self.memory.load(self.const_data + memory_chunks)
+            self.const_data = []
+            self.address_limits = self.memory.limits()
+
+        with phases('reset'):
+            self.reset()
+        return True
 
-        self.reset()
+    def programHash(self, disassembly, code_chunks, symbols):
+        h = hashlib.sha256(f'{cache_format} {__version__}'.encode())
+        h.update((disassembly or '').encode())
+        for address, data in code_chunks:
+            h.update(struct.pack('<LL', address, len(data)))
+            h.update(data)
+        h.update(repr(list(symbols)).encode())
+        return h.hexdigest()
+
+    def loadCache(self, cache_file):
+        ''' Decoded program stored by saveCache : plain data only, decoded instructions being rebuilt from it '''
+        try:
+            with open(cache_file, 'r') as f:
+                program = json.load(f)
+            labels = {name: int(address) for name, address in program['labels']}
+            label_by_address = {int(address): name for address, name in program['label_by_address']}
+            const_data = [(int(address), bytes.fromhex(data)) for address, data in program['const_data']]
+            dis = {int(address): text if cond is False else (bytes.fromhex(text), cond) for address, text, cond in program['dis']}
+            instructions = [(int(address), Decoded(mnem, factory, Operands(operands), dict(bitdiffs), int(length)), int(length))
+                for address, mnem, factory, operands, bitdiffs, length in program['decoded']]
+            instructions += [(int(address), text, int(length)) for address, text, length in program['assembly']]
+            instructions += [(int(address), bytes.fromhex(encoding), int(length)) for address, encoding, length in program['undefined']]
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.log.warning(f'Ignoring unreadable cache {cache_file} ({e})')
+            return False
+        self.log.getChild('loadCache').debug(f'Loading decoded program from {cache_file}')
+        self.labels = labels
+        self.label_by_address = label_by_address
+        self.const_data = const_data
+        self.dis.update(dis)
+        for address, instruction, length in sorted(instructions, key=lambda x: x[0]):
+            self.genExec(address, instruction, length)
         return True
 
+    def saveCache(self, cache_file):
+        self.log.getChild('saveCache').debug(f'Storing decoded program in {cache_file}')
+        program = {
+            'labels' : list(self.labels.items()),
+            'label_by_address' : list(self.label_by_address.items()),
+            'const_data' : [(address, bytes(data).hex()) for address, data in self.const_data],
+            # assembly text, or encoding and IT condition of text formatted on first access (see Disassembly)
+            'dis' : [(address, text, False) if type(text) is str else (address, text[0].hex(), text[1]) for address, text in dict.items(self.dis)],
+            'decoded' : [],     # (address, mnem, factory, operands, bitdiffs, length)
+            'assembly' : [],    # (address, text, length) of encodings unknown to the decoder
+            'undefined' : [],   # (address, encoding, length)
+        }
+        for address, (instruction, length) in self.instructions.items():
+            if type(instruction) is RawInstruction:
+                instruction = self.resolveInstruction(address, instruction)
+            if type(instruction) is str:
+                program['assembly'].append((address, instruction, length))
+            elif type(instruction) is bytes:
+                program['undefined'].append((address, instruction.hex(), length))
+            else:
+                program['decoded'].append((address, instruction.mnem, instruction.factory, instruction.operands, instruction.bitdiffs, length))
+        os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+        # concurrent runs may store the same program, the last one wins
+        tmp_file = f'{cache_file}.{os.getpid()}'
+        with open(tmp_file, 'w') as f:
+            json.dump(program, f, separators=(',', ':'))
+        os.replace(tmp_file, cache_file)
+
     def reset(self):
-        core = Core(self.log)
+        core = self.core
         if '__vectors' in self.labels:
             vector_table = self.labels['__vectors']
         elif '__vector_table' in self.labels:
@@ -136,32 +448,257 @@ class Simulator(object, metaclass=Singleton):
                 vector_table = self.rom_start
             
         # get initial sp & inital pc from vector table
-        byte_seq = b''.join(self.memory[i] for i in range(vector_table, vector_table + 8))
-        initial_sp, initial_pc = struct.unpack('<LL', byte_seq)
+        initial_sp, initial_pc = struct.unpack('<LL', self.memory.readBytes(vector_table, 8))
         core.configure(initial_pc, initial_sp, self.memory)
         self.cycles = {'step' : 0, 'total': 0}
+        # count of executed instructions
+        self.retired = 0
+
+    def snapshot(self, path=None):
+        ''' Complete simulation state (registers, flags, memory, semihosting handles, counters) as plain values,
+            also written to path if given (see writeSnapshot). Program is not part of it : snapshot is restored on a
+            simulator having loaded the same image '''
+        snapshot = {
+            'format' : snapshot_format,
+            'core' : self.core.saveState(),
+            'memory' : self.memory.snapshot(),
+            'cycles' : dict(self.cycles),
+            'retired' : self.retired,
+        }
+        if path is not None:
+            writeSnapshot(path, snapshot)
+        return snapshot
+
+    def restore(self, snapshot):
+        ''' Resumes simulation from snapshot, given as returned by snapshot or as the path of a snapshot file '''
+        if type(snapshot) is not dict:
+            snapshot = readSnapshot(snapshot)
+        if snapshot.get('format') != snapshot_format:
+            raise Exception(f'Unsupported snapshot format {snapshot.get("format")}')
+        self.memory.restore(snapshot['memory'])
+        self.core.restoreState(snapshot['core'])
+        self.cycles = dict(snapshot['cycles'])
+        self.retired = snapshot['retired']
 
     def step_in(self):
-        core = Core(self.log)
-        ex, pc_step = self.code[core.getPC()]
+        core = self.core
+        self.cycles['step'] = 0
+        self.execInstruction(core, core.getPC())
+
+    def step_block(self):
+        ''' Executes instructions up to the end of the basic block at PC, returns the count of executed instructions '''
+        core = self.core
+        self.cycles['step'] = 0
+        return self.execBlock(core, core.getPC())
+
+    def execInstruction(self, core, pc):
+        ex, pc_step = self.code[pc]
         if ex == 'break':
             # execute original instruction
-            ex, pc_step = self.breakpoints[core.getPC()]
+            ex, pc_step = self.breakpoints[pc]
         base_cnt = ex()
+        self.retired += 1
         cycle_adder, branch_penalty = core.incPC(pc_step)
         cycle_cnt = base_cnt + cycle_adder
         if branch_penalty:
             cycle_cnt += self.timings_logic._branch_penalty
-        self.cycles['step'] = cycle_cnt
+        self.cycles['step'] += cycle_cnt
         self.cycles['total'] += cycle_cnt
+        for monitor in self.monitors:
+            monitor.record(pc, pc_step, cycle_cnt)
+        return branch_penalty
+
+    def execBlock(self, core, pc):
+        if pc in self.host_calls:
+            return self.hostCall(core, pc)
+        block = self.blocks.get(pc, 0)
+        if type(block) is int:
+            if block < hot_block_count:
+                self.blocks[pc] = block + 1
+                return self.stepBlock(core, pc)
+            block = self.blocks[pc] = self.compileBlock(core, pc)
+        if block is False or core.APSR.ITsteps > 0:
+            # IT blocks are single stepped
+            self.execInstruction(core, pc)
+            return 1
+        return block(self.cycles)
+
+    def stepBlock(self, core, pc):
+        # single steps up to next taken branch or breakpoint
+        count = 1
+        while not self.execInstruction(core, pc) and count < max_block_length:
+            pc = core.getPC()
+            if pc in self.breakpoints or pc in self.host_calls:
+                break
+            count += 1
+        return count
+
+    def compileBlock(self, core, start):
+        ''' Generates a function executing instructions from start up to next branch, breakpoint or IT instruction,
+            as step_in would do for each of them, completed instructions being retired even when one of them raises
+            (end of execution). Returns False when instruction at start has to be single stepped.
+
+            Once an instruction neither reading memory nor touching PC went through incPC, pipeline state
+            (pending load, stall, PC update) is settled. Following register-only or store instructions are then
+            fused with it : their incPC is inlined as a PC increment and their store cycles, which is all it would do.
+            Only the list of updated registers, used when a load follows, is left to be cleared afterwards.
+
+            Common fused register-only instructions (see inline.inlined) are not called but generated as straight
+            line code, on registers held in locals. Registers, PC, cycles and retired count are written back before
+            anything else runs and at block exit. '''
+        if core.profile or len(self.monitors) > 0 or start in self.breakpoints:
+            return False
+        actions = []
+        source = []
+        address = start
+        settled = False         # pipeline state settled by previous instruction
+        dirty = False           # updated registers of fused instructions still listed
+        regs = RegisterLocals()
+        deferred = [0, 0, None] # PC increment, cycles and retired count of generated instructions
+
+        def writeBack():
+            lines = regs.flush()
+            if deferred[0]:
+                lines.append(f'R[15] += {deferred[0]}')
+            if deferred[1]:
+                lines.append(f'c += {deferred[1]}')
+            if deferred[2] is not None:
+                lines.append(f'n = {deferred[2]}')
+            deferred[:] = [0, 0, None]
+            return ['        ' + line for line in lines]
+
+        while len(actions) < max_block_length and address in self.code and address not in self.breakpoints \
+                and address not in self.host_calls:
+            ex, length = self.code[address]
+            if not hasattr(ex, 'action'):
+                # not decoded yet
+                ex = self.buildExec(address, self.instructions[address][0])
+                self.code[address] = (ex, length)
+            instruction = self.instructions[address][0]
+            if type(instruction) is bytes or getattr(instruction, 'mnem', None) == 'IT' or str(instruction).startswith('it'):
+                break
+            i = len(actions)
+            actions.append(ex.action)
+            kind = fusionKind(instruction)
+            if settled and kind == 'alu' and not core.trace and inlined(instruction):
+                source += ['        ' + line for line in inlineSource(instruction, core.reg_num, regs)]
+                deferred[0] += length
+                deferred[1] += ex.timing
+                deferred[2] = i + 1
+            elif settled and kind is not None:
+                source += writeBack()
+                source += [
+                    f'        a{i}()',
+                    f'        n = {i + 1}',
+                    f'        R[15] += {length}',
+                ]
+                if kind == 'store':
+                    source += [
+                        f'        c += {ex.timing} + core._store_result',
+                        f'        core._store_result = 0',
+                    ]
+                else:
+                    source += [f'        c += {ex.timing}']
+                dirty = True
+            else:
+                source += writeBack()
+                if dirty:
+                    source += [f'        core.lastUpdatedRegs = []']
+                    dirty = False
+                source += [
+                    f'        a{i}()',
+                    f'        n = {i + 1}',
+                    f'        x, p = incPC({length})',
+                    f'        c += {ex.timing} + x',
+                    f'        if p:',
+                    f'            c += penalty',
+                    f'            return n',
+                ]
+            settled = kind is not None
+            address += length
+            if endsBlock(instruction):
+                break
+        if len(actions) == 0:
+            return False
+
+        source += writeBack()
+        if dirty:
+            source += [f'        core.lastUpdatedRegs = []']
+        args = ', '.join(f'a{i}' for i in range(len(actions)))
+        source = [
+            f'def make(sim, core, incPC, penalty, {args}):',
+            f'    def block_{start:08x}(cycles):',
+            f'        R = core.R',
+            f'        apsr = core.APSR',
+            f'        c = 0',
+            f'        n = 0',
+            f'        try:',
+        ] + ['    ' + line for line in source] + [
+            f'            return n',
+            f'        finally:',
+            f'            cycles[\'step\'] += c',
+            f'            cycles[\'total\'] += c',
+            f'            sim.retired += n',
+            f'    return block_{start:08x}',
+        ]
+        self.log.getChild('compileBlock').debug(f'Compiling block of {len(actions)} instructions from {hex(start)} to {hex(address - 1)}')
+        namespace = {}
+        exec(compile('\n'.join(source), f'<block {hex(start)}>', 'exec'), namespace)
+        return namespace['make'](self, core, core.incPC, self.timings_logic._branch_penalty, *actions)
+
+    def accelerate(self, names=(), check=False):
+        ''' Runs routines of given names (see hostlib.routines) natively when entered by run or step_block,
+            instead of simulating them. In check mode, they are simulated anyway, and their result (r0 and
+            written memory) is compared to the native one. Routines of previous call are no longer accelerated '''
+        unknown = [name for name in names if name not in hostlib.routines]
+        if len(unknown) > 0:
+            raise Exception(f'No host implementation of {", ".join(unknown)}')
+        self.host_calls = {self.labels[name]: name for name in names if name in self.labels}
+        self.host_check = check
+        # compiled blocks may run through routines entries
+        self.blocks = {}
+        return list(self.host_calls.values())
+
+    def hostCall(self, core, pc):
+        ''' Runs routine entered at pc natively, up to its return, returns the count of executed instructions '''
+        name = self.host_calls[pc]
+        R = core.R
+        result, write, size = hostlib.routines[name](self.memory, R[0], R[1], R[2])
+        if self.host_check:
+            return self.checkHostCall(core, pc, name, result, write, size)
+        if write is not None:
+            self.memory.writeBytes(*write)
+        core.writeR(0, result)
+        R[15] = R[14] & 0xfffffffe
+        self.retired += 1
+        cycle_cnt = hostlib.cycleCost(name, size)
+        self.cycles['step'] += cycle_cnt
+        self.cycles['total'] += cycle_cnt
+        for monitor in self.monitors:
+            monitor.record(pc, 0, cycle_cnt)
+        return 1
+
+    def checkHostCall(self, core, pc, name, result, write, size):
+        return_address, sp = core.getLR() & 0xfffffffe, core.R[13]
+        cycles = self.cycles['total']
+        count = 1
+        self.execInstruction(core, pc)
+        while core.getPC() != return_address or core.R[13] != sp:
+            count += self.execBlock(core, core.getPC())
+        self.log.getChild('hostCall').debug(f'{name} processed {size} bytes in {self.cycles["total"] - cycles} cycles (modeled as {hostlib.cycleCost(name, size)})')
+        if core.R[0] != result:
+            raise Exception(f'Host {name} called from {hex(return_address)} returned {hex(result)} instead of {hex(core.R[0])}')
+        if write is not None and self.memory.readBytes(write[0], len(write[1])) != write[1]:
+            raise Exception(f'Host {name} called from {hex(return_address)} wrote different data at {hex(write[0])}')
+        return count
 
     def step_out(self):
-        core = Core(self.log)
+        core = self.core
         # set breakpoint at LR address & run
         self.run_until(core.getLR() & 0xfffffffe)
 
     def step_over(self):
-        core = Core(self.log)
+        core = self.core
         cur_pc = core.getPC()
         # set breakpoint at PC + inc & run
         _, pc_step = self.code[cur_pc]
@@ -172,26 +709,23 @@ class Simulator(object, metaclass=Singleton):
         self.run()
         self.removeBreakpoint(address)        
 
-    def run(self):
-        core = Core(self.log)
-        step_cnt = 0
-        self.cycles['step'] = 0
-        while True:
+    def run(self, max_cycles=None, max_instructions=None):
+        ''' Runs up to next breakpoint, or until total cycles or executed instructions reach given limits.
+            Limits are checked between blocks, so they may be exceeded by the last block.
+            Returns the count of executed instructions '''
+        core = self.core
+        breakpoints = self.breakpoints
+        cycles = self.cycles
+        cycle_limit = max_cycles if max_cycles is not None else float('inf')
+        instruction_limit = max_instructions if max_instructions is not None else float('inf')
+        start = self.retired
+        cycles['step'] = 0
+        while self.retired - start < instruction_limit and cycles['total'] < cycle_limit:
             cur_pc = core.getPC()
-            ex, pc_step = self.code[cur_pc]
-            if ex == 'break':
-                if step_cnt > 0: # do not break on first instruction
-                    break
-                # execute original instruction
-                ex, pc_step = self.breakpoints[cur_pc]
-            base_cnt = ex()
-            cycle_adder, branch_penalty = core.incPC(pc_step)
-            cycle_cnt = base_cnt + cycle_adder
-            if branch_penalty:
-                cycle_cnt += self.timings_logic._branch_penalty
-            self.cycles['step'] += cycle_cnt
-            self.cycles['total'] += cycle_cnt
-            step_cnt+=1
+            if cur_pc in breakpoints and self.retired > start: # do not break on first instruction
+                break
+            self.execBlock(core, cur_pc)
+        return self.retired - start
 
 
     def getBreakPoints(self):
@@ -204,7 +738,7 @@ class Simulator(object, metaclass=Singleton):
         return self.label_by_address.get(address, None)
 
     def getRegisters(self):
-        core = Core(self.log)
+        core = self.core
         reg_list = [(f'R{i:<2}', f'0x{core.UInt(core.R[i]):08x}') for i in range(13)]
         reg_list+= [('SP ', f'0x{core.UInt(core.R[13]):08x}')]
         reg_list+= [('LR ', f'0x{core.UInt(core.R[14]):08x}')]
@@ -212,7 +746,7 @@ class Simulator(object, metaclass=Singleton):
         return reg_list, str(core.APSR)
 
     def getDisassemblyAroundPC(self, before, after):
-        core = Core(self.log)
+        core = self.core
         cur_pc = core.getPC()
         lines = [(a, self.dis[a]) for a in range(cur_pc+before*2, cur_pc+after*2, 2) if a in self.dis]
         final_lines = []
@@ -226,10 +760,7 @@ class Simulator(object, metaclass=Singleton):
         return final_lines
 
     def isAddressValid(self, address):
-        for minaddr,maxaddr in self.address_limits:
-            if minaddr <= address <= maxaddr:
-                return True
-        return False
+        return self.memory.isAddressValid(address)
 
     def addBreakpoint(self, address):
         if address not in self.breakpoints and address in self.code:
@@ -239,6 +770,7 @@ class Simulator(object, metaclass=Singleton):
             self.dis[address] = 'x'+self.dis[address][1:]
             # store breakpoint info 
             self.breakpoints[address] = (prev_exec, pc_step)
+            self.blocks = {}
 
     def removeBreakpoint(self, address):
         if address in self.breakpoints:
@@ -246,6 +778,7 @@ class Simulator(object, metaclass=Singleton):
             self.code[address] = (prev_exec, pc_step)
             self.dis[address] = ' '+self.dis[address][1:]
             del self.breakpoints[address]
+            self.blocks = {}
 
 if __name__ == '__main__':
     from intelhex import IntelHex
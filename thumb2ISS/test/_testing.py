@@ -8,7 +8,8 @@
 #
 import os,sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from thumb2ISS.core import Core, Register
+from thumb2ISS.core import Core
+from thumb2ISS.memory import MemoryMap
 
 os.chdir('..')
 
@@ -16,10 +17,10 @@ os.chdir('..')
 def setup(c, initial_mem={}, intial_regs={13:0x20001000, 15:0}):
     for k in intial_regs:
         intial_regs[k] = c.Field(intial_regs[k])
-    c.configure(intial_regs[15], intial_regs[13], initial_mem)
+    c.configure(intial_regs[15], intial_regs[13], MemoryMap(initial_mem.items()))
     for i in list(range(13))+[14]:
         if i in intial_regs:
-            c.R[i] = Register(intial_regs[i])
+            c.R[i] = intial_regs[i]
 
 # default test : no memory access, 0 in registers
 def test(c, steps, initial_mem={}, intial_regs={13:0x20001000, 15:0}):
@@ -0,0 +1,27 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os
+import _testing
+from thumb2ISS.batch import simulateImage, runBatch
+
+if __name__ == '__main__':
+    demo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out')
+
+    result = simulateImage(demo)
+    assert(result['reason'] == 'exit' and result['exit_code'] == 0 and result['error'] is None)
+    assert(result['cycles'] == 6712)
+    assert(0 < result['instructions'] < result['cycles'])
+    assert(result['stdout'] == 'hello, world\n')
+
+    # images are reported in submission order, whatever the worker running them
+    results = list(runBatch([demo, 'missing.out', demo], jobs=2))
+    assert([r['image'] for r in results] == [demo, 'missing.out', demo])
+    assert([r['reason'] for r in results] == ['exit', 'error', 'exit'])
+    assert(results[2]['cycles'] == result['cycles'] and results[2]['stdout'] == result['stdout'])
+    assert(results[1]['error'].startswith('FileNotFoundError'))
@@ -0,0 +1,51 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os, io, json, tempfile
+import _testing
+from thumb2ISS.bench import bench_dir, measureWorkload, runSuite, readHistory, newRecord, compareHistory, writeReport
+
+# every workload checks its own results
+workload = os.path.join(bench_dir, 'divide.out')
+measures = measureWorkload(workload, repeat=2)
+assert(measures['status'] == 'ok')
+assert(measures['instructions'] > 100000 and measures['cycles'] > measures['instructions'])
+assert(measures['mips'] > 0 and measures['load_time'] > 0 and measures['run_time'] > 0)
+assert(abs(measures['mips'] - measures['instructions'] / measures['run_time'] / 1e6) < 1e-9)
+
+# a workload not ending with "ok" fails
+demo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out')
+(name, failed), = runSuite([demo], repeat=1)
+assert(name == 'hello_world-cm4' and failed['status'] == 'exit: hello, world')
+
+# regressions against median of history window, behavior changes against last record
+workloads = {'divide': measures}
+history = []
+for mips in [2.0, 2.0, 2.0, 1.0, 1.0]:
+    record = newRecord({'divide': dict(measures, mips=mips * measures['mips'])}, 'M4')
+    history.append(json.loads(json.dumps(record)))
+assert(compareHistory(workloads, [], window=3) == {})
+baseline, ratio, regressed, changed = compareHistory(workloads, history, window=3)['divide']
+assert(abs(baseline - measures['mips']) < 1e-9 and abs(ratio - 1) < 1e-9 and not regressed and not changed)
+baseline, ratio, regressed, changed = compareHistory(workloads, history[:3], window=3)['divide']
+assert(abs(ratio - 0.5) < 1e-9 and regressed)
+assert(not compareHistory(workloads, history[:3], window=3, tolerance=0.6)['divide'][2])
+history[-1]['workloads']['divide']['cycles'] += 1
+assert(compareHistory(workloads, history)['divide'][3])
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, 'history.jsonl')
+    assert(readHistory(path) == [])
+    with open(path, 'w') as f:
+        for record in history:
+            print(json.dumps(record), file=f)
+    assert(readHistory(path) == history)
+
+report = io.StringIO()
+writeReport({'divide': measures, 'hello': failed}, compareHistory(workloads, history[:3], window=3), report)
+assert('REGRESSION' in report.getvalue() and 'exit: hello, world' in report.getvalue())
@@ -0,0 +1,51 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import struct
+from _testing import Core
+from thumb2ISS.sim import Simulator
+
+code = struct.pack('<10H',
+    0x2000,     # 08: movs r0, #0
+    0x2164,     # 0a: movs r1, #100
+    0x3001,     # 0c: adds r0, #1
+    0x2832,     # 0e: cmp r0, #50
+    0xbfa8,     # 10: it ge
+    0x3001,     # 12: addge r0, #1
+    0x3901,     # 14: subs r1, #1
+    0xd1f9,     # 16: bne.n 0c
+    0xbf00,     # 18: nop
+    0xe7fe)     # 1a: b.n 1a
+image = struct.pack('<LL', 0x20001000, 0x9) + code
+
+s = Simulator()
+
+results = []
+for step in [s.step_in, s.step_block]:
+    s.loadChunks(None, [(0, image), (0x20000000, bytes(0x1000))], [('__vectors', 0)], code_chunks=[(8, code)])
+    c = s.core
+    count = 0
+    while c.getPC() != 0x18:
+        count += step() or 1
+    results.append((count, s.cycles['total'], c.UInt(c.R[0]), c.UInt(c.R[1])))
+
+assert(results[0] == results[1])
+assert(results[0][2] == 151)
+# IT instruction is single stepped, block stops before it
+assert(s.blocks[0x10] is False)
+assert(0x0c in s.blocks)
+
+# run stops on breakpoint located inside a block
+s.reset()
+s.addBreakpoint(0x14)
+s.run()
+assert(c.getPC() == 0x14)
+assert(c.UInt(c.R[0]) == 1 and c.UInt(c.R[1]) == 100)
+s.run()
+assert(c.getPC() == 0x14)
+assert(c.UInt(c.R[0]) == 2 and c.UInt(c.R[1]) == 99)
@@ -0,0 +1,49 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os
+import _testing
+from thumb2ISS.sim import Simulator, EndOfExecutionException, max_block_length
+from thumb2ISS.thumb2ISS import loadImage, execute, run
+from thumb2ISS.batch import batch
+from thumb2ISS.fanout import fanout
+
+demo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out')
+s = Simulator()
+
+assert(loadImage(s, demo))
+assert(execute(s) == ('exit', 3785))
+assert(s.cycles['total'] == 6712)
+
+# instructions of the block raising end of execution are retired, as when single stepped
+assert(loadImage(s, demo))
+try:
+    while True:
+        s.step_in()
+except EndOfExecutionException:
+    pass
+assert(s.retired == 3785 and s.cycles['total'] == 6712)
+
+# host wall-clock timeout, which is not deterministic, is opt-in
+assert(all([p.default for p in command.params if p.name == 'timeout'] == [None] for command in [run, batch, fanout]))
+
+# budgets stop simulation at the same point on every run, whatever the timeout
+results = []
+for timeout in [0, 10, 0]:
+    assert(loadImage(s, demo))
+    results.append((execute(s, timeout, max_cycles=1000), s.cycles['total'], s.core.getPC()))
+assert(results[0] == results[1] == results[2])
+assert(results[0][0][0] == 'cycle-limit' and 1000 <= results[0][1] < 1000 + 4 * max_block_length)
+
+assert(loadImage(s, demo))
+reason, instructions = execute(s, 10, max_instructions=1000)
+assert(reason == 'instruction-limit' and 1000 <= instructions < 1000 + max_block_length)
+
+# run without breakpoint stops on its own budget
+assert(loadImage(s, demo))
+assert(s.run(max_instructions=10) == s.retired >= 10)
@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os
+import io
+import json
+import pickle
+import time
+import tempfile
+import contextlib
+from _testing import Core
+from thumb2ISS.sim import Simulator
+from thumb2ISS.decoder import Decoded
+from thumb2ISS.elf import ElfFile
+from thumb2ISS.thumb2ISS import loadImage, execute
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+elf = ElfFile(os.path.join(root, 'demo', 'hello_world-cm4.out'))
+main = dict(elf.codeSymbols())['main']
+
+def loadTime(elf, cache_dir):
+    ''' Best load time of a lazily decoded image '''
+    times = []
+    for _ in range(5):
+        start = time.perf_counter()
+        Simulator().loadElf(elf, lazy=True, cache_dir=cache_dir)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+with tempfile.TemporaryDirectory() as cache_dir:
+    # lazily decoded images are faster to decode again than to reload, they are not cached
+    uncached = loadTime(elf, None)
+    cached = loadTime(elf, cache_dir)
+    assert(len(os.listdir(cache_dir)) == 0)
+    assert(cached < 1.5 * uncached)
+
+    results = []
+    for run in range(2):
+        s = Simulator()
+        s.loadElf(elf, lazy=False, cache_dir=cache_dir)
+        c = s.core
+        assert(len(os.listdir(cache_dir)) == 1)
+        # first run decodes image, second one reloads decoded program
+        assert(('decoding' in s.phases) == (run == 0))
+        assert(set(type(instruction) for instruction, _ in s.instructions.values()) == {Decoded})
+        assert(s.labels['main'] == main)
+        assert(s.dis[main] == '    push {r3, lr}')
+        s.run_until(main)
+        results.append((s.cycles['total'], c.getPC(), c.UInt(c.R[13]), c.getLR()))
+    assert(results[0] == results[1])
+
+    # decoded program is stored as plain data
+    cache_file = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    with open(cache_file, 'r') as f:
+        program = json.load(f)
+    decoded = {record[0]: record[1:] for record in program['decoded']}
+    assert(decoded[main] == ['PUSH', 'aarch32_PUSH_T1_A', {'registers': 'r3, lr'}, {'M': '1'}, 2])
+
+    # unreadable cache is ignored, then stored again
+    with open(cache_file, 'wb') as f:
+        f.write(pickle.dumps(s.instructions))
+    s = Simulator()
+    s.loadElf(elf, lazy=False, cache_dir=cache_dir)
+    assert('decoding' in s.phases)
+    with open(cache_file, 'r') as f:
+        assert(json.load(f) == program)
+
+    # another image does not hit the cache
+    Simulator().loadElf(ElfFile(os.path.join(root, 'bench', 'crc.out')), lazy=False, cache_dir=cache_dir)
+    assert(len(os.listdir(cache_dir)) == 2)
+
+    # assembly text of hex images is reloaded as such (companion files are found in current directory)
+    os.chdir(root)
+    hex_file = 'Hello.hex'
+    results = []
+    for run in range(2):
+        s = Simulator()
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            assert(loadImage(s, hex_file, cache_dir=cache_dir))
+            results.append((execute(s, 0), s.cycles['total'], stdout.getvalue(), dict(s.dis.items())))
+    assert(results[0] == results[1] and results[0][2].endswith('Hello World'))
+    assert(len(os.listdir(cache_dir)) == 3)
@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import random
+from _testing import Core
+from thumb2ISS.core_routines import condition_codes, condition_table
+c = Core()
+
+# condition table matches the architecture definition of each condition, for every flags value
+for nzcv in range(16):
+    c.APSR.nzcv = nzcv
+    N, Z, C, V = c.APSR.N, c.APSR.Z, c.APSR.C, c.APSR.V
+    expected = {'eq': Z, 'ne': not Z, 'cs': C, 'hs': C, 'cc': not C, 'lo': not C, 'mi': N, 'pl': not N,
+        'vs': V, 'vc': not V, 'hi': C and not Z, 'ls': not C or Z, 'ge': N == V, 'lt': N != V,
+        'gt': not Z and N == V, 'le': Z or N != V, 'al': True, 'nv': True}
+    for name, passed in expected.items():
+        assert(c.ConditionPassed(condition_codes[name]) == passed)
+assert(c.ConditionPassed(None))
+
+# flags are bits of nzcv
+c.APSR.nzcv = 0
+c.APSR.C = True
+c.APSR.N = 1
+assert(c.APSR.nzcv == 0b1010)
+c.APSR.N = False
+assert(c.APSR.nzcv == 0b0010 and c.APSR.C and not c.APSR.N)
+
+# flags of additions are computed when read, as defined from unsigned and signed sums
+random.seed(0)
+for _ in range(2000):
+    x, y, carry = random.choice([0, 1, 0x7fffffff, 0x80000000, 0xffffffff, random.getrandbits(32)]), random.getrandbits(32), random.getrandbits(1)
+    (result, flags) = c.AddWithCarry(x, y, carry)
+    c.APSR.update(flags)
+    assert(c.APSR.pending is not None)
+    unsigned_sum = x + y + carry
+    signed_sum = c.SInt(x) + c.SInt(y) + carry
+    assert(c.APSR.N == (result >> 31 == 1))
+    assert(c.APSR.pending is None)
+    assert(c.APSR.Z == (result == 0))
+    assert(c.APSR.C == (result != unsigned_sum))
+    assert(c.APSR.V == (c.SInt(result) != signed_sum))
+# flags set one by one apply on top of pending ones
+c.APSR.update(c.AddWithCarry(0xffffffff, 1, 0)[1])
+c.APSR.N = True
+assert(c.APSR.nzcv == 0b1110)
+
+# conditions of assembly are resolved when executor is built
+c.R[15] = 0
+c.APSR.nzcv = 0b0100
+c.R[0] = 0
+c.getExec('moveq', 'moveq r0, #1', 0)()
+c.getExec('movne', 'movne r0, #2', 0)()
+assert(c.R[0] == 1)
@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+from _testing import Core, test
+from thumb2ISS.decoder import Decoder
+import logging
+logging.basicConfig(level=logging.DEBUG)
+c = Core()
+d = Decoder()
+
+# halfwords as printed by objdump
+def decode(halfwords, address):
+    return d.decode(b''.join(bytes.fromhex(hw)[::-1] for hw in halfwords.split()), address)
+
+program = [
+    (0,  '2003',      'movs r0, #3',         'aarch32_MOV_i_T1_A'),
+    (2,  '2805',      'cmp r0, #5',          'aarch32_CMP_i_T1_A'),
+    (4,  'bf38',      'it cc',               'aarch32_IT_T1_A'),
+    (6,  '3001',      'addcc r0, #1',        'aarch32_ADD_i_T2_A'),
+    (8,  'f44f 7180', 'mov.w r1, #256',      'aarch32_MOV_i_T2_A'),
+    (12, 'fb01 f200', 'mul.w r2, r1, r0',    'aarch32_MUL_T2_A'),
+    (16, 'e92d 4003', 'push.w {r0, r1, lr}', 'aarch32_PUSH_T1_A'),
+    (20, 'ea4f 1312', 'lsr.w r3, r2, #4',    'aarch32_MOV_r_T3_A'),
+]
+
+steps = []
+for address, halfwords, assembly, factory in program:
+    decoded = decode(halfwords, address)
+    assert(str(decoded) == assembly)
+    assert(decoded.factory == factory)
+    # test steps do not advance PC
+    steps += [c.getDecodedExec(decoded, 0)]
+
+# flags are set outside of IT blocks only, ldr literal targets PC aligned address
+assert(decode('3001', 0).mnem == 'ADDS')
+assert(decode('3001', 0).bitdiffs['S'] == '1')
+assert(decode('4b04', 0x20a).operands['imm32'] == '16')
+assert(decode('f7ff ffee', 0x100).operands['abs_address'] == '0xe0')
+
+# saturate bit position is written before saturated register, shift last
+assert(str(decode('f303 0209', 0)) == 'ssat r2, #10, r3')
+assert(str(decode('f323 0249', 0)) == 'ssat r2, #10, r3, asr #1')
+assert(str(decode('f383 02c9', 0)) == 'usat r2, #9, r3, lsl #3')
+assert(str(decode('f323 020a', 0)) == 'ssat16 r2, #11, r3')
+assert(str(decode('f3a3 0203', 0)) == 'usat16 r2, #3, r3')
+
+# coprocessor instructions are not decoded
+assert(decode('ee07 3e0b', 0) is None)
+
+test(c, steps, {0x20000ff0: bytes(16)})
+
+assert(c.UInt(c.R[0]) == 4)
+assert(c.UInt(c.R[1]) == 256)
+assert(c.UInt(c.R[2]) == 1024)
+assert(c.UInt(c.R[3]) == 64)
+assert(c.UInt(c.R[13]) == 0x20000ff4)
+assert(c.memory.read(0x20000ff4, 4) == 4)
+assert(c.memory.read(0x20000ffc, 4) == 0xffffffff)
@@ -0,0 +1,35 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os
+from _testing import MemoryMap
+from thumb2ISS.elf import ElfFile
+
+elf = ElfFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out'))
+
+assert(elf.entry == 0x6d)
+assert(elf.getSection('.text').addr == 0)
+assert([(address, len(data)) for address, data in elf.romChunks()] == [(0, 0x2abc), (0x2abc, 0x558)])
+# heap and stack have no allocated section, ram is extended up to __StackTop
+assert([(address, len(data)) for address, data in elf.ramChunks()] == [(0x20000000, 0x558), (0x20000558, 0x3d8), (0x20000930, 0x76d0)])
+
+symbols = dict(elf.codeSymbols())
+assert(symbols['main'] == 0x5c)
+assert(symbols['Reset_Handler'] == 0x6c)
+assert(symbols['__isr_vector'] == 0)
+assert((0x6c, 't') in elf.mappingSymbols())
+assert((0, 'd') in elf.mappingSymbols())
+# vector table is data, literal pools are cut out of code chunks
+assert(min(address for address, _ in elf.thumbChunks()) == 0x44)
+assert((0x6c, 0x1c) in [(address, len(data)) for address, data in elf.thumbChunks()])
+
+m = MemoryMap(elf.ramChunks() + elf.romChunks())
+assert(m.limits() == [(0, 0x3013), (0x20000000, 0x20007fff)])
+# initial sp & reset handler from vector table
+assert(m.read(0, 4) == 0x20008000)
+assert(m.read(4, 4) == 0x6d)
@@ -0,0 +1,45 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import struct
+import _testing
+from thumb2ISS.sim import Simulator
+from thumb2ISS.thumb2ISS import execute
+from thumb2ISS.report import newResult, setReason
+
+def exitImage(cmd, reason_low):
+    # r1 is the reason for stopping of SYS_EXIT, or the address of (reason, status) block of SYS_EXIT_EXTENDED
+    code = struct.pack('<6H',
+        0x2000 | cmd,           # 08: movs r0, #cmd
+        0x2102 if cmd == 0x18 else 0x2101,
+                                # 0a: movs r1, #2 (#1)
+        0x0409 if cmd == 0x18 else 0x0749,
+                                # 0c: lsls r1, r1, #16 (#29)
+        0x3100 | reason_low if cmd == 0x18 else 0xbf00,
+                                # 0e: adds r1, #reason_low (nop)
+        0xbeab,                 # 10: bkpt 0xab
+        0xe7fe)                 # 12: b.n 12
+    return struct.pack('<LL', 0x20001000, 0x9) + code
+
+def run(cmd, reason_low, block=b''):
+    s = Simulator()
+    image = exitImage(cmd, reason_low)
+    s.loadChunks(None, [(0, image), (0x20000000, block + bytes(0x1000 - len(block)))], [('__vectors', 0)], code_chunks=[(8, image[8:])])
+    result = newResult('exit')
+    reason, result['instructions'] = execute(s, 0)
+    setReason(result, reason, s.core.exit_status)
+    return result['reason'], result['exit_code']
+
+# SYS_EXIT : application exit is a success, any other reason (run time error or abort) a failure
+assert(run(0x18, 0x26) == ('exit', 0))
+assert(run(0x18, 0x23) == ('exit', 1))
+# SYS_EXIT_EXTENDED : exit status of application exit
+assert(run(0x20, 0, struct.pack('<LL', 0x20026, 0)) == ('exit', 0))
+assert(run(0x20, 0, struct.pack('<LL', 0x20026, 3)) == ('exit', 3))
+assert(run(0x20, 0, struct.pack('<LL', 0x20026, 0x100)) == ('exit', 1))
+assert(run(0x20, 0, struct.pack('<LL', 0x20023, 0)) == ('exit', 1))
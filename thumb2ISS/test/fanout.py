@@ -0,0 +1,38 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os
+import _testing
+from thumb2ISS.sim import Simulator
+from thumb2ISS.thumb2ISS import loadImage
+from thumb2ISS.fanout import fanOut, runVariant
+
+demo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out')
+greeting = 0x29e0 # string printed by main
+
+s = Simulator()
+assert(loadImage(s, demo))
+variants = [{'name': 'plain'}, {'memory': {hex(greeting): b'HELLO'.hex()}}, {'memory': {'0xf0000000': '00'}}, {}]
+results = list(fanOut(s, 'demo', 'main', variants, jobs=2, max_cycles=100000, outputs=[(hex(greeting), 5)]))
+
+# variants are reported in order, counted from main
+assert([r['image'] for r in results] == ['demo[plain]', 'demo[1]', 'demo[2]', 'demo[3]'])
+assert([r['reason'] for r in results] == ['exit', 'exit', 'error', 'exit'])
+assert([r['stdout'] for r in results] == ['hello, world\n', 'HELLO, world\n', '', 'hello, world\n'])
+assert(results[0]['cycles'] == results[3]['cycles'] == 6712 - s.cycles['total'])
+assert(results[0]['instructions'] == results[3]['instructions'] == 3785 - s.retired)
+assert(results[1]['outputs'] == {hex(greeting): b'HELLO'.hex()})
+assert('Illegal memory access' in results[2]['error'])
+
+# parent state is left at main, untouched by variants
+assert(s.core.getPC() == s.labels['main'])
+assert(s.memory.readBytes(greeting, 5) == b'hello')
+
+# cycles budget is counted from fork point
+result = runVariant(s, 'demo', 'short', {}, max_cycles=100)
+assert(result['reason'] == 'cycle-limit' and 100 <= result['cycles'] < 1000)
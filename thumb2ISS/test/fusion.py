@@ -0,0 +1,44 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import struct
+from _testing import Core
+from thumb2ISS.sim import Simulator, fusionKind
+from thumb2ISS.decoder import decode
+
+code = struct.pack('<14H',
+    0xb082,     # 08: sub sp, #8
+    0x2200,     # 0a: movs r2, #0
+    0x2128,     # 0c: movs r1, #40
+    0x9100,     # 0e: str r1, [sp, #0]
+    0x1852,     # 10: adds r2, r2, r1
+    0x9b00,     # 12: ldr r3, [sp, #0]
+    0x18d2,     # 14: adds r2, r2, r3     (stalled on loaded r3)
+    0x2005,     # 16: movs r0, #5         (fused)
+    0x9201,     # 18: str r2, [sp, #4]    (fused)
+    0x9c01,     # 1a: ldr r4, [sp, #4]
+    0x4050,     # 1c: eors r0, r2         (not stalled, r0 was not loaded)
+    0x3901,     # 1e: subs r1, #1
+    0xd1f5,     # 20: bne.n 0e
+    0xe7fe)     # 22: b.n 22
+image = struct.pack('<LL', 0x20001000, 0x9) + code
+
+assert([fusionKind(decode(code[i:i+2], 8+i, None)) for i in range(6, 28, 2)] == ['store', 'alu', None, 'alu', 'alu', 'store', None, 'alu', 'alu', None, None])
+
+# fused blocks have the effects and cycles of single stepped instructions
+s = Simulator()
+results = []
+for step in [s.step_in, s.step_block]:
+    s.loadChunks(None, [(0, image), (0x20000000, bytes(0x1000))], [('__vectors', 0)], code_chunks=[(8, code)])
+    c = s.core
+    while c.getPC() != 0x22:
+        step()
+    results.append((s.cycles['total'], [c.UInt(r) for r in c.R], s.memory.read(0x20000ff8, 8)))
+assert(0x0e in s.blocks)
+assert(results[0] == results[1])
+assert(results[0][1][2] == 2 * sum(range(1, 41)))
@@ -0,0 +1,53 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os, random
+from _testing import MemoryMap
+from thumb2ISS import hostlib
+from thumb2ISS.sim import Simulator
+from thumb2ISS.thumb2ISS import loadImage, execute
+
+m = MemoryMap([(0x100, b'abc\x00abc'), (0x200, bytes(16))])
+assert(hostlib.strlen(m, 0x100) == (3, None, 4))
+assert(hostlib.memchr(m, 0x101, ord('a'), 6) == (0x104, None, 4))
+assert(hostlib.memchr(m, 0x101, ord('a'), 2) == (0, None, 2))
+assert(hostlib.memcpy(m, 0x200, 0x104, 3) == (0x200, (0x200, b'abc'), 3))
+assert(hostlib.memset(m, 0x200, 0x1ff, 2) == (0x200, (0x200, b'\xff\xff'), 2))
+assert(hostlib.memmove(m, 0x200, 0x104, 0)[1] is None)
+
+demo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out')
+s = Simulator()
+results = []
+for names, check in [((), False), (hostlib.routines, True), (hostlib.routines, False)]:
+    assert(loadImage(s, demo))
+    assert(len(s.accelerate(names, check)) == len(names))
+    assert(execute(s, 0)[0] == 'exit')
+    results.append(s.cycles['total'])
+# check mode simulates routines, acceleration saves cycles
+assert(results[0] == results[1] > results[2])
+
+# routines called on random areas give the same results natively and simulated
+assert(loadImage(s, demo))
+s.accelerate(hostlib.routines, check=True)
+c = s.core
+ret = s.labels['main']
+buf = 0x20000400
+random.seed(0)
+for i in range(100):
+    s.memory.writeBytes(buf, bytes(random.randrange(0, 4) for _ in range(0x300)))
+    name = random.choice(list(hostlib.routines))
+    a, b, n = buf + random.randrange(0, 0x100), buf + random.randrange(0, 0x100), random.randrange(0, 0x100)
+    if name == 'memcpy' and abs(a - b) < n:
+        # undefined behaviour
+        continue
+    if name == 'memset':
+        b = random.randrange(0, 0x1000)
+    elif name == 'memchr':
+        b = random.randrange(0, 5)
+    c.R[0], c.R[1], c.R[2], c.R[13], c.R[14], c.R[15] = a, b, n, 0x20000f00, ret | 1, s.labels[name]
+    s.run_until(ret)
@@ -0,0 +1,47 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import struct
+from _testing import Core
+from thumb2ISS.sim import Simulator
+from thumb2ISS.inline import inlined
+from thumb2ISS.decoder import decode
+
+code = struct.pack('<15H',
+    0x20b5,     # 08: movs r0, #0xb5
+    0x2128,     # 0a: movs r1, #40
+    0x2300,     # 0c: movs r3, #0
+    0x1084,     # 0e: asrs r4, r0, #2
+    0x0840,     # 10: lsrs r0, r0, #1     (carry shifted out of overwritten source)
+    0x4153,     # 12: adcs r3, r2
+    0x434c,     # 14: muls r4, r1
+    0xb2e5,     # 16: uxtb r5, r4
+    0xb226,     # 18: sxth r6, r4
+    0x424f,     # 1a: rsbs r7, r1, #0
+    0x438d,     # 1c: bics r5, r1
+    0x3901,     # 1e: subs r1, #1
+    0xd1f5,     # 20: bne.n 0e
+    0xe7fe,     # 22: b.n 22
+    0xbf00)
+image = struct.pack('<LL', 0x20001000, 0x9) + code
+
+assert([inlined(decode(code[i:i+2], 8+i, None)) for i in range(6, 24, 2)] == [True, True, False, True, True, True, True, True, True])
+
+# generated code has the effects and cycles of single stepped instructions
+s = Simulator()
+results = []
+for step in [s.step_in, s.step_block]:
+    s.loadChunks(None, [(0, image), (0x20000000, bytes(0x1000))], [('__vectors', 0)], code_chunks=[(8, code)])
+    c = s.core
+    while c.getPC() != 0x22:
+        step()
+    results.append((s.cycles['total'], s.retired, [c.UInt(r) for r in c.R], c.APSR.nzcv))
+assert(callable(s.blocks[0x0e]))
+assert(results[0] == results[1])
+# carries of lsrs are bits of r0
+assert(results[0][2][3] == bin(0xb5).count('1'))
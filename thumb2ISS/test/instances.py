@@ -0,0 +1,31 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os
+from _testing import Core
+from thumb2ISS.sim import Simulator, EndOfExecutionException
+from thumb2ISS.elf import ElfFile
+
+elf = ElfFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out'))
+sims = [Simulator(), Simulator()]
+assert(Simulator.current() is sims[1])
+for s in sims:
+    s.loadElf(elf)
+assert(sims[0].core is not sims[1].core)
+assert(Core.current() is sims[1].core)
+
+# interleaved executions do not interfere, semihosting handles included
+results = {}
+while len(results) < len(sims):
+    for i, s in enumerate(sims):
+        if i not in results:
+            try:
+                s.step_block()
+            except EndOfExecutionException:
+                results[i] = (s.cycles['total'], [s.core.UInt(r) for r in s.core.R[:15]])
+assert(results[0] == results[1])
@@ -0,0 +1,37 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os
+from _testing import Core
+from thumb2ISS.sim import Simulator
+from thumb2ISS.elf import ElfFile
+
+elf = ElfFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out'))
+s = Simulator()
+main = dict(elf.codeSymbols())['main']
+
+results = []
+for lazy in [False, True]:
+    s.loadElf(elf, lazy=lazy)
+    c = s.core
+    built = [ex.__name__ != 'lazy_exec' for ex, _ in s.code.values()]
+    assert(all(built) != lazy)
+    # breakpoint set before its instruction is ever executed
+    s.addBreakpoint(main)
+    s.run()
+    assert(c.getPC() == main)
+    s.removeBreakpoint(main)
+    s.step_in()
+    results.append((s.cycles['total'], c.getPC(), c.UInt(c.R[13]), c.getLR()))
+    if lazy:
+        # only executed instructions got decoded
+        built = [ex.__name__ != 'lazy_exec' for ex, _ in s.code.values()]
+        assert(0 < sum(built) < len(built) // 4)
+        assert(s.code[main][0].__name__ != 'lazy_exec')
+
+assert(results[0] == results[1])
@@ -0,0 +1,47 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os
+import _testing
+from thumb2ISS.lockstep import Engine, lockstep, runLockstep
+
+demo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out')
+
+# compiled blocks behave as reference executors
+result = lockstep(demo)
+assert(result['status'] == 'match' and result['instructions'] == result['last_match'] == 3782)
+assert(lockstep(demo, 'eager-step', 'step', interval=1000, max_instructions=2500)['status'] == 'limit')
+
+# a wrong result of the candidate is reported at the first comparison following it
+reference, candidate = Engine(demo, 'step'), Engine(demo, 'block')
+core = candidate.sim.core
+add_with_carry = core.AddWithCarry
+calls = []
+def faultyAddWithCarry(x, y, carry_in):
+    calls.append(x)
+    result, flags = add_with_carry(x, y, carry_in)
+    return (result ^ 1 if len(calls) == fault else result, flags)
+core.AddWithCarry = faultyAddWithCarry
+fault = 388
+result = runLockstep(reference, candidate, interval=100)
+assert(result['status'] == 'diverged')
+assert(result['last_match'] < result['instructions'] <= result['last_match'] + 100 + 64)
+assert(result['diff'] == ['r1: 0x2a10 != 0x2a11'])
+# only differences are reported
+assert(all('!=' in line for line in result['diff']) and len(result['diff']) < 8)
+
+# errors of an engine are differences too
+reference, candidate = Engine(demo, 'step'), Engine(demo, 'block')
+core = candidate.sim.core
+add_with_carry = core.AddWithCarry
+calls = []
+core.AddWithCarry = faultyAddWithCarry
+fault = 495
+result = runLockstep(reference, candidate, interval=1000)
+assert(result['status'] == 'diverged' and candidate.ended and not reference.ended)
+assert(any(line.startswith('error: None != Exception: Illegal memory access') for line in result['diff']))
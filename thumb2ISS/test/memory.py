@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import struct, tempfile, os
+from _testing import MemoryMap
+from thumb2ISS.memory import mapFile
+
+# overlapping and adjacent chunks are merged, last chunk wins
+m = MemoryMap([(0, b'\x01\x02\x03\x04'), (2, b'\xaa\xbb\xcc'), (0x20000000, b'\x00' * 16)])
+assert(m.limits() == [(0, 4), (0x20000000, 0x2000000f)])
+assert(m.readBytes(0, 5) == b'\x01\x02\xaa\xbb\xcc')
+assert(m.read(0, 4) == 0xbbaa0201)
+assert(m.read(3, 2) == 0xccbb)
+
+m.write(0x20000004, 4, 0x12345678)
+m.write(0x20000008, 1, 0x1ff)
+assert(m.readBytes(0x20000004, 5) == struct.pack('<LB', 0x12345678, 0xff))
+m.writeBytes(0x2000000e, b'\x55\x66')
+assert(m.read(0x2000000e, 2) == 0x6655)
+
+assert(m.isAddressValid(0x2000000f))
+assert(not m.isAddressValid(0x20000010))
+assert(not m.isAddressValid(5))
+
+for address, size in [(3, 4), (0x2000000e, 4), (-1, 1), (0x10, 1)]:
+    try:
+        m.read(address, size)
+    except Exception as e:
+        assert('Illegal memory access' in str(e))
+    else:
+        assert(False)
+
+# memory mapped image is used as is, other chunks are clipped around it
+with tempfile.TemporaryDirectory() as tmp:
+    image = os.path.join(tmp, 'rom.bin')
+    with open(image, 'wb') as f:
+        f.write(bytes(range(16)))
+
+    rom = mapFile(image)
+    m = MemoryMap([(0, b'\xff' * 0x24), (0x10, rom)])
+    assert(m.limits() == [(0, 0xf), (0x10, 0x1f), (0x20, 0x23)])
+    assert(m.read(0x14, 4) == 0x07060504)
+    # accesses across region boundaries, unaligned words of target code for instance
+    assert(m.read(0xe, 4) == 0x0100ffff)
+    assert(m.read(0x1e, 4) == 0xffff0f0e)
+    assert(m.readBytes(0xf, 0x12) == b'\xff' + bytes(range(16)) + b'\xff')
+    m.write(0x1e, 4, 0x44332211)
+    assert(m.readBytes(0x1c, 6) == b'\x0c\x0d\x11\x22\x33\x44')
+    m.write(0x1e, 2, 0x0f0e)
+    m.write(0x20, 2, 0xffff)
+    m.write(0x14, 4, 0)
+    assert(m.read(0x14, 4) == 0)
+    rom.close()
+    with open(image, 'rb') as f:
+        assert(f.read() == bytes(range(16)))
+
+    rom = mapFile(image, writable=False)
+    m = MemoryMap([(0x10, rom), (0x20, bytes(4))])
+    assert(m.read(0x1c, 4) == 0x0f0e0d0c)
+    for address in [0x1c, 0x1e]:
+        try:
+            m.write(address, 4, 0)
+        except Exception as e:
+            assert('read-only' in str(e))
+        else:
+            assert(False)
+    # nothing is written by a failed access
+    assert(m.read(0x20, 4) == 0)
+    m.write(0x20, 4, 0x12345678)
+    try:
+        m.read(0x22, 4)
+    except Exception as e:
+        assert('Illegal memory access between 0x22 and 0x25' in str(e))
+    else:
+        assert(False)
+    rom.close()
@@ -0,0 +1,43 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os, io
+import _testing
+from thumb2ISS.sim import Simulator
+from thumb2ISS.profiler import Profiler
+from thumb2ISS.thumb2ISS import loadImage, execute
+
+demo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out')
+s = Simulator()
+
+for accelerate in [(), ('memmove',)]:
+    assert(loadImage(s, demo))
+    s.accelerate(accelerate)
+    p = Profiler(s)
+    assert(execute(s, 0)[0] == 'exit')
+    functions = p.functions()
+    total = s.cycles['total']
+    # every cycle is spent in a single function, and within the root one
+    assert(p.cycles == total == sum(f[1] for f in functions.values()))
+    assert(functions['reset_handler'][3] == total)
+    # inclusive counts of a function add up its own and its callees ones, puts branching to _puts_r which
+    # returns to main in its place
+    assert(functions['puts'][3] == functions['puts'][1])
+    assert(functions['main'][3] == functions['main'][1] + functions['puts'][3] + functions['_puts_r'][3])
+    assert(functions['_puts_r'][4] == 1 and functions['memmove'][4] == 2)
+    assert(functions['_puts_r'][3] > functions['__sfvwrite_r'][3] > functions['memmove'][3] > 0)
+    # profiled code is stepped, with the same cycles as compiled blocks
+    assert(total == (6712 if len(accelerate) == 0 else 6712 - 138 + functions['memmove'][1]))
+
+f = io.StringIO()
+p.flatReport(f, hot_spots=3)
+p.callGraphReport(f)
+report = f.getvalue()
+assert(report.startswith(f'Flat profile : {p.instructions} instructions, {total} cycles'))
+assert('<reset_handler+0xe> strlt.w r0, [r2], #4' in report)
+assert(f'main : {functions["main"][3]} cycles' in report and '    -> puts : 1 calls, 6 cycles' in report)
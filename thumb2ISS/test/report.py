@@ -0,0 +1,46 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import io, json
+import xml.etree.ElementTree as ET
+import _testing
+from thumb2ISS.report import newResult, setReason, writeJsonLine, writeJUnit
+
+results = [newResult(name) for name in ['a.out', 'b.out', 'c.out']]
+setReason(results[0], 'exit')
+results[0].update(cycles=100, instructions=80, wall_time=0.5, stdout='hello <world> & co\n')
+setReason(results[1], 'timeout')
+results[2]['error'] = 'ValueError: bad'
+assert([r['exit_code'] for r in results] == [0, 124, 1])
+
+f = io.StringIO()
+for r in results:
+    writeJsonLine(r, f)
+assert([json.loads(line) for line in f.getvalue().splitlines()] == results)
+
+f = io.StringIO()
+writeJUnit(results, f)
+suite = ET.fromstring(f.getvalue())
+assert((suite.get('tests'), suite.get('failures'), suite.get('errors')) == ('3', '1', '1'))
+cases = suite.findall('testcase')
+assert([c.get('name') for c in cases] == ['a.out', 'b.out', 'c.out'])
+assert(cases[0].find('system-out').text == 'hello <world> & co\n')
+assert({p.get('name'):p.get('value') for p in cases[0].iter('property')}['instructions'] == '80')
+assert(cases[0].find('failure') is None and cases[1].find('failure') is not None)
+assert(cases[2].find('error').get('message') == 'ValueError: bad')
+
+# target exiting with failure fails with its exit status
+failed = newResult('d.out')
+setReason(failed, 'exit', 3)
+assert(failed['exit_code'] == 3)
+setReason(failed, 'exit', 0x100)
+assert(failed['exit_code'] == 1)
+f = io.StringIO()
+writeJUnit([results[0], failed], f)
+suite = ET.fromstring(f.getvalue())
+assert(suite.get('failures') == '1' and suite.findall('testcase')[1].find('failure').get('message') == 'Target exited with status 1')
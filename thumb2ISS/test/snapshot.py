@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os, io, tempfile
+import contextlib
+import _testing
+from thumb2ISS.sim import Simulator, readSnapshot
+from thumb2ISS.thumb2ISS import loadImage, execute
+
+demo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out')
+
+def finish(s, snapshot=None):
+    # target output goes to the host stdout active when simulation is restored
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        if snapshot is not None:
+            s.restore(snapshot)
+        reason, _ = execute(s, 0)
+    return reason, s.cycles['total'], s.retired, stdout.getvalue()
+
+s = Simulator()
+assert(loadImage(s, demo))
+with contextlib.redirect_stdout(io.StringIO()):
+    reference = finish(s)
+assert(reference == ('exit', 6712, 3785, 'hello, world\n'))
+
+# boot code runs once, then simulation resumes from main as many times as needed
+assert(loadImage(s, demo))
+with contextlib.redirect_stdout(io.StringIO()):
+    s.run_until(s.labels['main'])
+boot = s.snapshot()
+assert(0 < boot['cycles']['total'] < 6712)
+s.restore(boot)
+assert(s.core.getPC() == s.labels['main'])
+for _ in range(2):
+    assert(finish(s, boot) == reference)
+
+# snapshot data is not changed by the simulation resumed from it
+s.restore(boot)
+assert(s.snapshot() == boot)
+
+# snapshot file is restored on another simulator of same image
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, 'main.snapshot')
+    s.snapshot(path)
+    other = Simulator()
+    assert(loadImage(other, demo))
+    assert(finish(other, path) == reference)
+
+    # it is plain data : JSON state and raw memory, read back as taken, target files included
+    with open(path, 'rb') as f:
+        assert(f.read(1) == b'{')
+    target_file = os.path.join(tmp, 'input.txt')
+    with open(target_file, 'w') as f:
+        f.write('0123456789')
+    s.restore(boot)
+    handle = open(target_file, 'r')
+    handle.seek(4)
+    s.core.sh_files[handle] = (target_file, 'r')
+    s.core.sh_handles[7] = handle
+    saved = s.snapshot(path)
+    assert(readSnapshot(path) == saved)
+    s.restore(path)
+    assert(s.core.sh_handles[7].read() == '456789')
+    s.restore(boot)
+
+    # anything else is rejected
+    with open(path, 'wb') as f:
+        f.write(b'\x80\x05garbage')
+    try:
+        s.restore(path)
+        assert(False)
+    except Exception as e:
+        assert('not a snapshot' in str(e))
+
+# memory layout of another image does not match
+s.loadChunks(None, [(0, bytes(8))], [('__vectors', 0)])
+try:
+    s.restore(boot)
+    assert(False)
+except Exception as e:
+    assert('regions' in str(e))
@@ -0,0 +1,55 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os, io, re, time, contextlib
+import _testing
+from thumb2ISS.sim import Simulator, Phases
+from thumb2ISS.core import _compiled_patterns
+from thumb2ISS.thumb2ISS import loadImage, writeTimingReport
+
+demo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out')
+
+def load():
+    s = Simulator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert(loadImage(s, demo))
+    return s
+
+first = load()
+expected = ['simulator', 'image', 'instruction tables', 'core', 'disassembly', 'decoding', 'labels', 'memory', 'reset']
+assert(list(first.phases) == expected)
+assert(all(duration >= 0 for duration in first.phases.values()))
+
+# instruction tables are set up once per process
+second = load()
+assert(list(second.phases) == expected)
+assert(second.phases['instruction tables'] < 0.001)
+
+# instruction regexes are compiled on first use of their mnemonic, then shared by cores
+assert('UXTB16' not in _compiled_patterns)
+first.core.getExec('uxtb16', 'uxtb16 r0, r1', 0)
+compiled = _compiled_patterns['UXTB16']
+assert(len(compiled) > 0 and all(type(pat) is re.Pattern for pat, _, _ in compiled))
+assert(second.core.getPatterns('UXTB16') is compiled)
+assert(second.core.getPatterns('NOSUCH') == [])
+
+# phases entered twice are accumulated
+phases = Phases()
+with phases('sleep'):
+    time.sleep(0.01)
+with phases('sleep'):
+    time.sleep(0.01)
+assert(list(phases) == ['sleep'] and phases['sleep'] >= 0.02)
+
+report = io.StringIO()
+writeTimingReport({'imports': 0.1, 'decoding': 0.3}, report)
+lines = report.getvalue().splitlines()
+assert(lines[0] == 'Start up time by phase')
+assert(lines[1].split() == ['imports', '100.0', 'ms', '25.0%'])
+assert(lines[2].split() == ['decoding', '300.0', 'ms', '75.0%'])
+assert(lines[3].split() == ['total', '400.0', 'ms'])
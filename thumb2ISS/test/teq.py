@@ -32,3 +32,23 @@ assert(c.UInt(c.R[9]) == 0x5A)
 assert(c.UInt(c.R[10]) == 0xDEAD005A)
 
 assert(c.APSR.N)
+
+# carry out of constant : unchanged by plain and replicated constants, bit 31 of rotated ones
+steps = []
+steps += [c.getExec('cmp', 'cmp r0, r0', 0)]
+steps += [c.getExec('tst', 'tst r0, #255', 0)]
+steps += [c.getExec('movcs', 'movcs r1, r0', 0)]
+steps += [c.getExec('tst', 'tst r0, #1020', 0)]
+steps += [c.getExec('movcc', 'movcc r2, r0', 0)]
+steps += [c.getExec('teq', 'teq r0, #2147483648', 0)]
+steps += [c.getExec('movcs', 'movcs r3, r0', 0)]
+steps += [c.getExec('ands', 'ands r4, r0, #4278255360', 0)]
+steps += [c.getExec('movcs', 'movcs r5, r0', 0)]
+
+test(c, steps, intial_regs={0: 0x5A, 13:0x20001000, 15:0})
+
+assert(c.UInt(c.R[1]) == 0x5A)
+assert(c.UInt(c.R[2]) == 0x5A)
+assert(c.UInt(c.R[3]) == 0x5A)
+assert(c.UInt(c.R[4]) == 0)
+assert(c.UInt(c.R[5]) == 0x5A)
@@ -0,0 +1,46 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import os, tempfile
+import _testing
+from thumb2ISS.sim import Simulator
+from thumb2ISS.memory import MemoryMap
+from thumb2ISS.tracer import Tracer, readTrace, formatRecord, READ, WRITE
+from thumb2ISS.thumb2ISS import loadImage, execute
+
+demo = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'demo', 'hello_world-cm4.out')
+s = Simulator()
+
+with tempfile.TemporaryDirectory() as tmp:
+    traces = []
+    for name in ['hello.trace', 'hello.trace.gz']:
+        path = os.path.join(tmp, name)
+        assert(loadImage(s, demo))
+        with Tracer(s, path) as tracer:
+            assert(execute(s, 0)[0] == 'exit')
+        assert(type(s.memory) is MemoryMap and s.core.memory is s.memory)
+        traces.append(list(readTrace(path)))
+    # compressed trace holds the same records
+    assert(traces[0] == traces[1])
+    assert(os.path.getsize(os.path.join(tmp, 'hello.trace.gz')) < os.path.getsize(os.path.join(tmp, 'hello.trace')))
+
+records = traces[0]
+assert(len(records) == tracer.count)
+assert(sum(r.cycles for r in records) == s.cycles['total'] == 6712)
+# reset handler first loads the .data copy loop bounds from its literal pool
+first = records[0]
+assert(first.pc == s.labels['reset_handler'] and len(first.encoding) == 2)
+assert(list(first.registers) == [1] and first.accesses == [(READ, 0x88, first.registers[1].to_bytes(4, 'little'))])
+# then copies .data to RAM
+store = next(r for r in records if any(kind == WRITE for kind, _, _ in r.accesses))
+assert(formatRecord(store) == '0000007a: f842 0b04   3 r2=0x20000004 W4 [0x20000000]=0x0')
+# replayed register changes give final register values (r0-r12 being 0 on reset)
+registers = {i: 0 for i in range(13)}
+for record in records:
+    registers.update(record.registers)
+assert(all(registers[i] == s.core.R[i] for i in range(13)))
@@ -6,51 +6,49 @@
 #
 # License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
 #
+import time
+# start of imports, reported by --timing-report
+imports_start = time.perf_counter()
 import click
 import logging
 from itertools import groupby
 from intelhex import IntelHex
-import re,sys,time,os,subprocess,tempfile
-from .sim import Simulator, EndOfExecutionException, Core
+import re,sys,os
+import io
+import contextlib
+from .sim import Simulator, EndOfExecutionException
+from .memory import mapFile
+from .elf import ElfFile
+from .hostlib import routines as host_routines
+from .profiler import Profiler
+from .tracer import Tracer
 from .timings import Architecture
+from .report import newResult, setReason, Tee, writeJsonLine, writeJUnit
 from .version import __version__
 
-@click.command()
-@click.argument('elf_file', type=click.Path(exists=True))
-@click.option('-d', '--debug', is_flag=True, default=False, help='Launch with debugger CLI')
-@click.option('-c', '--cpu', type=click.Choice(['M0', 'M0+', 'M3', 'M4', 'M23', 'M33'], case_sensitive=False), default='M4', help='Tune target (cycle counting)')
-@click.option('-l', '--log', type=click.File('w'), help='Full debug log in target file')
-@click.option('-v', '--verbose', count=True, help='Tune stderr output verbosity')
-@click.option('-t', '--timeout', default=10, show_default=True, help='Simulation timeout (s) (not applicable on debugger)')
-@click.option('-p', '--profile', is_flag=True, default=False, help='Extract statistics about instruction coverage')
-@click.version_option(__version__)
-def run(elf_file, debug, cpu, log, verbose, timeout, profile):
-    ''' Runs ELF_FILE on thumb2 Instruction Set Simulator'''
-
-
-    if log is not None:
-        logging.basicConfig(level=logging.DEBUG, stream=log)
-    else:
-        logging.basicConfig(level=logging.INFO, stream=sys.stderr)
-        logging.getLogger('Mnem').setLevel(logging.WARNING)
-        logging.getLogger('thumb2ISS.Sim').setLevel(logging.WARNING)
-
-    log = logging.getLogger('thumb2ISS')
-
-    arch = Architecture.fromString(cpu)
-
-    log.info(f'Loaded timings for Cortex {cpu}')
+def romStart(sec_str):
+    # lowest address of allocated, non writable sections
+    return min(int(strt, 16) for strt in re.findall(r' ([\da-f]+) +[\da-f]+ +[\da-f]+ +[\da-f]+ +A', sec_str))
 
-    log.info(f'Loading elf {elf_file} ...')
+def loadImage(s, elf_file, profile=False, lazy=True, cache_dir=None, rom_image=None, rom_readonly=False):
+    ''' Loads ELF_FILE (or hex file with its companion files) in simulator s, returns load status.
+        Time spent in each phase of loading is then found in s.phases '''
+    with s.phases('image'):
+        is_elf, args = readImage(elf_file, rom_image, rom_readonly)
+    if not is_elf:
+        return s.load(*args, profile=profile, lazy=lazy, cache_dir=cache_dir)
+    return s.loadElf(*args, profile=profile, lazy=lazy, cache_dir=cache_dir)
 
-    # extract hex from elf
+def readImage(elf_file, rom_image=None, rom_readonly=False):
+    ''' Reads ELF_FILE (or hex file with its companion files), returns whether it is an ELF file with the
+        arguments of Simulator.loadElf (or Simulator.load) '''
     base_name = os.path.splitext(os.path.basename(elf_file))[0]
     hex_file = base_name + '.hex'
-    if os.path.exists(hex_file):
-        dis_file = base_name + '.dis'
+    dis_file = base_name + '.dis'
+    with open(elf_file, 'rb') as f:
+        is_elf = f.read(4) == b'\x7fELF'
+    if not is_elf:
         sec_file = base_name + '.sec'
-        ih = IntelHex()
-        ih.loadhex(hex_file)
         # load disassembly
         with open(dis_file, 'r') as f:
             dis_str = f.read()
@@ -65,66 +63,179 @@ def run(elf_file, debug, cpu, log, verbose, timeout, profile):
             sec_size = int(sz, 16)
             ram_memories.append((sec_strt, b'\x00' * sec_size))
 
-        rom_memory = ih.gets(ih.minaddr(), len(ih))
+        if rom_image is not None:
+            rom_memory = mapFile(rom_image, writable=not rom_readonly)
+            rom_start = romStart(sec_str)
+        else:
+            ih = IntelHex()
+            ih.loadhex(hex_file)
+            rom_memory = ih.gets(ih.minaddr(), len(ih))
+            rom_start = ih.minaddr()
+
+        return False, (dis_str, rom_memory, rom_start, ram_memories)
+
+    # memory layout and symbols are read from elf, code is decoded from elf unless a companion disassembly exists
+    elf = ElfFile(elf_file)
+    dis_str = None
+    if os.path.exists(dis_file):
+        with open(dis_file, 'r') as f:
+            dis_str = f.read()
 
-        s = Simulator(t_arch=arch, log_root=log)
-        if s.load(dis_str, rom_memory, ih.minaddr(), ram_memories, profile=profile):
-            for minaddr,maxaddr in s.address_limits:
-                print(f'Memory range : {hex(minaddr)} - {hex(maxaddr)}', file=sys.stderr)
+    rom_memory = None
+    if rom_image is not None:
+        rom_memory = mapFile(rom_image, writable=not rom_readonly)
 
+    return True, (elf, dis_str, rom_memory)
+
+def writeTimingReport(phases, f):
+    ''' Start up phases {name: duration (s)} with their share of total start up time '''
+    total = sum(phases.values())
+    print('Start up time by phase', file=f)
+    for name, duration in phases.items():
+        print(f'  {name:<20} {1000*duration:>9.1f} ms {100*duration/max(total, 1e-9):>6.1f}%', file=f)
+    print(f'  {"total":<20} {1000*total:>9.1f} ms', file=f)
+
+# executed instructions between two checks of simulation timeout
+time_check_period = 10000
+
+def execute(s, timeout=None, max_cycles=None, max_instructions=None):
+    ''' Runs loaded simulator until end of execution, timeout (s of host wall-clock time, None for no timeout) or
+        exhaustion of cycles or instructions budget, returns the reason for stopping and the count of retired
+        instructions. Budgets are checked between blocks, independently of host speed '''
+    time_limit = timeout + time.time() if timeout else None
+    try:
+        while True:
+            budget = max_instructions - s.retired if max_instructions else None
+            if time_limit is not None:
+                budget = time_check_period if budget is None else min(budget, time_check_period)
+            s.run(max_cycles=max_cycles, max_instructions=budget)
+            if max_instructions and s.retired >= max_instructions:
+                return 'instruction-limit', s.retired
+            if max_cycles and s.cycles['total'] >= max_cycles:
+                return 'cycle-limit', s.retired
+            if time_limit is not None and time.time() > time_limit:
+                return 'timeout', s.retired
+    except EndOfExecutionException:
+        return 'exit', s.retired
+
+@click.command()
+@click.argument('elf_file', type=click.Path(exists=True))
+@click.option('-d', '--debug', is_flag=True, default=False, help='Launch with debugger CLI')
+@click.option('-c', '--cpu', type=click.Choice(['M0', 'M0+', 'M3', 'M4', 'M23', 'M33'], case_sensitive=False), default='M4', help='Tune target (cycle counting)')
+@click.option('-l', '--log', type=click.File('w'), help='Full debug log in target file (implies --trace)')
+@click.option('--trace', is_flag=True, default=False, help='Log every instruction effect (registers, memory, branches)')
+@click.option('-v', '--verbose', count=True, help='Tune stderr output verbosity')
+@click.option('-t', '--timeout', type=click.IntRange(min=1), help='Stop simulation after this host wall-clock time (s), which depends on host speed (not applicable on debugger)  [default: none]')
+@click.option('--max-cycles', type=click.IntRange(min=1), help='Stop simulation once this count of cycles is simulated (not applicable on debugger)')
+@click.option('--max-instructions', type=click.IntRange(min=1), help='Stop simulation once this count of instructions is executed (not applicable on debugger)')
+@click.option('-p', '--profile', is_flag=True, default=False, help='Extract statistics about instruction coverage')
+@click.option('--record', type=click.Path(dir_okay=False), help='Record executed instructions (pc, encoding, cycles, changed registers, memory accesses) in target binary trace file, gzip compressed when named *.gz (not applicable on debugger)')
+@click.option('--perf-report', type=click.File('w'), help='Write flat and call graph profiles of simulated code (cycles by function and instruction) in target file (not applicable on debugger)')
+@click.option('--eager', is_flag=True, default=False, help='Decode every instruction at load instead of on first execution')
+@click.option('--cache-dir', type=click.Path(file_okay=False), help='Keep decoded programs in this directory to skip disassembly parsing or eager decoding on next runs of same image')
+@click.option('--rom-image', type=click.Path(exists=True, dir_okay=False), help='Flat binary of flash content, memory mapped instead of loaded from hex')
+@click.option('--rom-readonly', is_flag=True, default=False, help='Map rom image read-only instead of copy-on-write')
+@click.option('-a', '--accelerate', multiple=True, type=click.Choice(list(host_routines) + ['all']), help='Run this C library routine natively instead of simulating it (repeatable)')
+@click.option('--accelerate-check', is_flag=True, default=False, help='Simulate accelerated routines anyway and check native results against simulated ones')
+@click.option('--report', type=click.File('w'), help='Write simulation result (reason, cycles, instructions, wall time, stdout) in target file (not applicable on debugger)')
+@click.option('--report-format', type=click.Choice(['jsonl', 'junit'], case_sensitive=False), default='jsonl', show_default=True, help='Format of the result written by --report')
+@click.option('--timing-report', is_flag=True, default=False, help='Print time spent in each start up phase (imports, image reading, instruction tables, decoding, memory...) on stderr before simulation')
+@click.version_option(__version__)
+def run(elf_file, debug, cpu, log, trace, verbose, timeout, max_cycles, max_instructions, profile, record, perf_report, eager, cache_dir, rom_image, rom_readonly, accelerate, accelerate_check, report, report_format, timing_report):
+    ''' Runs ELF_FILE on thumb2 Instruction Set Simulator'''
+    # imports and command line parsing
+    imports_time = time.perf_counter() - imports_start
+
+    if log is not None:
+        logging.basicConfig(level=logging.DEBUG, stream=log)
+        trace = True
+    elif trace:
+        logging.basicConfig(level=logging.DEBUG, stream=sys.stderr)
     else:
-        with tempfile.TemporaryDirectory() as tmp:
-            hex_path = os.path.join(tmp, hex_file)
-            subprocess.run(f'arm-none-eabi-objcopy --gap-fill 0xFF -O ihex "{elf_file}" "{hex_path}"', shell=True)
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+        logging.getLogger('Mnem').setLevel(logging.WARNING)
+        logging.getLogger('thumb2ISS.Sim').setLevel(logging.WARNING)
 
-            ih = IntelHex()
-            ih.loadhex(hex_path)
-        
-            # load disassembly
-            dis_str = subprocess.check_output(f'arm-none-eabi-objdump.exe -d -z "{elf_file}"')
+    log = logging.getLogger('thumb2ISS')
 
-            # find RAM area
-            sec_str = subprocess.check_output(f'arm-none-eabi-readelf.exe -S "{elf_file}"')
+    arch = Architecture.fromString(cpu)
+    # profiling reports never executed instructions as well, those have to be decoded at load
+    lazy = not (eager or profile)
 
-            ram_memories = []
-            for strt,sz in re.findall(rb' ([\da-f]+) +[\da-f]+ +([\da-f]+) +[\da-f]+ +W', sec_str):
-                sec_strt = int(strt, 16)
-                sec_size = int(sz, 16)
-                ram_memories.append((sec_strt, b'\x00' * sec_size))
+    log.info(f'Loaded timings for Cortex {cpu}')
 
-            rom_memory = ih.gets(ih.minaddr(), len(ih))
+    log.info(f'Loading elf {elf_file} ...')
 
-            s = Simulator(t_arch=arch, log_root=log)
-            if s.load(dis_str.decode('ascii'), rom_memory, ih.minaddr(), ram_memories, profile=profile):
-                for minaddr,maxaddr in s.address_limits:
-                    print(f'Memory range : {hex(minaddr)} - {hex(maxaddr)}', file=sys.stderr)
+    base_name = os.path.splitext(os.path.basename(elf_file))[0]
+    s = Simulator(t_arch=arch, log_root=log, trace=trace)
+    if loadImage(s, elf_file, profile=profile, lazy=lazy, cache_dir=cache_dir, rom_image=rom_image, rom_readonly=rom_readonly):
+        for minaddr,maxaddr in s.address_limits:
+            print(f'Memory range : {hex(minaddr)} - {hex(maxaddr)}', file=sys.stderr)
+    if len(accelerate) > 0:
+        with s.phases('acceleration'):
+            accelerated = s.accelerate(host_routines if 'all' in accelerate else accelerate, accelerate_check)
+        log.info(f'Accelerated routines : {", ".join(accelerated)}')
+    if timing_report:
+        writeTimingReport(dict({'imports': imports_time}, **s.phases), sys.stderr)
 
     err_code = 0
     if not debug:
-        step_cnt = 0
+        # profiled code is single stepped
+        profiler = Profiler(s) if perf_report is not None else None
+        tracer = Tracer(s, record) if record is not None else None
+        result = newResult(elf_file)
+        stdout = io.StringIO()
         start_time = time.time()
-        time_limit = timeout + start_time if timeout else False
         try:
-            while True:
-                s.step_in()
-                step_cnt+=1
-                if step_cnt%100 == 0:
-                    if time_limit and time.time() > time_limit:
-                        total_cycles = s.cycles['total']
-                        log.info(f'Simulation ended by timeout : {total_cycles} cycles simulated in {timeout} s')
-                        err_code = 124 # posix timeout err code
-                        break
-        except EndOfExecutionException:
-            elapsed_time = time.time() - start_time
-            total_cycles = s.cycles['total']
-            log.info(f'Simulation ended by end of execution ({total_cycles} cycles simulated in {elapsed_time:.3f} s)')
+            # target output is still printed, and kept for the report
+            with contextlib.redirect_stdout(Tee(sys.stdout, stdout) if report else sys.stdout):
+                reason, result['instructions'] = execute(s, timeout, max_cycles, max_instructions)
+            setReason(result, reason, s.core.exit_status)
+            if reason == 'timeout':
+                total_cycles = s.cycles['total']
+                log.info(f'Simulation ended by wall-clock timeout : {total_cycles} cycles simulated in {timeout} s')
+                err_code = 124 # posix timeout err code
+            elif reason != 'exit':
+                total_cycles = s.cycles['total']
+                log.info(f'Simulation ended by {reason} : {total_cycles} cycles, {s.retired} instructions simulated')
+                err_code = 124
+            else:
+                elapsed_time = time.time() - start_time
+                total_cycles = s.cycles['total']
+                log.info(f'Simulation ended by end of execution ({total_cycles} cycles simulated in {elapsed_time:.3f} s)')
+                if result['exit_code'] != 0:
+                    log.info(f'Target exited with status {s.core.exit_status}')
+                    err_code = result['exit_code']
         except KeyboardInterrupt:
             log.info('Simulation ended by cancelation')
+            result['error'] = 'Simulation ended by cancelation'
+        except Exception as e:
+            if report is None:
+                raise
+            log.exception('Simulation ended by exception')
+            result['error'] = f'{type(e).__name__}: {e}'
+            err_code = result['exit_code']
+
+        if tracer is not None:
+            tracer.close()
+            log.info(f'{tracer.count} instructions recorded in {record}')
+        if profiler is not None:
+            profiler.flatReport(perf_report)
+            profiler.callGraphReport(perf_report)
+
+        if report is not None:
+            result['cycles'] = s.cycles['total']
+            result['wall_time'] = round(time.time() - start_time, 6)
+            result['stdout'] = stdout.getvalue()
+            if report_format == 'junit':
+                writeJUnit([result], report)
+            else:
+                writeJsonLine(result, report)
     else:
         # starting debugger
         from .debugger import Debugger
         end_of_exec = False
-        d = Debugger()
+        d = Debugger(s)
         try:
             d.loop()    
         except EndOfExecutionException:
@@ -159,7 +270,7 @@ def run(elf_file, debug, cpu, log, verbose, timeout, profile):
             sum_exec = defaultdict(lambda:0)
             
         used_mnems = []
-        c = Core()
+        c = s.core
         with open(f'prof_patt_{base_name}.csv', 'w') as f:
             with open(f'prof_patt_summary.csv', 'w') as s:
                 print('Mnemonic;Pattern;Occurences', file=f)
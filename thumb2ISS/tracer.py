@@ -0,0 +1,175 @@
+#
+# Copyright (c) 2023 Thibaut Zeissloff.
+#
+# This file is part of Thumb2ISS
+# (see https://github.com/TZe-0xff/thumb2ISS).
+#
+# License: 3-clause BSD, see https://opensource.org/licenses/BSD-3-Clause
+#
+import click
+import gzip
+import struct
+from collections import namedtuple
+from .version import __version__
+
+# Binary trace : magic and format version, then one record per executed instruction, made of
+#  - pc, encoding length, cycles, mask of changed registers (r0-r14), count of memory accesses
+#  - encoding, changed registers values (from r0 to r14)
+#  - memory accesses : kind (read / write), address, size, then accessed data
+# Files named *.gz are gzip compressed.
+trace_magic = b'T2TR'
+trace_format = 1
+_file_header = struct.Struct('<4sH')
+_record_header = struct.Struct('<IBIHB')
+_access_header = struct.Struct('<BIH')
+_register = struct.Struct('<I')
+
+READ, WRITE = 0, 1
+
+TraceRecord = namedtuple('TraceRecord', 'pc encoding cycles registers accesses')
+
+# records are written once this many bytes are buffered
+flush_size = 1 << 16
+
+def openTrace(path, mode):
+    return gzip.open(path, mode) if str(path).endswith('.gz') else open(path, mode)
+
+
+class RecordingMemory:
+    ''' MemoryMap proxy collecting memory accesses as (kind, address, data) '''
+    def __init__(self, memory):
+        self.memory = memory
+        self.accesses = []
+
+    def read(self, address, size):
+        value = self.memory.read(address, size)
+        self.accesses.append((READ, address, value.to_bytes(size, 'little')))
+        return value
+
+    def write(self, address, size, value):
+        self.memory.write(address, size, value)
+        self.accesses.append((WRITE, address, (value & ((1 << 8*size) - 1)).to_bytes(size, 'little')))
+
+    def readBytes(self, address, size):
+        data = self.memory.readBytes(address, size)
+        self.accesses.append((READ, address, data))
+        return data
+
+    def writeBytes(self, address, data):
+        self.memory.writeBytes(address, data)
+        self.accesses.append((WRITE, address, bytes(data)))
+
+    def __getattr__(self, name):
+        return getattr(self.memory, name)
+
+
+class Tracer:
+    ''' Records every executed instruction of a loaded simulator (single stepped while traced) in a binary trace
+        file, up to close '''
+
+    def __init__(self, sim, path):
+        self.sim = sim
+        self.core = sim.core
+        self.file = openTrace(path, 'wb')
+        self.buffer = bytearray(_file_header.pack(trace_magic, trace_format))
+        self.count = 0
+        self.memory = sim.memory
+        self.recording = RecordingMemory(self.memory)
+        sim.memory = self.core.memory = self.recording
+        self.registers = list(self.core.R[:15])
+        sim.monitors.append(self)
+        sim.blocks = {}
+
+    def record(self, pc, length, cycles):
+        R = self.core.R
+        registers = self.registers
+        mask = 0
+        values = []
+        for i in range(15):
+            if R[i] != registers[i]:
+                mask |= 1 << i
+                values.append(R[i])
+                registers[i] = R[i]
+        accesses = self.recording.accesses
+        encoding = self.memory.readBytes(pc, length)
+        buffer = self.buffer
+        buffer += _record_header.pack(pc, length, cycles, mask, len(accesses))
+        buffer += encoding
+        for value in values:
+            buffer += _register.pack(value)
+        for kind, address, data in accesses:
+            buffer += _access_header.pack(kind, address, len(data))
+            buffer += data
+        accesses.clear()
+        self.count += 1
+        if len(buffer) >= flush_size:
+            self.flush()
+
+    def flush(self):
+        self.file.write(self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        ''' Writes pending records and detaches from simulator '''
+        if self in self.sim.monitors:
+            self.sim.monitors.remove(self)
+            self.sim.memory = self.core.memory = self.memory
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _read(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise Exception('Truncated trace')
+    return data
+
+def readTrace(path):
+    ''' Yields TraceRecord of a trace file, registers being {register number: value} '''
+    with openTrace(path, 'rb') as f:
+        magic, version = _file_header.unpack(f.read(_file_header.size))
+        if magic != trace_magic or version != trace_format:
+            raise Exception(f'Unsupported trace format in {path}')
+        while True:
+            header = f.read(_record_header.size)
+            if len(header) == 0:
+                break
+            if len(header) != _record_header.size:
+                raise Exception('Truncated trace')
+            pc, length, cycles, mask, access_count = _record_header.unpack(header)
+            encoding = _read(f, length)
+            registers = {i: _register.unpack(_read(f, 4))[0] for i in range(15) if mask & (1 << i)}
+            accesses = []
+            for _ in range(access_count):
+                kind, address, size = _access_header.unpack(_read(f, _access_header.size))
+                accesses.append((kind, address, _read(f, size)))
+            yield TraceRecord(pc, encoding, cycles, registers, accesses)
+
+def formatRecord(record):
+    ''' One line per record : pc, encoding (halfwords as stored in memory), cycles, changed registers, memory accesses
+        (values of up to 4 bytes as integers, longer data as bytes) '''
+    encoding = ' '.join(f'{int.from_bytes(record.encoding[i:i+2], "little"):04x}' for i in range(0, len(record.encoding), 2))
+    fields = [f'{record.pc:08x}: {encoding:<9} {record.cycles:>3}']
+    fields += [f'r{i}={value:#x}' for i, value in record.registers.items()]
+    for kind, address, data in record.accesses:
+        value = f'{int.from_bytes(data, "little"):#x}' if len(data) <= 4 else data.hex()
+        fields.append(f'{"RW"[kind]}{len(data)} [{address:#x}]={value}')
+    return ' '.join(fields)
+
+@click.command()
+@click.argument('trace_file', type=click.Path(exists=True, dir_okay=False))
+@click.option('-o', '--output', type=click.File('w'), default='-', help='Text file  [default: stdout]')
+@click.version_option(__version__)
+def dump(trace_file, output):
+    ''' Converts TRACE_FILE, recorded by thumb2ISS --record, to text '''
+    for record in readTrace(trace_file):
+        print(formatRecord(record), file=output)
+
+if __name__ == '__main__':
+    dump()